@@ -3,16 +3,91 @@
 Sync extension documentation from registered extension repositories.
 This script reads .github/extensions.yml and pulls documentation from each
 registered extension repository into src/doc/extensions/<name>/.
+
+Extensions are synced concurrently. Each repository is fetched shallow and
+sparse (only docs_path), the last synced commit per extension is kept in a
+state file so unchanged extensions are skipped without fetching, and the
+target directory is updated incrementally: only changed files are written
+and only files removed upstream are deleted.
+
+Registry entries may set 'url' (e.g. file:///path/to/bare.git) instead of
+the GitHub 'repo' URL and 'branch' (default: main).
 """
 
+import argparse
+import fnmatch
+import hashlib
+import json
 import os
 import sys
 import yaml
-import shutil
 import subprocess
 import re
+import unicodedata
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+# Define subdirectories to exclude from sync
+EXCLUDE_SUBDIRS = [
+    'release_notes',        # Release notes directory with broken links
+    'releases',             # Releases directory with broken links
+    '.git',                 # Git directory
+    '__pycache__',          # Python cache
+]
+
+# Define file patterns to always exclude
+EXCLUDE_FILE_PATTERNS = [
+    '.git*',                # Git files
+    '*.pyc',                # Python compiled files
+]
+
+# Link rewrite rules: (link target, action, argument). Targets are matched
+# in full against the part between the parentheses. 'unlink' keeps the link
+# text as plain text (links into source code, not docs), 'rewrite' replaces
+# the target ({repo} is the extension repository).
+LINK_RULES = [
+    (r'\.\./lib/[^\)]+', 'unlink', None),                   # ../lib/...
+    (r'\.\./bin/[^\)]+', 'unlink', None),                   # ../bin/...
+    (r'\.\./scripts/[^\)]+', 'unlink', None),               # ../scripts/...
+    (r'(?:\.\./)*CHANGELOG\.md[^\)]*', 'unlink', None),     # CHANGELOG.md (any ../prefix, with optional anchor)
+    (r'(?:\.\./)*VERSION', 'unlink', None),                 # VERSION (any ../prefix)
+    (r'\.\./Makefile', 'unlink', None),                     # ../Makefile
+    (r'lib/README\.md', 'unlink', None),                    # lib/README.md
+    (r'bin/[^\)]+', 'unlink', None),                        # bin/...
+    (r'README\.md', 'unlink', None),                        # README.md (in same dir as index.md)
+    (r'\.\./README\.md', 'unlink', None),                   # ../README.md (parent directory README)
+    (r'release_notes/[^\)]*', 'unlink', None),              # release_notes/
+    (r'releases/[^\)]*', 'unlink', None),                   # releases/
+    (r'etc/', 'unlink', None),                              # etc/
+    (r'\.\./datasafe/', 'unlink', None),                    # ../datasafe/ (extension subdirectory)
+    (r'(?:\.\./)*\.github/[^\)]+', 'unlink', None),         # .github/ directory (any ../prefix)
+    (r'\.', 'rewrite', 'index.md'),                         # current directory
+    (r'\.\./tests/README\.md', 'rewrite', 'https://github.com/{repo}/blob/main/tests/README.md'),
+]
+
+# Markdown links. The link text is optional so that a '](target)' closing a
+# nested link (e.g. around an image) is still seen.
+LINK_RE = re.compile(r'(?:\[(?P<text>[^\]]*))?\]\((?P<target>[^\)]*)\)')
+
+# Links whose target matches a rule, all rules as one alternation: one scan
+# per file, the matching group (r<index>) selects the rule. Starts with a
+# character class (not an optional group) so the scan can skip ahead.
+RULES_RE = re.compile(r'[\[\]](?:(?<=\[)(?P<text>[^\]]*)\]|(?<=\]))\((?:'
+                      + '|'.join(f'(?P<r{i}>{rule[0]})' for i, rule in enumerate(LINK_RULES))
+                      + r')\)')
+
+# Dispatch table: action -> replacement for a link match
+LINK_ACTIONS = {
+    'unlink': lambda m, arg, repo: m.group('text') or m.group(0),
+    'rewrite': lambda m, arg, repo: m.group(0)[:m.start(m.lastgroup) - m.start()] + arg.format(repo=repo) + ')',
+}
+
+# Part of the sync state: cached per-file results are void when rules change
+RULES_DIGEST = hashlib.sha256(json.dumps(LINK_RULES).encode('utf-8')).hexdigest()[:16]
+
 
 def load_extensions_registry(registry_path: str) -> List[Dict]:
     """Load extensions from the registry YAML file."""
@@ -20,216 +95,382 @@ def load_extensions_registry(registry_path: str) -> List[Dict]:
         data = yaml.safe_load(f)
     return data.get('extensions', [])
 
-def clone_or_update_repo(repo: str, target_dir: Path, branch: str = 'main') -> bool:
-    """Clone or update a git repository."""
-    repo_url = f"https://github.com/{repo}.git"
-    
-    if target_dir.exists():
-        print(f"  Updating existing clone: {target_dir}")
-        try:
-            subprocess.run(['git', 'pull'], cwd=target_dir, check=True, capture_output=True)
+
+def load_state(state_file: Path) -> Dict:
+    """Load the last synced commit per extension (empty if missing/invalid)."""
+    try:
+        with open(state_file, 'r') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def save_state(state_file: Path, state: Dict) -> None:
+    """Write the sync state atomically."""
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = state_file.with_suffix('.tmp')
+    with open(tmp_file, 'w') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    tmp_file.replace(state_file)
+
+
+def repo_url(extension: Dict) -> str:
+    """Return the clone URL of an extension ('url' or the GitHub repo)."""
+    return extension.get('url') or f"https://github.com/{extension['repo']}.git"
+
+
+def run_git(args: List[str], cwd: Optional[Path] = None) -> subprocess.CompletedProcess:
+    """Run a git command without terminal prompts; raises CalledProcessError."""
+    env = dict(os.environ, GIT_TERMINAL_PROMPT='0')
+    return subprocess.run(['git'] + args, cwd=cwd, env=env, check=True, capture_output=True, text=True)
+
+
+def remote_head(url: str, branch: str) -> Optional[Tuple[str, Optional[str]]]:
+    """Resolve the remote commit without fetching.
+
+    Returns (commit, branch) for the requested branch, (commit, None) for the
+    remote default branch if the branch does not exist, or None on error.
+    """
+    try:
+        out = run_git(['ls-remote', url, f'refs/heads/{branch}', 'HEAD']).stdout
+    except subprocess.CalledProcessError:
+        return None
+    refs = {ref: sha for sha, ref in (line.split('\t', 1) for line in out.splitlines() if '\t' in line)}
+    if f'refs/heads/{branch}' in refs:
+        return refs[f'refs/heads/{branch}'], branch
+    if 'HEAD' in refs:
+        return refs['HEAD'], None
+    return None
+
+
+def clone_or_update_repo(url: str, target_dir: Path, docs_path: str, branch: Optional[str],
+                         log: List[str]) -> Optional[str]:
+    """Shallow, sparse clone or update of a repository limited to docs_path.
+
+    Returns the checked out commit or None on failure.
+    """
+    ref = branch or 'HEAD'
+    try:
+        if (target_dir / '.git').exists():
+            log.append(f"  Updating existing clone: {target_dir}")
+            run_git(['remote', 'set-url', 'origin', url], cwd=target_dir)
+            run_git(['sparse-checkout', 'set', docs_path], cwd=target_dir)
+            run_git(['fetch', '--depth', '1', '--filter=blob:none', 'origin', ref], cwd=target_dir)
+            run_git(['checkout', '--force', '--detach', 'FETCH_HEAD'], cwd=target_dir)
+        else:
+            log.append(f"  Cloning {url} to {target_dir}")
+            branch_args = ['--branch', branch] if branch else []
+            run_git(['clone', '--depth', '1', '--filter=blob:none', '--sparse'] + branch_args
+                    + [url, str(target_dir)])
+            run_git(['sparse-checkout', 'set', docs_path], cwd=target_dir)
+        return run_git(['rev-parse', 'HEAD'], cwd=target_dir).stdout.strip()
+    except subprocess.CalledProcessError as e:
+        log.append(f"  ⚠️  Failed to fetch: {(e.stderr or '').strip() or e}")
+        return None
+
+
+def extension_metadata(extension: Dict) -> Dict:
+    """Metadata written to .metadata.yml for an extension."""
+    return {
+        'title': extension['display_name'],
+        'description': extension['description'],
+        'category': extension['category'],
+        'repository': f"https://github.com/{extension['repo']}",
+        'status': extension['status']
+    }
+
+
+def should_exclude(rel_path: Path) -> bool:
+    """Check if a file (relative to the doc directory) should be excluded."""
+    # Exclude if file is in an excluded subdirectory
+    for part in rel_path.parts[:-1]:
+        if part in EXCLUDE_SUBDIRS:
             return True
-        except subprocess.CalledProcessError as e:
-            print(f"  ⚠️  Failed to update: {e}")
-            return False
-    else:
-        print(f"  Cloning {repo_url} to {target_dir}")
-        try:
-            subprocess.run(['git', 'clone', '--depth', '1', '--branch', branch, repo_url, str(target_dir)],
-                         check=True, capture_output=True)
+
+    # Check if filename matches exclusion patterns
+    for pattern in EXCLUDE_FILE_PATTERNS:
+        if fnmatch.fnmatch(rel_path.name, pattern):
             return True
-        except subprocess.CalledProcessError:
-            # Try without branch if it fails
-            try:
-                subprocess.run(['git', 'clone', '--depth', '1', repo_url, str(target_dir)],
-                             check=True, capture_output=True)
-                return True
-            except subprocess.CalledProcessError as e:
-                print(f"  ⚠️  Failed to clone: {e}")
-                return False
-
-def sync_extension_docs(extension: Dict, work_dir: Path, docs_dir: Path) -> bool:
-    """Sync documentation for a single extension."""
+
+    return False
+
+
+def cleanup_broken_links(content: str, repo: str) -> str:
+    """Remove or fix broken links that point outside the doc directory."""
+    def rewrite(match: re.Match) -> str:
+        _, action, arg = LINK_RULES[int(match.lastgroup[1:])]
+        return LINK_ACTIONS[action](match, arg, repo)
+
+    return RULES_RE.sub(rewrite, content)
+
+
+def render_docs(source_docs: Path, extension: Dict, target_docs: Path,
+                previous_hashes: Dict[str, str]) -> Tuple[Dict[str, Optional[bytes]], Dict[str, str], int]:
+    """Build the target file set of an extension in memory.
+
+    Applies the exclusions, the README.md -> index.md rename, the link
+    cleanup and adds .metadata.yml. Files whose source hash matches
+    previous_hashes and whose target exists are not processed again (content
+    None). Returns ({relative path: content}, {relative path: source hash},
+    number of markdown files with cleaned links).
+    """
+    sources = {}
+    for item in source_docs.rglob('*'):
+        rel_path = item.relative_to(source_docs)
+        if item.is_file() and not should_exclude(rel_path):
+            sources[rel_path.as_posix()] = item
+
+    # If README.md exists but index.md doesn't, use README as index
+    if 'README.md' in sources and 'index.md' not in sources:
+        sources['index.md'] = sources.pop('README.md')
+
+    files = {}
+    hashes = {}
+    cleaned = 0
+    for rel_path, item in sources.items():
+        data = item.read_bytes()
+        hashes[rel_path] = hashlib.sha256(data).hexdigest()
+        if previous_hashes.get(rel_path) == hashes[rel_path] and (target_docs / rel_path).is_file():
+            files[rel_path] = None
+            continue
+        if rel_path.endswith('.md'):
+            text = data.decode('utf-8')
+            fixed = cleanup_broken_links(text, extension['repo'])
+            if fixed != text:
+                cleaned += 1
+                data = fixed.encode('utf-8')
+        files[rel_path] = data
+
+    # Create a metadata file for reference
+    files['.metadata.yml'] = yaml.dump(extension_metadata(extension)).encode('utf-8')
+    return files, hashes, cleaned
+
+
+def mirror_files(files: Dict[str, Optional[bytes]], target_docs: Path) -> Tuple[int, int]:
+    """Make target_docs contain exactly files, touching only what differs.
+
+    Files with content None are kept as they are. Returns (files written,
+    files deleted).
+    """
+    written = 0
+    for rel_path, data in files.items():
+        target_file = target_docs / rel_path
+        if data is None:
+            continue
+        try:
+            if target_file.read_bytes() == data:
+                continue
+        except OSError:
+            target_file.parent.mkdir(parents=True, exist_ok=True)
+        target_file.write_bytes(data)
+        written += 1
+
+    deleted = 0
+    for item in sorted(target_docs.rglob('*'), reverse=True):
+        rel_path = item.relative_to(target_docs).as_posix()
+        if item.is_file() and rel_path not in files:
+            item.unlink()
+            deleted += 1
+        elif item.is_dir() and not any(item.iterdir()):
+            item.rmdir()
+    return written, deleted
+
+
+def entry_digest(extension: Dict) -> str:
+    """Digest of a registry entry, so metadata edits trigger a resync."""
+    return hashlib.sha256(json.dumps(extension, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def sync_extension_docs(extension: Dict, work_dir: Path, docs_dir: Path, previous: Optional[Dict],
+                        force: bool = False) -> Tuple[bool, Optional[Dict], List[str]]:
+    """Sync documentation for a single extension.
+
+    Returns (success, state entry, log lines). Runs in a worker thread, so
+    output is collected and printed by the caller.
+    """
     name = extension['name']
     repo = extension['repo']
     docs_path = extension.get('docs_path', 'doc')
-    
-    print(f"\n📦 Syncing {name} from {repo}")
-    
+    url = repo_url(extension)
+    log = [f"\n📦 Syncing {name} from {repo}"]
+
+    head = remote_head(url, extension.get('branch', 'main'))
+    if head is None:
+        log.append(f"  ⚠️  Failed to resolve remote: {url}")
+        return False, previous, log
+    commit, branch = head
+
+    target_docs = docs_dir / 'extensions' / name
+    digest = entry_digest(extension)
+    if (not force and previous and previous.get('commit') == commit and previous.get('entry') == digest
+            and previous.get('rules') == RULES_DIGEST and (target_docs / '.metadata.yml').exists()):
+        log.append(f"  ✓ Unchanged at {commit[:12]}, skipped")
+        return True, previous, log
+
     # Clone/update the extension repo
     repo_dir = work_dir / name
-    if not clone_or_update_repo(repo, repo_dir):
-        return False
-    
+    commit = clone_or_update_repo(url, repo_dir, docs_path, branch, log)
+    if commit is None:
+        return False, previous, log
+
     # Check if doc directory exists
     source_docs = repo_dir / docs_path
-    if not source_docs.exists():
-        print(f"  ⚠️  Doc directory not found: {docs_path}")
-        return False
-    
-    # Copy docs to target location
-    target_docs = docs_dir / 'extensions' / name
-    target_docs.parent.mkdir(parents=True, exist_ok=True)
-    
-    if target_docs.exists():
-        shutil.rmtree(target_docs)
-    
-    # Define subdirectories to exclude from sync
-    exclude_subdirs = [
-        'release_notes',        # Release notes directory with broken links
-        'releases',             # Releases directory with broken links
-        '.git',                 # Git directory
-        '__pycache__',          # Python cache
-    ]
-    
-    # Define file patterns to always exclude
-    exclude_file_patterns = [
-        '.git*',                # Git files
-        '*.pyc',                # Python compiled files
-    ]
-    
-    def should_exclude(file_path: Path) -> bool:
-        """Check if file should be excluded based on patterns."""
-        import fnmatch
-        
-        # Get relative path from source_docs to check for subdirectories
-        rel_path = file_path.relative_to(source_docs)
-        
-        # Exclude if file is in an excluded subdirectory
-        for part in rel_path.parts[:-1]:  # Check all directory parts except the filename
-            if part in exclude_subdirs:
-                return True
-        
-        # Check if filename matches exclusion patterns
-        for pattern in exclude_file_patterns:
-            if fnmatch.fnmatch(file_path.name, pattern):
-                return True
-        
-        return False
-    
-    # Copy files selectively
+    if not source_docs.is_dir():
+        log.append(f"  ⚠️  Doc directory not found: {docs_path}")
+        return False, previous, log
+
+    previous_hashes = {}
+    if not force and previous and previous.get('rules') == RULES_DIGEST:
+        previous_hashes = previous.get('hashes', {})
+    files, hashes, cleaned = render_docs(source_docs, extension, target_docs, previous_hashes)
     target_docs.mkdir(parents=True, exist_ok=True)
-    for item in source_docs.rglob('*'):
-        if item.is_file() and not should_exclude(item):
-            rel_path = item.relative_to(source_docs)
-            target_file = target_docs / rel_path
-            target_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(item, target_file)
-    
-    print(f"  ✓ Copied docs to {target_docs}")
-    
-    # If README.md exists but index.md doesn't, use README as index
-    readme_file = target_docs / 'README.md'
-    index_file = target_docs / 'index.md'
-    if readme_file.exists() and not index_file.exists():
-        shutil.move(str(readme_file), str(index_file))
-        print(f"  ✓ Renamed README.md to index.md")
-    
-    # Clean up broken links in synced documentation
-    cleanup_broken_links(target_docs, repo)
-    
-    # Create or update navigation metadata
-    create_extension_nav(extension, target_docs)
-    
-    return True
-
-def cleanup_broken_links(docs_dir: Path, repo: str) -> None:
-    """Remove or fix broken links that point outside the doc directory."""
-    # Patterns for links that will be broken (point to source code, not docs)
-    broken_link_patterns = [
-        r'\[([^\]]+)\]\(\.\./lib/[^\)]+\)',      # ../lib/...
-        r'\[([^\]]+)\]\(\.\./bin/[^\)]+\)',      # ../bin/...
-        r'\[([^\]]+)\]\(\.\./scripts/[^\)]+\)',  # ../scripts/...
-        r'\[([^\]]+)\]\((?:\.\./)*CHANGELOG\.md[^\)]*\)',  # CHANGELOG.md (any ../prefix, with optional anchor)
-        r'\[([^\]]+)\]\((?:\.\./)*VERSION\)',      # VERSION (any ../prefix)
-        r'\[([^\]]+)\]\(\.\./Makefile\)',        # ../Makefile
-        r'\[([^\]]+)\]\(lib/README\.md\)',       # lib/README.md
-        r'\[([^\]]+)\]\(bin/[^\)]+\)',           # bin/...
-        r'\[([^\]]+)\]\(README\.md\)',           # README.md (in same dir as index.md)
-        r'\[([^\]]+)\]\(\.\./README\.md\)',      # ../README.md (parent directory README)
-        r'\[([^\]]+)\]\(release_notes/[^\)]*\)', # release_notes/
-        r'\[([^\]]+)\]\(releases/[^\)]*\)',      # releases/
-        r'\[([^\]]+)\]\(etc/\)',                 # etc/
-        r'\[([^\]]+)\]\(\.\./datasafe/\)',       # ../datasafe/ (extension subdirectory)
-        r'\[([^\]]+)\]\((?:\.\./)*\.github/[^\)]+\)',  # .github/ directory (any ../prefix)
-    ]
-    
-    files_cleaned = 0
-    for md_file in docs_dir.rglob('*.md'):
-        content = md_file.read_text(encoding='utf-8')
-        original_content = content
-        
-        # Remove broken links, keep the link text as plain text
-        for pattern in broken_link_patterns:
-            content = re.sub(pattern, r'\1', content)
-        
-        # Fix common relative links that break after sync
-        content = re.sub(r'\]\(\.\)', r'](index.md)', content)
-        content = re.sub(
-            r'\]\(\.\./tests/README\.md\)',
-            rf'](https://github.com/{repo}/blob/main/tests/README.md)',
-            content,
-        )
-
-        # Write back if changes were made
-        if content != original_content:
-            md_file.write_text(content, encoding='utf-8')
-            files_cleaned += 1
-    
-    if files_cleaned > 0:
-        print(f"  ✓ Cleaned broken links in {files_cleaned} file(s)")
-
-def create_extension_nav(extension: Dict, docs_dir: Path) -> None:
-    """Create a .pages file for mkdocs-awesome-pages-plugin (if used) or metadata."""
-    metadata = {
-        'title': extension['display_name'],
-        'description': extension['description'],
-        'category': extension['category'],
-        'repository': f"https://github.com/{extension['repo']}",
-        'status': extension['status']
-    }
-    
-    # Create a metadata file for reference
-    meta_file = docs_dir / '.metadata.yml'
-    with open(meta_file, 'w') as f:
-        yaml.dump(metadata, f)
-    
-    print(f"  ✓ Created metadata file")
+    written, deleted = mirror_files(files, target_docs)
+    log.append(f"  ✓ Synced docs to {target_docs} at {commit[:12]} "
+               f"({written} written, {deleted} deleted, {len(files) - written} unchanged)")
+    if cleaned > 0:
+        log.append(f"  ✓ Cleaned broken links in {cleaned} file(s)")
+
+    return True, {'commit': commit, 'entry': digest, 'rules': RULES_DIGEST, 'hashes': hashes}, log
+
+
+# Link index: headings, explicit anchors and link targets of markdown files
+FENCE_RE = re.compile(r'^\s*(```|~~~)')
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)\s*$')
+ATTR_ID_RE = re.compile(r'\s*\{:?\s*#([\w.:-]+)[^}]*\}\s*$')   # attr_list: '{: #id }', '{ #id }'
+HTML_ID_RE = re.compile(r'<[a-zA-Z][^>]*?\s(?:id|name)=["\']([^"\']+)["\']')
+REF_DEF_RE = re.compile(r'^\s{0,3}\[[^\]]+\]:\s*<?([^\s>]+)')
+CODE_SPAN_RE = re.compile(r'(`+).*?\1')
+SCHEME_RE = re.compile(r'^[a-zA-Z][\w+.-]*:')
+
+
+def heading_slug(text: str) -> str:
+    """Anchor of a heading as generated by the markdown toc extension."""
+    text = re.sub(r'`([^`]*)`', r'\1', text)                 # code spans
+    text = re.sub(r'!?\[([^\]]*)\]\([^\)]*\)', r'\1', text)   # links and images
+    text = re.sub(r'(\*{1,2}|_{2})(.+?)\1', r'\2', text)     # emphasis
+    text = re.sub(r'<[^>]+>', '', text)                        # inline html
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    text = re.sub(r'[^\w\s-]', '', text).strip().lower()
+    return re.sub(r'[-\s]+', '-', text)
+
+
+class LinkIndex:
+    """Anchors and relative links of all markdown files below a docs root.
+
+    Built in one scan per file; unresolved() then checks every relative link
+    and anchor against the index without reading files again.
+    """
+
+    def __init__(self, docs_dir: Path):
+        self.docs_dir = docs_dir.resolve()
+        self.anchors: Dict[Path, Set[str]] = {}
+        self.links: List[Tuple[Path, int, str]] = []
+
+    def scan(self) -> 'LinkIndex':
+        for md_file in sorted(self.docs_dir.rglob('*.md')):
+            self.scan_file(md_file)
+        return self
+
+    def scan_file(self, md_file: Path) -> None:
+        anchors = set()
+        seen = Counter()
+        in_fence = None
+        lines = md_file.read_text(encoding='utf-8', errors='replace').splitlines()
+        for lineno, line in enumerate(lines, 1):
+            fence = FENCE_RE.match(line)
+            if fence:
+                if in_fence is None:
+                    in_fence = fence.group(1)
+                elif fence.group(1) == in_fence:
+                    in_fence = None
+                continue
+            if in_fence:
+                continue
+
+            heading = HEADING_RE.match(line)
+            if heading:
+                title = heading.group(2).rstrip('#').rstrip()
+                attr_id = ATTR_ID_RE.search(title)
+                if attr_id:
+                    anchors.add(attr_id.group(1))
+                else:
+                    # toc makes duplicate ids unique with _1, _2, ...
+                    slug = heading_slug(title)
+                    anchors.add(f"{slug}_{seen[slug]}" if seen[slug] else slug)
+                    seen[slug] += 1
+            anchors.update(HTML_ID_RE.findall(line))
+
+            text = CODE_SPAN_RE.sub('', line)
+            targets = [m.group('target') for m in LINK_RE.finditer(text)] + REF_DEF_RE.findall(text)
+            for target in targets:
+                target = target.strip().split(' ')[0].strip('<>')
+                if target and not SCHEME_RE.match(target) and not target.startswith('/'):
+                    self.links.append((md_file, lineno, target))
+        self.anchors[md_file.resolve()] = anchors
+
+    def unresolved(self) -> List[Tuple[Path, int, str, str]]:
+        """Return (file, line, target, reason) for every broken link."""
+        broken = []
+        for md_file, lineno, target in self.links:
+            path, _, anchor = target.partition('#')
+            resolved = Path(os.path.normpath(md_file.resolve().parent / unquote(path))) if path else md_file.resolve()
+            if resolved != self.docs_dir and self.docs_dir not in resolved.parents:
+                broken.append((md_file, lineno, target, 'outside docs'))
+            elif not resolved.exists():
+                broken.append((md_file, lineno, target, 'not found'))
+            elif anchor:
+                page = resolved / 'index.md' if resolved.is_dir() else resolved
+                if page in self.anchors and anchor not in self.anchors[page]:
+                    broken.append((md_file, lineno, target, 'missing anchor'))
+        return broken
+
+
+def check_links(docs_dir: Path) -> int:
+    """Report unresolved relative links and anchors below docs_dir."""
+    index = LinkIndex(docs_dir).scan()
+    broken = index.unresolved()
+    print(f"\n🔗 Link index: {len(index.anchors)} page(s), {len(index.links)} relative link(s), "
+          f"{len(broken)} unresolved")
+    for md_file, lineno, target, reason in broken:
+        print(f"  ⚠️  {md_file.relative_to(index.docs_dir)}:{lineno}: {target} ({reason})")
+    return len(broken)
+
 
 def update_extensions_index(extensions: List[Dict], index_file: Path) -> None:
     """Update the extensions catalog index page with current extensions."""
-    
+
     if not index_file.exists():
         print(f"⚠️  Index file not found: {index_file}")
         return
-    
+
     with open(index_file, 'r') as f:
         content = f.read()
-    
+
     # Find the auto-generated section
     start_marker = "<!-- EXTENSIONS_LIST_START -->"
     end_marker = "<!-- EXTENSIONS_LIST_END -->"
-    
+
     if start_marker not in content or end_marker not in content:
         print("⚠️  Index markers not found in catalog page")
         return
-    
+
     # Generate extension list - only include extensions with synced docs
     ext_list = ["\n"]
     synced_count = 0
-    
+
     docs_dir = index_file.parent / 'extensions'
-    
+
     for ext in extensions:
         if ext['status'] != 'active':
             continue
-        
+
         # Check if extension docs were synced
         ext_docs = docs_dir / ext['name']
         if not ext_docs.exists() or not (ext_docs / 'index.md').exists():
             print(f"  ⓘ  Skipping {ext['name']} - no docs synced")
             continue
-        
+
         ext_list.append(f"### {ext['display_name']}\n\n")
         ext_list.append(f"**Repository:** [{ext['repo']}](https://github.com/{ext['repo']})  \n")
         ext_list.append(f"**Category:** {ext['category']}  \n")
@@ -237,63 +478,103 @@ def update_extensions_index(extensions: List[Dict], index_file: Path) -> None:
         ext_list.append(f"{ext['description']}\n\n")
         ext_list.append(f"[View Documentation](extensions/{ext['name']}/index.md){{ .md-button }}\n\n")
         synced_count += 1
-    
+
     # If no extensions with docs, show placeholder message
     if synced_count == 0:
         ext_list = ["\n"]
         ext_list.append("No extensions with documentation are currently available. Extensions will appear here once\n")
         ext_list.append("they have documentation in their `doc/` directory and are registered in the extensions registry.\n\n")
         ext_list.append("To add your extension, see the [Extension System Guide](18-extensions.md).\n")
-    
+
     # Replace content between markers
     start_idx = content.index(start_marker) + len(start_marker)
     end_idx = content.index(end_marker)
-    
+
     new_content = content[:start_idx] + ''.join(ext_list) + content[end_idx:]
-    
+    if new_content == content:
+        print(f"✓ Extensions index unchanged ({synced_count} extension(s))")
+        return
+
     with open(index_file, 'w') as f:
         f.write(new_content)
-    
+
     print(f"✓ Updated extensions index with {synced_count} extension(s)")
 
 
-def main():
-    # Setup paths
+def parse_args() -> argparse.Namespace:
+    """Parse command line options (defaults: paths of this repository)."""
     repo_root = Path(__file__).parent.parent.parent
-    registry_file = repo_root / '.github' / 'extensions.yml'
-    docs_dir = repo_root / 'src' / 'doc'
+    parser = argparse.ArgumentParser(description="Sync extension documentation from registered repositories")
+    parser.add_argument('--registry', type=Path, default=repo_root / '.github' / 'extensions.yml',
+                        help="extension registry YAML")
+    parser.add_argument('--docs-dir', type=Path, default=repo_root / 'src' / 'doc',
+                        help="documentation root (extensions go to <docs-dir>/extensions/<name>)")
+    parser.add_argument('--work-dir', type=Path, default=repo_root / '.extensions_work',
+                        help="directory for the sparse clones")
+    parser.add_argument('--state-file', type=Path, default=None,
+                        help="last synced commit per extension (default: <work-dir>/sync_state.json)")
+    parser.add_argument('-j', '--jobs', type=int, default=4, help="extensions synced in parallel (default: 4)")
+    parser.add_argument('--force', action='store_true', help="sync even if the upstream commit is unchanged")
+    parser.add_argument('--check-links', action='store_true',
+                        help="report unresolved relative links and anchors in docs-dir (exit 1 if any)")
+    parser.add_argument('--no-sync', action='store_true', help="skip the sync (e.g. with --check-links)")
+    return parser.parse_args()
+
+
+def sync_all(args: argparse.Namespace) -> None:
+    """Sync all active extensions of the registry and update the index page."""
+    registry_file = args.registry
+    docs_dir = args.docs_dir
     index_file = docs_dir / 'extensions.md'
-    work_dir = repo_root / '.extensions_work'
-    
+    work_dir = args.work_dir
+    state_file = args.state_file or work_dir / 'sync_state.json'
+
     print("🔄 OraDBA Extension Documentation Sync")
     print(f"   Registry: {registry_file}")
     print(f"   Docs Dir: {docs_dir}")
-    
+
     # Load extensions
     if not registry_file.exists():
         print(f"❌ Registry file not found: {registry_file}")
         sys.exit(1)
-    
+
     extensions = load_extensions_registry(registry_file)
     print(f"   Found {len(extensions)} registered extension(s)")
-    
+
     # Create work directory
     work_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Sync each extension
+    state = load_state(state_file)
+
+    # Sync active extensions concurrently; print each log in registry order
+    active = [ext for ext in extensions if ext.get('status') == 'active']
     success_count = 0
-    for extension in extensions:
-        if extension.get('status') == 'active':
-            if sync_extension_docs(extension, work_dir, docs_dir):
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = pool.map(
+            lambda ext: sync_extension_docs(ext, work_dir, docs_dir, state.get(ext['name']), args.force),
+            active)
+        for ext, (ok, entry, log) in zip(active, results):
+            print('\n'.join(log))
+            if entry is not None:
+                state[ext['name']] = entry
+            if ok:
                 success_count += 1
-    
+    save_state(state_file, state)
+
     # Update the index page
     update_extensions_index(extensions, index_file)
-    
+
     print(f"\n✅ Synced {success_count}/{len(extensions)} extensions")
-    
+
     # Cleanup work directory (optional - comment out to keep for debugging)
     # shutil.rmtree(work_dir)
 
+
+def main():
+    args = parse_args()
+    if not args.no_sync:
+        sync_all(args)
+    if args.check_links and check_links(args.docs_dir) > 0:
+        sys.exit(1)
+
 if __name__ == '__main__':
     main()
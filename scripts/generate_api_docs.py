@@ -10,11 +10,18 @@
 # Purpose....: Generate API reference documentation from function headers
 # Notes......: Extracts function headers from source files and generates
 #              organized markdown documentation with categories and index.
+#              Parsed headers are cached per source file (content hash) and
+#              pages are only written when their content changes. Also writes
+#              a function catalog (JSON and TSV) with call sites for
+#              oradba_help.sh.
 # Reference..: https://github.com/oehrlis/oradba
 # License....: Apache License Version 2.0, January 2004 as shown
 #              at http://www.apache.org/licenses/
 # ------------------------------------------------------------------------------
 
+import argparse
+import hashlib
+import json
 import re
 import os
 import sys
@@ -28,6 +35,27 @@ PROJECT_ROOT = SCRIPT_DIR.parent
 SRC_LIB_DIR = PROJECT_ROOT / "src" / "lib"
 SRC_BIN_DIR = PROJECT_ROOT / "src" / "bin"
 OUTPUT_DIR = PROJECT_ROOT / "src" / "doc" / "api"
+CACHE_FILE = PROJECT_ROOT / ".cache" / "api_docs.json"
+CATALOG_JSON = OUTPUT_DIR / "function-catalog.json"
+CATALOG_TSV = OUTPUT_DIR / "function-catalog.tsv"
+
+# Cache entries are only valid for the parser that produced them
+CACHE_VERSION = 4
+CATALOG_VERSION = 1
+
+# Function definitions (name() { / function name {) and identifier tokens
+DEF_RE = re.compile(r'^\s*(?:function\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*\(\)')
+TOKEN_RE = re.compile(r'(?<![\w$])[A-Za-z_][A-Za-z0-9_]*(?!\w)')
+PARAM_RE = re.compile(r'[#!]?[A-Za-z_][A-Za-z0-9_]*')
+HEREDOC_RE = re.compile(r'<<(-?)\s*([\'"]?)([A-Za-z_][A-Za-z0-9_]*)\2')
+
+# Function links in the hand-written index text: [`name`](category.md#anchor)
+FUNCTION_LINK_RE = re.compile(r'\[`(\w+)`\]\(\w+\.md#[\w-]+\)')
+
+
+def function_anchor(name):
+    """Anchor ID of a function heading (lowercase with hyphens)"""
+    return name.lower().replace('_', '-')
 
 # Category mappings
 CATEGORY_MAP = {
@@ -35,10 +63,12 @@ CATEGORY_MAP = {
     "oradba_db_functions.sh": "database",
     "oradba_registry.sh": "registry",
     "oradba_aliases.sh": "aliases",
+    "oradba_peer_sync.sh": "common",
     "oradba_env_builder.sh": "environment",
     "oradba_env_changes.sh": "environment",
     "oradba_env_config.sh": "environment",
     "oradba_env_parser.sh": "environment",
+    "oradba_env_paths.sh": "environment",
     "oradba_env_status.sh": "environment",
     "oradba_env_validator.sh": "environment",
     "extensions.sh": "extensions",
@@ -73,11 +103,36 @@ class FunctionDoc:
     def __init__(self, name, source_file):
         self.name = name
         self.source_file = source_file
+        self.line = 0
         self.purpose = ""
         self.args = []
         self.returns = ""
         self.output = ""
         self.notes = ""
+
+    def to_dict(self):
+        """Return the parsed fields as a JSON serializable dict"""
+        return {
+            "name": self.name,
+            "line": self.line,
+            "purpose": self.purpose,
+            "args": self.args,
+            "returns": self.returns,
+            "output": self.output,
+            "notes": self.notes,
+        }
+
+    @classmethod
+    def from_dict(cls, data, source_file):
+        """Create a FunctionDoc from a dict written by to_dict"""
+        func_doc = cls(data["name"], source_file)
+        func_doc.line = data["line"]
+        func_doc.purpose = data["purpose"]
+        func_doc.args = list(data["args"])
+        func_doc.returns = data["returns"]
+        func_doc.output = data["output"]
+        func_doc.notes = data["notes"]
+        return func_doc
     
     @staticmethod
     def escape_html(text):
@@ -100,9 +155,8 @@ class FunctionDoc:
         """Generate markdown documentation for this function"""
         md = []
         
-        # Function header with anchor (use lowercase with underscores for anchor ID)
-        anchor_id = self.name.lower().replace('_', '-')
-        md.append(f"### `{self.name}` {{: #{anchor_id} }}")
+        # Function header with anchor (see function_anchor)
+        md.append(f"### `{self.name}` {{: #{function_anchor(self.name)} }}")
         md.append("")
         
         # Purpose
@@ -165,35 +219,47 @@ def get_category(file_path):
         return "scripts"
 
 
-def parse_function_header(file_path, start_line):
-    """Parse a function header starting at the given line"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
+def parse_headers(lines, file_path):
+    """Extract all function headers from the lines of a file in one pass
+
+    Returns (functions, definitions). Each function's line is the line of its
+    definition (the header line if the definition is not found); definitions
+    maps every function defined in the file to its line.
+    """
+    functions = []
+    definitions = {}
+    pending = {}
     func_doc = None
-    i = start_line
     current_field = None
-    
-    while i < len(lines):
-        line = lines[i].rstrip()
-        i += 1
-        
-        # Check for function name
+
+    for lineno, raw_line in enumerate(lines, 1):
+        line = raw_line.rstrip()
+
+        match = DEF_RE.match(line)
+        if match:
+            name = match.group(1)
+            definitions.setdefault(name, lineno)
+            if name in pending:
+                pending.pop(name).line = lineno
+
+        # Check for function name (starts a new header; an unterminated
+        # previous header is a leftover and is replaced)
         if line.startswith("# Function:"):
             func_name = line.replace("# Function:", "").strip()
             func_doc = FunctionDoc(func_name, file_path)
+            func_doc.line = lineno
             current_field = None
             continue
-        
+
         if not func_doc:
-            break
-        
+            continue
+
         # Check for purpose
         if line.startswith("# Purpose.:"):
             func_doc.purpose = line.replace("# Purpose.:", "").strip()
             current_field = "purpose"
             continue
-        
+
         # Check for args
         if line.startswith("# Args...."):
             arg_text = line.replace("# Args....:", "").strip()
@@ -201,29 +267,36 @@ def parse_function_header(file_path, start_line):
                 func_doc.args.append(arg_text)
             current_field = "args"
             continue
-        
+
         # Check for returns
         if line.startswith("# Returns."):
             func_doc.returns = line.replace("# Returns.:", "").strip()
             current_field = "returns"
             continue
-        
+
         # Check for output
         if line.startswith("# Output.."):
             func_doc.output = line.replace("# Output..:", "").strip()
             current_field = "output"
             continue
-        
+
         # Check for notes
         if line.startswith("# Notes..."):
             func_doc.notes = line.replace("# Notes...:", "").strip()
             current_field = "notes"
             continue
-        
-        # Check for separator line (end of header)
-        if line.startswith("# ------"):
-            break
-        
+
+        # Separator line or non-comment line ends the header
+        if line.startswith("# ------") or not line.startswith("#"):
+            if func_doc.name:
+                functions.append(func_doc)
+                pending[func_doc.name] = func_doc
+            func_doc = None
+            # A header directly followed by its definition
+            if match and match.group(1) in pending:
+                pending.pop(match.group(1)).line = lineno
+            continue
+
         # Check for continuation lines
         if line.startswith("#          ") or line.startswith("#           "):
             continuation = line[11:].strip() if line.startswith("#          ") else line[12:].strip()
@@ -234,34 +307,172 @@ def parse_function_header(file_path, start_line):
                     func_doc.notes += "\n" + continuation
                 else:
                     func_doc.notes = continuation
+
+    if func_doc and func_doc.name:
+        functions.append(func_doc)
+
+    return functions, definitions
+
+
+def code_tokens(lines):
+    """Yield (line number, code) with comments, strings and heredocs removed
+
+    Literal text is dropped so function names in usage examples and log
+    messages do not count as calls: single-quoted and $'...' strings, the
+    text of double-quoted strings (command substitutions inside them are
+    kept), parameter names, comments and heredoc bodies. Quotes may span
+    lines.
+    """
+    quote = None        # None, "'", '"' or "$'"
+    nested = []         # (closing char, quote state to restore) per $( ( ${
+    heredocs = []       # pending (delimiter, strip leading tabs)
+    for lineno, line in enumerate(lines, 1):
+        if heredocs:
+            delim, strip_tabs = heredocs[0]
+            if (line.lstrip("\t") if strip_tabs else line).rstrip() == delim:
+                heredocs.pop(0)
             continue
-        
-        # If we hit a non-comment line, we're done
-        if not line.startswith("#"):
-            break
-    
-    return func_doc
+        code = []
+        i, n = 0, len(line)
+        while i < n:
+            c = line[i]
+            if quote in ("'", "$'"):
+                if c == "\\" and quote == "$'":
+                    i += 2
+                    continue
+                if c == "'":
+                    quote = None
+                i += 1
+                continue
+            if c == "\\":
+                i += 2
+                continue
+            if line.startswith("${", i):
+                # Parameter expansion: skip the name, keep nested words
+                nested.append(("}", quote))
+                quote = None
+                match = PARAM_RE.match(line, i + 2)
+                i = match.end() if match else i + 2
+                code.append(" ")
+                continue
+            if nested and c == nested[-1][0]:
+                quote = nested.pop()[1]
+                code.append(" ")
+                i += 1
+                continue
+            if quote == '"':
+                if line.startswith("$(", i) and not line.startswith("$((", i):
+                    nested.append((")", quote))
+                    quote = None
+                    code.append(" ")
+                    i += 2
+                    continue
+                if c == '"':
+                    quote = None
+                i += 1
+                continue
+            if c == "#" and (i == 0 or line[i - 1] in " \t;|&("):
+                break
+            if c == "'":
+                quote = "'"
+            elif line.startswith("$'", i):
+                quote = "$'"
+                i += 1
+            elif c == '"':
+                quote = '"'
+            elif c == "(":
+                nested.append((")", None))
+            elif line.startswith("<<", i) and not line.startswith("<<<", i):
+                match = HEREDOC_RE.match(line, i)
+                if match:
+                    heredocs.append((match.group(3), bool(match.group(1))))
+                    i = match.end()
+                    continue
+            code.append(c if quote is None else " ")
+            i += 1
+        yield lineno, "".join(code)
+
+
+def find_calls(lines, names, definitions):
+    """Find the lines calling any of the given function names
+
+    Only code is searched (see code_tokens), and the definition line of the
+    function itself is ignored. Returns {name: [line, ...]}.
+    """
+    calls = defaultdict(list)
+    for lineno, code in code_tokens(lines):
+        for token in set(TOKEN_RE.findall(code)):
+            if token in names and definitions.get(token) != lineno:
+                calls[token].append(lineno)
+    return calls
+
+
+def load_cache(use_cache=True):
+    """Load the parse cache (empty if disabled, missing or outdated)"""
+    if not use_cache or not CACHE_FILE.is_file():
+        return {}
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != CACHE_VERSION:
+        return {}
+    return cache.get("files", {})
+
+
+def save_cache(files):
+    """Write the parse cache; a failure only costs the next run a full parse"""
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"version": CACHE_VERSION, "files": files}, f, sort_keys=True)
+        tmp_file.replace(CACHE_FILE)
+    except OSError as e:
+        print(f"[WARN] Could not write cache {CACHE_FILE}: {e}")
+
+
+def scan_file(file_path, cache, new_cache):
+    """Scan a file and extract all function documentation
+
+    Reads the file once; headers are taken from the cache when the content
+    hash matches the cached entry. Returns (functions, content_hash, lines)
+    where lines is None for cache hits.
+    """
+    data = file_path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    key = str(file_path.relative_to(PROJECT_ROOT))
+
+    cached = cache.get(key)
+    lines = None
+    if cached and cached.get("sha256") == digest:
+        functions = [FunctionDoc.from_dict(d, file_path) for d in cached["functions"]]
+        definitions = cached["definitions"]
+        calls = cached.get("calls")
+    else:
+        lines = data.decode('utf-8').splitlines()
+        functions, definitions = parse_headers(lines, file_path)
+        calls = None
 
+    new_cache[key] = {
+        "sha256": digest,
+        "functions": [func.to_dict() for func in functions],
+        "definitions": definitions,
+        "calls": calls,
+    }
+    return functions, digest, lines
 
-def scan_file(file_path):
-    """Scan a file and extract all function documentation"""
-    functions = []
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    for i, line in enumerate(lines):
-        if line.startswith("# Function:"):
-            func_doc = parse_function_header(file_path, i)
-            if func_doc and func_doc.name:
-                functions.append(func_doc)
-    
-    return functions
 
+def scan_all_files(cache, new_cache):
+    """Scan all source files and extract function documentation
 
-def scan_all_files():
-    """Scan all source files and extract function documentation"""
+    Returns (functions_by_category, inputs_by_category) where the inputs are
+    the (file, content hash) pairs each category page is built from.
+    """
     functions_by_category = defaultdict(list)
+    inputs_by_category = defaultdict(list)
+    file_lines = {}
     total_functions = 0
     
     print("=" * 72)
@@ -270,35 +481,123 @@ def scan_all_files():
     print()
     print("[INFO] Scanning source files for functions...")
     
-    # Scan lib files
-    for pattern in ["*.sh", "plugins/*.sh"]:
-        for file_path in SRC_LIB_DIR.glob(pattern):
-            if file_path.is_file():
-                functions = scan_file(file_path)
-                if functions:
-                    category = get_category(file_path)
-                    functions_by_category[category].extend(functions)
-                    print(f"[INFO]   {file_path.name}: {len(functions)} functions")
-                    total_functions += len(functions)
-    
-    # Scan bin files
-    for file_path in SRC_BIN_DIR.glob("*.sh"):
+    # Scan lib files, then bin files
+    sources = [p for pattern in ["*.sh", "plugins/*.sh"] for p in SRC_LIB_DIR.glob(pattern)]
+    sources += list(SRC_BIN_DIR.glob("*.sh"))
+    for file_path in sources:
         if file_path.is_file():
-            functions = scan_file(file_path)
+            functions, digest, lines = scan_file(file_path, cache, new_cache)
+            file_lines[file_path] = lines
             if functions:
                 category = get_category(file_path)
                 functions_by_category[category].extend(functions)
+                inputs_by_category[category].append(f"{file_path.name}:{digest}")
                 print(f"[INFO]   {file_path.name}: {len(functions)} functions")
                 total_functions += len(functions)
     
     print(f"[INFO] Total functions found: {total_functions}")
     print()
     
-    return functions_by_category
+    return functions_by_category, inputs_by_category, file_lines
+
+
+def collect_callers(functions_by_category, file_lines, cache, new_cache):
+    """Build the reverse index {function: ["lib/file.sh:line", ...]}
+
+    Call sites are cached per file and reused while the file content and the
+    set of documented function names are unchanged.
+    """
+    names = sorted({func.name for functions in functions_by_category.values() for func in functions})
+    names_digest = hashlib.sha256("\n".join(names).encode('utf-8')).hexdigest()
+    names_changed = cache.get("_names") != names_digest
+    new_cache["_names"] = names_digest
+    name_set = set(names)
+
+    callers = defaultdict(list)
+    for file_path, lines in file_lines.items():
+        key = str(file_path.relative_to(PROJECT_ROOT))
+        entry = new_cache[key]
+        if entry["calls"] is None or names_changed:
+            if lines is None:
+                lines = file_path.read_text(encoding='utf-8').splitlines()
+            entry["calls"] = find_calls(lines, name_set, entry["definitions"])
+        rel = str(file_path.relative_to(PROJECT_ROOT / "src"))
+        for name, line_numbers in entry["calls"].items():
+            callers[name].extend(f"{rel}:{n}" for n in line_numbers)
+    return callers
+
+
+def tsv_field(value):
+    """Escape a value for the TSV catalog (backslash, tab, newline)"""
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+
+def generate_catalog(functions_by_category, callers):
+    """Write the function catalog as JSON and as a sorted TSV index
+
+    The TSV has one line per function (name, category, source, line,
+    purpose, args, returns, output, notes, callers) sorted by name so
+    oradba_help.sh can look up or prefix-search it without a JSON parser.
+    Returns the names of the files written.
+    """
+    print("[INFO] Generating function catalog")
+
+    entries = []
+    for category, functions in functions_by_category.items():
+        for func in functions:
+            entry = func.to_dict()
+            entry["category"] = category
+            entry["source"] = str(Path(func.source_file).relative_to(PROJECT_ROOT / "src"))
+            entries.append(entry)
+    entries.sort(key=lambda e: (e["name"], e["source"]))
+
+    catalog = {
+        "version": CATALOG_VERSION,
+        "functions": entries,
+        "callers": {name: callers[name] for name in sorted(callers)},
+    }
+    written = []
+    if write_if_changed(CATALOG_JSON, json.dumps(catalog, sort_keys=True, separators=(",", ":")) + "\n"):
+        written.append(CATALOG_JSON.name)
+
+    rows = [f"# OraDBA function catalog v{CATALOG_VERSION}: name, category, source, line, purpose, "
+            "args, returns, output, notes, callers\n"]
+    for e in entries:
+        fields = [e["name"], e["category"], e["source"], e["line"], e["purpose"], "\n".join(e["args"]),
+                  e["returns"], e["output"], e["notes"], ",".join(callers.get(e["name"], []))]
+        rows.append("\t".join(tsv_field(f) for f in fields) + "\n")
+    if write_if_changed(CATALOG_TSV, "".join(rows)):
+        written.append(CATALOG_TSV.name)
+
+    print(f"[INFO]   Catalog generated with {len(entries)} functions, {len(callers)} with call sites")
+    return written
+
+
+def file_digest(file_path):
+    """Return the SHA-256 of a file, or None if it cannot be read"""
+    try:
+        return hashlib.sha256(file_path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def write_if_changed(output_file, content):
+    """Write content to output_file unless it already has that content"""
+    try:
+        if output_file.read_text(encoding='utf-8') == content:
+            return False
+    except OSError:
+        pass
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
 
 
 def generate_category_page(category, functions):
-    """Generate markdown page for a category"""
+    """Generate markdown page for a category
+
+    Returns True if the page was written, False if it was already current.
+    """
     output_file = OUTPUT_DIR / f"{category}.md"
     
     print(f"[INFO] Generating category page: {category}.md")
@@ -306,33 +605,29 @@ def generate_category_page(category, functions):
     title = CATEGORY_TITLES.get(category, category.title())
     description = CATEGORY_DESCRIPTIONS.get(category, "")
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(f"# {title}\n\n")
-        f.write(f"{description}\n\n")
-        
-        # For plugins and scripts categories, disable duplicate heading check
-        # since multiple plugins/scripts have same function names
-        if category in ("plugins", "scripts"):
-            f.write("<!-- markdownlint-disable MD024 -->\n\n")
-        
-        f.write("---\n\n")
-        f.write("## Functions\n\n")
-        
-        # Sort functions alphabetically
-        sorted_functions = sorted(functions, key=lambda x: x.name)
-        for i, func in enumerate(sorted_functions):
-            f.write(func.to_markdown())
-            # Add blank line after separator, except for last function
-            if i < len(sorted_functions) - 1:
-                f.write("\n\n")
-            else:
-                f.write("\n")
-    
-    print(f"[INFO]   Added {len(functions)} functions to {category}.md")
+    parts = [f"# {title}\n\n", f"{description}\n\n"]
+
+    # For plugins and scripts categories, disable duplicate heading check
+    # since multiple plugins/scripts have same function names
+    if category in ("plugins", "scripts"):
+        parts.append("<!-- markdownlint-disable MD024 -->\n\n")
+
+    parts.append("---\n\n")
+    parts.append("## Functions\n\n")
 
+    # Sort functions alphabetically; blank line after each separator except the last
+    sorted_functions = sorted(functions, key=lambda x: x.name)
+    parts.append("\n\n".join(func.to_markdown() for func in sorted_functions))
+    parts.append("\n")
 
-def generate_index_page():
-    """Generate API reference index page"""
+    written = write_if_changed(output_file, "".join(parts))
+    state = "Added" if written else "Unchanged,"
+    print(f"[INFO]   {state} {len(functions)} functions in {category}.md")
+    return written
+
+
+def generate_index_page(functions_by_category):
+    """Generate API reference index page (returns True if written)"""
     output_file = OUTPUT_DIR / "index.md"
     
     print("[INFO] Generating index page")
@@ -356,11 +651,11 @@ Core utility functions used throughout OraDBA including logging, PATH management
 
 **Key Functions:**
 
-- [`oradba_log`](common.md#oradba_log) - Unified logging with configurable levels
-- [`oradba_dedupe_path`](common.md#oradba_dedupe_path) - Remove duplicate PATH entries
-- [`detect_product_type`](common.md#detect_product_type) - Detect Oracle product type from filesystem
-- [`parse_oratab`](common.md#parse_oratab) - Parse oratab file entries
-- [`verify_oracle_env`](common.md#verify_oracle_env) - Verify Oracle environment variables
+- [`oradba_log`](common.md#oradba-log) - Unified logging with configurable levels
+- [`oradba_dedupe_path`](common.md#oradba-dedupe-path) - Remove duplicate PATH entries
+- [`detect_product_type`](common.md#detect-product-type) - Detect Oracle product type from filesystem
+- [`parse_oratab`](common.md#parse-oratab) - Parse oratab file entries
+- [`verify_oracle_env`](common.md#verify-oracle-env) - Verify Oracle environment variables
 
 ### [Registry API](registry.md)
 
@@ -368,11 +663,11 @@ Unified interface for Oracle installation discovery and management, combining or
 
 **Key Functions:**
 
-- [`oradba_registry_get_all`](registry.md#oradba_registry_get_all) - Get all installations
-- [`oradba_registry_get_by_name`](registry.md#oradba_registry_get_by_name) - Get installation by name
-- [`oradba_registry_get_by_type`](registry.md#oradba_registry_get_by_type) - Get installations by type
-- [`oradba_registry_get_status`](registry.md#oradba_registry_get_status) - Check service status
-- [`oradba_registry_validate_entry`](registry.md#oradba_registry_validate_entry) - Validate entry
+- [`oradba_registry_get_all`](registry.md#oradba-registry-get-all) - Get all installations
+- [`oradba_registry_get_by_name`](registry.md#oradba-registry-get-by-name) - Get installation by name
+- [`oradba_registry_get_by_type`](registry.md#oradba-registry-get-by-type) - Get installations by type
+- [`oradba_registry_get_status`](registry.md#oradba-registry-get-status) - Check service status
+- [`oradba_registry_validate_entry`](registry.md#oradba-registry-validate-entry) - Validate entry
 
 ### [Plugin Interface](plugins.md)
 
@@ -381,17 +676,17 @@ other Oracle products.
 
 **Required Plugin Functions:**
 
-- [`plugin_detect_installation`](plugins.md#plugin_detect_installation) - Auto-discover installations
-- [`plugin_validate_home`](plugins.md#plugin_validate_home) - Validate ORACLE_HOME
-- [`plugin_adjust_environment`](plugins.md#plugin_adjust_environment) - Adjust environment variables
-- [`plugin_check_status`](plugins.md#plugin_check_status) - Check service status
-- [`plugin_get_metadata`](plugins.md#plugin_get_metadata) - Extract version and edition
-- [`plugin_should_show_listener`](plugins.md#plugin_should_show_listener) - Determine if listener applies
-- [`plugin_discover_instances`](plugins.md#plugin_discover_instances) - Find instances
-- [`plugin_get_instance_status`](plugins.md#plugin_get_instance_status) - Get instance status
-- [`plugin_get_instance_type`](plugins.md#plugin_get_instance_type) - Get instance type
-- [`plugin_get_pdb_status`](plugins.md#plugin_get_pdb_status) - Get PDB status
-- [`plugin_get_version`](plugins.md#plugin_get_version) - Extract version
+- [`plugin_detect_installation`](plugins.md#plugin-detect-installation) - Auto-discover installations
+- [`plugin_validate_home`](plugins.md#plugin-validate-home) - Validate ORACLE_HOME
+- [`plugin_adjust_environment`](plugins.md#plugin-adjust-environment) - Adjust environment variables
+- [`plugin_check_status`](plugins.md#plugin-check-status) - Check service status
+- [`plugin_get_metadata`](plugins.md#plugin-get-metadata) - Extract version and edition
+- [`plugin_should_show_listener`](plugins.md#plugin-should-show-listener) - Determine if listener applies
+- [`plugin_discover_instances`](plugins.md#plugin-discover-instances) - Find instances
+- [`plugin_get_instance_status`](plugins.md#plugin-get-instance-status) - Get instance status
+- [`plugin_get_instance_type`](plugins.md#plugin-get-instance-type) - Get instance type
+- [`plugin_get_pdb_status`](plugins.md#plugin-get-pdb-status) - Get PDB status
+- [`plugin_get_version`](plugins.md#plugin-get-version) - Extract version
 
 ### [Environment Management](environment.md)
 
@@ -412,10 +707,10 @@ Database-specific operations including query execution, status checks, and datab
 
 **Key Functions:**
 
-- [`execute_db_query`](database.md#execute_db_query) - Execute SQL with simplified interface
-- [`check_database_status`](database.md#check_database_status) - Check if database is running
-- [`check_listener_status`](database.md#check_listener_status) - Check listener status
-- [`get_database_version`](database.md#get_database_version) - Get Oracle database version
+- [`execute_db_query`](database.md#execute-db-query) - Execute SQL with simplified interface
+- [`check_database_status`](database.md#check-database-status) - Check if database is running
+- [`check_listener_status`](database.md#check-listener-status) - Check listener status
+- [`get_database_version`](database.md#get-database-version) - Get Oracle database version
 
 ### [Alias Management](aliases.md)
 
@@ -423,9 +718,9 @@ Alias generation and management for database environments.
 
 **Key Functions:**
 
-- [`generate_sid_lists`](aliases.md#generate_sid_lists) - Generate SID lists
-- [`generate_oracle_home_aliases`](aliases.md#generate_oracle_home_aliases) - Generate Oracle Home aliases
-- [`generate_pdb_aliases`](aliases.md#generate_pdb_aliases) - Generate PDB aliases
+- [`generate_sid_lists`](aliases.md#generate-sid-lists) - Generate SID lists
+- [`generate_oracle_home_aliases`](aliases.md#generate-oracle-home-aliases) - Generate Oracle Home aliases
+- [`generate_pdb_aliases`](aliases.md#generate-pdb-aliases) - Generate PDB aliases
 
 ### [Extension System](extensions.md)
 
@@ -433,9 +728,9 @@ Extension system for loading and managing OraDBA extensions.
 
 **Key Functions:**
 
-- [`oradba_load_extension`](extensions.md#oradba_load_extension) - Load extension from directory
-- [`oradba_list_extensions`](extensions.md#oradba_list_extensions) - List available extensions
-- [`oradba_extension_discover`](extensions.md#oradba_extension_discover) - Discover extension directories
+- [`oradba_load_extension`](extensions.md#oradba-load-extension) - Load extension from directory
+- [`oradba_list_extensions`](extensions.md#oradba-list-extensions) - List available extensions
+- [`oradba_extension_discover`](extensions.md#oradba-extension-discover) - Discover extension directories
 
 ### [Scripts and Commands](scripts.md)
 
@@ -500,6 +795,8 @@ fi
 ## See Also
 
 - [Function Index](function-index.md) - Alphabetical function list
+- `function-catalog.json` / `function-catalog.tsv` - Machine-readable catalog with call sites,
+  used by `oradba help function NAME`
 
 For developer documentation including architecture, development guides, and function header standards,
 see the project repository documentation.
@@ -510,13 +807,24 @@ see the project repository documentation.
 **Last Generated:** {current_date}  
 **OraDBA Version:** v0.19.1+
 """
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(content)
+
+    # Point key function links at the page that documents the function;
+    # functions without a header documentation are not linked
+    documented = {func.name: category
+                  for category, functions in functions_by_category.items() for func in functions}
+
+    def link(match):
+        name = match.group(1)
+        if name not in documented:
+            return f"`{name}`"
+        return f"[`{name}`]({documented[name]}.md#{function_anchor(name)})"
+
+    content = FUNCTION_LINK_RE.sub(link, content)
+    return write_if_changed(output_file, content)
 
 
 def generate_function_index(functions_by_category):
-    """Generate alphabetical function index"""
+    """Generate alphabetical function index (returns True if written)"""
     output_file = OUTPUT_DIR / "function-index.md"
     
     print("[INFO] Generating function index")
@@ -530,41 +838,69 @@ def generate_function_index(functions_by_category):
     # Sort alphabetically
     all_functions.sort(key=lambda x: x[0].lower())
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write("# Function Index\n\n")
-        f.write("Alphabetical index of all OraDBA functions with links to detailed documentation.\n\n")
-        f.write("---\n\n")
-        
-        for func_name, category in all_functions:
-            category_title = CATEGORY_TITLES.get(category, category.title())
-            # Convert function name to anchor format (lowercase with hyphens)
-            anchor = func_name.lower().replace('_', '-')
-            f.write(f"- [`{func_name}`]({category}.md#{anchor}) - {category_title}\n")
-    
+    parts = [
+        "# Function Index\n\n",
+        "Alphabetical index of all OraDBA functions with links to detailed documentation.\n\n",
+        "---\n\n",
+    ]
+    for func_name, category in all_functions:
+        category_title = CATEGORY_TITLES.get(category, category.title())
+        parts.append(f"- [`{func_name}`]({category}.md#{function_anchor(func_name)}) - {category_title}\n")
+
+    written = write_if_changed(output_file, "".join(parts))
     print(f"[INFO]   Function index generated with {len(all_functions)} functions")
+    return written
+
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Generate API reference documentation from function headers")
+    parser.add_argument("--force", action="store_true",
+                        help="ignore the parse cache and regenerate every page")
+    return parser.parse_args()
 
 
 def main():
     """Main execution"""
+    args = parse_args()
+
     # Create output directory
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     print(f"[INFO] Created output directory: {OUTPUT_DIR}")
     print()
     
-    # Scan all files
-    functions_by_category = scan_all_files()
+    # Scan all files (cached headers for unchanged files)
+    cache = load_cache(use_cache=not args.force)
+    new_cache = {}
+    functions_by_category, inputs_by_category, file_lines = scan_all_files(cache, new_cache)
     
-    # Generate category pages
+    # Generate category pages whose inputs changed (or whose page was
+    # modified or removed since the last run)
     print("[INFO] Generating category pages...")
+    previous = cache.get("_categories", {})
+    new_cache["_categories"] = {}
+    written = []
     for category in ["common", "registry", "plugins", "environment", "database", "aliases", "extensions", "scripts"]:
         if category in functions_by_category:
-            generate_category_page(category, functions_by_category[category])
+            inputs = sorted(inputs_by_category[category])
+            page = OUTPUT_DIR / f"{category}.md"
+            if previous.get(category, {}).get("inputs") == inputs and file_digest(page) == previous[category]["page"]:
+                print(f"[INFO] Skipping category page: {category}.md (sources unchanged)")
+            elif generate_category_page(category, functions_by_category[category]):
+                written.append(f"{category}.md")
+            new_cache["_categories"][category] = {"inputs": inputs, "page": file_digest(page)}
     
     print()
     
-    # Generate index and function index
-    generate_index_page()
-    generate_function_index(functions_by_category)
+    # Index carries the generation date; only refresh it with the content
+    if written or args.force or not (OUTPUT_DIR / "index.md").is_file():
+        if generate_index_page(functions_by_category):
+            written.append("index.md")
+    if generate_function_index(functions_by_category):
+        written.append("function-index.md")
+    callers = collect_callers(functions_by_category, file_lines, cache, new_cache)
+    written.extend(generate_catalog(functions_by_category, callers))
+    save_cache(new_cache)
     
     print()
     print("=" * 72)
@@ -573,9 +909,10 @@ def main():
     print("=" * 72)
     print()
     print("Generated files:")
-    for file in sorted(OUTPUT_DIR.glob("*.md")):
+    for file in sorted(list(OUTPUT_DIR.glob("*.md")) + [CATALOG_JSON, CATALOG_TSV]):
         size = file.stat().st_size
-        print(f"  {file.name:30s} {size:>10,} bytes")
+        state = "written" if file.name in written else "unchanged"
+        print(f"  {file.name:30s} {size:>10,} bytes  {state}")
     print()
 
 
@@ -9,6 +9,8 @@
 # Revision...: 0.21.0
 # Purpose....: Monitor long-running operations in v$session_longops
 # Notes......: Generic script for monitoring RMAN, DataPump, and other operations
+#              Watch mode keeps one SQL*Plus session per SID open and derives
+#              throughput and ETA from the deltas between samples
 # Reference..: https://github.com/oehrlis/oradba
 # License....: Apache License Version 2.0, January 2004 as shown
 #              at http://www.apache.org/licenses/
@@ -45,6 +47,7 @@ debug_log() {
 # Default values
 WATCH_MODE=false
 WATCH_INTERVAL=5
+WATCH_COUNT=0
 OPERATION_FILTER=""
 SHOW_ALL=false
 SID_LIST=""
@@ -68,6 +71,7 @@ OPTIONS:
     -a, --all               Show all operations (completed and running)
     -w, --watch             Watch mode - continuously monitor operations
     -i, --interval SECONDS  Watch interval in seconds (default: 5)
+    -c, --count N           Stop watch mode after N refreshes (default: 0 = until Ctrl+C)
     -d, --debug             Enable debug logging
     -h, --help              Show this help message
 
@@ -87,6 +91,9 @@ EXAMPLES:
     # Monitor all long operations in multiple databases
     ${SCRIPT_NAME} -a ORCL FREE CDB1
 
+    # Watch RMAN in three databases in one merged view
+    ${SCRIPT_NAME} -o "RMAN%" -w CDB1 CDB2 CDB3
+
     # Monitor specific operation pattern with debug
     ${SCRIPT_NAME} -o "%Backup%" --debug
 
@@ -98,6 +105,13 @@ COMMON OPERATION PATTERNS:
     %Restore%       - All restore operations
     %Table Scan%    - Full table scan operations
 
+WATCH MODE:
+    Opens one SYSDBA session per SID and polls v\$session_longops through it
+    (no logon per refresh). All SIDs are shown in one table. Rate is the work
+    done per second (units of the operation) between the last two samples;
+    ETA is derived from that rate, Oracle's own estimate is shown as well.
+    Falls back to a new SQL*Plus call per refresh if no session can be opened.
+
 DEBUG MODE:
     Enable with --debug flag or ORADBA_DEBUG=true environment variable.
     Shows SQL query construction, filter application, environment sourcing.
@@ -141,6 +155,11 @@ parse_args() {
                 debug_log "Set watch interval: ${WATCH_INTERVAL} seconds"
                 shift 2
                 ;;
+            -c | --count)
+                WATCH_COUNT="$2"
+                debug_log "Set watch count: ${WATCH_COUNT}"
+                shift 2
+                ;;
             -d | --debug)
                 DEBUG_ENABLED=true
                 debug_log "Debug mode activated via command line flag"
@@ -180,34 +199,10 @@ parse_args() {
 # ------------------------------------------------------------------------------
 monitor_longops() {
     local sid=$1
-    local where_clause=""
+    local where_clause
 
     debug_log "Starting monitor_longops for SID: ${sid}"
-    
-    # Build WHERE clause based on filters
-    if [[ -n "${OPERATION_FILTER}" ]]; then
-        where_clause="opname LIKE '${OPERATION_FILTER}'"
-        debug_log "Applied operation filter: ${OPERATION_FILTER}"
-    fi
-
-    if [[ "${SHOW_ALL}" != "true" ]]; then
-        if [[ -n "${where_clause}" ]]; then
-            where_clause="${where_clause} AND totalwork != 0 AND sofar <> totalwork"
-        else
-            where_clause="totalwork != 0 AND sofar <> totalwork"
-        fi
-        debug_log "Applied running operations filter (excluding completed)"
-    else
-        debug_log "Show all operations enabled (including completed)"
-    fi
-
-    # Add WHERE keyword if we have conditions
-    if [[ -n "${where_clause}" ]]; then
-        where_clause="WHERE ${where_clause}"
-        debug_log "Final WHERE clause: ${where_clause}"
-    else
-        debug_log "No WHERE clause filters applied"
-    fi
+    where_clause=$(build_where_clause)
 
     debug_log "Executing SQL query against v\$session_longops"
     debug_log "Current ORACLE_SID: ${ORACLE_SID:-<not set>}"
@@ -256,6 +251,180 @@ EOF
     debug_log "SQL query completed with exit code: ${sqlplus_exit_code}"
 }
 
+# ------------------------------------------------------------------------------
+# Function: load_sid_env
+# Purpose.: Set the Oracle environment of a SID via oraenv.sh
+# Args....: $1 - Oracle SID
+# Returns.: 0 (a failing oraenv.sh keeps the current environment)
+# Output..: None
+# Notes...: oraenv.sh and the configuration it loads are not written for
+#           nounset, so set -u is suspended while sourcing
+# ------------------------------------------------------------------------------
+load_sid_env() {
+    local sid=$1
+
+    if [[ ! -f "${SCRIPT_DIR}/oraenv.sh" ]]; then
+        debug_log "oraenv.sh not found, using current environment"
+        return 0
+    fi
+
+    debug_log "Sourcing Oracle environment for SID: ${sid}"
+    set +u
+    # shellcheck source=oraenv.sh
+    if source "${SCRIPT_DIR}/oraenv.sh" "${sid}" > /dev/null 2>&1; then
+        debug_log "Successfully sourced environment for SID: ${sid}"
+    else
+        debug_log "WARNING: Failed to source environment for SID: ${sid}"
+    fi
+    set -u
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: build_where_clause
+# Purpose.: Build the WHERE clause for v$session_longops from the filters
+# Args....: None (uses OPERATION_FILTER, SHOW_ALL)
+# Returns.: 0
+# Output..: WHERE clause (empty if no filter applies)
+# ------------------------------------------------------------------------------
+build_where_clause() {
+    local where_clause=""
+
+    # Build WHERE clause based on filters
+    if [[ -n "${OPERATION_FILTER}" ]]; then
+        where_clause="opname LIKE '${OPERATION_FILTER}'"
+        debug_log "Applied operation filter: ${OPERATION_FILTER}"
+    fi
+
+    if [[ "${SHOW_ALL}" != "true" ]]; then
+        if [[ -n "${where_clause}" ]]; then
+            where_clause="${where_clause} AND totalwork != 0 AND sofar <> totalwork"
+        else
+            where_clause="totalwork != 0 AND sofar <> totalwork"
+        fi
+        debug_log "Applied running operations filter (excluding completed)"
+    else
+        debug_log "Show all operations enabled (including completed)"
+    fi
+
+    # Add WHERE keyword if we have conditions
+    if [[ -n "${where_clause}" ]]; then
+        where_clause="WHERE ${where_clause}"
+        debug_log "Final WHERE clause: ${where_clause}"
+    else
+        debug_log "No WHERE clause filters applied"
+    fi
+    echo "${where_clause}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: open_watch_session
+# Purpose.: Make sure a persistent SQL*Plus session is open for a SID
+# Args....: $1 - Oracle SID
+# Returns.: 0 if a session is open, 1 if one-shot SQL*Plus calls are needed
+# Output..: None
+# Notes...: Sources oraenv.sh only when the session has to be (re)opened, so
+#           a session that ended (e.g. instance restart) is replaced on the
+#           next refresh. Must run in the main shell (not in $(...)).
+# ------------------------------------------------------------------------------
+open_watch_session() {
+    local sid=$1
+
+    export ORACLE_SID="${sid}"
+    export ORACLE_HOME="${WATCH_HOMES[${sid}]:-${ORACLE_HOME:-}}"
+    oradba_sql_session_active && return 0
+
+    load_sid_env "${sid}"
+    export ORACLE_SID="${sid}"
+    WATCH_HOMES[${sid}]="${ORACLE_HOME:-}"
+
+    if oradba_sql_session_open; then
+        debug_log "Opened monitoring session for ${sid}"
+        return 0
+    fi
+    debug_log "WARNING: No persistent session for ${sid}, using one SQL*Plus call per refresh"
+    return 1
+}
+
+# ------------------------------------------------------------------------------
+# Function: sample_longops
+# Purpose.: Take one v$session_longops sample of a SID
+# Args....: $1 - Oracle SID
+#           $2 - WHERE clause
+# Returns.: 0
+# Output..: Rows db|sid|serial#|opname|sofar|totalwork|units|last_update|
+#           elapsed|time_remaining|start|message (times in epoch seconds)
+# Notes...: Runs through the SID's open session via execute_db_query
+# ------------------------------------------------------------------------------
+sample_longops() {
+    local sid=$1
+    local where_clause=$2
+    local rows line
+
+    rows=$(execute_db_query "SELECT sid || '|' || serial# || '|' || SUBSTR(REPLACE(opname, '|', '/'), 1, 30)
+    || '|' || sofar || '|' || totalwork || '|' || units
+    || '|' || ROUND((last_update_time - DATE '1970-01-01') * 86400)
+    || '|' || elapsed_seconds || '|' || NVL(time_remaining, 0)
+    || '|' || ROUND((start_time - DATE '1970-01-01') * 86400)
+    || '|' || SUBSTR(REPLACE(message, '|', '/'), 1, 60)
+FROM v\$session_longops
+${where_clause}
+ORDER BY start_time DESC, sid;" raw) || true
+
+    while IFS= read -r line; do
+        [[ "${line}" == *"|"* ]] && printf '%s|%s\n' "${sid}" "${line}"
+    done <<< "${rows}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: render_watch
+# Purpose.: Print the merged long operations table with rate and ETA
+# Args....: $1 - State file with the previous samples (updated)
+# Returns.: 0
+# Output..: Table to stdout; input rows from sample_longops on stdin
+# Notes...: Rate = sofar delta / last_update_time delta of the same operation
+#           (db, sid, serial#, opname, start). Without a delta yet, or while
+#           Oracle has not updated the row, the previous rate or the average
+#           since start is used. ETA = (totalwork - sofar) / rate.
+# ------------------------------------------------------------------------------
+render_watch() {
+    local state_file=$1
+
+    awk -F'|' -v state="${state_file}" '
+        function hms(s) {
+            if (s < 0) return "-"
+            return sprintf("%d:%02d:%02d", int(s / 3600), int(s % 3600 / 60), int(s % 60))
+        }
+        FILENAME == state {
+            key = $1 "|" $2 "|" $3 "|" $4 "|" $5
+            prev_sofar[key] = $6; prev_t[key] = $7; prev_rate[key] = $8
+            next
+        }
+        {
+            key = $1 "|" $2 "|" $3 "|" $4 "|" $11
+            sofar = $5; total = $6; t = $8
+            if ((key in prev_t) && t > prev_t[key] && sofar >= prev_sofar[key]) {
+                rate = (sofar - prev_sofar[key]) / (t - prev_t[key])
+            } else if (key in prev_rate) {
+                rate = prev_rate[key]
+            } else {
+                rate = ($9 > 0) ? sofar / $9 : 0
+            }
+            eta = (rate > 0 && total > 0) ? (total - sofar) / rate : -1
+            pct = (total > 0) ? sofar / total * 100 : 0
+            out[++n] = sprintf("%-10s %5s %6s %-30s %6.1f %12s %12s %-8s %10.1f %9s %9s", $1, $2, $3, $4,
+                pct, sofar, total, substr($7, 1, 8), rate, hms(eta), hms($10))
+            new_state = new_state key "|" sofar "|" t "|" rate "\n"
+        }
+        END {
+            printf "%-10s %5s %6s %-30s %6s %12s %12s %-8s %10s %9s %9s\n", "DB", "SID", "Ser#",
+                "Operation", "Pct%", "So Far", "Total", "Units", "Rate/s", "ETA", "ETA(ora)"
+            for (i = 1; i <= n; i++) print out[i]
+            if (n == 0) print "no long operations"
+            printf "%s", new_state > state
+        }' "${state_file}" -
+}
+
 # ------------------------------------------------------------------------------
 # Function: display_header
 # Purpose.: Display formatted header with timestamp and database info
@@ -277,13 +446,89 @@ display_header() {
     echo "================================================================================"
 }
 
+# ------------------------------------------------------------------------------
+# Function: run_watch
+# Purpose.: Refresh the merged long operations view until stopped
+# Args....: $1 - Space separated SID list
+# Returns.: 0 after WATCH_COUNT refreshes (loops forever if 0)
+# Output..: Merged table of all SIDs per refresh
+# Notes...: One persistent session per SID (ORADBA_SQL_SESSION); the idle
+#           timeout is raised to cover the interval. Without the common
+#           library each refresh runs monitor_longops per SID instead.
+# ------------------------------------------------------------------------------
+run_watch() {
+    local sid_list=$1
+    local where_clause sid mode rows
+    local iteration=1
+    local -a sids
+    read -ra sids <<< "${sid_list}"
+    declare -gA WATCH_HOMES=()
+
+    where_clause=$(build_where_clause)
+    # Previous samples for the rate calculation; the SQL session library
+    # keeps this trap when it adds its own cleanup
+    WATCH_STATE_FILE=$(mktemp "${TMPDIR:-/tmp}/longops.XXXXXX")
+    trap 'rm -f "${WATCH_STATE_FILE}"' EXIT
+
+    mode="session"
+    if ! command -v oradba_sql_session_open > /dev/null 2>&1; then
+        mode="legacy"
+    else
+        export ORADBA_SQL_SESSION=true
+        local idle="${ORADBA_SQL_SESSION_IDLE:-300}" min_idle
+        min_idle=$(awk -v i="${WATCH_INTERVAL}" 'BEGIN { printf "%d", i * 3 + 1 }')
+        ((idle < min_idle)) && idle=${min_idle}
+        export ORADBA_SQL_SESSION_IDLE=${idle}
+    fi
+    debug_log "Watch mode: ${mode}, SIDs: ${sids[*]}"
+
+    while true; do
+        debug_log "Watch mode iteration ${iteration}"
+        rows=""
+        if [[ "${mode}" == "session" ]]; then
+            for sid in "${sids[@]}"; do
+                open_watch_session "${sid}" || true
+                rows+=$(sample_longops "${sid}" "${where_clause}")$'\n'
+            done
+        fi
+
+        if [[ -t 1 ]]; then
+            clear
+        fi
+        echo "================================================================================"
+        printf 'Long Operations Monitor - %s - %s\n' "$(IFS=,; echo "${sids[*]}")" "$(date '+%Y-%m-%d %H:%M:%S')"
+        if [[ -n "${OPERATION_FILTER}" ]]; then
+            echo "Filter: ${OPERATION_FILTER}"
+        fi
+        echo "================================================================================"
+
+        if [[ "${mode}" == "session" ]]; then
+            printf '%s' "${rows}" | render_watch "${WATCH_STATE_FILE}"
+        else
+            for sid in "${sids[@]}"; do
+                display_header "${sid}"
+                load_sid_env "${sid}"
+                monitor_longops "${sid}"
+            done
+        fi
+        echo ""
+
+        if ((WATCH_COUNT > 0 && iteration >= WATCH_COUNT)); then
+            break
+        fi
+        echo "Next refresh in ${WATCH_INTERVAL} seconds... (Ctrl+C to exit)"
+        sleep "${WATCH_INTERVAL}"
+        iteration=$((iteration + 1))
+    done
+}
+
 # ------------------------------------------------------------------------------
 # Function: run_monitor
 # Purpose.: Execute monitoring for all specified SIDs (single shot or watch mode)
 # Args....: None (uses global SID_LIST, ORACLE_SID, WATCH_MODE, WATCH_INTERVAL)
 # Returns.: 0 on success, 1 if no SID specified
 # Output..: Monitoring results for each SID to stdout
-# Notes...: Watch mode clears screen and loops with WATCH_INTERVAL; sources oraenv per SID
+# Notes...: Watch mode is handled by run_watch; single run sources oraenv per SID
 # ------------------------------------------------------------------------------
 run_monitor() {
     local sid_to_monitor="${SID_LIST:-${ORACLE_SID:-}}"
@@ -311,40 +556,7 @@ run_monitor() {
         echo "Starting watch mode (Ctrl+C to exit)..."
         echo ""
 
-        local iteration=1
-        while true; do
-            debug_log "Watch mode iteration ${iteration}"
-            
-            # Clear screen
-            clear
-
-            # Loop over SID list
-            for sid in ${sid_to_monitor}; do
-                debug_log "Processing SID: ${sid} in watch mode"
-                display_header "${sid}"
-
-                # Source Oracle environment if oraenv.sh is available
-                if [[ -f "${SCRIPT_DIR}/oraenv.sh" ]]; then
-                    debug_log "Sourcing Oracle environment for SID: ${sid}"
-                    # shellcheck source=oraenv.sh
-                    if source "${SCRIPT_DIR}/oraenv.sh" "${sid}" > /dev/null 2>&1; then
-                        debug_log "Successfully sourced environment for SID: ${sid}"
-                    else
-                        debug_log "WARNING: Failed to source environment for SID: ${sid}"
-                    fi
-                else
-                    debug_log "oraenv.sh not found, using current environment"
-                fi
-
-                monitor_longops "${sid}"
-                echo ""
-            done
-
-            echo "Next refresh in ${WATCH_INTERVAL} seconds... (Ctrl+C to exit)"
-            debug_log "Sleeping for ${WATCH_INTERVAL} seconds before next iteration"
-            sleep "${WATCH_INTERVAL}"
-            iteration=$((iteration + 1))
-        done
+        run_watch "${sid_to_monitor}"
     else
         debug_log "Starting single run mode"
         # Single run mode
@@ -354,19 +566,7 @@ run_monitor() {
             echo "Long Operations for ${sid}"
             echo "================================================================================"
 
-            # Source Oracle environment if oraenv.sh is available
-            if [[ -f "${SCRIPT_DIR}/oraenv.sh" ]]; then
-                debug_log "Sourcing Oracle environment for SID: ${sid}"
-                # shellcheck source=oraenv.sh
-                if source "${SCRIPT_DIR}/oraenv.sh" "${sid}" > /dev/null 2>&1; then
-                    debug_log "Successfully sourced environment for SID: ${sid}"
-                else
-                    debug_log "WARNING: Failed to source environment for SID: ${sid}"
-                fi
-            else
-                debug_log "oraenv.sh not found, using current environment"
-            fi
-
+            load_sid_env "${sid}"
             monitor_longops "${sid}"
             echo ""
         done
@@ -67,15 +67,35 @@ CHECKS_FAILED=0
 CHECKS_WARNING=0
 CHECKS_INFO=0
 
+# Record file of the check running in this (worker) shell, see run_checks
+CHECK_RECORD_FILE=""
+
+# ------------------------------------------------------------------------------
+# Function: _check_record
+# Purpose.: Append a result line to the record file of the running check
+# Args....: $1 - Level (HEADER, PASS, FAIL, WARN, INFO)
+#           $2 - Message
+# Returns.: 0 if recorded, 1 if no check is running in this shell
+# Output..: None
+# Notes...: One "LEVEL<TAB>message" line per call, newlines in the message
+#           are stored as \037 and restored by the renderers
+# ------------------------------------------------------------------------------
+_check_record() {
+    [[ -n "${CHECK_RECORD_FILE}" ]] || return 1
+    printf '%s\t%s\n' "$1" "${2//$'\n'/$'\037'}" >> "${CHECK_RECORD_FILE}"
+}
+
 # ------------------------------------------------------------------------------
 # Function: log_pass
 # Purpose.: Log successful check with green checkmark
 # Args....: $1 - Success message
 # Returns.: None
 # Output..: Green ✓ followed by message (suppressed in quiet mode)
-# Notes...: Increments CHECKS_PASSED counter; respects --quiet flag
+# Notes...: Increments CHECKS_PASSED counter; respects --quiet flag. Inside a
+#           check worker the message is recorded instead (see run_checks)
 # ------------------------------------------------------------------------------
 log_pass() {
+    _check_record PASS "$1" && return
     CHECKS_PASSED=$((CHECKS_PASSED + 1))
     [[ "$QUIET" == "true" ]] && return # Don't show passes in quiet mode
     echo -e "  ${GREEN}[OK]${NC} $1"
@@ -87,9 +107,11 @@ log_pass() {
 # Args....: $1 - Failure message
 # Returns.: None
 # Output..: Red ✗ followed by message (always displayed)
-# Notes...: Increments CHECKS_FAILED counter; never suppressed (critical errors)
+# Notes...: Increments CHECKS_FAILED counter; never suppressed (critical errors).
+#           Inside a check worker the message is recorded instead
 # ------------------------------------------------------------------------------
 log_fail() {
+    _check_record FAIL "$1" && return
     CHECKS_FAILED=$((CHECKS_FAILED + 1))
     echo -e "  ${RED}[FAIL]${NC} $1"
 }
@@ -100,9 +122,11 @@ log_fail() {
 # Args....: $1 - Warning message
 # Returns.: None
 # Output..: Yellow ⚠ followed by message (suppressed in quiet mode)
-# Notes...: Increments CHECKS_WARNING counter; respects --quiet flag
+# Notes...: Increments CHECKS_WARNING counter; respects --quiet flag. Inside a
+#           check worker the message is recorded instead
 # ------------------------------------------------------------------------------
 log_warn() {
+    _check_record WARN "$1" && return
     CHECKS_WARNING=$((CHECKS_WARNING + 1))
     [[ "$QUIET" == "true" ]] && return # Don't show warnings in quiet mode
     echo -e "  ${YELLOW}[WARN]${NC} $1"
@@ -114,9 +138,11 @@ log_warn() {
 # Args....: $1 - Informational message
 # Returns.: None
 # Output..: Blue ℹ followed by message (suppressed in quiet mode)
-# Notes...: Increments CHECKS_INFO counter; respects --quiet flag
+# Notes...: Increments CHECKS_INFO counter; respects --quiet flag. Inside a
+#           check worker the message is recorded instead
 # ------------------------------------------------------------------------------
 log_info() {
+    _check_record INFO "$1" && return
     CHECKS_INFO=$((CHECKS_INFO + 1))
     [[ "$QUIET" == "true" ]] && return # Don't show info in quiet mode
     echo -e "  ${BLUE}[INFO]${NC} $1"
@@ -142,9 +168,11 @@ log_debug() {
 # Args....: $1 - Header text
 # Returns.: None
 # Output..: Blank line, bold header text, dynamic underline (suppressed in quiet mode)
-# Notes...: Underline matches header length; respects --quiet flag
+# Notes...: Underline matches header length; respects --quiet flag. Inside a
+#           check worker the header is recorded instead
 # ------------------------------------------------------------------------------
 log_header() {
+    _check_record HEADER "$1" && return
     [[ "$QUIET" == "true" ]] && return # Don't show headers in quiet mode
     echo ""
     echo -e "${BOLD}$1${NC}"
@@ -172,7 +200,10 @@ USAGE:
 OPTIONS:
     -d, --dir PATH      Check disk space for specific directory
     -q, --quiet         Minimal output (errors only)
-    -v, --verbose       Verbose output with additional details
+    -v, --verbose       Verbose output with additional details and check timings
+    -j, --jobs N        Run up to N checks concurrently (default: 4)
+    -t, --timeout SEC   Timeout for every check (default: per check, 10-60s)
+    --json              Print results as JSON (status, message, duration per check)
     --debug             Enable debug logging (detailed operation tracking)
     -h, --help          Show this help message
     --version           Show version information
@@ -195,6 +226,9 @@ EXAMPLES:
     # Verbose output for troubleshooting
     $SCRIPT_NAME --verbose
 
+    # Machine-readable results for configuration management
+    $SCRIPT_NAME --json --timeout 20
+
 CHECKS PERFORMED:
     - System tools and utilities (bash, tar, awk, sed, grep)
     - Checksum tools (sha256sum/shasum)
@@ -220,6 +254,9 @@ EOF
 CHECK_DIR="${HOME}/oradba"
 VERBOSE=false
 QUIET=false
+OUTPUT_JSON=false
+CHECK_JOBS="${ORADBA_CHECK_JOBS:-4}"
+CHECK_TIMEOUT="${ORADBA_CHECK_TIMEOUT:-}"
 
 while [[ $# -gt 0 ]]; do
     case $1 in
@@ -235,6 +272,26 @@ while [[ $# -gt 0 ]]; do
             VERBOSE=true
             shift
             ;;
+        -j | --jobs)
+            if [[ ! "${2:-}" =~ ^[1-9][0-9]*$ ]]; then
+                echo "Error: --jobs requires a positive number"
+                exit 2
+            fi
+            CHECK_JOBS="$2"
+            shift 2
+            ;;
+        -t | --timeout)
+            if [[ ! "${2:-}" =~ ^[1-9][0-9]*$ ]]; then
+                echo "Error: --timeout requires a positive number of seconds"
+                exit 2
+            fi
+            CHECK_TIMEOUT="$2"
+            shift 2
+            ;;
+        --json)
+            OUTPUT_JSON=true
+            shift
+            ;;
         --debug)
             ORADBA_DEBUG="true"
             log_debug "oradba_check.sh: Debug mode enabled via --debug flag"
@@ -256,10 +313,10 @@ while [[ $# -gt 0 ]]; do
 done
 
 # Debug summary of parsed arguments
-log_debug "Args parsed: CHECK_DIR='${CHECK_DIR}', QUIET='${QUIET}', VERBOSE='${VERBOSE}', ORADBA_DEBUG='${ORADBA_DEBUG}'"
+log_debug "Args parsed: CHECK_DIR='${CHECK_DIR}', QUIET='${QUIET}', VERBOSE='${VERBOSE}', JSON='${OUTPUT_JSON}', JOBS='${CHECK_JOBS}', TIMEOUT='${CHECK_TIMEOUT}', ORADBA_DEBUG='${ORADBA_DEBUG}'"
 
 # Print banner
-if [[ "$QUIET" != "true" ]]; then
+if [[ "$QUIET" != "true" ]] && [[ "$OUTPUT_JSON" != "true" ]]; then
     # Calculate padding for centered version text
     version_text="Version ${SCRIPT_VERSION}"
     box_width=60 # Inner width of the box
@@ -709,8 +766,9 @@ check_database_connectivity() {
         log_pass "Database process found for $ORACLE_SID"
         log_debug "PMON process detected for SID '${ORACLE_SID}'"
 
-        # Try to connect
-        if timeout 5 sqlplus -S / as sysdba <<< "SELECT 'CONNECTION_OK' FROM DUAL;" 2>&1 | grep -q "CONNECTION_OK"; then
+        # Try to connect (--foreground keeps sqlplus in the worker's process
+        # group, so a check timeout also kills it)
+        if timeout --foreground -k 2 5 sqlplus -S / as sysdba <<< "SELECT 'CONNECTION_OK' FROM DUAL;" 2>&1 | grep -q "CONNECTION_OK"; then
             log_pass "Database connection successful"
             log_debug "sysdba connection succeeded"
 
@@ -868,28 +926,451 @@ check_oradba_installation() {
     fi
 }
 
+# =============================================================================
+# Check Executor
+# =============================================================================
+# Declared checks in report order: name|function|title|critical|timeout|deps
+# - critical checks decide the exit code and are the only ones run in --quiet
+# - timeout is in seconds (overridden by --timeout)
+# - deps is a comma separated list of checks that must have finished first;
+#   a check whose dependency timed out is skipped
+CHECK_DEFS=(
+    "system_info|check_system_info|System Information|false|10|"
+    "system_tools|check_system_tools|System Tools|true|30|"
+    "optional_tools|check_optional_tools|Optional Tools|false|30|"
+    "github_connectivity|check_github_connectivity|GitHub Connectivity|false|15|"
+    "disk_space|check_disk_space|Disk Space|true|30|"
+    "oracle_environment|check_oracle_environment|Oracle Environment Variables|false|10|"
+    "oracle_tools|check_oracle_tools|Oracle Tools|false|30|oracle_environment"
+    "database_connectivity|check_database_connectivity|Database Connectivity|false|30|oracle_tools"
+    "oracle_versions|check_oracle_versions|Oracle Versions|false|60|"
+    "oradba_installation|check_oradba_installation|OraDBA Installation|false|30|"
+)
+
+# Per-check state, indexed like the active checks (see run_checks)
+CHECK_NAME=()
+CHECK_FUNC=()
+CHECK_TITLE=()
+CHECK_CRITICAL=()
+CHECK_LIMIT=()
+CHECK_DEPS=()
+CHECK_STATE=()    # pending|running|done
+CHECK_PID=()      # worker pid (process group leader)
+CHECK_WATCHDOG=() # timeout watchdog pid (process group leader)
+CHECK_STATUS=()   # pass|info|warn|fail|timeout|skipped
+CHECK_MESSAGE=()
+CHECK_DURATION=() # milliseconds
+CHECK_WORK_DIR=""
+
+# ------------------------------------------------------------------------------
+# Function: _check_now_ms
+# Purpose.: Get the current time in milliseconds
+# Args....: $1 - Name of the variable receiving the time
+# Returns.: 0
+# Output..: None
+# Notes...: Uses EPOCHREALTIME (bash 5+) without forking, whole seconds from
+#           date otherwise
+# ------------------------------------------------------------------------------
+_check_now_ms() {
+    if [[ -n "${EPOCHREALTIME:-}" ]]; then
+        local now="${EPOCHREALTIME/[.,]/}"
+        printf -v "$1" '%s' "$((now / 1000))"
+    else
+        printf -v "$1" '%s' "$(($(date +%s) * 1000))"
+    fi
+}
+
+# ------------------------------------------------------------------------------
+# Function: _check_worker
+# Purpose.: Run one check and record its results
+# Args....: $1 - Check index
+# Returns.: 0
+# Output..: None (writes <idx>.rec and, when done, <idx>.rc with
+#           "<exit code> <duration ms>" to the work directory)
+# Notes...: Runs in a background job; log_* calls go to the record file
+# ------------------------------------------------------------------------------
+_check_worker() {
+    local idx="$1"
+    local rc=0 start end
+
+    CHECK_RECORD_FILE="${CHECK_WORK_DIR}/${idx}.rec"
+    : > "${CHECK_RECORD_FILE}"
+    _check_now_ms start
+    "${CHECK_FUNC[$idx]}" || rc=$?
+    _check_now_ms end
+    printf '%s %s\n' "${rc}" "$((end - start))" > "${CHECK_WORK_DIR}/${idx}.tmp"
+    mv -f "${CHECK_WORK_DIR}/${idx}.tmp" "${CHECK_WORK_DIR}/${idx}.rc"
+}
+
+# ------------------------------------------------------------------------------
+# Function: _check_launch
+# Purpose.: Start a check worker and its timeout watchdog
+# Args....: $1 - Check index
+# Returns.: 0
+# Output..: None
+# Notes...: Worker and watchdog get their own process groups (set -m), so a
+#           timeout also stops SQL*Plus, curl etc. started by the check
+# ------------------------------------------------------------------------------
+_check_launch() {
+    local idx="$1"
+    local limit="${CHECK_TIMEOUT:-${CHECK_LIMIT[$idx]}}"
+
+    log_debug "Starting check ${CHECK_NAME[$idx]} (timeout ${limit}s)"
+    set -m
+    _check_worker "$idx" < /dev/null > /dev/null &
+    CHECK_PID[idx]=$!
+    (
+        sleep "${limit}"
+        : > "${CHECK_WORK_DIR}/${idx}.timeout"
+        kill -TERM -- "-${CHECK_PID[$idx]}"
+    ) < /dev/null > /dev/null 2>&1 &
+    CHECK_WATCHDOG[idx]=$!
+    set +m
+    CHECK_STATE[idx]="running"
+}
+
+# ------------------------------------------------------------------------------
+# Function: _check_finish
+# Purpose.: Collect the result of a finished, timed out or skipped check
+# Args....: $1 - Check index
+#           $2 - Optional: skip reason (check was not run)
+# Returns.: 0
+# Output..: None (sets CHECK_STATUS, CHECK_MESSAGE, CHECK_DURATION)
+# Notes...: Status is the most severe recorded level; timeouts, skips and a
+#           non-zero exit without a recorded failure add a result line. On a
+#           timeout the worker's process group is killed, so nothing started
+#           by the check (e.g. a process ignoring TERM) outlives it.
+# ------------------------------------------------------------------------------
+_check_finish() {
+    local idx="$1" reason="${2:-}"
+    local rec="${CHECK_WORK_DIR}/${idx}.rec"
+    local rc="" duration=0 level msg status
+    local limit="${CHECK_TIMEOUT:-${CHECK_LIMIT[$idx]}}"
+    local -a first=() count=()
+
+    if [[ -n "${CHECK_WATCHDOG[$idx]:-}" ]]; then
+        kill -TERM -- "-${CHECK_WATCHDOG[$idx]}" 2> /dev/null || true
+    fi
+    [[ -f "${CHECK_WORK_DIR}/${idx}.rc" ]] && read -r rc duration < "${CHECK_WORK_DIR}/${idx}.rc"
+    touch "${rec}"
+
+    if [[ -n "${reason}" ]]; then
+        status="skipped"
+        _check_record_to "${rec}" INFO "Skipped - ${reason}"
+    elif [[ -z "${rc}" ]]; then
+        status="timeout"
+        duration=$((limit * 1000))
+        kill -KILL -- "-${CHECK_PID[$idx]}" 2> /dev/null || true
+        if [[ -f "${CHECK_WORK_DIR}/${idx}.timeout" ]]; then
+            msg="${CHECK_TITLE[$idx]} check timed out after ${limit}s"
+        else
+            msg="${CHECK_TITLE[$idx]} check terminated unexpectedly"
+        fi
+        if [[ "${CHECK_CRITICAL[$idx]}" == "true" ]]; then
+            _check_record_to "${rec}" FAIL "${msg}"
+        else
+            _check_record_to "${rec}" WARN "${msg}"
+        fi
+    fi
+
+    # Severity order: FAIL > WARN > PASS > INFO
+    while IFS=$'\t' read -r level msg; do
+        case "${level}" in
+            FAIL) level=0 ;;
+            WARN) level=1 ;;
+            PASS) level=2 ;;
+            INFO) level=3 ;;
+            *) continue ;;
+        esac
+        count[level]=$((${count[level]:-0} + 1))
+        [[ -n "${first[level]:-}" ]] || first[level]="${msg//$'\037'/ }"
+    done < "${rec}"
+
+    if [[ -n "${rc}" ]] && [[ "${rc}" != "0" ]] && [[ -z "${count[0]:-}" ]]; then
+        _check_record_to "${rec}" FAIL "${CHECK_TITLE[$idx]} check failed (exit code ${rc})"
+        count[0]=1
+        first[0]="${CHECK_TITLE[$idx]} check failed (exit code ${rc})"
+    fi
+
+    if [[ -z "${status:-}" ]]; then
+        if [[ -n "${count[0]:-}" ]]; then
+            status="fail"
+        elif [[ -n "${count[1]:-}" ]]; then
+            status="warn"
+        elif [[ -n "${count[2]:-}" ]]; then
+            status="pass"
+        else
+            status="info"
+        fi
+    fi
+
+    case "${status}" in
+        fail | timeout) msg="${first[0]:-${first[1]:-}}" ;;
+        warn) msg="${first[1]}" ;;
+        skipped) msg="Skipped - ${reason}" ;;
+        pass)
+            msg="${count[2]} passed"
+            [[ -z "${count[3]:-}" ]] || msg="${msg}, ${count[3]} info"
+            ;;
+        *) msg="${first[3]:-No results}" ;;
+    esac
+    [[ "${status}" =~ ^(fail|warn)$ ]] && [[ $((${count[0]:-0} + ${count[1]:-0})) -gt 1 ]] \
+        && msg="${msg} (+$((${count[0]:-0} + ${count[1]:-0} - 1)) more)"
+
+    CHECK_STATUS[idx]="${status}"
+    CHECK_MESSAGE[idx]="${msg}"
+    CHECK_DURATION[idx]="${duration}"
+    CHECK_STATE[idx]="done"
+    log_debug "Check ${CHECK_NAME[$idx]}: ${status} in ${duration} ms"
+}
+
+# ------------------------------------------------------------------------------
+# Function: _check_record_to
+# Purpose.: Append a result line to a given record file
+# Args....: $1 - Record file
+#           $2 - Level
+#           $3 - Message
+# Returns.: 0
+# Output..: None
+# ------------------------------------------------------------------------------
+_check_record_to() {
+    local CHECK_RECORD_FILE="$1"
+    _check_record "$2" "$3"
+}
+
+# ------------------------------------------------------------------------------
+# Function: render_check_text
+# Purpose.: Print the results of a check with the colored log functions
+# Args....: $1 - Check index
+# Returns.: 0
+# Output..: Section header and one line per result (as log_header/log_pass/...)
+# Notes...: Updates the CHECKS_* counters; --verbose adds the check duration
+#           to the header
+# ------------------------------------------------------------------------------
+render_check_text() {
+    local idx="$1"
+    local level msg header_done=false title="${CHECK_TITLE[$idx]}"
+
+    [[ "$VERBOSE" == "true" ]] && title="${title} (${CHECK_DURATION[$idx]} ms)"
+    while IFS=$'\t' read -r level msg; do
+        msg="${msg//$'\037'/$'\n'}"
+        if [[ "${header_done}" == "false" ]]; then
+            log_header "${title}"
+            header_done=true
+            [[ "${level}" == "HEADER" ]] && continue
+        fi
+        case "${level}" in
+            PASS) log_pass "${msg}" ;;
+            FAIL) log_fail "${msg}" ;;
+            WARN) log_warn "${msg}" ;;
+            INFO) log_info "${msg}" ;;
+        esac
+    done < "${CHECK_WORK_DIR}/${idx}.rec"
+    [[ "${header_done}" == "true" ]] || log_header "${title}"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _json_escape
+# Purpose.: Escape a string for a JSON document
+# Args....: $1 - Name of the variable receiving the escaped string
+#           $2 - String
+# Returns.: 0
+# Output..: None
+# ------------------------------------------------------------------------------
+_json_escape() {
+    local str="$2"
+    str="${str//\\/\\\\}"
+    str="${str//\"/\\\"}"
+    str="${str//$'\037'/\\n}"
+    str="${str//$'\n'/\\n}"
+    str="${str//$'\r'/\\r}"
+    str="${str//$'\t'/\\t}"
+    printf -v "$1" '%s' "${str}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: render_json
+# Purpose.: Print all check results as one JSON document
+# Args....: $1 - Overall result (passed|failed)
+#           $2 - Total duration in milliseconds
+# Returns.: 0
+# Output..: JSON object with host, summary counts and per-check status,
+#           message, duration_ms and result items
+# ------------------------------------------------------------------------------
+render_json() {
+    local result="$1" total_ms="$2"
+    local idx level msg sep item_sep host
+    local passed=0 failed=0 warnings=0 info=0
+
+    _json_escape host "$(hostname 2> /dev/null || echo unknown)"
+    printf '{\n  "tool": "oradba_check",\n  "version": "%s",\n  "host": "%s",\n' "${SCRIPT_VERSION}" "${host}"
+    printf '  "status": "%s",\n  "duration_ms": %s,\n  "jobs": %s,\n  "checks": [' "${result}" "${total_ms}" "${CHECK_JOBS}"
+    sep=""
+    for idx in "${!CHECK_NAME[@]}"; do
+        _json_escape msg "${CHECK_MESSAGE[$idx]}"
+        printf '%s\n    {\n      "name": "%s",\n      "title": "%s",\n      "critical": %s,\n' \
+            "${sep}" "${CHECK_NAME[$idx]}" "${CHECK_TITLE[$idx]}" "${CHECK_CRITICAL[$idx]}"
+        printf '      "status": "%s",\n      "message": "%s",\n      "duration_ms": %s,\n      "items": [' \
+            "${CHECK_STATUS[$idx]}" "${msg}" "${CHECK_DURATION[$idx]}"
+        item_sep=""
+        while IFS=$'\t' read -r level msg; do
+            case "${level}" in
+                PASS) passed=$((passed + 1)) ;;
+                FAIL) failed=$((failed + 1)) ;;
+                WARN) warnings=$((warnings + 1)) ;;
+                INFO) info=$((info + 1)) ;;
+                *) continue ;;
+            esac
+            _json_escape msg "${msg}"
+            printf '%s\n        {"level": "%s", "message": "%s"}' "${item_sep}" "${level}" "${msg}"
+            item_sep=","
+        done < "${CHECK_WORK_DIR}/${idx}.rec"
+        [[ -n "${item_sep}" ]] && printf '\n      '
+        printf ']\n    }'
+        sep=","
+    done
+    printf '\n  ],\n  "summary": {"passed": %s, "failed": %s, "warnings": %s, "info": %s}\n}\n' \
+        "${passed}" "${failed}" "${warnings}" "${info}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: _check_cleanup
+# Purpose.: Stop remaining check workers and remove the work directory
+# Args....: None
+# Returns.: 0
+# Output..: None
+# Notes...: No-op in subshells: a worker or watchdog signalled right after the
+#           fork may still run the inherited traps
+# ------------------------------------------------------------------------------
+_check_cleanup() {
+    local pid
+    [[ ${BASH_SUBSHELL} -eq 0 ]] || return 0
+    if [[ ${#CHECK_PID[@]} -gt 0 ]]; then
+        for pid in "${CHECK_PID[@]}" "${CHECK_WATCHDOG[@]}"; do
+            [[ -n "${pid}" ]] && { kill -TERM -- "-${pid}" 2> /dev/null || true; }
+        done
+    fi
+    [[ -z "${CHECK_WORK_DIR}" ]] || rm -rf "${CHECK_WORK_DIR}"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: run_checks
+# Purpose.: Run the declared checks concurrently in dependency order
+# Args....: None (uses CHECK_DEFS, QUIET, CHECK_JOBS, CHECK_TIMEOUT)
+# Returns.: 0
+# Output..: In text mode each check is rendered as soon as it and all checks
+#           before it are done, so the report keeps the declared order
+# Notes...: Up to CHECK_JOBS workers run at a time. Waits with "wait -n"
+#           (bash 4.3+) and polls every 0.1s on older shells.
+# ------------------------------------------------------------------------------
+run_checks() {
+    local def name func title critical limit deps dep idx jdx
+    local running=0 rendered=0 ready reason
+    local wait_n=false
+
+    ((BASH_VERSINFO[0] > 4 || (BASH_VERSINFO[0] == 4 && BASH_VERSINFO[1] >= 3))) && wait_n=true
+
+    for def in "${CHECK_DEFS[@]}"; do
+        IFS='|' read -r name func title critical limit deps <<< "${def}"
+        [[ "$QUIET" == "true" ]] && [[ "${critical}" != "true" ]] && continue
+        CHECK_NAME+=("${name}")
+        CHECK_FUNC+=("${func}")
+        CHECK_TITLE+=("${title}")
+        CHECK_CRITICAL+=("${critical}")
+        CHECK_LIMIT+=("${limit}")
+        CHECK_DEPS+=("${deps//,/ }")
+        CHECK_STATE+=("pending")
+        CHECK_PID+=("")
+        CHECK_WATCHDOG+=("")
+    done
+
+    while [[ ${rendered} -lt ${#CHECK_NAME[@]} ]]; do
+        # Collect finished or timed out workers
+        for idx in "${!CHECK_NAME[@]}"; do
+            [[ "${CHECK_STATE[$idx]}" == "running" ]] || continue
+            if [[ -f "${CHECK_WORK_DIR}/${idx}.rc" ]] || [[ -f "${CHECK_WORK_DIR}/${idx}.timeout" ]] \
+                || ! kill -0 "${CHECK_PID[$idx]}" 2> /dev/null; then
+                _check_finish "${idx}"
+                running=$((running - 1))
+            fi
+        done
+
+        # Start checks whose dependencies are done
+        for idx in "${!CHECK_NAME[@]}"; do
+            [[ "${CHECK_STATE[$idx]}" == "pending" ]] || continue
+            ready=true
+            reason=""
+            for dep in ${CHECK_DEPS[$idx]}; do
+                for jdx in "${!CHECK_NAME[@]}"; do
+                    [[ "${CHECK_NAME[$jdx]}" == "${dep}" ]] || continue
+                    if [[ "${CHECK_STATE[$jdx]}" != "done" ]]; then
+                        ready=false
+                    elif [[ "${CHECK_STATUS[$jdx]}" =~ ^(timeout|skipped)$ ]]; then
+                        reason="dependency ${dep} did not complete"
+                    fi
+                done
+            done
+            [[ "${ready}" == "true" ]] || continue
+            if [[ -n "${reason}" ]]; then
+                _check_finish "${idx}" "${reason}"
+            elif [[ ${running} -lt ${CHECK_JOBS} ]]; then
+                _check_launch "${idx}"
+                running=$((running + 1))
+            fi
+        done
+
+        # Render completed checks in declared order
+        while [[ ${rendered} -lt ${#CHECK_NAME[@]} ]] && [[ "${CHECK_STATE[$rendered]}" == "done" ]]; do
+            [[ "$OUTPUT_JSON" == "true" ]] || render_check_text "${rendered}"
+            rendered=$((rendered + 1))
+        done
+        [[ ${rendered} -lt ${#CHECK_NAME[@]} ]] || break
+
+        if [[ ${running} -eq 0 ]]; then
+            # Unresolvable dependencies (unknown check names are ignored)
+            for idx in "${!CHECK_NAME[@]}"; do
+                [[ "${CHECK_STATE[$idx]}" == "pending" ]] && _check_finish "${idx}" "dependency cycle"
+            done
+        elif [[ "${wait_n}" == "true" ]]; then
+            wait -n 2> /dev/null || true
+        else
+            sleep 0.1
+        fi
+    done
+}
+
 # =============================================================================
 # Main execution
 # =============================================================================
 
-[[ "$QUIET" != "true" ]] && check_system_info
+CHECK_WORK_DIR="$(mktemp -d "${TMPDIR:-/tmp}/oradba_check.XXXXXX")"
+trap _check_cleanup EXIT
+trap 'exit 130' INT TERM
+
+check_start=0
+check_end=0
+_check_now_ms check_start
+run_checks
+_check_now_ms check_end
 
 # Critical checks
 critical_failed=false
+for idx in "${!CHECK_NAME[@]}"; do
+    if [[ "${CHECK_CRITICAL[$idx]}" == "true" ]] && [[ "${CHECK_STATUS[$idx]}" =~ ^(fail|timeout|skipped)$ ]]; then
+        critical_failed=true
+    fi
+done
 
-check_system_tools || critical_failed=true
-[[ "$QUIET" != "true" ]] && check_optional_tools
-[[ "$QUIET" != "true" ]] && check_github_connectivity
-check_disk_space || critical_failed=true
-
-# Oracle-related checks (informational)
-[[ "$QUIET" != "true" ]] && check_oracle_environment
-[[ "$QUIET" != "true" ]] && check_oracle_tools
-[[ "$QUIET" != "true" ]] && check_database_connectivity
-[[ "$QUIET" != "true" ]] && check_oracle_versions
-
-# OraDBA installation check
-[[ "$QUIET" != "true" ]] && check_oradba_installation
+if [[ "$OUTPUT_JSON" == "true" ]]; then
+    if [[ "$critical_failed" == "true" ]]; then
+        render_json "failed" "$((check_end - check_start))"
+        exit 1
+    fi
+    render_json "passed" "$((check_end - check_start))"
+    exit 0
+fi
 
 # Summary
 if [[ "$QUIET" != "true" ]]; then
@@ -898,6 +1379,7 @@ if [[ "$QUIET" != "true" ]]; then
     echo -e "  ${RED}[FAIL] Failed:${NC}   $CHECKS_FAILED"
     echo -e "  ${YELLOW}[WARN] Warnings:${NC} $CHECKS_WARNING"
     echo -e "  ${BLUE}[INFO] Info:${NC}     $CHECKS_INFO"
+    [[ "$VERBOSE" == "true" ]] && echo "  Duration:        $((check_end - check_start)) ms (${CHECK_JOBS} jobs)"
     echo ""
 fi
 
@@ -102,6 +102,7 @@ Commands:
   validate [level]         Validate current Oracle environment
                            Levels: basic, standard (default), full
   changes                  Check for configuration file changes
+  pdbs [SID] [--refresh]   Show the cached PDB topology (refresh queries the CDB)
   help                     Display this help message
   version                  Display version information
 
@@ -116,6 +117,7 @@ Examples:
   ${SCRIPT_NAME} validate                # Validate current environment
   ${SCRIPT_NAME} validate full           # Full validation with database checks
   ${SCRIPT_NAME} changes                 # Check for config changes
+  ${SCRIPT_NAME} pdbs CDB1 --refresh     # Refresh PDB aliases cache of CDB1
 
 Environment Variables:
   ORATAB_FILE            Path to oratab file (default: /etc/oratab)
@@ -686,6 +688,70 @@ cmd_changes() {
     fi
 }
 
+# ------------------------------------------------------------------------------
+# Function: cmd_pdbs
+# Purpose.: Show or refresh the cached PDB topology of a SID
+# Args....: [SID] [--refresh]
+# Returns.: 0 on success, 1 if no topology is available or refresh failed
+# Output..: PDB names and open modes
+# ------------------------------------------------------------------------------
+cmd_pdbs() {
+    local sid="" refresh=false arg
+    local cache_file="" stamp="" cdb="" entry
+    local -a pdbs=()
+
+    for arg in "$@"; do
+        case "$arg" in
+            -r | --refresh) refresh=true ;;
+            -*)
+                echo "ERROR: Unknown option: $arg" >&2
+                return 1
+                ;;
+            *) sid="$arg" ;;
+        esac
+    done
+    sid="${sid:-${ORACLE_SID:-}}"
+
+    if [[ -z "$sid" ]]; then
+        echo "ERROR: No SID specified and ORACLE_SID not set" >&2
+        return 1
+    fi
+
+    if [[ "$refresh" == "true" ]]; then
+        # Query needs the environment of the SID
+        if [[ "$sid" != "${ORACLE_SID:-}" ]] || [[ -z "${ORACLE_HOME:-}" ]]; then
+            local oratab_entry
+            oratab_entry=$(parse_oratab "$sid" 2> /dev/null)
+            if [[ -z "$oratab_entry" ]]; then
+                echo "ERROR: SID not found in oratab: $sid" >&2
+                return 1
+            fi
+            sid="${oratab_entry%%:*}"
+            oratab_entry="${oratab_entry#*:}"
+            export ORACLE_SID="$sid"
+            export ORACLE_HOME="${oratab_entry%%:*}"
+            export PATH="${ORACLE_HOME}/bin:${PATH}"
+        fi
+        if ! oradba_pdb_cache_refresh; then
+            echo "ERROR: Cannot refresh PDB topology for $sid" >&2
+            return 1
+        fi
+    fi
+
+    _oradba_pdb_cache_file cache_file "$sid"
+    if ! _oradba_pdb_cache_read "$cache_file" stamp cdb pdbs; then
+        echo "No cached PDB topology for $sid (use: ${SCRIPT_NAME} pdbs $sid --refresh)"
+        return 1
+    fi
+
+    printf 'PDB topology for %s (CDB: %s, cached %(%Y-%m-%d %H:%M:%S)T)\n' "$sid" "$cdb" "$stamp"
+    echo ""
+    for entry in ${pdbs[@]+"${pdbs[@]}"}; do
+        printf '  %-30s %s\n' "${entry%%|*}" "${entry#*|}"
+    done
+    return 0
+}
+
 # ------------------------------------------------------------------------------
 # Function: cmd_version
 # Purpose.: Display version information
@@ -702,7 +768,7 @@ EOF
 # ------------------------------------------------------------------------------
 # Function: main
 # Purpose.: Main entry point for Oracle Environment management utility
-# Args....: $1 - Command (list|show|status|validate|changes|version|help)
+# Args....: $1 - Command (list|show|status|validate|changes|pdbs|version|help)
 #           $@ - Command-specific options and arguments
 # Returns.: 0 on success, 1 on error
 # Output..: Command output to stdout, errors to stderr
@@ -730,6 +796,9 @@ main() {
         changes)
             cmd_changes "$@"
             ;;
+        pdbs)
+            cmd_pdbs "$@"
+            ;;
         version)
             cmd_version
             ;;
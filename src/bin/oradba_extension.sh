@@ -1952,6 +1952,14 @@ main() {
     local command="${1:-help}"
     shift || true
 
+    # Parse extension metadata once for the reporting commands; the
+    # get_all_extensions/sort subshells inherit the index
+    case "${command}" in
+        list | info | validate-all | discover | paths | enabled | disabled)
+            oradba_extension_index_load 2> /dev/null || true
+            ;;
+    esac
+
     case "${command}" in
         add)
             cmd_add "$@"
@@ -49,6 +49,8 @@ TOPICS
     config          Configuration system and files
     sql             SQL*Plus scripts and helpers
     online          Open online documentation
+    function NAME   Library function reference (NAME* for prefix search,
+                    --callers lists all call sites)
 
 QUICK HELP
     alih            Display alias reference
@@ -64,6 +66,8 @@ EXAMPLES
     oradba help aliases      # Show alias help
     oradba help variables    # List environment variables
     oradba help scripts      # List available scripts
+    oradba help function oradba_registry_get_field
+    oradba help function 'oradba_registry_*'
 
 For detailed documentation on any topic, visit the online docs.
 
@@ -293,22 +297,102 @@ show_online_help() {
     fi
 }
 
+# ------------------------------------------------------------------------------
+# Function: show_function_help
+# Purpose.: Look up a function in the generated function catalog
+# Args....: $1 - Function name, or prefix ending in * for a prefix search
+#           $2 - Optional --callers to list all call sites
+# Returns.: 0 if found, 1 if no function matches or the catalog is missing
+# Output..: Function reference (source, args, returns, notes, call sites) or
+#           list of matching functions
+# Notes...: Reads doc/api/function-catalog.tsv (scripts/generate_api_docs.py,
+#           override with ORADBA_FUNCTION_CATALOG). The file is sorted by
+#           name, so the scan stops after the matching block. A name without
+#           exact match falls back to a prefix search.
+# ------------------------------------------------------------------------------
+show_function_help() {
+    local query="${1:-}"
+    local show_callers=false
+    [[ "${2:-}" == "--callers" ]] && show_callers=true
+    local base="${ORADBA_BASE:-$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)}"
+    local catalog="${ORADBA_FUNCTION_CATALOG:-${base}/doc/api/function-catalog.tsv}"
+
+    if [[ -z "${query}" ]]; then
+        echo "Usage: oradba help function NAME|PREFIX* [--callers]"
+        return 1
+    fi
+    if [[ ! -f "${catalog}" ]]; then
+        echo "Function catalog not found: ${catalog}"
+        echo "Generate it with: make docs-api"
+        return 1
+    fi
+
+    local prefix_mode=false
+    if [[ "${query}" == *"*" ]]; then
+        prefix_mode=true
+        query="${query%\*}"
+    fi
+
+    LC_ALL=C awk -F'\t' -v q="${query}" -v prefix="${prefix_mode}" -v all="${show_callers}" \
+        -v bold="${COLOR_BOLD}" -v green="${COLOR_GREEN}" -v blue="${COLOR_BLUE}" -v reset="${COLOR_RESET}" '
+        function unescape(s) {
+            gsub(/\\t/, "\t", s); gsub(/\\n/, "\n", s); gsub(/\\\\/, "\\", s)
+            return s
+        }
+        function indent(s) {
+            gsub(/\n/, "\n    ", s)
+            return "    " s
+        }
+        /^#/ { next }
+        substr($1, 1, length(q)) > q { exit }
+        index($1, q) == 1 {
+            if (prefix == "false" && $1 == q) { exact[++n_exact] = $0 }
+            list[++n_list] = sprintf("  %s%-40s%s %-12s %s", green, $1, reset, $2, $5)
+        }
+        END {
+            if (n_exact > 0) {
+                for (i = 1; i <= n_exact; i++) {
+                    split(exact[i], f, "\t")
+                    printf "%s%s%s (%s)  %s:%s\n", bold, f[1], reset, f[2], f[3], f[4]
+                    if (f[5] != "") printf "  %s\n", unescape(f[5])
+                    if (f[6] != "") printf "\n  %sArguments:%s\n%s\n", blue, reset, indent(unescape(f[6]))
+                    if (f[7] != "") printf "\n  %sReturns:%s %s\n", blue, reset, unescape(f[7])
+                    if (f[8] != "") printf "  %sOutput:%s  %s\n", blue, reset, unescape(f[8])
+                    if (f[9] != "") printf "\n  %sNotes:%s\n%s\n", blue, reset, indent(unescape(f[9]))
+                    n_calls = (f[10] == "") ? 0 : split(f[10], calls, ",")
+                    printf "\n  %sCalled from (%d):%s\n", blue, n_calls, reset
+                    limit = (all == "true") ? n_calls : (n_calls > 10 ? 10 : n_calls)
+                    for (j = 1; j <= limit; j++) printf "    %s\n", calls[j]
+                    if (limit < n_calls) printf "    ... %d more (--callers)\n", n_calls - limit
+                    if (i < n_exact) print ""
+                }
+                exit 0
+            }
+            if (n_list == 0) exit 1
+            printf "%sFunctions matching %s*:%s\n", bold, q, reset
+            for (i = 1; i <= n_list; i++) print list[i]
+        }' "${catalog}" && return 0
+
+    echo "No function matching '${query}' in ${catalog}"
+    return 1
+}
+
 # ------------------------------------------------------------------------------
 # Function: main
 # Purpose.: Entry point and topic dispatcher
-# Args....: $1 - Topic name (aliases/scripts/variables/config/sql/online) or empty for main help
+# Args....: $1 - Topic name (aliases/scripts/variables/config/sql/online/function) or empty for main help
+#           $2.. - Topic arguments (function: NAME [--callers])
 # Returns.: 0 on success, 1 on unknown topic
 # Output..: Depends on selected topic
 # Notes...: Routes to appropriate show_*_help function; defaults to main help
 # ------------------------------------------------------------------------------
 main() {
     # Handle 'oradba help <topic>' and 'oradba <topic>' formats
-    local topic="${1:-}"
-
     # If first arg is 'help', shift to get actual topic
-    if [[ "$topic" == "help" ]]; then
-        topic="${2:-}"
+    if [[ "${1:-}" == "help" ]]; then
+        shift
     fi
+    local topic="${1:-}"
 
     case "$topic" in
         "")
@@ -332,13 +416,16 @@ main() {
         online | docs | web)
             show_online_help
             ;;
+        function | func | fn)
+            show_function_help "${2:-}" "${3:-}" || exit 1
+            ;;
         -h | --help | help)
             show_main_help
             ;;
         *)
             echo "Unknown topic: $topic"
             echo ""
-            echo "Available topics: aliases, scripts, variables, config, sql, online"
+            echo "Available topics: aliases, scripts, variables, config, sql, online, function"
             echo "Use 'oradba help' for the main help menu."
             exit 1
             ;;
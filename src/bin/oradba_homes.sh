@@ -52,6 +52,7 @@ COMMANDS:
     dedupe              Remove duplicate entries from configuration
     export              Export configuration to stdout
     import [file]       Import configuration from file or stdin
+    cache [stats|clear] Show or clear the product/version detection cache
 
 LIST OPTIONS:
     -t, --type <type>   Filter by product type (oud, client, weblogic, etc.)
@@ -70,11 +71,16 @@ DISCOVER OPTIONS:
     -b, --base <path>       Base directory to search (default: $ORACLE_BASE)
     --auto-add              Automatically add discovered homes
     --dry-run               Show what would be discovered without adding
+    --full                  Re-classify all directories (ignore discovery state)
 
 IMPORT OPTIONS:
     --force                 Force import without confirmation
     --no-backup             Skip backup of existing configuration
 
+CACHE OPTIONS:
+    stats                   Show cache file, entries, valid/stale homes
+    clear [name|path]       Clear the whole cache or a single Oracle Home
+
 GLOBAL OPTIONS:
     -h, --help              Show this help message
     -q, --quiet             Minimal output
@@ -459,6 +465,9 @@ add_home() {
         fi
     fi
 
+    # Drop stale detection results for this path (re-installed or re-registered home)
+    oradba_detect_cache_invalidate "$path"
+
     # Auto-detect product type if not specified
     if [[ -z "$ptype" ]]; then
         if [[ -d "$path" ]]; then
@@ -624,6 +633,11 @@ remove_home() {
     # Create backup
     cp "$config_file" "${config_file}.bak"
 
+    # Forget cached detection results for the removed home
+    local home_path
+    home_path=$(get_oracle_home_path "$name" 2> /dev/null) || home_path=""
+    [[ -n "$home_path" ]] && oradba_detect_cache_invalidate "$home_path"
+
     # Remove entry
     sed -i.tmp "/^${name}:/d" "$config_file"
     rm -f "${config_file}.tmp"
@@ -728,6 +742,7 @@ discover_homes() {
     local auto_add=false
     local dry_run=false
     local silent=false
+    local rescan="incremental"
 
     # Parse options
     while [[ $# -gt 0 ]]; do
@@ -748,6 +763,10 @@ discover_homes() {
                 silent=true
                 shift
                 ;;
+            --full)
+                rescan="full"
+                shift
+                ;;
             *)
                 oradba_log ERROR "Unknown option: $1"
                 return 1
@@ -778,9 +797,9 @@ discover_homes() {
         # Pass silent mode to suppress verbose output
         local discover_rc=0
         if [[ "$silent" == "true" ]]; then
-            auto_discover_oracle_homes "${base_dir}/product" "true" || discover_rc=$?
+            auto_discover_oracle_homes "${base_dir}/product" "true" "${rescan}" || discover_rc=$?
         else
-            auto_discover_oracle_homes "${base_dir}/product" || discover_rc=$?
+            auto_discover_oracle_homes "${base_dir}/product" "false" "${rescan}" || discover_rc=$?
         fi
         return "${discover_rc}"
     fi
@@ -1250,10 +1269,69 @@ dedupe_homes() {
     return 0
 }
 
+# ------------------------------------------------------------------------------
+# Function: cache_command
+# Purpose.: Show or clear the product/version detection cache
+# Args....: $1 - Action: stats (default) or clear
+#           $2 - Oracle Home name or path (optional, clear only)
+# Returns.: 0 on success, 1 on invalid action
+# Output..: Cache statistics or confirmation message
+# Notes...: stats validates every registered home against its cached signature
+# ------------------------------------------------------------------------------
+cache_command() {
+    local action="${1:-stats}"
+    local target="${2:-}"
+
+    case "$action" in
+        stats)
+            local valid=0 stale=0
+            local name path
+            local homes_file
+            if homes_file=$(get_oracle_homes_path 2> /dev/null); then
+                while IFS=':' read -r name path _; do
+                    [[ -z "$name" ]] && continue
+                    [[ "$name" =~ ^[[:space:]]*# ]] && continue
+                    [[ -d "$path" ]] || continue
+                    if _oradba_detect_cache_enabled && _oradba_detect_cache_lookup "$path"; then
+                        valid=$((valid + 1))
+                    else
+                        stale=$((stale + 1))
+                    fi
+                done < "$homes_file"
+            fi
+            echo ""
+            echo "Detection Cache"
+            echo "================================================================================"
+            oradba_detect_cache_stats | while IFS='=' read -r key value; do
+                printf "  %-12s: %s\n" "$key" "$value"
+            done
+            printf "  %-12s: %s\n" "valid" "$valid"
+            printf "  %-12s: %s\n" "stale" "$stale"
+            echo ""
+            ;;
+        clear)
+            if [[ -n "$target" ]] && [[ ! -d "$target" ]]; then
+                target=$(get_oracle_home_path "$target" 2> /dev/null) || {
+                    oradba_log ERROR "Oracle Home '$2' not found"
+                    return 1
+                }
+            fi
+            oradba_detect_cache_invalidate "$target"
+            oradba_log INFO "Detection cache cleared${target:+ for $target}"
+            ;;
+        *)
+            oradba_log ERROR "Unknown cache action: $action (use stats or clear)"
+            return 1
+            ;;
+    esac
+
+    return 0
+}
+
 # ------------------------------------------------------------------------------
 # Function: main
 # Purpose.: Main entry point for Oracle Homes management
-# Args....: $1 - Command (list|show|add|remove|discover|validate|dedupe|export|import)
+# Args....: $1 - Command (list|show|add|remove|discover|validate|dedupe|export|import|cache)
 #           $@ - Command-specific options and arguments
 # Returns.: 0 on success, 1 on error
 # Output..: Command output to stdout, errors to stderr
@@ -1298,6 +1376,9 @@ main() {
         import)
             import_config "$@"
             ;;
+        cache)
+            cache_command "$@"
+            ;;
         *)
             oradba_log ERROR "Unknown command: $command"
             echo ""
@@ -0,0 +1,174 @@
+#!/usr/bin/env bash
+# ------------------------------------------------------------------------------
+# OraDBA - Oracle Database Infrastructure and Security, 5630 Muri, Switzerland
+# ------------------------------------------------------------------------------
+# Name.......: oradba_profile.sh
+# Author.....: Stefan Oehrli (oes) stefan.oehrli@oradba.ch
+# Editor.....: Stefan Oehrli
+# Date.......: 2026.02.11
+# Revision...: 0.21.0
+# Purpose....: Record and report oraenv.sh startup profiles
+# Notes......: Profiles are written by oraenv.sh when ORADBA_PROFILE=true
+#              (see lib/oradba_profile.sh). The report aggregates any number
+#              of profile files into a top-N hot-spot table.
+# Reference..: https://github.com/oehrlis/oradba
+# License....: Apache License Version 2.0, January 2004 as shown
+#              at http://www.apache.org/licenses/
+# ------------------------------------------------------------------------------
+
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+# shellcheck source=../lib/oradba_bootstrap.sh
+source "${SCRIPT_DIR}/../lib/oradba_bootstrap.sh"
+# shellcheck source=../lib/oradba_profile.sh
+source "${ORADBA_BASE}/lib/oradba_profile.sh"
+
+# Script variables
+SCRIPT_NAME="$(basename "$0")"
+PROFILE_DIR="${ORADBA_PROFILE_DIR:-${ORADBA_LOG:-${ORADBA_BASE}/log}/profile}"
+
+# ------------------------------------------------------------------------------
+# Function: usage
+# Purpose.: Display usage information and command-line options
+# Args....: None
+# Returns.: 0 (exits after display)
+# Output..: Usage information to stdout
+# ------------------------------------------------------------------------------
+usage() {
+    cat << EOF
+Usage: $SCRIPT_NAME <command> [OPTIONS]
+
+Record and analyse oraenv.sh startup profiles (ORADBA_PROFILE=true).
+
+Commands:
+  report [PATH...]    Aggregate profiles into a hot-spot table
+                      (default PATH: ${PROFILE_DIR})
+  run TARGET          Source oraenv.sh for TARGET in fresh shells with
+                      profiling enabled and report the results
+  list                List recorded profile files
+  clean               Remove recorded profile files
+
+Options:
+  -n, --top N         Number of rows in the report (default: 20, 0 = all)
+  -r, --runs N        Number of runs for 'run' (default: 5)
+  -h, --help          Display this help message
+
+Environment:
+  ORADBA_PROFILE=true         Record a profile on every oraenv.sh run
+  ORADBA_PROFILE_DIR          Profile directory (default: \${ORADBA_LOG}/profile)
+  ORADBA_PROFILE_FUNCTIONS    Space-separated list of functions to time
+
+Examples:
+  $SCRIPT_NAME run FREE --runs 10
+  $SCRIPT_NAME report --top 10
+  $SCRIPT_NAME report /shared/profiles/host*/
+
+EOF
+    exit 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: run_profiles
+# Purpose.: Profile oraenv.sh for a target in fresh shells
+# Args....: $1 - Target SID or Oracle Home name
+#           $2 - Number of runs
+# Returns.: 0 on success, 1 if any run failed
+# Output..: Progress line per run
+# Notes...: Each run uses a new bash so library sourcing is included
+# ------------------------------------------------------------------------------
+run_profiles() {
+    local target="$1"
+    local runs="$2"
+    local i rc=0
+
+    for ((i = 1; i <= runs; i++)); do
+        if ORADBA_PROFILE=true ORADBA_PROFILE_DIR="${PROFILE_DIR}" \
+            bash -c 'source "$1" "$2" --silent > /dev/null 2>&1' _ "${ORADBA_BASE}/bin/oraenv.sh" "${target}"; then
+            echo "Run ${i}/${runs}: ok"
+        else
+            echo "Run ${i}/${runs}: failed"
+            rc=1
+        fi
+    done
+    return ${rc}
+}
+
+# ------------------------------------------------------------------------------
+# Function: main
+# Purpose.: Main entry point
+# Args....: $@ - Command and options
+# Returns.: 0 on success, 1 on error
+# Output..: Depends on command
+# ------------------------------------------------------------------------------
+main() {
+    local command="${1:-}"
+    local top=20 runs=5
+    local -a args=()
+
+    [[ -z "${command}" ]] && usage
+    shift
+
+    while [[ $# -gt 0 ]]; do
+        case "$1" in
+            -n | --top)
+                top="${2:-}"
+                shift 2
+                ;;
+            -r | --runs)
+                runs="${2:-}"
+                shift 2
+                ;;
+            -h | --help)
+                usage
+                ;;
+            -*)
+                oradba_log ERROR "Unknown option: $1"
+                return 1
+                ;;
+            *)
+                args+=("$1")
+                shift
+                ;;
+        esac
+    done
+
+    if [[ ! "${top}" =~ ^[0-9]+$ ]] || [[ ! "${runs}" =~ ^[0-9]+$ ]]; then
+        oradba_log ERROR "--top and --runs require a number"
+        return 1
+    fi
+
+    case "${command}" in
+        report)
+            [[ ${#args[@]} -eq 0 ]] && args=("${PROFILE_DIR}")
+            oradba_profile_report "${top}" "${args[@]}"
+            ;;
+        run)
+            if [[ ${#args[@]} -ne 1 ]]; then
+                oradba_log ERROR "run requires exactly one target (SID or Oracle Home name)"
+                return 1
+            fi
+            local rc=0
+            run_profiles "${args[0]}" "${runs}" || rc=1
+            echo ""
+            oradba_profile_report "${top}" "${PROFILE_DIR}" || rc=1
+            return ${rc}
+            ;;
+        list)
+            ls -1t "${PROFILE_DIR}"/*.prof 2> /dev/null || oradba_log INFO "No profiles in ${PROFILE_DIR}"
+            ;;
+        clean)
+            rm -f "${PROFILE_DIR}"/*.prof
+            oradba_log INFO "Profiles removed from ${PROFILE_DIR}"
+            ;;
+        -h | --help | help)
+            usage
+            ;;
+        *)
+            oradba_log ERROR "Unknown command: ${command}"
+            return 1
+            ;;
+    esac
+}
+
+main "$@"
@@ -70,6 +70,19 @@ OPT_NO_CLEANUP=false
 OPT_TABLESPACES=""
 OPT_DATAFILES=""
 OPT_PLUGGABLE_DATABASE=""
+OPT_MAX_JOBS=""
+OPT_TIMEOUT=""
+OPT_IO_BUDGET=""
+
+# Job scheduler settings (environment defaults, overridden by CLI options)
+RMAN_MAX_JOBS="${RMAN_MAX_JOBS:-4}"
+RMAN_JOB_TIMEOUT="${RMAN_JOB_TIMEOUT:-0}"
+RMAN_IO_BUDGET="${RMAN_IO_BUDGET:-0}"
+RMAN_POLL_INTERVAL="${RMAN_POLL_INTERVAL:-1}"
+RMAN_KILL_GRACE="${RMAN_KILL_GRACE:-30}"
+JOB_DIR="${TEMP_DIR}/jobs"
+RESULTS_FILE="${SCRIPT_LOG%.log}.results"
+JOB_RECORDS=()
 
 # RMAN configuration defaults (overridden by load_rman_config)
 RMAN_CHANNELS=""
@@ -125,6 +138,12 @@ OPTIONS
     --pdb <names>            Pluggable database names (comma-separated, e.g., PDB1,PDB2)
     --notify <email>         Email address for notifications (default: from config)
     --parallel <method>      Parallel method: background|gnu (default: background)
+    --max-jobs <n>           Maximum concurrent RMAN jobs, 0 = unlimited
+                             (default: \${RMAN_MAX_JOBS:-4})
+    --timeout <duration>     Wall-clock limit per SID, e.g. 90m, 4h, 30s; plain
+                             numbers are minutes, 0 = none (default: \${RMAN_JOB_TIMEOUT:-0})
+    --io-budget <n>          Total I/O weight of concurrently running jobs,
+                             0 = no budget (default: \${RMAN_IO_BUDGET:-0})
     --dry-run                Show what would be executed without running
     --no-cleanup             Keep temporary files after execution
     --verbose                Show detailed output
@@ -147,6 +166,16 @@ CONFIGURATION
         RMAN_NOTIFY_EMAIL      Email for notifications
         RMAN_NOTIFY_ON_SUCCESS Enable success notifications
         RMAN_NOTIFY_ON_ERROR   Enable error notifications
+        RMAN_IO_WEIGHT         I/O weight of this SID for --io-budget
+                               (default: channels, e.g. scale with database size)
+        RMAN_JOB_TIMEOUT       Wall-clock limit for this SID (CLI --timeout overrides)
+
+    Job scheduler (environment):
+        RMAN_MAX_JOBS          Maximum concurrent jobs (default: 4)
+        RMAN_JOB_TIMEOUT       Default wall-clock limit per SID (default: 0 = none)
+        RMAN_IO_BUDGET         I/O weight budget (default: 0 = none). A job starts
+                               only while the running weight plus its own weight
+                               fits the budget; an oversized job runs alone.
 
 TEMPLATE TAGS
     RMAN scripts support template processing with these tags:
@@ -166,6 +195,9 @@ TEMPLATE TAGS
 LOGGING
     Script log:  \${ORADBA_LOG}/oradba_rman_<timestamp>.log
     SID logs:    \${ORADBA_ORA_ADMIN_SID}/log/<script>_<timestamp>.log
+    Results:     \${ORADBA_LOG}/oradba_rman_<timestamp>.results
+                 One record per SID: sid|status|exit_code|duration_s|weight|log
+                 (status SUCCESS, FAILED or TIMEOUT)
 
 EXIT CODES
     0    All operations successful
@@ -180,6 +212,9 @@ EXAMPLES
     # Multiple databases in parallel
     ${SCRIPT_NAME} --sid DB01,DB02 --rcv backup_full.rcv --channels 4
 
+    # 30 databases, at most 6 at a time, 8 channels of I/O, 4 hours per SID
+    ${SCRIPT_NAME} --sid "\${SIDS}" --rcv backup_full.rcv --max-jobs 6 --io-budget 8 --timeout 4h
+
     # With custom backup tag and notification
     ${SCRIPT_NAME} --sid PROD --rcv backup_full.rcv --tag DAILY --notify dba@example.com
 
@@ -228,7 +263,10 @@ export ORADBA_LOG_FILE="${SCRIPT_LOG}"
 #           Falls back to background if GNU parallel not available
 # ------------------------------------------------------------------------------
 check_parallel_method() {
-    if [[ "${OPT_PARALLEL}" == "gnu" ]]; then
+    if [[ "${OPT_PARALLEL}" == "gnu" && "${RMAN_IO_BUDGET}" -gt 0 ]]; then
+        oradba_log WARN "GNU parallel does not support --io-budget, using background jobs"
+        PARALLEL_METHOD="background"
+    elif [[ "${OPT_PARALLEL}" == "gnu" ]]; then
         if command -v parallel > /dev/null 2>&1; then
             PARALLEL_METHOD="gnu_parallel"
             oradba_log INFO "Using GNU parallel for execution"
@@ -690,6 +728,11 @@ execute_rman_for_sid() {
     script_basename=$(basename "${rcv_script}" .rcv)
     local sid_log="${log_dir}/${script_basename}_${TIMESTAMP}.log"
 
+    # Hand the log path to the job scheduler for the result record
+    if [[ -d "${JOB_DIR}" ]]; then
+        printf '%s\n' "${sid_log}" > "${JOB_DIR}/${sid}.log_path"
+    fi
+
     oradba_log INFO "  ORACLE_HOME:      ${ORACLE_HOME}"
     oradba_log INFO "  Log file:         ${sid_log}"
 
@@ -772,7 +815,7 @@ execute_rman_for_sid() {
         oradba_log ERROR "  RMAN execution failed for ${sid}: exit code ${rman_exit_code}"
         oradba_log ERROR "  Check log: ${sid_log}"
         oradba_log ERROR "  Processed script: ${saved_rcv}"
-        return 1
+        return "${rman_exit_code}"
     else
         oradba_log INFO "  RMAN execution successful for ${sid}"
         oradba_log INFO "  Log:              ${sid_log}"
@@ -782,44 +825,209 @@ execute_rman_for_sid() {
 }
 
 # ------------------------------------------------------------------------------
-# Execute RMAN for multiple SIDs in parallel
+# Job scheduler
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# Function: parse_duration
+# Purpose.: Convert a duration to seconds
+# Args....: $1 - Duration: N (minutes), Ns, Nm or Nh; empty or 0 = no limit
+# Returns.: 0 on success, 1 if the value is invalid
+# Output..: Number of seconds
+# ------------------------------------------------------------------------------
+parse_duration() {
+    local value="${1:-0}"
+    local number unit
+
+    [[ "${value}" =~ ^([0-9]+)([smh]?)$ ]] || return 1
+    number=$((10#${BASH_REMATCH[1]}))
+    unit="${BASH_REMATCH[2]}"
+
+    case "${unit}" in
+        s) echo "${number}" ;;
+        h) echo "$((number * 3600))" ;;
+        *) echo "$((number * 60))" ;;
+    esac
+}
+
+# ------------------------------------------------------------------------------
+# Function: format_duration
+# Purpose.: Format seconds for the summary
+# Args....: $1 - Seconds
+# Returns.: 0
+# Output..: Duration as [Hh]MMmSSs
+# ------------------------------------------------------------------------------
+format_duration() {
+    local seconds="${1:-0}"
+
+    if [[ ${seconds} -ge 3600 ]]; then
+        printf '%dh%02dm%02ds\n' $((seconds / 3600)) $((seconds % 3600 / 60)) $((seconds % 60))
+    else
+        printf '%dm%02ds\n' $((seconds / 60)) $((seconds % 60))
+    fi
+}
+
+# ------------------------------------------------------------------------------
+# Function: get_sid_job_settings
+# Purpose.: Determine I/O weight and timeout of a SID before scheduling it
+# Args....: $1 - Oracle SID
+# Returns.: 0
+# Output..: "<weight> <timeout_seconds>"
+# Notes...: Reads the SID's oradba_rman.conf in a subshell (the job loads it
+#           again after oraenv). Weight: RMAN_IO_WEIGHT, else --channels, else
+#           RMAN_CHANNELS, else 1. Timeout: --timeout, else RMAN_JOB_TIMEOUT
+#           from the SID config, else the RMAN_JOB_TIMEOUT default.
+# ------------------------------------------------------------------------------
+get_sid_job_settings() {
+    local sid="$1"
+    local config_file=""
+    local candidate
+
+    for candidate in \
+        "${ORADBA_ORA_ADMIN:+${ORADBA_ORA_ADMIN}/${sid}/etc/oradba_rman.conf}" \
+        "${ORACLE_BASE:+${ORACLE_BASE}/admin/${sid}/etc/oradba_rman.conf}"; do
+        if [[ -n "${candidate}" && -f "${candidate}" ]]; then
+            config_file="${candidate}"
+            break
+        fi
+    done
+
+    (
+        set +eu
+        RMAN_IO_WEIGHT=""
+        # shellcheck source=/dev/null
+        [[ -n "${config_file}" ]] && source "${config_file}" > /dev/null 2>&1
+        weight="${RMAN_IO_WEIGHT:-${OPT_CHANNELS:-${RMAN_CHANNELS:-1}}}"
+        [[ "${weight}" =~ ^[0-9]+$ && ${weight} -gt 0 ]] || weight=1
+        if ! timeout=$(parse_duration "${OPT_TIMEOUT:-${RMAN_JOB_TIMEOUT}}"); then
+            oradba_log WARN "Invalid RMAN_JOB_TIMEOUT for ${sid}: ${RMAN_JOB_TIMEOUT}, no timeout"
+            timeout=0
+        fi
+        echo "${weight} ${timeout}"
+    )
+}
+
+# ------------------------------------------------------------------------------
+# Function: write_job_record
+# Purpose.: Record the result of one SID
+# Args....: $1 - Oracle SID
+#           $2 - Status (SUCCESS|FAILED|TIMEOUT)
+#           $3 - Exit code
+#           $4 - Duration in seconds
+#           $5 - I/O weight
+# Returns.: 0
+# Output..: Record appended to RESULTS_FILE and JOB_RECORDS
+# Notes...: Record format: sid|status|exit_code|duration_s|weight|log
+#           The log path is taken from the job's hand-off file
 # ------------------------------------------------------------------------------
+write_job_record() {
+    local sid="$1" status="$2" exit_code="$3" duration="$4" weight="$5"
+    local sid_log=""
+
+    if [[ -f "${JOB_DIR}/${sid}.log_path" ]]; then
+        IFS= read -r sid_log < "${JOB_DIR}/${sid}.log_path" || true
+    fi
+
+    local record="${sid}|${status}|${exit_code}|${duration}|${weight}|${sid_log}"
+    JOB_RECORDS+=("${record}")
+    if [[ ! -f "${RESULTS_FILE}" ]]; then
+        echo "# sid|status|exit_code|duration_s|weight|log" > "${RESULTS_FILE}" 2> /dev/null || true
+    fi
+    echo "${record}" >> "${RESULTS_FILE}" 2> /dev/null || true
+}
+
 # ------------------------------------------------------------------------------
 # Function: execute_parallel_background
-# Purpose.: Execute RMAN for multiple SIDs using background jobs
+# Purpose.: Execute RMAN for SIDs with the native job scheduler
 # Args....: $@ - List of Oracle SIDs
-# Returns.: 0 if all successful, 1 if any failed
-# Output..: Parallel execution status to log
-# Notes...: Standard bash background jobs with wait
-#           Default parallel method if GNU parallel unavailable
-#           Updates FAILED_SIDS and SUCCESSFUL_SIDS arrays
+# Returns.: 0
+# Output..: Scheduling status to log, one result record per SID
+# Notes...: Bounded worker pool: starts SIDs in the given order while fewer
+#           than RMAN_MAX_JOBS run and the running I/O weight plus the next
+#           job's weight fits RMAN_IO_BUDGET (an oversized job runs alone).
+#           Jobs exceeding their timeout are terminated with their process
+#           tree (TERM, KILL after RMAN_KILL_GRACE seconds) and recorded as
+#           TIMEOUT. Exit codes come from wait, not from marker files.
 # ------------------------------------------------------------------------------
 execute_parallel_background() {
     local -a sids=("$@")
-    local -a pids=()
+    local -A job_pid=() job_start=() job_weight=() job_timeout=() job_killed=()
+    local -i running=0 running_weight=0 next=0
+    local sid pid rc now status weight timeout
 
-    oradba_log INFO "Starting parallel execution (background jobs) for ${#sids[@]} SID(s)"
+    mkdir -p "${JOB_DIR}"
 
-    # Start background job for each SID
     for sid in "${sids[@]}"; do
-        (
-            if execute_rman_for_sid "${sid}" "${OPT_RCV_SCRIPT}"; then
-                echo "${sid}" >> "${TEMP_DIR}/success.txt"
+        read -r weight timeout <<< "$(get_sid_job_settings "${sid}")"
+        job_weight[${sid}]="${weight}"
+        job_timeout[${sid}]="${timeout}"
+    done
+
+    oradba_log INFO "Scheduling ${#sids[@]} RMAN job(s): max ${RMAN_MAX_JOBS} concurrent (0 = unlimited), I/O budget ${RMAN_IO_BUDGET} (0 = none)"
+
+    while [[ ${next} -lt ${#sids[@]} || ${running} -gt 0 ]]; do
+        # Start queued jobs while slots and I/O budget allow (FIFO)
+        while [[ ${next} -lt ${#sids[@]} ]]; do
+            sid="${sids[next]}"
+            weight="${job_weight[${sid}]}"
+            [[ ${RMAN_MAX_JOBS} -gt 0 && ${running} -ge ${RMAN_MAX_JOBS} ]] && break
+            if [[ ${RMAN_IO_BUDGET} -gt 0 && ${running} -gt 0 ]] \
+                && [[ $((running_weight + weight)) -gt ${RMAN_IO_BUDGET} ]]; then
+                break
+            fi
+
+            (
+                if execute_rman_for_sid "${sid}" "${OPT_RCV_SCRIPT}"; then
+                    exit 0
+                else
+                    exit $?
+                fi
+            ) &
+            job_pid[${sid}]=$!
+            printf -v job_start[${sid}] '%(%s)T' -1
+            running+=1
+            running_weight+=weight
+            next+=1
+            oradba_log INFO "Started ${sid} (pid ${job_pid[${sid}]}, weight ${weight}, timeout ${job_timeout[${sid}]}s, running ${running})"
+        done
+
+        sleep "${RMAN_POLL_INTERVAL}"
+        printf -v now '%(%s)T' -1
+
+        for sid in "${!job_pid[@]}"; do
+            pid="${job_pid[${sid}]}"
+            if kill -0 "${pid}" 2> /dev/null; then
+                timeout="${job_timeout[${sid}]}"
+                if [[ -z "${job_killed[${sid}]:-}" && ${timeout} -gt 0 ]] \
+                    && [[ $((now - job_start[${sid}])) -ge ${timeout} ]]; then
+                    oradba_log ERROR "RMAN job for ${sid} exceeded timeout of ${timeout}s, terminating"
+                    oradba_kill_process_tree "${pid}" TERM
+                    job_killed[${sid}]="${now}"
+                elif [[ -n "${job_killed[${sid}]:-}" ]] \
+                    && [[ $((now - job_killed[${sid}])) -ge ${RMAN_KILL_GRACE} ]]; then
+                    oradba_kill_process_tree "${pid}" KILL
+                fi
+                continue
+            fi
+
+            rc=0
+            wait "${pid}" || rc=$?
+            if [[ -n "${job_killed[${sid}]:-}" ]]; then
+                status="TIMEOUT"
+            elif [[ ${rc} -eq 0 ]]; then
+                status="SUCCESS"
             else
-                echo "${sid}" >> "${TEMP_DIR}/failed.txt"
+                status="FAILED"
             fi
-        ) &
-        pids+=($!)
-    done
+            write_job_record "${sid}" "${status}" "${rc}" "$((now - job_start[${sid}]))" "${job_weight[${sid}]}"
+            oradba_log INFO "Finished ${sid}: ${status} (exit ${rc}, $(format_duration $((now - job_start[${sid}]))))"
 
-    # Wait for all jobs to complete
-    # Use || true: success/failure tracked via success.txt/failed.txt, not exit codes
-    oradba_log INFO "Waiting for ${#pids[@]} background job(s) to complete..."
-    for pid in "${pids[@]}"; do
-        wait "${pid}" || true
+            running=$((running - 1))
+            running_weight=$((running_weight - job_weight[${sid}]))
+            unset "job_pid[${sid}]"
+        done
     done
 
-    oradba_log INFO "All background jobs completed"
+    oradba_log INFO "All RMAN jobs completed"
 }
 
 # ------------------------------------------------------------------------------
@@ -829,30 +1037,51 @@ execute_parallel_background() {
 # Function: execute_parallel_gnu
 # Purpose.: Execute RMAN for multiple SIDs using GNU parallel
 # Args....: $@ - List of Oracle SIDs
-# Returns.: 0 if all successful, 1 if any failed
-# Output..: Parallel execution status to log
+# Returns.: 0
+# Output..: Parallel execution status to log, one result record per SID
 # Notes...: Requires GNU parallel command installed
-#           Better load balancing and progress tracking than background
+#           Uses --jobs (RMAN_MAX_JOBS) and --timeout (global timeout only);
+#           result records are built from the parallel job log
 #           Exports execute_rman_for_sid function for parallel
 # ------------------------------------------------------------------------------
 execute_parallel_gnu() {
     local -a sids=("$@")
+    local joblog="${JOB_DIR}/parallel.joblog"
+    local timeout
+    local -a parallel_opts=(--will-cite --joblog "${joblog}" --jobs "${RMAN_MAX_JOBS}")
+
+    mkdir -p "${JOB_DIR}"
+    timeout=$(parse_duration "${OPT_TIMEOUT:-${RMAN_JOB_TIMEOUT}}") || timeout=0
+    [[ ${timeout} -gt 0 ]] && parallel_opts+=(--timeout "${timeout}")
 
-    oradba_log INFO "Starting parallel execution (GNU parallel) for ${#sids[@]} SID(s)"
+    oradba_log INFO "Starting parallel execution (GNU parallel) for ${#sids[@]} SID(s), max ${RMAN_MAX_JOBS} concurrent"
 
     # Export function and variables for parallel
     export -f execute_rman_for_sid load_rman_config process_template
     export OPT_RCV_SCRIPT OPT_CHANNELS OPT_FORMAT OPT_TAG OPT_COMPRESSION OPT_DRY_RUN OPT_VERBOSE
-    export ORADBA_BASE SCRIPT_LOG TEMP_DIR TIMESTAMP
-
-    # Execute using GNU parallel
-    printf '%s\n' "${sids[@]}" | parallel --will-cite "
-        if execute_rman_for_sid {} '${OPT_RCV_SCRIPT}'; then
-            echo {} >> ${TEMP_DIR}/success.txt
-        else
-            echo {} >> ${TEMP_DIR}/failed.txt
-        fi
-    "
+    export ORADBA_BASE SCRIPT_LOG TEMP_DIR TIMESTAMP JOB_DIR
+
+    # Failures are taken from the job log
+    printf '%s\n' "${sids[@]}" \
+        | parallel "${parallel_opts[@]}" "execute_rman_for_sid {} '${OPT_RCV_SCRIPT}'" || true
+
+    # Job log columns: Seq Host Starttime JobRuntime Send Receive Exitval Signal Command
+    local seq runtime exit_code signal command sid status
+    if [[ -f "${joblog}" ]]; then
+        while IFS=$'\t' read -r seq _ _ runtime _ _ exit_code signal command; do
+            [[ "${seq}" == "Seq" ]] && continue
+            sid="${command#execute_rman_for_sid }"
+            sid="${sid%% *}"
+            if [[ "${signal}" != "0" && ${timeout} -gt 0 ]]; then
+                status="TIMEOUT"
+            elif [[ "${exit_code}" == "0" ]]; then
+                status="SUCCESS"
+            else
+                status="FAILED"
+            fi
+            write_job_record "${sid}" "${status}" "${exit_code}" "${runtime%.*}" "1"
+        done < "${joblog}"
+    fi
 
     oradba_log INFO "GNU parallel execution completed"
 }
@@ -902,16 +1131,26 @@ send_notification() {
     body+="\n"
 
     if [[ ${#SUCCESSFUL_SIDS[@]} -gt 0 ]]; then
-        body+="Successful SIDs (${#SUCCESSFUL_SIDS[@]}):\n"
-        printf '  - %s\n' "${SUCCESSFUL_SIDS[@]}" >> "${body}"
+        body+="Successful SIDs (${#SUCCESSFUL_SIDS[@]}): ${SUCCESSFUL_SIDS[*]}\n"
     fi
 
     if [[ ${#FAILED_SIDS[@]} -gt 0 ]]; then
-        body+="Failed SIDs (${#FAILED_SIDS[@]}):\n"
-        printf '  - %s\n' "${FAILED_SIDS[@]}" >> "${body}"
+        body+="Failed SIDs (${#FAILED_SIDS[@]}): ${FAILED_SIDS[*]}\n"
+    fi
+
+    # Per-SID result records
+    local record r_sid r_status r_rc r_duration r_weight r_log
+    if [[ ${#JOB_RECORDS[@]} -gt 0 ]]; then
+        body+="\nResults:\n"
+        for record in "${JOB_RECORDS[@]}"; do
+            IFS='|' read -r r_sid r_status r_rc r_duration r_weight r_log <<< "${record}"
+            body+="  - ${r_sid}: ${r_status} (exit ${r_rc}, $(format_duration "${r_duration}"))"
+            body+="${r_log:+ log: ${r_log}}\n"
+        done
     fi
 
     body+="\nScript Log: ${SCRIPT_LOG}\n"
+    [[ -f "${RESULTS_FILE}" ]] && body+="Results File: ${RESULTS_FILE}\n"
 
     # Send email using mail command
     if command -v mail > /dev/null 2>&1; then
@@ -989,6 +1228,18 @@ main() {
                 esac
                 shift 2
                 ;;
+            --max-jobs)
+                OPT_MAX_JOBS="$2"
+                shift 2
+                ;;
+            --timeout)
+                OPT_TIMEOUT="$2"
+                shift 2
+                ;;
+            --io-budget)
+                OPT_IO_BUDGET="$2"
+                shift 2
+                ;;
             --backup-path)
                 OPT_BACKUP_PATH="$2"
                 shift 2
@@ -1047,6 +1298,18 @@ main() {
         exit 2
     fi
 
+    # Validate job scheduler settings (CLI overrides environment)
+    RMAN_MAX_JOBS="${OPT_MAX_JOBS:-${RMAN_MAX_JOBS}}"
+    RMAN_IO_BUDGET="${OPT_IO_BUDGET:-${RMAN_IO_BUDGET}}"
+    if [[ ! "${RMAN_MAX_JOBS}" =~ ^[0-9]+$ ]] || [[ ! "${RMAN_IO_BUDGET}" =~ ^[0-9]+$ ]]; then
+        echo "ERROR: --max-jobs and --io-budget require a number" >&2
+        exit 2
+    fi
+    if ! parse_duration "${OPT_TIMEOUT:-${RMAN_JOB_TIMEOUT}}" > /dev/null; then
+        echo "ERROR: Invalid timeout: ${OPT_TIMEOUT:-${RMAN_JOB_TIMEOUT}} (use N, Ns, Nm or Nh)" >&2
+        exit 2
+    fi
+
     # Validate RCV script exists (check direct path and ORADBA_BASE/rcv/)
     if [[ ! -f "${OPT_RCV_SCRIPT}" ]] && [[ ! -f "${ORADBA_BASE}/rcv/${OPT_RCV_SCRIPT}" ]]; then
         echo "ERROR: RCV script not found: ${OPT_RCV_SCRIPT}" >&2
@@ -1072,6 +1335,9 @@ main() {
     [[ -n "${OPT_COMPRESSION}" ]] && oradba_log INFO "Compression:        ${OPT_COMPRESSION}"
     [[ -n "${OPT_TAG}" ]] && oradba_log INFO "Tag:                ${OPT_TAG}"
     [[ -n "${OPT_PARALLEL}" ]] && oradba_log INFO "Parallel:           ${OPT_PARALLEL}"
+    oradba_log INFO "Max Jobs:           ${RMAN_MAX_JOBS}"
+    [[ "${RMAN_IO_BUDGET}" -gt 0 ]] && oradba_log INFO "I/O Budget:         ${RMAN_IO_BUDGET}"
+    [[ -n "${OPT_TIMEOUT}" ]] && oradba_log INFO "Timeout per SID:    ${OPT_TIMEOUT}"
     [[ -n "${OPT_NOTIFY_EMAIL}" ]] && oradba_log INFO "Notification Email: ${OPT_NOTIFY_EMAIL}"
     [[ "${OPT_DRY_RUN}" == "true" ]] && oradba_log INFO "Mode:               DRY RUN"
     oradba_log INFO ""
@@ -1082,32 +1348,29 @@ main() {
     # Split SIDs into array
     IFS=',' read -ra SID_ARRAY <<< "${OPT_SIDS}"
 
-    # Execute based on number of SIDs
-    if [[ ${#SID_ARRAY[@]} -eq 1 ]]; then
-        # Single SID - execute directly
-        if execute_rman_for_sid "${SID_ARRAY[0]}" "${OPT_RCV_SCRIPT}"; then
-            SUCCESSFUL_SIDS+=("${SID_ARRAY[0]}")
-        else
-            FAILED_SIDS+=("${SID_ARRAY[0]}")
-        fi
+    # Execute through the job scheduler (a single SID is a pool of one, so
+    # timeouts and result records apply as well)
+    if [[ "${PARALLEL_METHOD}" == "gnu_parallel" && ${#SID_ARRAY[@]} -gt 1 ]]; then
+        execute_parallel_gnu "${SID_ARRAY[@]}"
     else
-        # Multiple SIDs - execute in parallel
-        if [[ "${PARALLEL_METHOD}" == "gnu_parallel" ]]; then
-            execute_parallel_gnu "${SID_ARRAY[@]}"
-        else
-            execute_parallel_background "${SID_ARRAY[@]}"
-        fi
+        execute_parallel_background "${SID_ARRAY[@]}"
+    fi
 
-        # Read results (bash 3 compatible: avoid mapfile/readarray)
-        if [[ -f "${TEMP_DIR}/success.txt" ]]; then
-            SUCCESSFUL_SIDS=()
-            while IFS= read -r line; do SUCCESSFUL_SIDS+=("$line"); done < "${TEMP_DIR}/success.txt"
-        fi
-        if [[ -f "${TEMP_DIR}/failed.txt" ]]; then
-            FAILED_SIDS=()
-            while IFS= read -r line; do FAILED_SIDS+=("$line"); done < "${TEMP_DIR}/failed.txt"
+    # Derive SID lists from the result records; SIDs without a record failed
+    local record r_sid r_status sid
+    local -A recorded=()
+    for record in "${JOB_RECORDS[@]}"; do
+        IFS='|' read -r r_sid r_status _ <<< "${record}"
+        recorded[${r_sid}]=1
+        if [[ "${r_status}" == "SUCCESS" ]]; then
+            SUCCESSFUL_SIDS+=("${r_sid}")
+        else
+            FAILED_SIDS+=("${r_sid}")
         fi
-    fi
+    done
+    for sid in "${SID_ARRAY[@]}"; do
+        [[ -z "${recorded[${sid}]:-}" ]] && FAILED_SIDS+=("${sid}")
+    done
 
     # Summary
     oradba_log INFO ""
@@ -1122,6 +1385,16 @@ main() {
         oradba_log INFO "Failed SIDs: ${FAILED_SIDS[*]}"
     fi
 
+    local r_rc r_duration r_weight r_log
+    oradba_log INFO ""
+    oradba_log INFO "$(printf '%-12s %-8s %5s %10s %6s  %s' SID STATUS EXIT DURATION WEIGHT LOG)"
+    for record in "${JOB_RECORDS[@]}"; do
+        IFS='|' read -r r_sid r_status r_rc r_duration r_weight r_log <<< "${record}"
+        oradba_log INFO "$(printf '%-12s %-8s %5s %10s %6s  %s' "${r_sid}" "${r_status}" "${r_rc}" \
+            "$(format_duration "${r_duration}")" "${r_weight}" "${r_log:--}")"
+    done
+    [[ -f "${RESULTS_FILE}" ]] && oradba_log INFO "Results file: ${RESULTS_FILE}"
+
     # Send notification
     if [[ ${#FAILED_SIDS[@]} -gt 0 ]]; then
         send_notification "ERROR" "${OPT_NOTIFY_EMAIL}"
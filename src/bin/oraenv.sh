@@ -23,10 +23,21 @@ if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
     exit 1
 fi
 
+# Start time for the optional profiler (ORADBA_PROFILE=true)
+_ORAENV_PROFILE_T0="${EPOCHREALTIME:-}"
+
 # Get the directory where this script resides
 _ORAENV_SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 _ORAENV_BASE_DIR="$(dirname "$_ORAENV_SCRIPT_DIR")"
 
+# Optional profiler: records phase/function times and forks to a profile file
+if [[ "${ORADBA_PROFILE:-false}" == "true" ]] && [[ -f "${_ORAENV_BASE_DIR}/lib/oradba_profile.sh" ]]; then
+    # shellcheck source=/dev/null
+    source "${_ORAENV_BASE_DIR}/lib/oradba_profile.sh"
+    oradba_profile_start "oraenv.sh" "${_ORAENV_PROFILE_T0}" || true
+    oradba_profile_mark "source oradba_profile.sh"
+fi
+
 # Set ORADBA_PREFIX for configuration loading (kept for compatibility)
 export ORADBA_PREFIX="${_ORAENV_BASE_DIR}"
 export ORADBA_BASE="${ORADBA_BASE:-${ORADBA_PREFIX}}"
@@ -35,6 +46,7 @@ export ORADBA_CONFIG_DIR="${ORADBA_BASE}/etc"
 # Source common library first (provides load_config function)
 if [[ -f "${_ORAENV_BASE_DIR}/lib/oradba_common.sh" ]]; then
     source "${_ORAENV_BASE_DIR}/lib/oradba_common.sh"
+    [[ -n "${_ORADBA_PROFILE_ACTIVE:-}" ]] && oradba_profile_mark "source oradba_common.sh"
 else
     echo "ERROR: Cannot find common library at ${_ORAENV_BASE_DIR}/lib/oradba_common.sh"
     return 1
@@ -44,6 +56,7 @@ fi
 if [[ -f "${_ORAENV_BASE_DIR}/lib/oradba_registry.sh" ]]; then
     # shellcheck source=/dev/null
     source "${_ORAENV_BASE_DIR}/lib/oradba_registry.sh"
+    [[ -n "${_ORADBA_PROFILE_ACTIVE:-}" ]] && oradba_profile_mark "source oradba_registry.sh"
 fi
 
 # Load core configuration (provides base settings for oratab, paths, etc.)
@@ -55,6 +68,7 @@ fi
 
 # Load local configuration (created during installation, contains coexistence mode)
 load_config_file "${ORADBA_CONFIG_DIR}/oradba_local.conf"
+[[ -n "${_ORADBA_PROFILE_ACTIVE:-}" ]] && oradba_profile_mark "load oradba_core.conf/oradba_local.conf"
 
 # Dynamic BasEnv coexistence detection (Step 2 of issue #93)
 # Auto-set minimal coexist mode when BasEnv is active but not yet configured.
@@ -75,11 +89,13 @@ fi
 # Source database functions library (optional, only if available)
 if [[ -f "${_ORAENV_BASE_DIR}/lib/oradba_db_functions.sh" ]]; then
     source "${_ORAENV_BASE_DIR}/lib/oradba_db_functions.sh"
+    [[ -n "${_ORADBA_PROFILE_ACTIVE:-}" ]] && oradba_profile_mark "source oradba_db_functions.sh"
 fi
 
 # Source extension system library (optional, only if enabled)
 if [[ "${ORADBA_AUTO_DISCOVER_EXTENSIONS}" == "true" ]] && [[ -f "${_ORAENV_BASE_DIR}/lib/extensions.sh" ]]; then
     source "${_ORAENV_BASE_DIR}/lib/extensions.sh"
+    [[ -n "${_ORADBA_PROFILE_ACTIVE:-}" ]] && oradba_profile_mark "source extensions.sh"
     oradba_log DEBUG "Extension system library loaded (extensions.sh sourced)"
 elif [[ "${ORADBA_AUTO_DISCOVER_EXTENSIONS}" != "true" ]]; then
     oradba_log DEBUG "Extension discovery disabled (ORADBA_AUTO_DISCOVER_EXTENSIONS=${ORADBA_AUTO_DISCOVER_EXTENSIONS})"
@@ -121,6 +137,7 @@ _oraenv_ensure_lib() {
         # shellcheck source=/dev/null
         source "${_lib}"
         declare -g "${_flag}=1"
+        [[ -n "${_ORADBA_PROFILE_ACTIVE:-}" ]] && oradba_profile_mark "source ${_lib##*/}"
         return 0
     fi
     return 1
@@ -147,9 +164,16 @@ _oradba_path_contains() {
 # Args....: None
 # Returns.: 0 on success
 # Output..: Milliseconds since epoch
-# Notes...: Uses python3 first, then perl Time::HiRes, then date seconds fallback
+# Notes...: Uses EPOCHREALTIME (bash 5+, no fork) first, then python3, then
+#           perl Time::HiRes, then date seconds fallback
 # ------------------------------------------------------------------------------
 _oraenv_now_ms() {
+    if [[ -n "${EPOCHREALTIME:-}" ]]; then
+        local _now="${EPOCHREALTIME/[.,]/}"
+        echo "$((10#${_now} / 1000))"
+        return 0
+    fi
+
     if command -v python3 &> /dev/null; then
         python3 -c 'import time; print(int(time.time() * 1000))' 2> /dev/null && return 0
     fi
@@ -185,9 +209,11 @@ _oraenv_profile_start() {
 # Args....: $1 - Phase label
 # Returns.: 0 always
 # Output..: Profile timing line to stderr when enabled
+# Notes...: Also records the phase in the profile file when ORADBA_PROFILE=true
 # ------------------------------------------------------------------------------
 _oraenv_profile_mark() {
     local label="$1"
+    [[ -n "${_ORADBA_PROFILE_ACTIVE:-}" ]] && oradba_profile_mark "${label}"
     [[ "${_ORAENV_PROFILE_ENABLED}" != "true" ]] && return 0
 
     local now_ms
@@ -750,11 +776,7 @@ _oraenv_apply_path_configs() {
     fi
 
     # Final PATH deduplication after all configs and path additions
-    if command -v oradba_dedupe_path &> /dev/null; then
-        local final_path
-        final_path="$(oradba_dedupe_path "$PATH")"
-        export PATH="$final_path"
-    fi
+    oradba_pathset_dedupe PATH
 }
 
 # ------------------------------------------------------------------------------
@@ -1391,6 +1413,313 @@ _oraenv_unset_old_env() {
     export LD_LIBRARY_PATH
 }
 
+# ------------------------------------------------------------------------------
+# Environment Bundles
+# ------------------------------------------------------------------------------
+# After a full build, oraenv.sh stores the resulting changes (libraries
+# loaded, variables, aliases and functions) as a shell fragment per target and
+# mode in ${ORADBA_CACHE_DIR}/env. A later switch to the same target from the
+# same starting environment sources that fragment instead of rebuilding. The
+# file name includes a checksum of the starting environment, so switching
+# back and forth between targets keeps one bundle per starting point. A
+# bundle is only used while oratab, the etc/*.conf files and the extension
+# directories are unchanged and for at most ORADBA_ENV_BUNDLE_TTL seconds,
+# since PDB aliases depend on the database state.
+
+# ------------------------------------------------------------------------------
+# Function: _oraenv_bundle_path
+# Purpose.: Determine the bundle file for a target, the current mode and the
+#           starting environment
+# Args....: $1 - Requested SID or Oracle Home name
+# Returns.: 0 if bundles are enabled, 1 otherwise
+# Output..: None (sets _ORAENV_BUNDLE_FILE, and _ORAENV_BUNDLE_INPUTS if empty)
+# Notes...: Disabled with ORADBA_ENV_BUNDLE=false and in basenv coexistence
+#           mode (BasEnv owns the Oracle environment). The checksum costs one
+#           cksum call; the bundle header still compares the full inputs.
+# ------------------------------------------------------------------------------
+_oraenv_bundle_path() {
+    local target="$1"
+    local cache_dir mode="i"
+
+    _ORAENV_BUNDLE_FILE=""
+    oradba_cache_dir cache_dir
+    [[ "${ORADBA_ENV_BUNDLE:-true}" != "true" ]] && return 1
+    [[ "${ORADBA_COEXIST_MODE:-standalone}" == "basenv"* ]] && return 1
+    [[ -z "${target}" || -z "${cache_dir}" ]] && return 1
+
+    if [[ "${ORAENV_FAST_SILENT}" == "true" ]]; then
+        mode="f"
+    elif [[ "${ORAENV_INTERACTIVE}" != "true" ]]; then
+        mode="s"
+    fi
+
+    local sum
+    [[ -z "${_ORAENV_BUNDLE_INPUTS}" ]] && _oraenv_bundle_inputs
+    read -r sum _ < <(cksum <<< "${_ORAENV_BUNDLE_INPUTS}")
+    _ORAENV_BUNDLE_FILE="${cache_dir}/env/${target//[^A-Za-z0-9_.+-]/_}.${mode}.${sum:-0}.sh"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oraenv_bundle_inputs
+# Purpose.: Fingerprint the starting environment a bundle depends on
+# Args....: None
+# Returns.: 0 always
+# Output..: None (sets _ORAENV_BUNDLE_INPUTS)
+# Notes...: Covers PATH-style variables and all ORACLE_*, ORADBA_*, ORAENV_*
+#           and DATASAFE_* variables. Builtins only (no subshells).
+# ------------------------------------------------------------------------------
+_oraenv_bundle_inputs() {
+    local _name
+    _ORAENV_BUNDLE_INPUTS=""
+    for _name in PATH LD_LIBRARY_PATH SQLPATH TNS_ADMIN NLS_LANG JAVA_HOME ORATAB_FILE \
+        ${!ORACLE_@} ${!ORADBA_@} ${!ORAENV_@} ${!DATASAFE_@}; do
+        [[ "${_name}" == "ORADBA_SESSION_LOG" ]] && continue
+        _ORAENV_BUNDLE_INPUTS+="${_name}=${!_name-<unset>}"$'\x1f'
+    done
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oraenv_bundle_valid
+# Purpose.: Validate the header of a bundle while it is being sourced
+# Args....: $1 - Bundle file
+# Returns.: 0 if the bundle may be applied, 1 otherwise
+# Output..: None
+# Notes...: Reads _b_created, _b_inputs and _b_deps set by the bundle header
+# ------------------------------------------------------------------------------
+_oraenv_bundle_valid() {
+    local bundle="$1"
+    local ttl="${ORADBA_ENV_BUNDLE_TTL:-900}"
+    local now dep
+
+    [[ "${_b_inputs}" == "${_ORAENV_BUNDLE_INPUTS}" ]] || return 1
+    printf -v now '%(%s)T' -1
+    [[ "${ttl}" =~ ^[0-9]+$ ]] && [[ $((now - _b_created)) -lt ${ttl} ]] || return 1
+    for dep in "${_b_deps[@]}"; do
+        [[ -e "${dep}" && ! "${dep}" -nt "${bundle}" ]] || return 1
+    done
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oraenv_bundle_load
+# Purpose.: Apply a valid cached environment bundle for a target
+# Args....: $1 - Requested SID or Oracle Home name
+# Returns.: 0 if the bundle was applied, 1 if a full build is required
+# Output..: None (modifies environment)
+# Notes...: Only sources bundles owned by the current user and not writable
+#           by group or others (see oradba_is_private_file)
+# ------------------------------------------------------------------------------
+_oraenv_bundle_load() {
+    local _b_created=0 _b_inputs=""
+    local -a _b_deps=()
+
+    _ORAENV_BUNDLE_INPUTS=""
+    _oraenv_bundle_path "$1" || return 1
+    [[ -f "${_ORAENV_BUNDLE_FILE}" ]] || return 1
+    if ! oradba_is_private_file "${_ORAENV_BUNDLE_FILE}"; then
+        oradba_log DEBUG "Ignoring environment bundle not private to this user: ${_ORAENV_BUNDLE_FILE}"
+        return 1
+    fi
+
+    # shellcheck source=/dev/null
+    if source "${_ORAENV_BUNDLE_FILE}"; then
+        oradba_log DEBUG "Environment for $1 loaded from bundle ${_ORAENV_BUNDLE_FILE}"
+        return 0
+    fi
+    oradba_log DEBUG "Environment bundle for $1 is stale, rebuilding"
+    return 1
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oraenv_bundle_skip_var
+# Purpose.: Check whether a variable is excluded from bundles
+# Args....: $1 - Variable name
+# Returns.: 0 if the variable must not be recorded, 1 otherwise
+# Output..: None
+# ------------------------------------------------------------------------------
+_oraenv_bundle_skip_var() {
+    case "$1" in
+        _* | BASH* | COMP_* | HIST* | COPROC* | FUNCNAME | LINENO | RANDOM | SRANDOM | SECONDS | \
+            EPOCHSECONDS | EPOCHREALTIME | PIPESTATUS | GROUPS | DIRSTACK | PPID | UID | EUID | \
+            SHLVL | SHELLOPTS | PWD | OLDPWD | OPTARG | OPTIND | REPLY | MAPFILE | COLUMNS | LINES | \
+            ORADBA_SESSION_LOG)
+            return 0
+            ;;
+    esac
+    return 1
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oraenv_bundle_decl
+# Purpose.: Get a re-sourceable declaration of a variable
+# Args....: $1 - Variable name
+# Returns.: 0 if the variable can be recorded, 1 for readonly/nameref variables
+# Output..: None (sets _ORAENV_BUNDLE_DECL)
+# ------------------------------------------------------------------------------
+_oraenv_bundle_decl() {
+    local _attrs="${!1@a}"
+    _ORAENV_BUNDLE_DECL=""
+    [[ "${_attrs}" == *[rn]* ]] && return 1
+    if [[ "${_attrs}" == *[aA]* ]]; then
+        local -n _ref="$1"
+        _ORAENV_BUNDLE_DECL="${_ref[*]@A}"
+    else
+        _ORAENV_BUNDLE_DECL="${!1@A}"
+    fi
+    # Declared but unset (e.g. exported without value)
+    [[ -z "${_ORAENV_BUNDLE_DECL}" ]] && _ORAENV_BUNDLE_DECL="declare -${_attrs:--} $1"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oraenv_bundle_capture
+# Purpose.: Snapshot variables, aliases and functions before a full build
+# Args....: $1 - Requested SID or Oracle Home name
+# Returns.: 0 if a snapshot was taken, 1 if bundles are disabled
+# Output..: None (sets _ORAENV_BUNDLE_PRE_* globals)
+# ------------------------------------------------------------------------------
+_oraenv_bundle_capture() {
+    _oraenv_bundle_path "$1" || return 1
+
+    declare -gA _ORAENV_BUNDLE_PRE_VARS=()
+    declare -gA _ORAENV_BUNDLE_PRE_ALIASES=()
+    declare -gA _ORAENV_BUNDLE_PRE_FUNCS=()
+    local _name _line
+    for _name in $(compgen -v); do
+        _oraenv_bundle_skip_var "${_name}" && continue
+        _oraenv_bundle_decl "${_name}" && _ORAENV_BUNDLE_PRE_VARS["${_name}"]="${_ORAENV_BUNDLE_DECL}"
+    done
+    for _name in "${!BASH_ALIASES[@]}"; do
+        _ORAENV_BUNDLE_PRE_ALIASES["${_name}"]="${BASH_ALIASES[${_name}]}"
+    done
+    while read -r _line; do
+        _ORAENV_BUNDLE_PRE_FUNCS["${_line##* }"]=1
+    done < <(declare -F)
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oraenv_bundle_write
+# Purpose.: Write the bundle for a target after a successful full build
+# Args....: $1 - Requested SID or Oracle Home name
+#           $2 - Path to oratab file
+# Returns.: 0 on success, 1 if no snapshot exists or the bundle is not writable
+# Output..: None (creates ${ORADBA_CACHE_DIR}/env/<target>.<mode>.sh)
+# Notes...: Records the libraries sourced during the build (sourced again by
+#           the bundle), changed/unset variables, changed/removed aliases, the
+#           functions defined by configuration files, extensions or other new
+#           code, and which of those functions are exported
+# ------------------------------------------------------------------------------
+_oraenv_bundle_write() {
+    local _target="$1"
+    local _oratab="$2"
+    [[ -n "${_ORAENV_BUNDLE_FILE}" ]] && declare -p _ORAENV_BUNDLE_PRE_VARS &> /dev/null || return 1
+
+    local _bundle="${_ORAENV_BUNDLE_FILE}"
+    local _tmp="${_bundle}.$$"
+    mkdir -p "${_bundle%/*}" 2> /dev/null || return 1
+
+    # Dependencies: any change invalidates the bundle
+    local -a _deps=()
+    local _dep
+    for _dep in "${_oratab}" "${ORADBA_CONFIG_DIR}" "${ORADBA_CONFIG_DIR}"/*.conf \
+        "${ORADBA_BASE}/etc" "${ORADBA_BASE}/etc"/*.conf "${BASH_SOURCE[0]}" "${_ORAENV_BASE_DIR}/lib"; do
+        [[ -n "${_dep}" && -e "${_dep}" ]] && _deps+=("${_dep}")
+    done
+    if [[ "${ORADBA_AUTO_DISCOVER_EXTENSIONS}" == "true" ]] && [[ -d "${ORADBA_LOCAL_BASE:-}" ]]; then
+        for _dep in "${ORADBA_LOCAL_BASE}" "${ORADBA_LOCAL_BASE}"/*/ "${ORADBA_LOCAL_BASE}"/*/.extension; do
+            [[ -e "${_dep}" ]] && _deps+=("${_dep%/}")
+        done
+    fi
+
+    # Libraries sourced during the build are sourced again by the bundle (they
+    # also set up their own state). Functions to carry over: all defined by
+    # configuration files or extensions, and other new ones outside oraenv.sh.
+    local -a _funcs=() _all_funcs=() _libs=() _exports=()
+    local -A _seen_libs=() _exported=()
+    local _name _line _file
+    local _extdebug=false
+    mapfile -t _all_funcs < <(compgen -A function)
+    while read -r _ _ _name; do
+        _exported["${_name}"]=1
+    done < <(declare -Fx)
+    shopt -q extdebug && _extdebug=true
+    shopt -s extdebug
+    while read -r _name _line _file; do
+        [[ "${_file}" == "${_ORAENV_BASE_DIR}/bin/"* ]] && continue
+        if [[ "${_file}" == "${_ORAENV_BASE_DIR}/lib/"* ]]; then
+            [[ -n "${_ORAENV_BUNDLE_PRE_FUNCS[${_name}]:-}" || -n "${_seen_libs[${_file}]:-}" ]] && continue
+            _seen_libs["${_file}"]=1
+            _libs+=("${_file}")
+        elif [[ "${_file}" == "${ORADBA_CONFIG_DIR}/"* ]] \
+            || [[ -n "${ORADBA_LOCAL_BASE:-}" && "${_file}" == "${ORADBA_LOCAL_BASE}/"* ]] \
+            || [[ -z "${_ORAENV_BUNDLE_PRE_FUNCS[${_name}]:-}" && "${_file}" == /* ]]; then
+            _funcs+=("${_name}")
+        else
+            continue
+        fi
+        [[ -n "${_exported[${_name}]:-}" ]] && _exports+=("${_name}")
+    done < <(declare -F "${_all_funcs[@]}")
+    [[ "${_extdebug}" == "false" ]] && shopt -u extdebug
+
+    {
+        printf '# OraDBA environment bundle for %s (generated by oraenv.sh)\n' "${_target}"
+        printf '_b_created=%(%s)T\n' -1
+        printf '_b_inputs=%q\n' "${_ORAENV_BUNDLE_INPUTS}"
+        printf '_b_deps=('
+        printf ' %q' "${_deps[@]}"
+        printf ' )\n'
+        printf '_oraenv_bundle_valid %q || return 1\n' "${_bundle}"
+        for _file in ${_libs[@]+"${_libs[@]}"}; do
+            printf 'source %q || return 1\n' "${_file}"
+        done
+
+        for _name in $(compgen -v); do
+            _oraenv_bundle_skip_var "${_name}" && continue
+            _oraenv_bundle_decl "${_name}" || continue
+            [[ "${_ORAENV_BUNDLE_PRE_VARS[${_name}]-}" == "${_ORAENV_BUNDLE_DECL}" ]] && continue
+            if [[ "${_ORAENV_BUNDLE_DECL}" == "declare -- "* ]]; then
+                printf '%s\n' "declare -g ${_ORAENV_BUNDLE_DECL#declare -- }"
+            elif [[ "${_ORAENV_BUNDLE_DECL}" == "declare -"* ]]; then
+                printf '%s\n' "declare -g${_ORAENV_BUNDLE_DECL#declare -}"
+            else
+                printf '%s\n' "${_ORAENV_BUNDLE_DECL}"
+            fi
+        done
+        for _name in "${!_ORAENV_BUNDLE_PRE_VARS[@]}"; do
+            declare -p "${_name}" &> /dev/null || printf 'unset -v %s\n' "${_name}"
+        done
+
+        for _name in "${!BASH_ALIASES[@]}"; do
+            [[ "${_ORAENV_BUNDLE_PRE_ALIASES[${_name}]-}" == "${BASH_ALIASES[${_name}]}" ]] && continue
+            printf 'alias %s=%q\n' "${_name}" "${BASH_ALIASES[${_name}]}"
+        done
+        for _name in "${!_ORAENV_BUNDLE_PRE_ALIASES[@]}"; do
+            [[ -n "${BASH_ALIASES[${_name}]+set}" ]] || printf 'unalias %s 2> /dev/null\n' "${_name}"
+        done
+
+        [[ ${#_funcs[@]} -gt 0 ]] && declare -f "${_funcs[@]}"
+        [[ ${#_exports[@]} -gt 0 ]] && printf 'export -f %s\n' "${_exports[*]}"
+        printf 'return 0\n'
+    } > "${_tmp}" 2> /dev/null && chmod 600 "${_tmp}" 2> /dev/null \
+        && mv -f "${_tmp}" "${_bundle}" 2> /dev/null || {
+        rm -f "${_tmp}"
+        return 1
+    }
+
+    unset _ORAENV_BUNDLE_PRE_VARS _ORAENV_BUNDLE_PRE_ALIASES _ORAENV_BUNDLE_PRE_FUNCS
+
+    # Drop expired bundles of other starting environments for this target
+    local _ttl="${ORADBA_ENV_BUNDLE_TTL:-900}" _stem="${_bundle##*/}"
+    [[ "${_ttl}" =~ ^[0-9]+$ ]] || _ttl=900
+    find "${_bundle%/*}" -maxdepth 1 -type f -name "${_stem%.*.sh}.*.sh" \
+        -mmin "+$(((_ttl + 59) / 60))" -delete 2> /dev/null
+    oradba_log DEBUG "Environment bundle written: ${_bundle}"
+    return 0
+}
+
 # ------------------------------------------------------------------------------
 # Function: _oraenv_show_environment
 # Purpose.: Display current Oracle environment variables
@@ -1458,28 +1787,46 @@ _oraenv_main() {
 
     oradba_log DEBUG "Using oratab file: $oratab_file"
 
-    # Get ORACLE_SID if not provided
-    if [[ -z "$REQUESTED_SID" ]]; then
-        # basenv-maximal mode: BasEnv has already set ORACLE_SID — use it directly,
-        # no interactive menu needed. Fall through to normal prompt only if not set.
-        if [[ "${ORADBA_COEXIST_MODE:-standalone}" == "basenv-maximal" ]] && [[ -n "${ORACLE_SID:-}" ]]; then
-            REQUESTED_SID="${ORACLE_SID}"
-            oradba_log DEBUG "basenv-maximal mode: using BasEnv-set ORACLE_SID=${ORACLE_SID}"
-        else
-            REQUESTED_SID=$(_oraenv_prompt_sid "$oratab_file")
+    # Reuse the cached environment bundle of an explicitly requested target
+    local result=0
+    if [[ -n "$REQUESTED_SID" ]] && _oraenv_bundle_load "$REQUESTED_SID"; then
+        _oraenv_profile_mark "env_bundle_load"
+    else
+        # Build the registry index once in this shell so later lookups (including
+        # those in command substitutions) are served without reparsing oratab
+        if type -t oradba_registry_load &> /dev/null; then
+            oradba_registry_load || true
+            _oraenv_profile_mark "registry_load"
         fi
-        _oraenv_profile_mark "resolve_requested_sid"
+
+        # Get ORACLE_SID if not provided
         if [[ -z "$REQUESTED_SID" ]]; then
-            oradba_log ERROR "No ORACLE_SID provided"
-            return 1
+            # basenv-maximal mode: BasEnv has already set ORACLE_SID — use it directly,
+            # no interactive menu needed. Fall through to normal prompt only if not set.
+            if [[ "${ORADBA_COEXIST_MODE:-standalone}" == "basenv-maximal" ]] && [[ -n "${ORACLE_SID:-}" ]]; then
+                REQUESTED_SID="${ORACLE_SID}"
+                oradba_log DEBUG "basenv-maximal mode: using BasEnv-set ORACLE_SID=${ORACLE_SID}"
+            else
+                REQUESTED_SID=$(_oraenv_prompt_sid "$oratab_file")
+            fi
+            _oraenv_profile_mark "resolve_requested_sid"
+            if [[ -z "$REQUESTED_SID" ]]; then
+                oradba_log ERROR "No ORACLE_SID provided"
+                return 1
+            fi
         fi
-    fi
 
-    # Set environment
-    _oraenv_set_environment "$REQUESTED_SID" "$oratab_file"
-    local result=$?
+        # Set environment (full build) and record it as bundle for later switches
+        _oraenv_bundle_capture "$REQUESTED_SID" || true
+        _oraenv_set_environment "$REQUESTED_SID" "$oratab_file"
+        result=$?
+        _oraenv_profile_mark "set_environment"
+        if [[ $result -eq 0 ]]; then
+            _oraenv_bundle_write "$REQUESTED_SID" "$oratab_file" || true
+            _oraenv_profile_mark "env_bundle_write"
+        fi
+    fi
     local current_product_type="${ORADBA_CURRENT_HOME_TYPE:-database}"
-    _oraenv_profile_mark "set_environment"
 
     if [[ $result -eq 0 ]]; then
         # In basenv-maximal login mode (SID taken from BasEnv, not from CLI),
@@ -1499,6 +1846,8 @@ _oraenv_main() {
             show_database_status
             _oraenv_profile_mark "show_database_status"
         fi
+        # Do not leave a persistent SQL*Plus session behind in the sourcing shell
+        type -t oradba_sql_session_close_all &> /dev/null && oradba_sql_session_close_all
         # Silent mode or no status: show nothing
     fi
 
@@ -1507,5 +1856,22 @@ _oraenv_main() {
     return $result
 }
 
+# ------------------------------------------------------------------------------
+# Function: _oraenv_run
+# Purpose.: Run _oraenv_main and stop the profiler on every exit path
+# Args....: $@ - All command line arguments
+# Returns.: Exit status of _oraenv_main
+# Output..: None
+# Notes...: Keeps wrapped functions from staying wrapped in the sourcing shell
+#           after an early return (see oradba_profile_finish)
+# ------------------------------------------------------------------------------
+_oraenv_run() {
+    local rc
+    _oraenv_main "$@"
+    rc=$?
+    [[ -n "${_ORADBA_PROFILE_ACTIVE:-}" ]] && oradba_profile_finish "${rc}"
+    return ${rc}
+}
+
 # Run main function with all arguments
-_oraenv_main "$@"
+_oraenv_run "$@"
@@ -67,6 +67,18 @@ else
     oradba_log DEBUG "oraup.sh: Using oratab file (fallback): ${ORATAB_FILE}"
 fi
 
+# Instance status collection settings
+ORAUP_TIMEOUT="${ORADBA_ORAUP_TIMEOUT:-10}" # Per-instance SQL*Plus timeout (seconds, 0 = none)
+ORAUP_JOBS="${ORADBA_ORAUP_JOBS:-8}"        # Concurrent open-mode queries
+
+# Instance snapshot state (filled once per refresh by build_instance_map)
+declare -gA _ORAUP_PMON_PID=()    # "ora:<sid>" / "db:<SID>" -> pmon pid
+declare -ga _ORAUP_LISTENERS=()   # "<name>|<ORACLE_HOME>" of running database listeners
+declare -gA _ORAUP_DB_MODE=()     # SID -> last collected open mode
+declare -gA _ORAUP_DB_MODE_PID=() # SID -> pmon pid the mode was collected for
+_ORAUP_MAP_LOADED=false
+_ORAUP_REUSE_MODES=false
+
 # ------------------------------------------------------------------------------
 # Function: show_usage
 # Purpose.: Display usage information
@@ -81,6 +93,8 @@ OPTIONS:
     -h, --help      Show this help message
     -v, --verbose   Show verbose output
     -q, --quiet     Minimal output (errors only)
+    -w, --watch [N] Refresh the status every N seconds (default: 5)
+    -c, --count N   Stop watch mode after N refreshes (default: unlimited)
 
 DESCRIPTION:
     Shows all Oracle environments on the system:
@@ -94,10 +108,18 @@ DESCRIPTION:
     
     Supports Oracle 11g through 23ai (both ora_pmon_* and db_pmon_* naming)
 
+    The process table is read once per refresh. Open modes of running
+    instances are queried concurrently (ORADBA_ORAUP_JOBS, default 8), each
+    limited to ORADBA_ORAUP_TIMEOUT seconds (default 10); an instance that
+    does not answer in time is reported as "timeout". In watch mode the
+    registry is read once and open instances are only queried again when
+    their pmon process changed.
+
 EXAMPLES:
     $(basename "$0")                # Show full status
     $(basename "$0") --verbose      # Show detailed information
     $(basename "$0") --quiet        # Minimal output
+    $(basename "$0") --watch 10     # Refresh every 10 seconds
 
 EOF
 }
@@ -113,6 +135,79 @@ get_process_list() {
     ps -ef 2> /dev/null || true
 }
 
+# ------------------------------------------------------------------------------
+# Function: build_instance_map
+# Purpose.: Build the SID -> pmon pid map and the list of running listeners
+# Args....: $1 - Optional: process list (from get_process_list)
+# Returns.: 0 on success, 1 if no process list is given and the shared
+#           instance scan is not available
+# Output..: None (fills _ORAUP_PMON_PID and _ORAUP_LISTENERS, sets
+#           _ORAUP_MAP_LOADED=true)
+# Notes...: Without a process list the shared instance table of
+#           oradba_instance_scan is used (one /proc pass, no ps). A process
+#           list is parsed for pmon background processes only (ora_pmon_<sid>
+#           before 23ai, db_pmon_<SID> from 23ai), so grep commands or scripts
+#           mentioning a pmon name are not counted. Listeners of Data Safe /
+#           Connection Manager homes are left out.
+# ------------------------------------------------------------------------------
+build_instance_map() {
+    local process_list="${1:-}"
+    local kind name pid home cmd _f
+    local -a fields=()
+
+    _ORAUP_PMON_PID=()
+    _ORAUP_LISTENERS=()
+    if [[ -z "${process_list}" ]]; then
+        type -t oradba_instance_scan &> /dev/null && oradba_instance_scan || return 1
+        while IFS='|' read -r kind name pid _ home; do
+            if [[ "${kind}" == "listener" ]]; then
+                _ORAUP_LISTENERS+=("${name}|${home}")
+            else
+                _ORAUP_PMON_PID["db:${name}"]="${pid}"
+                _ORAUP_PMON_PID["ora:${name,,}"]="${pid}"
+            fi
+        done < <(oradba_instance_list db listener)
+    else
+        while read -r _ pid _ _ _ _ _ cmd; do
+            if [[ "${cmd}" =~ ^(ora|db)_pmon_([^[:space:]]+) ]]; then
+                _ORAUP_PMON_PID["${BASH_REMATCH[1]}:${BASH_REMATCH[2]}"]="${pid}"
+            fi
+        done < <(grep -E "(db|ora)_pmon_" <<< "${process_list}" 2> /dev/null || true)
+
+        # ps output format: /path/to/oracle_home/bin/tnslsnr LISTENER -inherit
+        while read -ra fields; do
+            name="${fields[${#fields[@]} - 2]}"
+            home=""
+            for _f in "${fields[@]}"; do
+                if [[ "${_f}" == */tnslsnr ]]; then
+                    home="${_f%/bin/tnslsnr}"
+                    break
+                fi
+            done
+            _ORAUP_LISTENERS+=("${name}|${home}")
+        done < <(grep "[t]nslsnr" <<< "$process_list" | grep -v "datasafe\|oracle_cman_home")
+    fi
+
+    _ORAUP_MAP_LOADED=true
+    oradba_log DEBUG "oraup.sh: Instance map built (${#_ORAUP_PMON_PID[@]} pmon entries, ${#_ORAUP_LISTENERS[@]} listeners)"
+}
+
+# ------------------------------------------------------------------------------
+# Function: get_instance_pid
+# Purpose.: Look up the pmon pid of an instance in the instance map
+# Args....: $1 - SID name
+#           $2 - Name of the variable receiving the pid
+# Returns.: 0 if the instance is running, 1 otherwise
+# Output..: None
+# Notes...: Requires build_instance_map; no subshell or external command
+# ------------------------------------------------------------------------------
+get_instance_pid() {
+    local sid="$1"
+    local sid_lower="${sid,,}"
+    printf -v "$2" '%s' "${_ORAUP_PMON_PID[db:${sid}]:-${_ORAUP_PMON_PID[ora:${sid_lower}]:-}}"
+    [[ -n "${!2}" ]]
+}
+
 # ------------------------------------------------------------------------------
 # Function: get_db_status
 # Purpose.: Get database instance status by checking pmon process
@@ -146,32 +241,70 @@ get_db_status() {
     fi
 }
 
+# ------------------------------------------------------------------------------
+# Function: run_sqlplus
+# Purpose.: Run SQL*Plus as sysdba for an instance with the status timeout
+# Args....: $1 - ORACLE_HOME
+#           $2 - SID
+# Returns.: SQL*Plus exit code, 124 on timeout
+# Output..: SQL*Plus output (script is read from stdin)
+# Notes...: Uses timeout(1) when available and ORAUP_TIMEOUT > 0
+# ------------------------------------------------------------------------------
+run_sqlplus() {
+    local oracle_home="$1"
+    local sid="$2"
+    local -a cmd=("${oracle_home}/bin/sqlplus" -S / as sysdba)
+
+    if [[ "${ORAUP_TIMEOUT}" =~ ^[0-9]+$ ]] && [[ ${ORAUP_TIMEOUT} -gt 0 ]] && command -v timeout &> /dev/null; then
+        cmd=(timeout "${ORAUP_TIMEOUT}" "${cmd[@]}")
+    fi
+
+    ORACLE_HOME="$oracle_home" ORACLE_SID="$sid" "${cmd[@]}" 2> /dev/null
+}
+
 # ------------------------------------------------------------------------------
 # Function: get_db_mode
 # Purpose.: Get database open mode (OPEN, MOUNTED, etc.)
-# Returns.: Open mode or "n/a"
+# Args....: $1 - SID name
+#           $2 - ORACLE_HOME
+#           $3 - Optional: cached process list (when no instance map is loaded)
+# Returns.: 0 always
+# Output..: Open mode, "timeout" or "n/a"
+# Notes...: Uses the instance map from build_instance_map when loaded
 # ------------------------------------------------------------------------------
 get_db_mode() {
     local sid="$1"
     local oracle_home="$2"
+    local process_list="${3:-}"
 
     # Check if instance is running
-    if [[ "$(get_db_status "$sid")" != "up" ]]; then
+    if [[ "${_ORAUP_MAP_LOADED}" == "true" ]]; then
+        if ! get_instance_pid "$sid" _; then
+            echo "n/a"
+            return
+        fi
+    elif [[ "$(get_db_status "$sid" "$process_list")" != "up" ]]; then
         echo "n/a"
         return
     fi
 
     # Try to get open mode via SQL*Plus
-    local mode
+    local mode rc=0
     mode=$(
-        ORACLE_HOME="$oracle_home" ORACLE_SID="$sid" "$oracle_home/bin/sqlplus" -S / as sysdba 2> /dev/null << EOF
+        run_sqlplus "$oracle_home" "$sid" << EOF
 SET PAGESIZE 0 FEEDBACK OFF VERIFY OFF HEADING OFF ECHO OFF
 WHENEVER SQLERROR EXIT SQL.SQLCODE
 WHENEVER OSERROR EXIT FAILURE
 SELECT status FROM v\$instance;
 EXIT;
 EOF
-    )
+    ) || rc=$?
+
+    # A hung instance costs one timeout, skip the fallback query
+    if [[ ${rc} -eq 124 ]]; then
+        echo "timeout"
+        return
+    fi
 
     # Clean up output (strip whitespace/control chars via parameter expansion)
     mode="${mode//[$'\n'$'\r']/}"
@@ -184,12 +317,12 @@ EOF
     else
         # If v$instance query failed, try v$database for open_mode
         mode=$(
-            ORACLE_HOME="$oracle_home" ORACLE_SID="$sid" "$oracle_home/bin/sqlplus" -S / as sysdba 2> /dev/null << EOF
+            run_sqlplus "$oracle_home" "$sid" << EOF
 SET PAGESIZE 0 FEEDBACK OFF VERIFY OFF HEADING OFF ECHO OFF
 SELECT open_mode FROM v\$database;
 EXIT;
 EOF
-        )
+        ) || true
         mode="${mode//[$'\n'$'\r']/}"
         mode="${mode#"${mode%%[![:space:]]*}"}"
         mode="${mode%"${mode##*[![:space:]]}"}"
@@ -202,17 +335,97 @@ EOF
     fi
 }
 
+# ------------------------------------------------------------------------------
+# Function: collect_db_modes
+# Purpose.: Collect open modes of running instances concurrently
+# Args....: $@ - "SID|ORACLE_HOME" pairs
+# Returns.: 0 always
+# Output..: None (fills _ORAUP_DB_MODE and _ORAUP_DB_MODE_PID)
+# Notes...: Requires build_instance_map. Runs at most ORAUP_JOBS queries at a
+#           time, each bounded by ORAUP_TIMEOUT. With _ORAUP_REUSE_MODES=true
+#           (watch mode) an open instance is not queried again while its pmon
+#           pid is unchanged.
+# ------------------------------------------------------------------------------
+collect_db_modes() {
+    local -a pending=()
+    local pair sid home pid
+
+    for pair in "$@"; do
+        sid="${pair%%|*}"
+        if ! get_instance_pid "$sid" pid; then
+            _ORAUP_DB_MODE["$sid"]="n/a"
+            _ORAUP_DB_MODE_PID["$sid"]=""
+            continue
+        fi
+        if [[ "${_ORAUP_REUSE_MODES}" == "true" ]] \
+            && [[ "${_ORAUP_DB_MODE_PID[$sid]:-}" == "$pid" ]] \
+            && [[ "${_ORAUP_DB_MODE[$sid]:-}" == "open" ]]; then
+            continue
+        fi
+        pending+=("$pair")
+    done
+
+    [[ ${#pending[@]} -eq 0 ]] && return 0
+    oradba_log DEBUG "oraup.sh: Querying open mode of ${#pending[@]} instance(s), ${ORAUP_JOBS} at a time"
+
+    local work_dir
+    work_dir=$(mktemp -d "${TMPDIR:-/tmp}/oraup.XXXXXX")
+
+    local jobs="${ORAUP_JOBS}"
+    [[ "${jobs}" =~ ^[0-9]+$ ]] && [[ ${jobs} -ge 1 ]] || jobs=1
+    local idx running=0
+    for idx in "${!pending[@]}"; do
+        pair="${pending[$idx]}"
+        (
+            local q_sid="${pair%%|*}"
+            local q_home="${pair#*|}"
+            local q_pid exe=""
+            # Fall back to the home of the running instance if needed (from
+            # the instance scan, else the binary of its pmon process)
+            if [[ ! -x "${q_home}/bin/sqlplus" ]]; then
+                if type -t oradba_instance_get &> /dev/null && oradba_instance_get db "$q_sid" "" exe \
+                    && [[ -n "$exe" ]]; then
+                    q_home="${exe}"
+                elif get_instance_pid "$q_sid" q_pid \
+                    && exe=$(readlink "/proc/${q_pid}/exe" 2> /dev/null) && [[ "$exe" == */bin/oracle ]]; then
+                    q_home="${exe%/bin/oracle}"
+                fi
+            fi
+            get_db_mode "$q_sid" "$q_home" > "${work_dir}/${idx}"
+        ) &
+        running=$((running + 1))
+        if [[ ${running} -ge ${jobs} ]]; then
+            # wait -n needs bash 4.3; otherwise drain the whole batch
+            if wait -n 2> /dev/null; then
+                running=$((running - 1))
+            else
+                wait
+                running=0
+            fi
+        fi
+    done
+    wait
+
+    local mode
+    for idx in "${!pending[@]}"; do
+        sid="${pending[$idx]%%|*}"
+        mode=""
+        read -r mode < "${work_dir}/${idx}" 2> /dev/null || true
+        _ORAUP_DB_MODE["$sid"]="${mode:-started}"
+        get_instance_pid "$sid" pid || pid=""
+        _ORAUP_DB_MODE_PID["$sid"]="$pid"
+    done
+    rm -rf "${work_dir}"
+}
+
 # ------------------------------------------------------------------------------
 # Function: should_show_listener_section
 # Purpose.: Check if listener section should be displayed using plugin system
-# Args....: $1 - Process list (from get_process_list)
-#           $2+ - Array of database homes
+# Args....: $@ - Array of database homes
 # Returns.: 0 if section should be shown, 1 otherwise
-# Notes...: Uses plugin_should_show_listener() from database plugin
+# Notes...: Requires build_instance_map
 # ------------------------------------------------------------------------------
 should_show_listener_section() {
-    local process_list="$1"
-    shift
     local -a db_homes=("$@")
 
     # If we have database SIDs, always show (backward compatible)
@@ -220,8 +433,8 @@ should_show_listener_section() {
         return 0
     fi
 
-    # Check for running listeners using cached process list
-    if grep "[t]nslsnr" <<< "$process_list" | grep -qv "datasafe\|oracle_cman_home"; then
+    # Check for running listeners in the instance map
+    if [[ ${#_ORAUP_LISTENERS[@]} -gt 0 ]]; then
         return 0
     fi
 
@@ -240,10 +453,14 @@ show_oracle_status_registry() {
 
     oradba_log DEBUG "oraup.sh: show_oracle_status_registry called with ${#installations[@]} installations"
 
-    # OPTIMIZATION: Get process list once for batch process detection
-    local process_list
-    process_list=$(get_process_list)
-    oradba_log DEBUG "oraup.sh: Captured process list for batch detection ($(echo "$process_list" | wc -l) lines)"
+    # OPTIMIZATION: Scan running instances and listeners once per refresh,
+    # the ps -ef process list is only captured where /proc is not available
+    local process_list=""
+    if ! build_instance_map; then
+        process_list=$(get_process_list)
+        oradba_log DEBUG "oraup.sh: Captured process list for batch detection ($(echo "$process_list" | wc -l) lines)"
+        build_instance_map "$process_list"
+    fi
 
     # Separate by type and source
     local -a database_sids=()  # Real SIDs from oratab (with flags)
@@ -340,24 +557,31 @@ show_oracle_status_registry() {
         printf "%-20s %-16s %-13s %s\n" "SID" "FLAG" "STATUS" "ORACLE_HOME"
         echo "------------------------------------------------------------------------------------------"
 
+        local -a db_sids=() db_flags=() db_homes=() mode_requests=()
         for db_obj in "${database_sids[@]}"; do
             local sid home flags
             sid=$(oradba_registry_get_field "$db_obj" "name")
             home=$(oradba_registry_get_field "$db_obj" "home")
             flags=$(oradba_registry_get_field "$db_obj" "flags")
+            db_sids+=("$sid")
+            db_flags+=("$flags")
+            db_homes+=("$home")
+            mode_requests+=("${sid}|${home}")
+        done
 
-            # Get status using cached process list
-            local status
-            status=$(get_db_status "$sid" "$process_list")
+        # Query open modes of all running instances concurrently
+        collect_db_modes "${mode_requests[@]}"
 
-            # Get open mode if instance is up
-            if [[ "$status" == "up" ]]; then
-                local mode
-                mode=$(get_db_mode "$sid" "$home")
-                status="$mode"
+        for idx in "${!db_sids[@]}"; do
+            local sid="${db_sids[$idx]}" status
+            # Status from the instance map, open mode if instance is up
+            if get_instance_pid "$sid" _; then
+                status="${_ORAUP_DB_MODE[$sid]:-started}"
+            else
+                status="down"
             fi
 
-            printf "%-20s %-16s %-13s %s\n" "$sid" "$flags" "$status" "$home"
+            printf "%-20s %-16s %-13s %s\n" "$sid" "${db_flags[$idx]}" "$status" "${db_homes[$idx]}"
         done
     fi
 
@@ -369,8 +593,8 @@ show_oracle_status_registry() {
     local total_databases=$((${#database_sids[@]}))
     local has_database_listeners=false
 
-    # Check if any database listeners are actually running (using cached process list)
-    if grep "[t]nslsnr" <<< "$process_list" | grep -qv "datasafe\|oracle_cman_home"; then
+    # Check if any database listeners are actually running (using the instance map)
+    if [[ ${#_ORAUP_LISTENERS[@]} -gt 0 ]]; then
         has_database_listeners=true
     fi
 
@@ -384,21 +608,11 @@ show_oracle_status_registry() {
         printf "%-20s %-16s %-13s %s\n" "NAME" "PORT (tcp/tcps)" "STATUS" "ORACLE_HOME"
         echo "------------------------------------------------------------------------------------------"
 
-        # Check for running listeners (using cached process list)
-        local listener_count=0
-        while read -r listener_line; do
-            local listener_name listener_home _lsnr_fields _f
-            # Extract listener name and Oracle Home from ps output
-            # ps output format: /path/to/oracle_home/bin/tnslsnr LISTENER -inherit
-            read -ra _lsnr_fields <<< "$listener_line"
-            listener_name="${_lsnr_fields[${#_lsnr_fields[@]} - 2]}"
-            listener_home=""
-            for _f in "${_lsnr_fields[@]}"; do
-                if [[ "${_f}" == */tnslsnr ]]; then
-                    listener_home="${_f%/bin/tnslsnr}"
-                    break
-                fi
-            done
+        # Check for running listeners (using the instance map)
+        local listener_count=0 listener_entry
+        for listener_entry in "${_ORAUP_LISTENERS[@]}"; do
+            local listener_name="${listener_entry%%|*}"
+            local listener_home="${listener_entry#*|}"
 
             # Get detailed listener status and ports
             # Use lsnrctl from the listener's ORACLE_HOME to ensure compatibility
@@ -526,7 +740,7 @@ show_oracle_status_registry() {
             # Use full path for listener home (not [SID] notation)
             printf "%-20s %-16s %-13s %s\n" "$listener_name" "$port_display" "$lsnr_status" "$listener_home"
             listener_count=$((listener_count + 1))
-        done < <(grep "[t]nslsnr" <<< "$process_list" | grep -v "datasafe\|oracle_cman_home")
+        done
 
         if [[ $listener_count -eq 0 ]]; then
             echo "  No database listeners running"
@@ -671,9 +885,16 @@ show_oracle_status_registry() {
 # ------------------------------------------------------------------------------
 # Function: show_oracle_status
 # Purpose.: Display comprehensive Oracle status overview
+# Args....: $1 - Verbose flag (true|false)
+#           $2 - Watch interval in seconds (optional, 0 = show once)
+#           $3 - Number of refreshes in watch mode (optional, 0 = unlimited)
+# Notes...: Watch mode reads the registry once and refreshes process status,
+#           open modes, listeners and connectors on every cycle
 # ------------------------------------------------------------------------------
 show_oracle_status() {
     local verbose="${1:-false}"
+    local watch_interval="${2:-0}"
+    local watch_count="${3:-0}"
 
     # Header
     echo ""
@@ -704,7 +925,24 @@ show_oracle_status() {
         fi
 
         # Process installations using registry
-        show_oracle_status_registry "${all_installations[@]}"
+        if [[ "${watch_interval}" -gt 0 ]]; then
+            local cycle=0
+            while true; do
+                cycle=$((cycle + 1))
+                show_oracle_status_registry "${all_installations[@]}"
+                echo "Refreshing every ${watch_interval}s ($(date '+%Y-%m-%d %H:%M:%S')), press Ctrl-C to stop"
+                [[ "${watch_count}" -gt 0 ]] && [[ ${cycle} -ge ${watch_count} ]] && break
+                sleep "${watch_interval}"
+                # Keep open modes of unchanged instances from the previous cycle
+                _ORAUP_REUSE_MODES=true
+                [[ -t 1 ]] && printf '\033[H\033[2J'
+                echo ""
+                echo "Oracle Environment Status"
+                echo "=========================================================================================="
+            done
+        else
+            show_oracle_status_registry "${all_installations[@]}"
+        fi
         return 0
     fi
 
@@ -721,7 +959,8 @@ show_oracle_status() {
 # ------------------------------------------------------------------------------
 # Function: main
 # Purpose.: Main entry point for Oracle status display utility
-# Args....: [OPTIONS] - Command-line flags (-h|--help, -v|--verbose, -q|--quiet)
+# Args....: [OPTIONS] - Command-line flags (-h|--help, -v|--verbose, -q|--quiet,
+#                       -w|--watch [N], -c|--count N)
 # Returns.: 0 on success, 1 on error
 # Output..: Oracle status information to stdout (unless --quiet)
 # Notes...: Quick status display for current Oracle environment
@@ -731,6 +970,8 @@ show_oracle_status() {
 main() {
     local verbose=false
     local quiet=false
+    local watch_interval=0
+    local watch_count=0
 
     oradba_log DEBUG "oraup.sh: Starting main function with $# arguments: $*"
 
@@ -749,6 +990,23 @@ main() {
                 quiet=true
                 shift
                 ;;
+            -w | --watch)
+                watch_interval=5
+                if [[ "${2:-}" =~ ^[0-9]+$ ]]; then
+                    watch_interval="$2"
+                    shift
+                fi
+                [[ "${watch_interval}" -lt 1 ]] && watch_interval=1
+                shift
+                ;;
+            -c | --count)
+                if [[ ! "${2:-}" =~ ^[0-9]+$ ]]; then
+                    echo "Error: --count requires a number"
+                    exit 1
+                fi
+                watch_count="$2"
+                shift 2
+                ;;
             *)
                 echo "Error: Unknown option: $1"
                 show_usage
@@ -759,8 +1017,8 @@ main() {
 
     # Show status
     if [[ "$quiet" == "false" ]]; then
-        oradba_log DEBUG "oraup.sh: Calling show_oracle_status with verbose=${verbose}"
-        show_oracle_status "$verbose"
+        oradba_log DEBUG "oraup.sh: Calling show_oracle_status with verbose=${verbose}, watch=${watch_interval}"
+        show_oracle_status "$verbose" "$watch_interval" "$watch_count"
     else
         oradba_log DEBUG "oraup.sh: Quiet mode - skipping status display"
     fi
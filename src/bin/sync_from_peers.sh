@@ -37,6 +37,8 @@ else
     echo "ERROR: Cannot find oradba_common.sh library"
     exit 1
 fi
+# shellcheck source=../lib/oradba_peer_sync.sh
+source "${SCRIPT_BASE}/lib/oradba_peer_sync.sh"
 
 # Default values
 PEER_HOSTS_DEFAULT=()
@@ -128,6 +130,9 @@ OPTIONS:
     -q                     Quiet mode (suppress non-error output)
     -H "host1 host2"       Space-separated list of peer hosts
     -r <remote_base>       Remote base path on source peer (default: absolute path)
+    -F                     Full sync: ignore the manifest, run rsync for every peer
+    -j <n>                 Number of peers synced in parallel, 0 = all (default: ${SYNC_JOBS})
+    -t <seconds>           Timeout per peer, 0 = none (default: ${SYNC_TIMEOUT})
     -c <config_file>       Load additional config file
     -h                     Show this help message
 
@@ -136,6 +141,10 @@ CONFIGURATION:
     SSH_PORT.......: ${SSH_PORT}
     PEER_HOSTS.....: ${PEER_HOSTS[*]}
     RSYNC_OPTS.....: ${RSYNC_OPTS}
+    SYNC_JOBS......: ${SYNC_JOBS}
+    SYNC_TIMEOUT...: ${SYNC_TIMEOUT}
+    SYNC_MANIFEST..: ${SYNC_MANIFEST} (hash: ${SYNC_MANIFEST_HASH})
+    SSH_CONTROL....: ${SSH_CONTROL_MASTER} (${SSH_CONTROL_DIR}, persist ${SSH_CONTROL_PERSIST})
     Config files...: ${LOADED_CONFIG:-none}
 
 EXAMPLES:
@@ -150,7 +159,12 @@ EXAMPLES:
 
 NOTES:
     - Requires ssh and rsync on all hosts
-    - SSH keys must be configured for passwordless access
+    - SSH keys must be configured for passwordless access (BatchMode)
+    - SSH connections are shared per peer (ControlMaster) and kept open for
+      SSH_CONTROL_PERSIST; set SSH_CONTROL_MASTER=false to disable
+    - Local content manifest: peers already holding the current content are
+      skipped, others receive only changed files. Use -F after changes made
+      directly on a peer.
     - First syncs from source peer to local host
     - Then distributes from local to all other peers (excluding source and self)
 
@@ -183,7 +197,7 @@ should_log() {
 # ------------------------------------------------------------------------------
 # shellcheck disable=SC2034  # DRYRUN and DELETE tracked but effect is in RSYNC_OPTS
 parse_args() {
-    while getopts ":p:nvdDqH:r:c:h" opt; do
+    while getopts ":p:nvdDFqH:r:j:t:c:h" opt; do
         case "${opt}" in
             p) REMOTE_PEER="${OPTARG}" ;;
             n)
@@ -202,6 +216,9 @@ parse_args() {
             q) QUIET=true ;;
             H) IFS=' ' read -r -a PEER_HOSTS <<< "${OPTARG}" ;;
             r) REMOTE_BASE="${OPTARG}" ;;
+            F) SYNC_MANIFEST=false ;;
+            j) SYNC_JOBS="${OPTARG}" ;;
+            t) SYNC_TIMEOUT="${OPTARG}" ;;
             c) CONFIG_FILE="${OPTARG}" ;;
             h) usage ;;
             *) usage ;;
@@ -222,6 +239,12 @@ parse_args() {
         usage
     fi
 
+    # Validate fan-out and timeout
+    if [[ ! "${SYNC_JOBS}" =~ ^[0-9]+$ || ! "${SYNC_TIMEOUT}" =~ ^[0-9]+$ ]]; then
+        should_log ERROR && oradba_log ERROR "SYNC_JOBS (-j) and SYNC_TIMEOUT (-t) must be numbers."
+        exit 1
+    fi
+
     # Validate peer hosts
     if [[ ${#PEER_HOSTS[@]} -eq 0 ]]; then
         should_log ERROR && oradba_log ERROR "PEER_HOSTS is empty. Configure via environment, config file, or -H option."
@@ -236,6 +259,7 @@ parse_args() {
 # Returns.: 0 if all syncs succeed, 1 if phase 1 or any phase 2 sync fails
 # Output..: Status messages via oradba_log; rsync output if verbose
 # Notes...: Phase 1: pull from REMOTE_PEER; Phase 2: push to peers (excluding source and self)
+#           Both phases use oradba_peer_sync; phase 2 runs peers in parallel (SYNC_JOBS)
 # ------------------------------------------------------------------------------
 perform_sync() {
     local abs_source
@@ -260,8 +284,7 @@ perform_sync() {
     should_log INFO && oradba_log INFO "Syncing from ${REMOTE_PEER}:${remote_path} to local: ${this_host}:${rsync_target}"
 
     # Sync from remote peer to local
-    # shellcheck disable=SC2086
-    if rsync ${RSYNC_OPTS} -e "ssh -p ${SSH_PORT}" "${SSH_USER}@${REMOTE_PEER}:${remote_path}" "${rsync_target}"; then
+    if oradba_peer_sync pull "${remote_path}" "${rsync_target}" "${REMOTE_PEER}"; then
         should_log INFO && oradba_log INFO "Initial sync from ${REMOTE_PEER} succeeded"
     else
         should_log ERROR && oradba_log ERROR "Initial sync from ${REMOTE_PEER} failed"
@@ -269,26 +292,41 @@ perform_sync() {
     fi
 
     # Sync from local to other peers (excluding REMOTE_PEER and THIS_HOST)
+    local host
+    local -a peers=()
     for host in "${PEER_HOSTS[@]}"; do
         # Skip self and source peer
         if [[ "${host}" == "${this_host}" || "${host}" == "${REMOTE_PEER}" ]]; then
             should_log DEBUG && oradba_log DEBUG "Skipping ${host}"
             continue
         fi
+        peers+=("${host}")
+    done
+
+    oradba_peer_sync push "${rsync_target}" "${rsync_target}" ${peers[@]+"${peers[@]}"} || true
+    collect_results 1
+
+    should_log INFO && oradba_log INFO "Sync operation finished."
+}
 
-        # Execute rsync
-        should_log INFO && oradba_log INFO "Syncing to ${host}:${rsync_target} ..."
-        # shellcheck disable=SC2086
-        if rsync ${RSYNC_OPTS} -e "ssh -p ${SSH_PORT}" "${rsync_target}" "${SSH_USER}@${host}:${rsync_target}"; then
-            should_log INFO && oradba_log INFO "Sync to ${host} completed"
+# ------------------------------------------------------------------------------
+# Function: collect_results
+# Purpose.: Fill SYNC_SUCCESS and SYNC_FAILURE from the peer sync records
+# Args....: $1 - First record index to evaluate
+# Returns.: None
+# Output..: None
+# ------------------------------------------------------------------------------
+collect_results() {
+    local i host status
+
+    for ((i = $1; i < ${#PEER_SYNC_RESULTS[@]}; i++)); do
+        IFS='|' read -r host status _ <<< "${PEER_SYNC_RESULTS[i]}"
+        if [[ "${status}" == "SUCCESS" || "${status}" == "UNCHANGED" ]]; then
             SYNC_SUCCESS+=("${host}")
         else
-            should_log ERROR && oradba_log ERROR "Failed to sync to ${host}"
             SYNC_FAILURE+=("${host}")
         fi
     done
-
-    should_log INFO && oradba_log INFO "Sync operation finished."
 }
 
 # ------------------------------------------------------------------------------
@@ -298,6 +336,7 @@ perform_sync() {
 # Returns.: None
 # Output..: Source peer, local host, successful/failed syncs to stdout (if verbose)
 # Notes...: Shows phase 1 source and phase 2 distribution results; only in verbose mode
+#           Per-peer duration and bytes sent/received from PEER_SYNC_RESULTS
 # ------------------------------------------------------------------------------
 show_summary() {
     if [[ "${VERBOSE}" == "true" && "${QUIET}" != "true" ]]; then
@@ -309,6 +348,9 @@ show_summary() {
         should_log INFO && oradba_log INFO "Local  : ${this_host}"
         should_log INFO && oradba_log INFO "Success: ${SYNC_SUCCESS[*]:-none}"
         should_log INFO && oradba_log INFO "Failed : ${SYNC_FAILURE[*]:-none}"
+        if [[ ${#PEER_SYNC_RESULTS[@]} -gt 0 ]]; then
+            oradba_peer_sync_summary
+        fi
     fi
 }
 
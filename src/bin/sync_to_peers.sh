@@ -36,6 +36,8 @@ else
     echo "ERROR: Cannot find oradba_common.sh library"
     exit 1
 fi
+# shellcheck source=../lib/oradba_peer_sync.sh
+source "${SCRIPT_BASE}/lib/oradba_peer_sync.sh"
 
 # Default values
 PEER_HOSTS_DEFAULT=()
@@ -125,6 +127,9 @@ OPTIONS:
     -q                     Quiet mode (suppress non-error output)
     -H "host1 host2"       Space-separated list of peer hosts
     -r <remote_base>       Remote base path (default: absolute source path)
+    -F                     Full sync: ignore the manifest, run rsync for every peer
+    -j <n>                 Number of peers synced in parallel, 0 = all (default: ${SYNC_JOBS})
+    -t <seconds>           Timeout per peer, 0 = none (default: ${SYNC_TIMEOUT})
     -c <config_file>       Load additional config file
     -h                     Show this help message
 
@@ -133,6 +138,10 @@ CONFIGURATION:
     SSH_PORT.......: ${SSH_PORT}
     PEER_HOSTS.....: ${PEER_HOSTS[*]}
     RSYNC_OPTS.....: ${RSYNC_OPTS}
+    SYNC_JOBS......: ${SYNC_JOBS}
+    SYNC_TIMEOUT...: ${SYNC_TIMEOUT}
+    SYNC_MANIFEST..: ${SYNC_MANIFEST} (hash: ${SYNC_MANIFEST_HASH})
+    SSH_CONTROL....: ${SSH_CONTROL_MASTER} (${SSH_CONTROL_DIR}, persist ${SSH_CONTROL_PERSIST})
     Config files...: ${LOADED_CONFIG:-none}
 
 EXAMPLES:
@@ -147,7 +156,12 @@ EXAMPLES:
 
 NOTES:
     - Requires ssh and rsync on all hosts
-    - SSH keys must be configured for passwordless access
+    - SSH keys must be configured for passwordless access (BatchMode)
+    - SSH connections are shared per peer (ControlMaster) and kept open for
+      SSH_CONTROL_PERSIST; set SSH_CONTROL_MASTER=false to disable
+    - Local content manifest: peers already holding the current content are
+      skipped, others receive only changed files. Use -F after changes made
+      directly on a peer.
     - Source path is converted to absolute path
 
 EOF
@@ -179,7 +193,7 @@ should_log() {
 # ------------------------------------------------------------------------------
 # shellcheck disable=SC2034  # DRYRUN and DELETE tracked but effect is in RSYNC_OPTS
 parse_args() {
-    while getopts ":nvdDqH:r:c:h" opt; do
+    while getopts ":nvdDFqH:r:j:t:c:h" opt; do
         case "${opt}" in
             n)
                 DRYRUN=true
@@ -197,6 +211,9 @@ parse_args() {
             q) QUIET=true ;;
             H) IFS=' ' read -r -a PEER_HOSTS <<< "${OPTARG}" ;;
             r) REMOTE_BASE="${OPTARG}" ;;
+            F) SYNC_MANIFEST=false ;;
+            j) SYNC_JOBS="${OPTARG}" ;;
+            t) SYNC_TIMEOUT="${OPTARG}" ;;
             c) CONFIG_FILE="${OPTARG}" ;;
             h) usage ;;
             *) usage ;;
@@ -218,6 +235,12 @@ parse_args() {
         exit 1
     fi
 
+    # Validate fan-out and timeout
+    if [[ ! "${SYNC_JOBS}" =~ ^[0-9]+$ || ! "${SYNC_TIMEOUT}" =~ ^[0-9]+$ ]]; then
+        should_log ERROR && oradba_log ERROR "SYNC_JOBS (-j) and SYNC_TIMEOUT (-t) must be numbers."
+        exit 1
+    fi
+
     # Validate peer hosts
     if [[ ${#PEER_HOSTS[@]} -eq 0 ]]; then
         should_log ERROR && oradba_log ERROR "PEER_HOSTS is empty. Configure via environment, config file, or -H option."
@@ -232,6 +255,7 @@ parse_args() {
 # Returns.: 0 if all syncs succeed, 1 if any fails
 # Output..: Status messages via oradba_log; rsync output if verbose
 # Notes...: Skips local host; converts to absolute paths; tracks success/failure arrays
+#           Peers run in parallel (SYNC_JOBS) via oradba_peer_sync
 # ------------------------------------------------------------------------------
 perform_sync() {
     local abs_source
@@ -251,31 +275,45 @@ perform_sync() {
     this_host=$(hostname -s)
     should_log INFO && oradba_log INFO "Starting sync of '${rsync_source}' from ${this_host} to peers..."
 
-    # Sync to each peer host
+    # Determine target path
+    local target_path="${REMOTE_BASE}"
+    [[ -z "${target_path}" ]] && target_path="${abs_source}"
+
+    # Sync to all peer hosts except self
+    local host
+    local -a peers=()
     for host in "${PEER_HOSTS[@]}"; do
-        # Skip self
         if [[ "${host}" == "${this_host}" ]]; then
             should_log DEBUG && oradba_log DEBUG "Skipping self (${this_host})"
             continue
         fi
+        peers+=("${host}")
+    done
+
+    oradba_peer_sync push "${rsync_source}" "${target_path}" ${peers[@]+"${peers[@]}"} || true
+    collect_results 0
+
+    should_log INFO && oradba_log INFO "Sync operation finished."
+}
 
-        # Determine target path
-        local target_path="${REMOTE_BASE}"
-        [[ -z "${target_path}" ]] && target_path="${abs_source}"
+# ------------------------------------------------------------------------------
+# Function: collect_results
+# Purpose.: Fill SYNC_SUCCESS and SYNC_FAILURE from the peer sync records
+# Args....: $1 - First record index to evaluate
+# Returns.: None
+# Output..: None
+# ------------------------------------------------------------------------------
+collect_results() {
+    local i host status
 
-        # Execute rsync
-        should_log INFO && oradba_log INFO "Syncing to ${host}:${target_path} ..."
-        # shellcheck disable=SC2086
-        if rsync ${RSYNC_OPTS} -e "ssh -p ${SSH_PORT}" "${rsync_source}" "${SSH_USER}@${host}:${target_path}"; then
-            should_log INFO && oradba_log INFO "Sync to ${host} completed"
+    for ((i = $1; i < ${#PEER_SYNC_RESULTS[@]}; i++)); do
+        IFS='|' read -r host status _ <<< "${PEER_SYNC_RESULTS[i]}"
+        if [[ "${status}" == "SUCCESS" || "${status}" == "UNCHANGED" ]]; then
             SYNC_SUCCESS+=("${host}")
         else
-            should_log ERROR && oradba_log ERROR "Failed to sync to ${host}"
             SYNC_FAILURE+=("${host}")
         fi
     done
-
-    should_log INFO && oradba_log INFO "Sync operation finished."
 }
 
 # ------------------------------------------------------------------------------
@@ -285,6 +323,7 @@ perform_sync() {
 # Returns.: None
 # Output..: Success/failure counts and lists to stdout (if verbose mode)
 # Notes...: Shows local host, successful peers, failed peers; only in verbose mode
+#           Per-peer duration and bytes sent/received from PEER_SYNC_RESULTS
 # ------------------------------------------------------------------------------
 show_summary() {
     if [[ "${VERBOSE}" == "true" && "${QUIET}" != "true" ]]; then
@@ -295,6 +334,9 @@ show_summary() {
         should_log INFO && oradba_log INFO "Local  : ${this_host}"
         should_log INFO && oradba_log INFO "Success: ${SYNC_SUCCESS[*]:-none}"
         should_log INFO && oradba_log INFO "Failed : ${SYNC_FAILURE[*]:-none}"
+        if [[ ${#PEER_SYNC_RESULTS[@]} -gt 0 ]]; then
+            oradba_peer_sync_summary
+        fi
     fi
 }
 
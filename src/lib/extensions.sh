@@ -23,6 +23,12 @@
 [[ -n "${ORADBA_EXTENSIONS_LOADED:-}" ]] && return 0
 readonly ORADBA_EXTENSIONS_LOADED=1
 
+# Path-set engine for PATH/SQLPATH updates (normally loaded by oradba_common.sh)
+if [[ -z "${ORADBA_ENV_PATHS_LOADED:-}" ]]; then
+    # shellcheck source=./oradba_env_paths.sh
+    source "${BASH_SOURCE[0]%/*}/oradba_env_paths.sh"
+fi
+
 # Optional extension etc/ hook sourcing (disabled by default for safety)
 # When enabled, extensions can opt-in via .extension metadata:
 #   load_env: true      -> source etc/env.sh
@@ -33,6 +39,294 @@ export ORADBA_EXTENSIONS_SOURCE_ETC="${ORADBA_EXTENSIONS_SOURCE_ETC:-false}"
 # Format: <extension_name>_backup_YYYYMMDD_HHMMSS
 readonly BACKUP_DIR_PATTERN='_backup_[0-9]{8}_[0-9]{6}$'
 
+# Extension metadata index (in-shell, survives re-sourcing)
+if ! declare -p _ORADBA_EXT_KIND &> /dev/null; then
+    declare -gA _ORADBA_EXT_KIND=()  # path -> meta|content|none
+    declare -gA _ORADBA_EXT_META=()  # "path|key" -> value
+    declare -gA _ORADBA_EXT_PROPS=() # path -> indexed keys
+    declare -ga _ORADBA_EXT_LIST=()  # discovered extensions in ORADBA_LOCAL_BASE
+    _ORADBA_EXT_INDEX_BASE=""
+    _ORADBA_EXT_INDEX_FILE=""
+    _ORADBA_EXT_INDEX_TOKEN=""
+fi
+
+# ------------------------------------------------------------------------------
+# Extension Metadata Index
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_ext_index_drop
+# Purpose.: Remove an extension directory from the in-shell index
+# Args....: $1 - Extension path
+# Returns.: 0 always
+# Output..: None
+# ------------------------------------------------------------------------------
+_oradba_ext_index_drop() {
+    local ext_path="$1"
+    local key
+
+    for key in ${_ORADBA_EXT_PROPS["${ext_path}"]:-}; do
+        unset '_ORADBA_EXT_META["${ext_path}|${key}"]'
+    done
+    unset '_ORADBA_EXT_PROPS["${ext_path}"]' '_ORADBA_EXT_KIND["${ext_path}"]'
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_ext_index_set
+# Purpose.: Store one metadata value in the in-shell index (first value wins)
+# Args....: $1 - Extension path
+#           $2 - Property name
+#           $3 - Value
+# Returns.: 0 always
+# Output..: None
+# ------------------------------------------------------------------------------
+_oradba_ext_index_set() {
+    [[ -n "${_ORADBA_EXT_META["$1|$2"]+set}" ]] && return 0
+    _ORADBA_EXT_META["$1|$2"]="$3"
+    _ORADBA_EXT_PROPS["$1"]+="$2 "
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_ext_index_parse
+# Purpose.: Classify an extension directory and parse its .extension file once
+# Args....: $1 - Extension path
+# Returns.: 0 always
+# Output..: None (updates the in-shell index)
+# Notes...: Top-level "key: value" lines are stored under their key with the
+#           same rules as parse_extension_metadata (first match wins,
+#           whitespace trimmed). Indented lines of the provides: block are
+#           stored as provides.<key>. Kind is meta (.extension present),
+#           content (bin/, sql/ or rcv/ only) or none.
+# ------------------------------------------------------------------------------
+_oradba_ext_index_parse() {
+    local ext_path="$1"
+    local metadata="${ext_path}/.extension"
+    local kind="none" in_provides=0 line key value
+
+    _oradba_ext_index_drop "${ext_path}"
+    if [[ -f "${metadata}" ]]; then
+        kind="meta"
+    elif [[ -d "${ext_path}/bin" ]] || [[ -d "${ext_path}/sql" ]] || [[ -d "${ext_path}/rcv" ]]; then
+        kind="content"
+    fi
+    _ORADBA_EXT_KIND["${ext_path}"]="${kind}"
+    _ORADBA_EXT_PROPS["${ext_path}"]=""
+
+    [[ "${kind}" == "meta" ]] && [[ -r "${metadata}" ]] || return 0
+    while IFS= read -r line || [[ -n "${line}" ]]; do
+        [[ "${line}" =~ ^[[:blank:]]*# ]] && continue
+        [[ "${line}" == *:* ]] || {
+            [[ "${line:0:1}" == " " || "${line:0:1}" == $'\t' ]] || in_provides=0
+            continue
+        }
+        if [[ "${line:0:1}" == " " || "${line:0:1}" == $'\t' ]]; then
+            [[ ${in_provides} -eq 1 ]] || continue
+            read -r key <<< "${line%%:*}"
+            read -r value <<< "${line#*:}"
+            _oradba_ext_index_set "${ext_path}" "provides.${key}" "${value}"
+            continue
+        fi
+        key="${line%%:*}"
+        read -r value <<< "${line#*:}"
+        in_provides=0
+        [[ "${key}" == "provides" ]] && in_provides=1
+        _oradba_ext_index_set "${ext_path}" "${key}" "${value}"
+    done < "${metadata}"
+    oradba_log DEBUG "Indexed extension metadata: ${ext_path}"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_ext_index_read
+# Purpose.: Seed the in-shell index from the persisted index file
+# Args....: $1 - Index file
+#           $2 - Extension base directory the index must belong to
+# Returns.: 0 if the file was read, 1 if it is missing or for another base
+# Output..: None
+# Format..: Header "# oradba extension index v1|<base>|<token>", then
+#           K<TAB>path<TAB>kind and M<TAB>path<TAB>key<TAB>value records
+# ------------------------------------------------------------------------------
+_oradba_ext_index_read() {
+    local file="$1"
+    local base_dir="$2"
+    local line rest path key
+    local -a lines=()
+
+    [[ -r "${file}" ]] || return 1
+    mapfile -t lines < "${file}"
+    [[ "${lines[0]:-}" == "# oradba extension index v1|${base_dir}|"* ]] || return 1
+
+    _ORADBA_EXT_KIND=()
+    _ORADBA_EXT_META=()
+    _ORADBA_EXT_PROPS=()
+    for line in "${lines[@]:1}"; do
+        rest="${line#?$'\t'}"
+        case "${line:0:1}" in
+            K)
+                path="${rest%$'\t'*}"
+                _ORADBA_EXT_KIND["${path}"]="${rest##*$'\t'}"
+                _ORADBA_EXT_PROPS["${path}"]+=""
+                ;;
+            M)
+                path="${rest%%$'\t'*}"
+                rest="${rest#*$'\t'}"
+                key="${rest%%$'\t'*}"
+                _oradba_ext_index_set "${path}" "${key}" "${rest#*$'\t'}"
+                ;;
+        esac
+    done
+    _ORADBA_EXT_INDEX_TOKEN="${lines[0]##*|}"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_ext_index_write
+# Purpose.: Persist the in-shell index
+# Args....: $1 - Index file
+# Returns.: 0 on success, 1 if the file could not be written
+# Output..: None
+# Notes...: Written to a temporary file and renamed; the new mtime is the
+#           reference for later -nt checks
+# ------------------------------------------------------------------------------
+_oradba_ext_index_write() {
+    local file="$1"
+    local tmp="${file}.$$"
+    local token="${EPOCHREALTIME:-${SECONDS}}.$$"
+    local path key
+
+    mkdir -p "${file%/*}" 2> /dev/null || return 1
+    if {
+        printf '# oradba extension index v1|%s|%s\n' "${_ORADBA_EXT_INDEX_BASE}" "${token}"
+        for path in "${!_ORADBA_EXT_KIND[@]}"; do
+            printf 'K\t%s\t%s\n' "${path}" "${_ORADBA_EXT_KIND[${path}]}"
+            for key in ${_ORADBA_EXT_PROPS["${path}"]:-}; do
+                printf 'M\t%s\t%s\t%s\n' "${path}" "${key}" "${_ORADBA_EXT_META["${path}|${key}"]}"
+            done
+        done
+    } > "${tmp}" 2> /dev/null && mv -f "${tmp}" "${file}" 2> /dev/null; then
+        _ORADBA_EXT_INDEX_TOKEN="${token}"
+        oradba_log DEBUG "Extension index written: ${file} (${#_ORADBA_EXT_KIND[@]} entries)"
+        return 0
+    fi
+    rm -f "${tmp}" 2> /dev/null
+    return 1
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_extension_index_load
+# Purpose.: Build or refresh the extension metadata index
+# Args....: None
+# Returns.: 0 on success
+# Output..: None (fills _ORADBA_EXT_KIND, _ORADBA_EXT_META, _ORADBA_EXT_LIST)
+# Notes...: Every .extension file is parsed once; the result is kept in
+#           ${ORADBA_CACHE_DIR}/extensions.index. Later loads only re-parse
+#           directories whose directory entry or .extension file is newer
+#           than the index (builtin -nt tests, no forks). Manually configured
+#           extensions (ORADBA_EXTENSION_PATHS) are indexed as well.
+#           Call in the parent shell so command substitutions inherit the
+#           index. Disable persistence with ORADBA_EXTENSION_CACHE=false.
+# ------------------------------------------------------------------------------
+oradba_extension_index_load() {
+    local base_dir="${ORADBA_LOCAL_BASE:-}"
+    local cache_dir index_file="" header="" changed=false full=false
+    local dir dir_name
+    local -a manual=()
+    local -A seen=()
+
+    oradba_cache_dir cache_dir
+    if [[ "${ORADBA_EXTENSION_CACHE:-true}" == "true" ]] && [[ -n "${cache_dir}" ]]; then
+        index_file="${cache_dir}/extensions.index"
+    fi
+
+    # Re-seed from the index file unless this shell already holds its content
+    if [[ -z "${index_file}" ]] || [[ ! -f "${index_file}" ]]; then
+        full=true
+    else
+        read -r header < "${index_file}" 2> /dev/null || header=""
+        if [[ "${_ORADBA_EXT_INDEX_BASE}" != "${base_dir}" ]] || [[ "${_ORADBA_EXT_INDEX_FILE}" != "${index_file}" ]] \
+            || [[ "${header##*|}" != "${_ORADBA_EXT_INDEX_TOKEN}" ]]; then
+            _ORADBA_EXT_INDEX_BASE="${base_dir}"
+            _oradba_ext_index_read "${index_file}" "${base_dir}" || full=true
+        fi
+    fi
+    if [[ "${full}" == "true" ]]; then
+        _ORADBA_EXT_KIND=()
+        _ORADBA_EXT_META=()
+        _ORADBA_EXT_PROPS=()
+        _ORADBA_EXT_INDEX_TOKEN=""
+        changed=true
+    fi
+    _ORADBA_EXT_INDEX_BASE="${base_dir}"
+    _ORADBA_EXT_INDEX_FILE="${index_file}"
+
+    # Walk ORADBA_LOCAL_BASE, re-parsing only changed directories
+    _ORADBA_EXT_LIST=()
+    if [[ -n "${base_dir}" ]] && [[ -d "${base_dir}" ]]; then
+        for dir in "${base_dir}"/*; do
+            [[ -d "${dir}" ]] || continue
+            dir_name="${dir##*/}"
+
+            # Skip oradba itself and backup directories (created by updates)
+            [[ "${dir_name}" == "oradba" ]] || [[ "${dir}" == "${ORADBA_BASE}" ]] && continue
+            [[ "${dir_name}" =~ ${BACKUP_DIR_PATTERN} ]] && continue
+
+            seen["${dir}"]=1
+            if [[ "${full}" == "true" ]] || [[ -z "${_ORADBA_EXT_KIND["${dir}"]:-}" ]] \
+                || [[ "${dir}" -nt "${index_file}" ]] || [[ "${dir}/.extension" -nt "${index_file}" ]]; then
+                _oradba_ext_index_parse "${dir}"
+                changed=true
+            fi
+            [[ "${_ORADBA_EXT_KIND["${dir}"]}" != "none" ]] && _ORADBA_EXT_LIST+=("${dir}")
+        done
+    fi
+
+    # Manually configured extensions
+    if [[ -n "${ORADBA_EXTENSION_PATHS:-}" ]]; then
+        IFS=':' read -ra manual <<< "${ORADBA_EXTENSION_PATHS}"
+        for dir in "${manual[@]}"; do
+            [[ -n "${dir}" ]] && [[ -d "${dir}" ]] && [[ -z "${seen["${dir}"]:-}" ]] || continue
+            seen["${dir}"]=1
+            if [[ -z "${_ORADBA_EXT_KIND["${dir}"]:-}" ]] \
+                || [[ "${dir}" -nt "${index_file}" ]] || [[ "${dir}/.extension" -nt "${index_file}" ]]; then
+                _oradba_ext_index_parse "${dir}"
+                changed=true
+            fi
+        done
+    fi
+
+    # Drop entries that are no longer discovered or configured
+    for dir in "${!_ORADBA_EXT_KIND[@]}"; do
+        [[ -n "${seen["${dir}"]:-}" ]] && continue
+        _oradba_ext_index_drop "${dir}"
+        changed=true
+    done
+
+    if [[ "${changed}" == "true" ]] && [[ -n "${index_file}" ]]; then
+        _oradba_ext_index_write "${index_file}" || oradba_log DEBUG "Extension index not writable: ${index_file}"
+    fi
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_extension_index_invalidate
+# Purpose.: Drop the in-shell extension index and the persisted index file
+# Args....: None
+# Returns.: 0 always
+# Output..: None
+# ------------------------------------------------------------------------------
+oradba_extension_index_invalidate() {
+    [[ -n "${_ORADBA_EXT_INDEX_FILE}" ]] && rm -f "${_ORADBA_EXT_INDEX_FILE}" 2> /dev/null
+    _ORADBA_EXT_KIND=()
+    _ORADBA_EXT_META=()
+    _ORADBA_EXT_PROPS=()
+    _ORADBA_EXT_LIST=()
+    _ORADBA_EXT_INDEX_BASE=""
+    _ORADBA_EXT_INDEX_FILE=""
+    _ORADBA_EXT_INDEX_TOKEN=""
+    return 0
+}
+
 # ------------------------------------------------------------------------------
 # Extension Discovery Functions
 # ------------------------------------------------------------------------------
@@ -43,10 +337,11 @@ readonly BACKUP_DIR_PATTERN='_backup_[0-9]{8}_[0-9]{6}$'
 # Args....: None
 # Returns.: 0 on success
 # Output..: List of extension paths (one per line) containing .extension marker file
+# Notes...: Served from the extension metadata index; unchanged extension
+#           directories are not re-examined (see oradba_extension_index_load)
 # ------------------------------------------------------------------------------
 discover_extensions() {
     local base_dir="${ORADBA_LOCAL_BASE}"
-    local extensions=()
 
     if [[ -z "${base_dir}" ]]; then
         oradba_log DEBUG "Extension base directory not configured (ORADBA_LOCAL_BASE is empty)"
@@ -59,40 +354,11 @@ discover_extensions() {
     fi
 
     oradba_log DEBUG "Scanning for extensions in: ${base_dir}"
-
-    # Find directories with .extension marker or content directories
-    for dir in "${base_dir}"/*; do
-        # Skip if not a directory
-        [[ ! -d "${dir}" ]] && continue
-
-        local dir_name
-        dir_name="$(basename "${dir}")"
-
-        # Skip oradba itself (the main OraDBA installation)
-        if [[ "${dir_name}" == "oradba" ]] || [[ "${dir}" == "${ORADBA_BASE}" ]]; then
-            oradba_log DEBUG "Skipping main OraDBA directory: ${dir_name}"
-            continue
-        fi
-
-        # Skip backup directories (created by update operations)
-        if [[ "${dir_name}" =~ ${BACKUP_DIR_PATTERN} ]]; then
-            oradba_log DEBUG "Skipping backup directory: ${dir_name}"
-            continue
-        fi
-
-        # Check for .extension marker file or content directories (bin/, sql/, rcv/)
-        if [[ -f "${dir}/.extension" ]]; then
-            extensions+=("${dir}")
-            oradba_log DEBUG "Found extension with metadata: ${dir_name}"
-        elif [[ -d "${dir}/bin" ]] || [[ -d "${dir}/sql" ]] || [[ -d "${dir}/rcv" ]]; then
-            extensions+=("${dir}")
-            oradba_log DEBUG "Found extension with content directories: ${dir_name}"
-        fi
-    done
+    oradba_extension_index_load
 
     # Output one per line (only if array is not empty)
-    if [[ ${#extensions[@]} -gt 0 ]]; then
-        printf "%s\n" "${extensions[@]}"
+    if [[ ${#_ORADBA_EXT_LIST[@]} -gt 0 ]]; then
+        printf "%s\n" "${_ORADBA_EXT_LIST[@]}"
     fi
 }
 
@@ -141,41 +407,58 @@ get_all_extensions() {
 #           check_config  - Optional "true" to check ORADBA_EXT_<NAME>_<PROPERTY> override
 # Returns.: Property value from metadata, config override, or fallback
 # Note....: New in v0.13.3 - Eliminates metadata access duplication
+#           Metadata comes from the extension index (parsed once per file)
 # ------------------------------------------------------------------------------
 get_extension_property() {
-    local ext_path="$1"
-    local property="$2"
-    local fallback="${3:-}"
-    local check_config="${4:-false}"
-    local metadata="${ext_path}/.extension"
-    local value=""
+    local value
+    _oradba_ext_property value "$@"
+    echo "${value}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_ext_property
+# Purpose.: Fork-free variant of get_extension_property
+# Args....: $1 - Name of the variable to set (must not start with _ep_)
+#           $2 - Extension path
+#           $3 - Property name
+#           $4 - Fallback value (optional)
+#           $5 - "true" to check ORADBA_EXT_<NAME>_<PROPERTY> (optional)
+# Returns.: 0 always
+# Output..: None (sets the variable named in $1)
+# Notes...: Extensions missing from the index are parsed on first access
+# ------------------------------------------------------------------------------
+_oradba_ext_property() {
+    local _ep_var="$1"
+    local _ep_path="$2"
+    local _ep_property="$3"
+    local _ep_fallback="${4:-}"
+    local _ep_check_config="${5:-false}"
+    local _ep_value=""
 
     # Check config override first (if requested)
-    if [[ "${check_config}" == "true" ]]; then
-        local ext_name
-        ext_name="$(basename "${ext_path}")"
+    if [[ "${_ep_check_config}" == "true" ]]; then
+        local _ep_name="${_ep_path%/}"
+        _ep_name="${_ep_name##*/}"
         # Sanitize extension name for use in variable names
         # Replace hyphens with underscores and remove dots and other special characters
-        local safe_ext_name="${ext_name//-/_}"
-        safe_ext_name="${safe_ext_name//[^a-zA-Z0-9_]/}"
-        local safe_ext_name_upper property_upper
-        safe_ext_name_upper="${safe_ext_name^^}"
-        property_upper="${property^^}"
-        local config_var="ORADBA_EXT_${safe_ext_name_upper}_${property_upper}"
-        value="${!config_var:-}"
+        _ep_name="${_ep_name//-/_}"
+        _ep_name="${_ep_name//[^a-zA-Z0-9_]/}"
+        local _ep_config_var="ORADBA_EXT_${_ep_name^^}_${_ep_property^^}"
+        _ep_value="${!_ep_config_var:-}"
     fi
 
-    # Fall back to metadata file
-    if [[ -z "${value}" ]] && [[ -f "${metadata}" ]]; then
-        value=$(parse_extension_metadata "${metadata}" "${property}")
+    # Fall back to metadata (indexed)
+    if [[ -z "${_ep_value}" ]]; then
+        [[ -n "${_ORADBA_EXT_KIND["${_ep_path}"]:-}" ]] || _oradba_ext_index_parse "${_ep_path}"
+        _ep_value="${_ORADBA_EXT_META["${_ep_path}|${_ep_property}"]:-}"
     fi
 
     # Use fallback if still empty
-    if [[ -z "${value}" ]]; then
-        value="${fallback}"
+    if [[ -z "${_ep_value}" ]]; then
+        _ep_value="${_ep_fallback}"
     fi
 
-    echo "${value}"
+    printf -v "${_ep_var}" '%s' "${_ep_value}"
 }
 
 # ------------------------------------------------------------------------------
@@ -216,9 +499,8 @@ parse_extension_metadata() {
 # ------------------------------------------------------------------------------
 get_extension_name() {
     local ext_path="$1"
-    local fallback
-    fallback="$(basename "${ext_path}")"
-    get_extension_property "${ext_path}" "name" "${fallback}"
+    local fallback="${ext_path%/}"
+    get_extension_property "${ext_path}" "name" "${fallback##*/}"
 }
 
 # ------------------------------------------------------------------------------
@@ -269,7 +551,7 @@ is_extension_enabled() {
     local ext_name="$1"
     local ext_path="$2"
     local enabled
-    enabled=$(get_extension_property "${ext_path}" "enabled" "true" "true")
+    _oradba_ext_property enabled "${ext_path}" "enabled" "true" "true"
     [[ "${enabled}" == "true" ]]
 }
 
@@ -292,8 +574,9 @@ sort_extensions_by_priority() {
 
     # Build array of "priority:name:path" for stable sorting
     for ext in "${extensions[@]}"; do
-        priority=$(get_extension_priority "${ext}")
-        name="$(basename "${ext}")"
+        _oradba_ext_property priority "${ext}" "priority" "50" "true"
+        name="${ext%/}"
+        name="${name##*/}"
         priorities+=("${priority}:${name}:${ext}")
     done
 
@@ -312,36 +595,18 @@ sort_extensions_by_priority() {
 # Purpose.: Remove extension paths from PATH and SQLPATH
 # Args....: None
 # Returns.: 0 on success
-# Output..: Updates PATH and SQLPATH environment variables
+# Output..: Updates PATH and SQLPATH (held in the path-set session if active)
 # ------------------------------------------------------------------------------
 remove_extension_paths() {
     if [[ -n "${ORADBA_LOCAL_BASE}" ]]; then
         # Remove all paths matching ORADBA_LOCAL_BASE/*/bin from PATH (except oradba itself)
-        local cleaned_path=""
-        IFS=':' read -ra path_parts <<< "${PATH}"
-        for part in "${path_parts[@]}"; do
-            # Skip if matches extension pattern, but not the main oradba directory
-            if [[ "${part}" =~ ^${ORADBA_LOCAL_BASE}/[^/]+/bin$ ]] && [[ "${part}" != "${ORADBA_LOCAL_BASE}/oradba/bin" ]]; then
-                oradba_log DEBUG "Removing extension path: ${part}"
-                continue
-            fi
-            cleaned_path="${cleaned_path:+${cleaned_path}:}${part}"
-        done
-        export PATH="${cleaned_path}"
+        oradba_pathset_remove_match PATH "^${ORADBA_LOCAL_BASE}/[^/]+/bin$" "${ORADBA_LOCAL_BASE}/oradba/bin"
 
         # Remove extension paths from SQLPATH (except oradba itself)
-        if [[ -n "${SQLPATH}" ]]; then
-            local cleaned_sqlpath=""
-            IFS=':' read -ra sqlpath_parts <<< "${SQLPATH}"
-            for part in "${sqlpath_parts[@]}"; do
-                # Skip if matches extension pattern, but not the main oradba directory
-                if [[ "${part}" =~ ^${ORADBA_LOCAL_BASE}/[^/]+/sql$ ]] && [[ "${part}" != "${ORADBA_LOCAL_BASE}/oradba/sql" ]]; then
-                    oradba_log DEBUG "Removing extension SQLPATH: ${part}"
-                    continue
-                fi
-                cleaned_sqlpath="${cleaned_sqlpath:+${cleaned_sqlpath}:}${part}"
-            done
-            export SQLPATH="${cleaned_sqlpath}"
+        local sqlpath=""
+        oradba_pathset_get SQLPATH sqlpath
+        if [[ -n "${sqlpath}" ]]; then
+            oradba_pathset_remove_match SQLPATH "^${ORADBA_LOCAL_BASE}/[^/]+/sql$" "${ORADBA_LOCAL_BASE}/oradba/sql"
         fi
     fi
 }
@@ -352,34 +617,10 @@ remove_extension_paths() {
 # Args....: None
 # Returns.: 0 on success
 # Output..: Updates PATH environment variable
-# Notes...: Uses oradba_dedupe_path() from oradba_env_builder.sh if available
+# Notes...: Uses the path-set engine (oradba_env_paths.sh)
 # ------------------------------------------------------------------------------
 deduplicate_path() {
-    if command -v oradba_dedupe_path > /dev/null 2>&1; then
-        local deduped_path
-        deduped_path="$(oradba_dedupe_path "${PATH}")"
-        export PATH="${deduped_path}"
-    else
-        # Fallback if oradba_dedupe_path not available
-        local seen=()
-        local new_path=""
-        IFS=':' read -ra path_parts <<< "${PATH}"
-        for part in "${path_parts[@]}"; do
-            [[ -z "${part}" ]] && continue
-            local found=false
-            for seen_part in "${seen[@]}"; do
-                if [[ "${part}" == "${seen_part}" ]]; then
-                    found=true
-                    break
-                fi
-            done
-            if [[ "${found}" == "false" ]]; then
-                seen+=("${part}")
-                new_path="${new_path:+${new_path}:}${part}"
-            fi
-        done
-        export PATH="${new_path}"
-    fi
+    oradba_pathset_dedupe PATH
 }
 
 # ------------------------------------------------------------------------------
@@ -388,36 +629,10 @@ deduplicate_path() {
 # Args....: None
 # Returns.: 0 on success
 # Output..: Updates SQLPATH environment variable
-# Notes...: Uses oradba_dedupe_path() from oradba_env_builder.sh if available
+# Notes...: Uses the path-set engine (oradba_env_paths.sh)
 # ------------------------------------------------------------------------------
 deduplicate_sqlpath() {
-    [[ -z "${SQLPATH}" ]] && return 0
-
-    if command -v oradba_dedupe_path > /dev/null 2>&1; then
-        local deduped_sqlpath
-        deduped_sqlpath="$(oradba_dedupe_path "${SQLPATH}")"
-        export SQLPATH="${deduped_sqlpath}"
-    else
-        # Fallback if oradba_dedupe_path not available
-        local seen=()
-        local new_sqlpath=""
-        IFS=':' read -ra sqlpath_parts <<< "${SQLPATH}"
-        for part in "${sqlpath_parts[@]}"; do
-            [[ -z "${part}" ]] && continue
-            local found=false
-            for seen_part in "${seen[@]}"; do
-                if [[ "${part}" == "${seen_part}" ]]; then
-                    found=true
-                    break
-                fi
-            done
-            if [[ "${found}" == "false" ]]; then
-                seen+=("${part}")
-                new_sqlpath="${new_sqlpath:+${new_sqlpath}:}${part}"
-            fi
-        done
-        export SQLPATH="${new_sqlpath}"
-    fi
+    oradba_pathset_dedupe SQLPATH
 }
 
 # ------------------------------------------------------------------------------
@@ -430,16 +645,23 @@ deduplicate_sqlpath() {
 # ------------------------------------------------------------------------------
 load_extensions() {
     local extensions=()
-    local ext_path
+    local ext_path current_path=""
+
+    # Collect all PATH/SQLPATH changes and export them once at the end
+    oradba_pathset_begin
 
     # Save original PATH/SQLPATH on first run
     if [[ -z "${ORADBA_ORIGINAL_PATH}" ]]; then
-        export ORADBA_ORIGINAL_PATH="${PATH}"
+        oradba_pathset_get PATH current_path
+        export ORADBA_ORIGINAL_PATH="${current_path}"
         oradba_log DEBUG "Saved original PATH"
     fi
-    if [[ -z "${ORADBA_ORIGINAL_SQLPATH}" ]] && [[ -n "${SQLPATH}" ]]; then
-        export ORADBA_ORIGINAL_SQLPATH="${SQLPATH}"
-        oradba_log DEBUG "Saved original SQLPATH"
+    if [[ -z "${ORADBA_ORIGINAL_SQLPATH}" ]]; then
+        oradba_pathset_get SQLPATH current_path
+        if [[ -n "${current_path}" ]]; then
+            export ORADBA_ORIGINAL_SQLPATH="${current_path}"
+            oradba_log DEBUG "Saved original SQLPATH"
+        fi
     fi
 
     # Remove any existing extension paths before re-loading
@@ -448,6 +670,10 @@ load_extensions() {
 
     oradba_log DEBUG "Starting extension discovery and loading..."
 
+    # Parse all extension metadata once in this shell; the discovery and
+    # sort subshells below inherit the index
+    oradba_extension_index_load
+
     # Get all extensions (discovered + manual)
     while IFS= read -r ext_path; do
         [[ -n "${ext_path}" ]] && extensions+=("${ext_path}")
@@ -456,6 +682,7 @@ load_extensions() {
     # Check if any extensions found
     if [[ ${#extensions[@]} -eq 0 ]]; then
         oradba_log DEBUG "No extensions found"
+        oradba_pathset_end
         return 0
     fi
 
@@ -470,6 +697,7 @@ load_extensions() {
     oradba_log DEBUG "Deduplicating PATH and SQLPATH"
     deduplicate_path
     deduplicate_sqlpath
+    oradba_pathset_end
 
     oradba_log DEBUG "Extension loading complete"
 }
@@ -496,7 +724,8 @@ load_extension() {
     fi
 
     # Get extension name
-    ext_name="$(get_extension_name "${ext_path}")"
+    ext_name="${ext_path%/}"
+    _oradba_ext_property ext_name "${ext_path}" "name" "${ext_name##*/}"
 
     # Check if disabled via config
     if ! is_extension_enabled "${ext_name}" "${ext_path}"; then
@@ -514,43 +743,14 @@ load_extension() {
     local load_env="false"
     local load_aliases="false"
 
-    # Read provides section if metadata exists — single-pass, no subshells (#214)
+    # Read provides section from the extension index (parsed once, #214)
     if [[ -f "${metadata}" ]]; then
-        local _in_provides=0 _line _val
-        while IFS= read -r _line; do
-            # Skip comments and blank lines
-            [[ "${_line}" =~ ^[[:blank:]]*# ]] && continue
-            [[ -z "${_line// /}" ]] && continue
-
-            if [[ "${_line}" == "provides:"* ]]; then
-                _in_provides=1
-            elif [[ "${_line:0:1}" == " " || "${_line:0:1}" == $'\t' ]]; then
-                # Indented line — part of the current block
-                if [[ ${_in_provides} -eq 1 ]]; then
-                    _val="${_line#*:}"
-                    case "${_line}" in
-                        *"bin:"*) read -r provides_bin <<< "${_val}" ;;
-                        *"sql:"*) read -r provides_sql <<< "${_val}" ;;
-                        *"rcv:"*) read -r provides_rcv <<< "${_val}" ;;
-                    esac
-                fi
-            else
-                # Top-level key — exit provides block and handle known keys
-                _in_provides=0
-                _val="${_line#*:}"
-                case "${_line}" in
-                    "load_env:"*) read -r load_env <<< "${_val}" ;;
-                    "load_aliases:"*) read -r load_aliases <<< "${_val}" ;;
-                esac
-            fi
-        done < "${metadata}"
-
-        # Default to true/false if not set by metadata
-        provides_bin="${provides_bin:-true}"
-        provides_sql="${provides_sql:-true}"
-        provides_rcv="${provides_rcv:-true}"
-        load_env="${load_env:-false}"
-        load_aliases="${load_aliases:-false}"
+        local _idx="${ext_path}|"
+        provides_bin="${_ORADBA_EXT_META["${_idx}provides.bin"]:-true}"
+        provides_sql="${_ORADBA_EXT_META["${_idx}provides.sql"]:-true}"
+        provides_rcv="${_ORADBA_EXT_META["${_idx}provides.rcv"]:-true}"
+        load_env="${_ORADBA_EXT_META["${_idx}load_env"]:-false}"
+        load_aliases="${_ORADBA_EXT_META["${_idx}load_aliases"]:-false}"
     fi
 
     # Normalize booleans to lowercase (printf -v sets var directly, no subshells)
@@ -563,8 +763,8 @@ load_extension() {
 
     # Add to PATH (bin directory) - only if provides bin
     if [[ "${provides_bin}" == "true" ]] && [[ -d "${ext_path}/bin" ]]; then
-        # Add to beginning of PATH (after ORADBA_BIN)
-        export PATH="${ext_path}/bin:${PATH}"
+        # Add to beginning of PATH (after ORADBA_BIN), moving an existing entry
+        oradba_pathset_promote PATH "${ext_path}/bin"
         oradba_log DEBUG "  Added ${ext_name}/bin to PATH"
     fi
 
@@ -574,7 +774,7 @@ load_extension() {
         if command -v add_to_sqlpath > /dev/null 2>&1; then
             add_to_sqlpath "${ext_path}/sql"
         else
-            export SQLPATH="${SQLPATH:+${SQLPATH}:}${ext_path}/sql"
+            oradba_pathset_append SQLPATH "${ext_path}/sql"
         fi
         oradba_log DEBUG "  Added ${ext_name}/sql to SQLPATH"
     fi
@@ -602,6 +802,8 @@ load_extension() {
 
     # Optional etc/ hook sourcing (opt-in via global + metadata flags)
     if [[ "${ORADBA_EXTENSIONS_SOURCE_ETC}" == "true" ]]; then
+        # Hooks may read PATH/SQLPATH directly
+        oradba_pathset_commit
         if [[ "${load_env}" == "true" ]] && [[ -f "${ext_path}/etc/env.sh" ]]; then
             # shellcheck disable=SC1090
             if ! source "${ext_path}/etc/env.sh"; then
@@ -630,7 +832,7 @@ load_extension() {
 
     # Show version if available
     local version
-    version=$(get_extension_version "${ext_path}")
+    _oradba_ext_property version "${ext_path}" "version" "unknown"
     if [[ "${version}" != "unknown" ]]; then
         oradba_log DEBUG "Loaded extension: ${ext_name} (v${version})"
     else
@@ -688,13 +890,18 @@ show_extension_info() {
         return 1
     fi
 
+    oradba_extension_index_load
+
     # Determine if identifier is a path or name
     if [[ -d "${ext_identifier}" ]]; then
         ext_path="${ext_identifier}"
     else
         # Search by name
+        local path path_name
         while IFS= read -r path; do
-            if [[ "$(get_extension_name "${path}")" == "${ext_identifier}" ]]; then
+            path_name="${path%/}"
+            _oradba_ext_property path_name "${path}" "name" "${path_name##*/}"
+            if [[ "${path_name}" == "${ext_identifier}" ]]; then
                 ext_path="${path}"
                 break
             fi
@@ -707,15 +914,12 @@ show_extension_info() {
     fi
 
     # Get extension details
-    ext_name="$(get_extension_name "${ext_path}")"
-    version=$(get_extension_version "${ext_path}")
-    desc=$(get_extension_description "${ext_path}")
-    priority=$(get_extension_priority "${ext_path}")
-
-    # Get author from metadata
-    if [[ -f "${ext_path}/.extension" ]]; then
-        author=$(parse_extension_metadata "${ext_path}/.extension" "author")
-    fi
+    ext_name="${ext_path%/}"
+    _oradba_ext_property ext_name "${ext_path}" "name" "${ext_name##*/}"
+    _oradba_ext_property version "${ext_path}" "version" "unknown"
+    _oradba_ext_property desc "${ext_path}" "description"
+    _oradba_ext_property priority "${ext_path}" "priority" "50" "true"
+    _oradba_ext_property author "${ext_path}" "author"
 
     # Check enabled status
     if is_extension_enabled "${ext_name}" "${ext_path}"; then
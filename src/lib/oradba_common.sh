@@ -33,6 +33,81 @@ get_script_dir() {
     echo "$(cd -P "$(dirname "$source")" && pwd)"
 }
 
+# ------------------------------------------------------------------------------
+# Function: oradba_add_exit_handler
+# Purpose.: Add a command to the EXIT trap, keeping an existing trap
+# Args....: $1 - Command to run on exit
+#           $2 - Position: last (default, after the existing trap) or first
+# Returns.: 0
+# Output..: None
+# Notes...: Idempotent. A subshell reports the trap of its parent although it
+#           does not run it there, so the existing trap is only kept in the
+#           main shell.
+# ------------------------------------------------------------------------------
+oradba_add_exit_handler() {
+    local handler="$1"
+    local position="${2:-last}"
+    local existing=""
+
+    [[ "$(trap -p EXIT)" == *"${handler}"* ]] && return 0
+    if [[ "${BASHPID}" == "$$" ]]; then
+        eval "set -- $(trap -p EXIT)"
+        existing="${3:-}"
+    fi
+    # shellcheck disable=SC2064
+    if [[ "${position}" == "first" ]]; then
+        trap "${handler}${existing:+; ${existing}}" EXIT
+    else
+        trap "${existing:+${existing}; }${handler}" EXIT
+    fi
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_is_private_file
+# Purpose.: Check that a generated file is safe to source
+# Args....: $1 - File path
+# Returns.: 0 if the file is owned by the current user and not writable by
+#           group or others, 1 otherwise
+# Output..: None
+# Notes...: Guards the shell code kept in the cache directory, which may be
+#           shared between users. One stat call.
+# ------------------------------------------------------------------------------
+oradba_is_private_file() {
+    local file="$1"
+    local mode
+
+    [[ -f "${file}" && -O "${file}" ]] || return 1
+    if [[ "${OSTYPE:-}" == darwin* ]]; then
+        mode=$(stat -f '%Lp' "${file}" 2> /dev/null) || return 1
+    else
+        mode=$(stat -c '%a' "${file}" 2> /dev/null) || return 1
+    fi
+    [[ "${mode}" =~ ^[0-7]+$ ]] && (((8#${mode} & 8#022) == 0))
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_cache_dir
+# Purpose.: Resolve the OraDBA cache directory
+# Args....: $1 - Name of the variable to receive the directory
+# Returns.: 0 always
+# Output..: None (sets the named variable, empty if no directory is known)
+# Notes...: ORADBA_CACHE_DIR, else ${ORADBA_BASE}/var/cache, else the user's
+#           cache directory (${XDG_CACHE_HOME:-~/.cache}/oradba). Resolved per
+#           call, as libraries may be sourced before ORADBA_BASE is known.
+#           Shared by all caches (registry, detection, config, extensions,
+#           environment bundles, change tracker, peer sync state).
+# ------------------------------------------------------------------------------
+oradba_cache_dir() {
+    local _dir="${ORADBA_CACHE_DIR:-${ORADBA_BASE:+${ORADBA_BASE}/var/cache}}"
+
+    if [[ -z "${_dir}" ]]; then
+        _dir="${XDG_CACHE_HOME:-${HOME:+${HOME}/.cache}}"
+        _dir="${_dir:+${_dir}/oradba}"
+    fi
+    printf -v "$1" '%s' "${_dir}"
+}
+
 # ------------------------------------------------------------------------------
 # Unified Logging System
 # ------------------------------------------------------------------------------
@@ -44,10 +119,13 @@ get_script_dir() {
 # Returns.: 0 on success
 # Output..: Creates ORADBA_LOG_DIR, sets ORADBA_LOG_FILE, ORADBA_ERROR_LOG
 # Notes...: Falls back to ${HOME}/.oradba/logs if /var/log not writable
+#           Compiles the oradba_log threshold (see _oradba_log_compile)
 # ------------------------------------------------------------------------------
 init_logging() {
     local log_dir="${ORADBA_LOG_DIR:-}"
 
+    _oradba_log_compile
+
     # Determine log directory
     if [[ -z "$log_dir" ]]; then
         if [[ -w "/var/log" ]]; then
@@ -90,6 +168,9 @@ init_logging() {
 # Args....: None
 # Returns.: 0 on success
 # Output..: Sets ORADBA_SESSION_LOG environment variable
+# Notes...: ORADBA_SESSION_LOG_BUFFER=true buffers session log lines in memory
+#           and writes them every ORADBA_SESSION_LOG_BUFFER_LINES lines (100)
+#           and on exit (oradba_session_log_flush)
 # ------------------------------------------------------------------------------
 init_session_log() {
     # Only create session log if enabled and logging is initialized
@@ -129,6 +210,81 @@ EOF
         export ORADBA_LOG_FILE="$session_log"
     fi
 
+    # Optional buffered writer, owned by this shell (subshells write directly)
+    if [[ "${ORADBA_SESSION_LOG_BUFFER:-false}" == "true" ]]; then
+        _ORADBA_SESSION_LOG_BUFFER=()
+        _ORADBA_SESSION_LOG_BUFFER_FILE="$session_log"
+        _ORADBA_SESSION_LOG_BUFFER_PID="${BASHPID}"
+        oradba_add_exit_handler oradba_session_log_flush
+    fi
+
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_session_log_flush
+# Purpose.: Write buffered session log lines to the session log file
+# Args....: None
+# Returns.: 0
+# Output..: Appends to the buffered session log file
+# Notes...: Runs from the EXIT trap installed by init_session_log; safe to call
+#           when buffering is disabled
+# ------------------------------------------------------------------------------
+oradba_session_log_flush() {
+    if [[ ${#_ORADBA_SESSION_LOG_BUFFER[@]} -gt 0 ]] && [[ -n "${_ORADBA_SESSION_LOG_BUFFER_FILE:-}" ]]; then
+        printf '%s\n' "${_ORADBA_SESSION_LOG_BUFFER[@]}" >> "${_ORADBA_SESSION_LOG_BUFFER_FILE}"
+    fi
+    _ORADBA_SESSION_LOG_BUFFER=()
+    return 0
+}
+
+# Numeric log levels (TRACE < DEBUG < INFO/SUCCESS/SECTION < WARN < ERROR/FAILURE)
+if ! declare -p _ORADBA_LOG_LEVEL_VALUES &> /dev/null; then
+    declare -gA _ORADBA_LOG_LEVEL_VALUES=(
+        [TRACE]=-1 [DEBUG]=0 [INFO]=1 [WARN]=2 [ERROR]=3 [SUCCESS]=1 [FAILURE]=3 [SECTION]=1
+        [trace]=-1 [debug]=0 [info]=1 [warn]=2 [error]=3 [success]=1 [failure]=3 [section]=1
+    )
+fi
+if ! declare -p _ORADBA_SESSION_LOG_BUFFER &> /dev/null; then
+    _ORADBA_SESSION_LOG_BUFFER=()
+fi
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_log_compile
+# Purpose.: Compute the effective oradba_log threshold from the log variables
+# Args....: None
+# Returns.: 0
+# Output..: Sets _ORADBA_LOG_MIN (numeric threshold) and _ORADBA_LOG_SIG
+# Notes...: ORADBA_LOG_LEVEL (default INFO), raised to DEBUG by DEBUG=1,
+#           ORADBA_PLUGIN_DEBUG=true or ORADBA_DEBUG=true and to TRACE by
+#           ORADBA_TRACE=true. oradba_log recompiles when _ORADBA_LOG_SIG no
+#           longer matches these variables.
+# ------------------------------------------------------------------------------
+_oradba_log_compile() {
+    local min_level="${ORADBA_LOG_LEVEL:-INFO}"
+
+    # Legacy DEBUG=1, plugin and OraDBA debug switches enable DEBUG level
+    if [[ "${DEBUG:-0}" == "1" ]] || [[ "${ORADBA_PLUGIN_DEBUG:-false}" == "true" ]] \
+        || [[ "${ORADBA_DEBUG:-false}" == "true" ]]; then
+        case "${min_level}" in
+            trace | TRACE) ;;
+            *) min_level="DEBUG" ;;
+        esac
+    fi
+
+    # ORADBA_TRACE=true support - map to TRACE level
+    if [[ "${ORADBA_TRACE:-false}" == "true" ]]; then
+        min_level="TRACE"
+    fi
+
+    case "${min_level}" in
+        trace | TRACE) _ORADBA_LOG_MIN=-1 ;;
+        debug | DEBUG) _ORADBA_LOG_MIN=0 ;;
+        warn | WARN) _ORADBA_LOG_MIN=2 ;;
+        error | ERROR) _ORADBA_LOG_MIN=3 ;;
+        *) _ORADBA_LOG_MIN=1 ;; # INFO and unknown levels
+    esac
+    _ORADBA_LOG_SIG="${ORADBA_LOG_LEVEL-}|${DEBUG-}|${ORADBA_PLUGIN_DEBUG-}|${ORADBA_DEBUG-}|${ORADBA_TRACE-}"
     return 0
 }
 
@@ -179,126 +335,331 @@ fi # End of readonly variables guard
 #           Replaces deprecated log_info/log_warn/log_error/log_debug functions
 # ------------------------------------------------------------------------------
 oradba_log() {
-    local level="$1"
+    # Fast path: recompile only when a controlling variable changed, return
+    # before any formatting when the level is suppressed
+    if [[ "${ORADBA_LOG_LEVEL-}|${DEBUG-}|${ORADBA_PLUGIN_DEBUG-}|${ORADBA_DEBUG-}|${ORADBA_TRACE-}" != "${_ORADBA_LOG_SIG-}" ]]; then
+        _oradba_log_compile
+    fi
+    # Unknown levels count as INFO
+    if ((${_ORADBA_LOG_LEVEL_VALUES[${1:-INFO}]:-1} < _ORADBA_LOG_MIN)); then
+        return 0
+    fi
+    local level="${1:-INFO}"
     shift
     local message="$*"
-    local level_upper
-    local min_level_upper
+    local level_upper="${level}"
+    [[ -n "${_ORADBA_LOG_LEVEL_VALUES[${level}]:-}" ]] && level_upper="${level^^}"
 
-    # Default log level is INFO if not set
-    local min_level="${ORADBA_LOG_LEVEL:-INFO}"
-    case "${level}" in
-        trace | TRACE) level_upper="TRACE" ;;
-        debug | DEBUG) level_upper="DEBUG" ;;
-        info | INFO) level_upper="INFO" ;;
-        warn | WARN) level_upper="WARN" ;;
-        error | ERROR) level_upper="ERROR" ;;
-        success | SUCCESS) level_upper="SUCCESS" ;;
-        failure | FAILURE) level_upper="FAILURE" ;;
-        section | SECTION) level_upper="SECTION" ;;
-        *) level_upper="${level}" ;;
+    # Select color based on level
+    local color=""
+    case "${level_upper}" in
+        TRACE) color="${LOG_COLOR_TRACE}" ;;
+        DEBUG) color="${LOG_COLOR_DEBUG}" ;;
+        INFO) color="${LOG_COLOR_INFO}" ;;
+        WARN) color="${LOG_COLOR_WARN}" ;;
+        ERROR) color="${LOG_COLOR_ERROR}" ;;
+        SUCCESS) color="${LOG_COLOR_SUCCESS}" ;;
+        FAILURE) color="${LOG_COLOR_FAILURE}" ;;
+        SECTION) color="${LOG_COLOR_SECTION}" ;;
     esac
 
-    # Legacy DEBUG=1 support - if DEBUG is set, enable DEBUG level
-    if [[ "${DEBUG:-0}" == "1" ]] && [[ "${min_level}" != "DEBUG" ]] && [[ "${min_level}" != "TRACE" ]]; then
-        min_level="DEBUG"
+    # Format log message
+    local timestamp
+    printf -v timestamp '%(%Y-%m-%d %H:%M:%S)T' -1
+
+    # Add caller information if enabled
+    local log_line
+    if [[ "${ORADBA_LOG_SHOW_CALLER:-false}" == "true" ]]; then
+        local caller="${BASH_SOURCE[2]##*/}:${BASH_LINENO[1]}"
+        log_line="[${level_upper}] ${timestamp} [${caller}] - ${message}"
+    else
+        log_line="[${level_upper}] ${timestamp} - ${message}"
     fi
 
-    # ORADBA_PLUGIN_DEBUG support - enable DEBUG level for plugin diagnostics
-    if [[ "${ORADBA_PLUGIN_DEBUG:-false}" == "true" ]] && [[ "${min_level}" != "DEBUG" ]] && [[ "${min_level}" != "TRACE" ]]; then
-        min_level="DEBUG"
+    # Output to stderr with color if enabled
+    if [[ -n "${color}" ]]; then
+        echo -e "${color}${log_line}${LOG_COLOR_RESET}" >&2
+    else
+        echo "${log_line}" >&2
     fi
 
-    # ORADBA_DEBUG=true support - map to DEBUG level
-    if [[ "${ORADBA_DEBUG:-false}" == "true" ]] && [[ "${min_level}" != "DEBUG" ]] && [[ "${min_level}" != "TRACE" ]]; then
-        min_level="DEBUG"
+    # Optional file logging (without color codes)
+    if [[ -n "${ORADBA_LOG_FILE:-}" ]]; then
+        _oradba_log_write "${ORADBA_LOG_FILE}" "${log_line}"
     fi
 
-    # ORADBA_TRACE=true support - map to TRACE level
-    if [[ "${ORADBA_TRACE:-false}" == "true" ]] && [[ "${min_level}" != "TRACE" ]]; then
-        min_level="TRACE"
+    # Dual logging: also write to session log if different from main log
+    if [[ -n "${ORADBA_SESSION_LOG:-}" ]] && [[ "${ORADBA_SESSION_LOG}" != "${ORADBA_LOG_FILE:-}" ]]; then
+        _oradba_log_write "${ORADBA_SESSION_LOG}" "${log_line}"
     fi
+    return 0
+}
 
-    # Recompute normalized minimum level after compatibility overrides
-    case "${min_level}" in
-        trace | TRACE) min_level_upper="TRACE" ;;
-        debug | DEBUG) min_level_upper="DEBUG" ;;
-        info | INFO) min_level_upper="INFO" ;;
-        warn | WARN) min_level_upper="WARN" ;;
-        error | ERROR) min_level_upper="ERROR" ;;
-        *) min_level_upper="${min_level}" ;;
-    esac
+# ------------------------------------------------------------------------------
+# Function: _oradba_log_write
+# Purpose.: Append a log line to a file, through the session log buffer if
+#           the file is the buffered session log of this shell
+# Args....: $1 - Log file
+#           $2 - Log line
+# Returns.: 0
+# Output..: Appends to the file (or the buffer)
+# ------------------------------------------------------------------------------
+_oradba_log_write() {
+    if [[ "$1" == "${_ORADBA_SESSION_LOG_BUFFER_FILE:-}" ]] && [[ "${BASHPID}" == "${_ORADBA_SESSION_LOG_BUFFER_PID:-}" ]]; then
+        _ORADBA_SESSION_LOG_BUFFER+=("$2")
+        if [[ ${#_ORADBA_SESSION_LOG_BUFFER[@]} -ge ${ORADBA_SESSION_LOG_BUFFER_LINES:-100} ]]; then
+            oradba_session_log_flush
+        fi
+    else
+        echo "$2" >> "$1"
+    fi
+    return 0
+}
 
-    # Convert levels to numeric values for comparison
-    local level_value=0
-    local min_level_value=0
+# ------------------------------------------------------------------------------
+# SQL*Plus Session Mode (opt-in: ORADBA_SQL_SESSION=true)
+# ------------------------------------------------------------------------------
+# Keeps one SQL*Plus process per ORACLE_SID/ORACLE_HOME open behind a pair of
+# named pipes so execute_db_query does not pay a bequeath connect per query.
+# Each query is framed by a PROMPT sentinel. Sessions end when the shell
+# exits, on oradba_sql_session_close or after ORADBA_SQL_SESSION_IDLE seconds
+# without a query. Open the session in the calling shell (not inside $(...))
+# so that command substitutions inherit and share it.
 
-    case "${level_upper}" in
-        TRACE) level_value=-1 ;;
-        DEBUG) level_value=0 ;;
-        INFO) level_value=1 ;;
-        WARN) level_value=2 ;;
-        ERROR) level_value=3 ;;
-        SUCCESS) level_value=1 ;; # Same as INFO
-        FAILURE) level_value=3 ;; # Same as ERROR
-        SECTION) level_value=1 ;; # Same as INFO
-        *) level_value=1 ;;       # Default to INFO for unknown levels
-    esac
+if ! declare -p _ORADBA_SQL_SESSION_PID &> /dev/null; then
+    declare -gA _ORADBA_SQL_SESSION_PID=()   # key -> sqlplus pid
+    declare -gA _ORADBA_SQL_SESSION_IN=()    # key -> fd writing to sqlplus
+    declare -gA _ORADBA_SQL_SESSION_OUT=()   # key -> fd reading from sqlplus
+    declare -gA _ORADBA_SQL_SESSION_DIR=()   # key -> pipe/state directory
+    declare -gA _ORADBA_SQL_SESSION_WATCH=() # key -> idle watchdog pid
+fi
 
-    case "${min_level_upper}" in
-        TRACE) min_level_value=-1 ;;
-        DEBUG) min_level_value=0 ;;
-        INFO) min_level_value=1 ;;
-        WARN) min_level_value=2 ;;
-        ERROR) min_level_value=3 ;;
-        *) min_level_value=1 ;; # Default to INFO
-    esac
+# ------------------------------------------------------------------------------
+# Function: oradba_sql_session_active
+# Purpose.: Check whether a SQL*Plus session is open for an instance
+# Args....: $1 - Session key (optional, default: "${ORACLE_SID}|${ORACLE_HOME}")
+# Returns.: 0 if the session process is alive, 1 otherwise
+# Output..: None
+# ------------------------------------------------------------------------------
+oradba_sql_session_active() {
+    local key="${1:-${ORACLE_SID:-}|${ORACLE_HOME:-}}"
+    local pid="${_ORADBA_SQL_SESSION_PID[${key}]:-}"
 
-    # Only log if message level meets minimum threshold
-    if [[ ${level_value} -ge ${min_level_value} ]]; then
-        # Select color based on level
-        local color=""
-        case "${level_upper}" in
-            TRACE) color="${LOG_COLOR_TRACE}" ;;
-            DEBUG) color="${LOG_COLOR_DEBUG}" ;;
-            INFO) color="${LOG_COLOR_INFO}" ;;
-            WARN) color="${LOG_COLOR_WARN}" ;;
-            ERROR) color="${LOG_COLOR_ERROR}" ;;
-            SUCCESS) color="${LOG_COLOR_SUCCESS}" ;;
-            FAILURE) color="${LOG_COLOR_FAILURE}" ;;
-            SECTION) color="${LOG_COLOR_SECTION}" ;;
+    [[ -n "${pid}" ]] && kill -0 "${pid}" 2> /dev/null
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_sql_session_read
+# Purpose.: Read session output up to a sentinel line
+# Args....: $1 - Session key
+#           $2 - Sentinel
+# Returns.: 0 on success, 1 if SQL errors were reported, 2 if the session
+#           timed out or ended
+# Output..: Output lines before the sentinel
+# ------------------------------------------------------------------------------
+_oradba_sql_session_read() {
+    local key="$1"
+    local sentinel="$2"
+    local fd_out="${_ORADBA_SQL_SESSION_OUT[${key}]}"
+    local timeout="${ORADBA_SQL_SESSION_TIMEOUT:-60}"
+    local line rc=0
+
+    while true; do
+        if ! IFS= read -r -t "${timeout}" -u "${fd_out}" line; then
+            return 2
+        fi
+        [[ "${line}" == "${sentinel}" ]] && break
+        case "${line}" in
+            ORA-* | SP2-*) rc=1 ;;
         esac
+        printf '%s\n' "${line}"
+    done
+    return ${rc}
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_sql_session_send
+# Purpose.: Send a script to a session followed by a sentinel PROMPT
+# Args....: $1 - Session key
+#           $2 - SQL*Plus script
+#           $3 - Sentinel
+# Returns.: 0 on success, 1 if the session is gone
+# Output..: None
+# Notes...: Writes from a subshell so a vanished reader raises SIGPIPE there
+#           instead of terminating the calling script
+# ------------------------------------------------------------------------------
+_oradba_sql_session_send() {
+    local key="$1"
+    local script="$2"
+    local sentinel="$3"
+    local fd_in="${_ORADBA_SQL_SESSION_IN[${key}]}"
+    local dir="${_ORADBA_SQL_SESSION_DIR[${key}]}"
+
+    printf '%s' "${EPOCHSECONDS:-$(date +%s)}" > "${dir}/last" 2> /dev/null
+    (printf '%s\nPROMPT %s\n' "${script}" "${sentinel}" >&"${fd_in}") 2> /dev/null
+}
 
-        # Format log message
-        local timestamp
-        timestamp="$(date '+%Y-%m-%d %H:%M:%S')"
+# ------------------------------------------------------------------------------
+# Function: oradba_sql_session_open
+# Purpose.: Open (or reuse) the SQL*Plus session for the current instance
+# Args....: None (uses ORACLE_SID, ORACLE_HOME and sqlplus from PATH)
+# Returns.: 0 if a session is available, 1 if session mode is disabled or the
+#           session could not be started (callers fall back to one-shot calls)
+# Output..: None
+# Notes...: No-op unless ORADBA_SQL_SESSION=true. Logs on once (-L), so a
+#           failed connect ends the process instead of prompting for input.
+# ------------------------------------------------------------------------------
+oradba_sql_session_open() {
+    [[ "${ORADBA_SQL_SESSION:-false}" != "true" ]] && return 1
 
-        # Add caller information if enabled
-        local log_line
-        if [[ "${ORADBA_LOG_SHOW_CALLER:-false}" == "true" ]]; then
-            local caller="${BASH_SOURCE[2]##*/}:${BASH_LINENO[1]}"
-            log_line="[${level_upper}] ${timestamp} [${caller}] - ${message}"
-        else
-            log_line="[${level_upper}] ${timestamp} - ${message}"
-        fi
+    local key="${ORACLE_SID:-}|${ORACLE_HOME:-}"
+    oradba_sql_session_active "${key}" && return 0
+    [[ -n "${_ORADBA_SQL_SESSION_PID[${key}]:-}" ]] && oradba_sql_session_close "${key}"
 
-        # Output to stderr with color if enabled
-        if [[ -n "${color}" ]]; then
-            echo -e "${color}${log_line}${LOG_COLOR_RESET}" >&2
-        else
-            echo "${log_line}" >&2
-        fi
+    local dir
+    dir=$(mktemp -d "${TMPDIR:-/tmp}/oradba_sql.XXXXXX") || return 1
+    if ! mkfifo "${dir}/in" "${dir}/out" 2> /dev/null; then
+        rm -rf "${dir}"
+        return 1
+    fi
 
-        # Optional file logging (without color codes)
-        if [[ -n "${ORADBA_LOG_FILE:-}" ]]; then
-            echo "${log_line}" >> "${ORADBA_LOG_FILE}"
-        fi
+    sqlplus -s -L / as sysdba < "${dir}/in" > "${dir}/out" 2>&1 &
+    local pid=$!
+    local fd_in fd_out
+    exec {fd_in}> "${dir}/in"
+    exec {fd_out}< "${dir}/out"
 
-        # Dual logging: also write to session log if different from main log
-        if [[ -n "${ORADBA_SESSION_LOG:-}" ]] && [[ "${ORADBA_SESSION_LOG}" != "${ORADBA_LOG_FILE:-}" ]]; then
-            echo "${log_line}" >> "${ORADBA_SESSION_LOG}"
-        fi
+    _ORADBA_SQL_SESSION_PID["${key}"]="${pid}"
+    _ORADBA_SQL_SESSION_IN["${key}"]="${fd_in}"
+    _ORADBA_SQL_SESSION_OUT["${key}"]="${fd_out}"
+    _ORADBA_SQL_SESSION_DIR["${key}"]="${dir}"
+
+    # Configure the session and wait until it answers
+    local sentinel="__ORADBA_EOQ_${BASHPID}_${RANDOM}${RANDOM}__"
+    if ! _oradba_sql_session_send "${key}" 'SET PAGESIZE 0 LINESIZE 500 TRIMSPOOL ON TRIMOUT ON
+SET HEADING OFF FEEDBACK OFF VERIFY OFF ECHO OFF
+SET TIMING OFF TIME OFF SQLPROMPT "" SUFFIX SQL
+SET TAB OFF UNDERLINE OFF WRAP ON COLSEP ""
+SET SERVEROUTPUT OFF TERMOUT ON
+WHENEVER SQLERROR CONTINUE
+WHENEVER OSERROR CONTINUE' "${sentinel}" \
+        || ! _oradba_sql_session_read "${key}" "${sentinel}" > /dev/null; then
+        oradba_log DEBUG "oradba_sql_session_open: Session for ${key} did not start"
+        oradba_sql_session_close "${key}"
+        return 1
     fi
+
+    # Idle watchdog: ends the session after ORADBA_SQL_SESSION_IDLE seconds
+    local idle="${ORADBA_SQL_SESSION_IDLE:-300}"
+    if [[ "${idle}" =~ ^[0-9]+$ ]] && [[ ${idle} -gt 0 ]]; then
+        local poll=$((idle < 10 ? 1 : 10))
+        (
+            exec {fd_in}>&- {fd_out}<&-
+            trap - EXIT
+            local last now
+            while kill -0 "${pid}" 2> /dev/null; do
+                sleep "${poll}"
+                last=$(< "${dir}/last") 2> /dev/null || last=0
+                now=$(date +%s)
+                if [[ $((now - last)) -ge ${idle} ]]; then
+                    kill "${pid}" 2> /dev/null
+                    break
+                fi
+            done
+        ) > /dev/null 2>&1 &
+        _ORADBA_SQL_SESSION_WATCH["${key}"]=$!
+    fi
+
+    # Close sessions on exit, before an existing EXIT trap of the caller runs
+    oradba_add_exit_handler oradba_sql_session_close_all first
+
+    oradba_log DEBUG "oradba_sql_session_open: Session for ${key} started (pid ${pid})"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_sql_session_query
+# Purpose.: Run a query in the open session of the current instance
+# Args....: $1 - SQL*Plus script (statements must be terminated by ; or /)
+# Returns.: 0 on success, 1 on SQL errors, 2 if no usable session exists
+# Output..: Query output (unfiltered)
+# Notes...: A session that times out or dies is stopped, so the next
+#           oradba_sql_session_open starts a fresh one
+# ------------------------------------------------------------------------------
+oradba_sql_session_query() {
+    local query="$1"
+    local key="${ORACLE_SID:-}|${ORACLE_HOME:-}"
+
+    oradba_sql_session_active "${key}" || return 2
+
+    local sentinel="__ORADBA_EOQ_${BASHPID}_${RANDOM}${RANDOM}__"
+    local rc=0
+    _oradba_sql_session_send "${key}" "${query}" "${sentinel}" || rc=2
+    [[ ${rc} -eq 0 ]] && { _oradba_sql_session_read "${key}" "${sentinel}" || rc=$?; }
+
+    if [[ ${rc} -eq 2 ]]; then
+        oradba_log DEBUG "oradba_sql_session_query: Session for ${key} timed out or ended"
+        kill "${_ORADBA_SQL_SESSION_PID[${key}]}" 2> /dev/null
+    fi
+    return ${rc}
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_sql_session_usable
+# Purpose.: Check whether execute_db_query should use the session
+# Args....: None
+# Returns.: 0 if session mode is enabled and a session is (or could be) open
+# Output..: None
+# Notes...: Opens the session lazily, but only in the main shell; subshells
+#           such as $(...) reuse an inherited session and never start one
+# ------------------------------------------------------------------------------
+_oradba_sql_session_usable() {
+    [[ "${ORADBA_SQL_SESSION:-false}" == "true" ]] || return 1
+    oradba_sql_session_active && return 0
+    [[ "${BASHPID}" == "$$" ]] && oradba_sql_session_open
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_sql_session_close
+# Purpose.: Close the SQL*Plus session of an instance
+# Args....: $1 - Session key (optional, default: "${ORACLE_SID}|${ORACLE_HOME}")
+# Returns.: 0 always
+# Output..: None
+# ------------------------------------------------------------------------------
+oradba_sql_session_close() {
+    local key="${1:-${ORACLE_SID:-}|${ORACLE_HOME:-}}"
+    local pid="${_ORADBA_SQL_SESSION_PID[${key}]:-}"
+    [[ -z "${pid}" ]] && return 0
+
+    local fd_in="${_ORADBA_SQL_SESSION_IN[${key}]}"
+    local fd_out="${_ORADBA_SQL_SESSION_OUT[${key}]}"
+    if kill -0 "${pid}" 2> /dev/null; then
+        (printf 'EXIT\n' >&"${fd_in}") 2> /dev/null || true
+    fi
+    exec {fd_in}>&- 2> /dev/null
+    exec {fd_out}<&- 2> /dev/null
+
+    [[ -n "${_ORADBA_SQL_SESSION_WATCH[${key}]:-}" ]] && kill "${_ORADBA_SQL_SESSION_WATCH[${key}]}" 2> /dev/null
+    rm -rf "${_ORADBA_SQL_SESSION_DIR[${key}]}"
+    unset "_ORADBA_SQL_SESSION_PID[${key}]" "_ORADBA_SQL_SESSION_IN[${key}]" "_ORADBA_SQL_SESSION_OUT[${key}]" \
+        "_ORADBA_SQL_SESSION_DIR[${key}]" "_ORADBA_SQL_SESSION_WATCH[${key}]"
+    oradba_log DEBUG "oradba_sql_session_close: Session for ${key} closed"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_sql_session_close_all
+# Purpose.: Close all open SQL*Plus sessions
+# Args....: None
+# Returns.: 0 always
+# Output..: None
+# ------------------------------------------------------------------------------
+oradba_sql_session_close_all() {
+    local key
+    for key in "${!_ORADBA_SQL_SESSION_PID[@]}"; do
+        oradba_sql_session_close "${key}"
+    done
+    return 0
 }
 
 # ------------------------------------------------------------------------------
@@ -309,6 +670,8 @@ oradba_log() {
 #           format - Output format: 'raw' (default) or 'delimited'
 # Returns.: Query results in specified format
 # Note....: New in v0.13.2 - Eliminates SQL*Plus boilerplate duplication
+#           With ORADBA_SQL_SESSION=true the query runs in the persistent
+#           session of the current instance (see oradba_sql_session_open)
 # ------------------------------------------------------------------------------
 execute_db_query() {
     local query="$1"
@@ -326,10 +689,16 @@ execute_db_query() {
         return 1
     fi
 
+    # Reuse the persistent session when enabled (ORADBA_SQL_SESSION=true)
+    local result exit_code=2
+    if _oradba_sql_session_usable; then
+        result=$(oradba_sql_session_query "${query}") && exit_code=0 || exit_code=$?
+    fi
+
     # Execute query with standard SQL*Plus configuration
-    local result
-    result=$(
-        sqlplus -s / as sysdba 2>&1 << EOF
+    if [[ ${exit_code} -eq 2 ]]; then
+        result=$(
+            sqlplus -s / as sysdba 2>&1 << EOF
 SET PAGESIZE 0 LINESIZE 500 TRIMSPOOL ON TRIMOUT ON
 SET HEADING OFF FEEDBACK OFF VERIFY OFF ECHO OFF
 SET TIMING OFF TIME OFF SQLPROMPT "" SUFFIX SQL
@@ -340,9 +709,9 @@ WHENEVER OSERROR EXIT FAILURE
 ${query}
 EXIT;
 EOF
-    )
-
-    local exit_code=$?
+        )
+        exit_code=$?
+    fi
 
     # Check for SQL*Plus errors
     if [[ $exit_code -ne 0 ]]; then
@@ -485,6 +854,30 @@ command_exists() {
     command -v "$1" > /dev/null 2>&1
 }
 
+# ------------------------------------------------------------------------------
+# Function: oradba_kill_process_tree
+# Purpose.: Send a signal to a process and all its descendants
+# Args....: $1 - Process ID
+#           $2 - Signal (optional, default: TERM)
+# Returns.: 0
+# Output..: None
+# Notes...: Stops each process before walking its children (pgrep -P) so it
+#           cannot fork or react; the signal is delivered on continue.
+#           Used for job timeouts in oradba_rman.sh and the peer sync engine.
+# ------------------------------------------------------------------------------
+oradba_kill_process_tree() {
+    local pid="$1"
+    local signal="${2:-TERM}"
+    local child
+
+    kill -STOP "${pid}" 2> /dev/null || return 0
+    for child in $(pgrep -P "${pid}" 2> /dev/null); do
+        oradba_kill_process_tree "${child}" "${signal}"
+    done
+    kill "-${signal}" "${pid}" 2> /dev/null || true
+    kill -CONT "${pid}" 2> /dev/null || true
+}
+
 # ------------------------------------------------------------------------------
 # Coexistence Mode Functions (TVD BasEnv / DB*Star)
 # ------------------------------------------------------------------------------
@@ -950,10 +1343,7 @@ set_oracle_home_environment() {
         esac
 
         # Deduplicate PATH after all additions
-        if command -v oradba_dedupe_path &> /dev/null; then
-            PATH="$(oradba_dedupe_path "${PATH}")"
-            export PATH
-        fi
+        oradba_pathset_dedupe PATH
     fi
     if command -v _oraenv_profile_mark &> /dev/null; then
         _oraenv_profile_mark "set_home.finalize_path"
@@ -1068,24 +1458,7 @@ load_config_file() {
 
         # Deduplicate PATH if it changed
         if [[ "${PATH}" != "${path_before}" ]]; then
-            # Use oradba_dedupe_path if available (Phase 2), otherwise use awk
-            if command -v oradba_dedupe_path &> /dev/null; then
-                PATH="$(oradba_dedupe_path "${PATH}")"
-            else
-                # Fallback deduplication using bash 4+ associative array
-                local _deduped="" _p
-                declare -A _seen_paths
-                IFS=: read -ra _path_parts <<< "${PATH}"
-                for _p in "${_path_parts[@]}"; do
-                    [[ -z "${_p}" ]] && continue
-                    if [[ -z "${_seen_paths[${_p}]+set}" ]]; then
-                        _seen_paths["${_p}"]=1
-                        _deduped="${_deduped:+${_deduped}:}${_p}"
-                    fi
-                done
-                PATH="${_deduped}"
-            fi
-            export PATH
+            oradba_pathset_dedupe PATH
         fi
 
         return 0
@@ -1484,17 +1857,13 @@ add_to_sqlpath() {
     fi
 
     # Check if already in SQLPATH
-    if [[ ":${SQLPATH}:" == *":${new_path}:"* ]]; then
+    if oradba_pathset_contains SQLPATH "${new_path}"; then
         oradba_log DEBUG "Directory already in SQLPATH: ${new_path}"
         return 0
     fi
 
     # Add to SQLPATH
-    if [[ -z "${SQLPATH}" ]]; then
-        export SQLPATH="${new_path}"
-    else
-        export SQLPATH="${SQLPATH}:${new_path}"
-    fi
+    oradba_pathset_append SQLPATH "${new_path}"
 
     oradba_log DEBUG "Added to SQLPATH: ${new_path}"
 }
@@ -1585,6 +1954,143 @@ sanitize_sensitive_data() {
         -e 's/(password|pwd|passwd)=([^[:space:]&;|"'\''=]+)/\1=***/gi'
 }
 
+# Memo of pure plugin function results (see _oradba_plugin_memo_key):
+# key "plugin|function|home|arg|GRID_HOME|plugin mtime" -> "exit_code:stdout"
+if ! declare -p _ORADBA_PLUGIN_MEMO &> /dev/null; then
+    declare -gA _ORADBA_PLUGIN_MEMO=()
+    declare -gA _ORADBA_PLUGIN_MTIME=()
+    declare -gA _ORADBA_PLUGIN_MTIME_AT=()
+fi
+
+# Plugin functions whose result only depends on plugin, home, argument and
+# GRID_HOME (the database plugin adds the Grid bin and lib directories)
+: "${ORADBA_PLUGIN_PURE_FUNCTIONS:=build_bin_path build_lib_path get_config_section get_required_binaries}"
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_plugin_file
+# Purpose.: Resolve the plugin file of a product type
+# Args....: $1 - Variable name for the plugin file path
+#           $2 - product type (plugin name)
+# Returns.: 0 if the plugin file exists, 1 otherwise
+# Output..: None
+# ------------------------------------------------------------------------------
+_oradba_plugin_file() {
+    local -n _plugin_file="$1"
+    local oradba_base="${ORADBA_BASE}"
+
+    if [[ -z "${oradba_base}" ]]; then
+        local script_dir
+        script_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+        oradba_base="$(cd "${script_dir}/../.." && pwd)"
+    fi
+
+    _plugin_file="${oradba_base}/lib/plugins/${2}_plugin.sh"
+    if [[ ! -f "${_plugin_file}" ]]; then
+        oradba_log DEBUG "Plugin not found: ${2}_plugin.sh"
+        return 1
+    fi
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_plugin_memo_key
+# Purpose.: Build the memo key of a pure plugin function call
+# Args....: $1 - Variable name for the key
+#           $2 - plugin file
+#           $3 - product type
+#           $4 - function name (without plugin_ prefix)
+#           $5 - ORACLE_HOME or NOARGS
+#           $6 - extra argument (optional)
+# Returns.: 0 if the call may be memoized, 1 otherwise
+# Output..: None
+# Notes...: Only functions listed in ORADBA_PLUGIN_PURE_FUNCTIONS are memoized
+#           (ORADBA_PLUGIN_MEMO=false disables the memo). GRID_HOME and the
+#           plugin file mtime are part of the key; the mtime is re-read at most
+#           every ORADBA_PLUGIN_MEMO_CHECK seconds (default: 60).
+# ------------------------------------------------------------------------------
+_oradba_plugin_memo_key() {
+    local -n _memo_key="$1"
+    local plugin_file="$2"
+    local mtime=""
+
+    [[ "${ORADBA_PLUGIN_MEMO:-true}" == "true" ]] || return 1
+    [[ " ${ORADBA_PLUGIN_PURE_FUNCTIONS} " == *" ${4} "* ]] || return 1
+
+    if [[ -z "${_ORADBA_PLUGIN_MTIME[${plugin_file}]:-}" ]] \
+        || ((SECONDS - ${_ORADBA_PLUGIN_MTIME_AT[${plugin_file}]:-0} >= ${ORADBA_PLUGIN_MEMO_CHECK:-60})); then
+        if [[ "${OSTYPE:-}" == darwin* ]]; then
+            mtime=$(stat -f '%m' "${plugin_file}" 2> /dev/null)
+        else
+            mtime=$(stat -c '%Y' "${plugin_file}" 2> /dev/null)
+        fi
+        [[ -n "${mtime}" ]] || return 1
+        _ORADBA_PLUGIN_MTIME["${plugin_file}"]="${mtime}"
+        _ORADBA_PLUGIN_MTIME_AT["${plugin_file}"]="${SECONDS}"
+    fi
+
+    _memo_key="${3}|${4}|${5}|${6:-}|${GRID_HOME:-}|${_ORADBA_PLUGIN_MTIME[${plugin_file}]}"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_plugin_memo_clear
+# Purpose.: Drop all memoized plugin function results
+# Args....: None
+# Returns.: 0
+# Output..: None
+# ------------------------------------------------------------------------------
+oradba_plugin_memo_clear() {
+    _ORADBA_PLUGIN_MEMO=()
+    _ORADBA_PLUGIN_MTIME=()
+    _ORADBA_PLUGIN_MTIME_AT=()
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_plugin_isolate
+# Purpose.: Set the minimal plugin environment (isolated subshell only)
+# Args....: $1 - ORACLE_HOME or NOARGS (keep current ORACLE_HOME/LD_LIBRARY_PATH)
+# Returns.: 0
+# Output..: None
+# ------------------------------------------------------------------------------
+_oradba_plugin_isolate() {
+    if [[ "$1" == "NOARGS" ]]; then
+        # Set minimal Oracle environment from current context
+        export ORACLE_HOME="${ORACLE_HOME:-}"
+        export LD_LIBRARY_PATH="${LD_LIBRARY_PATH:-}"
+    else
+        export ORACLE_HOME="$1"
+        export LD_LIBRARY_PATH="$1/lib"
+    fi
+    # Unset inherited environment variables to prevent cross-contamination
+    # TNS_ADMIN: Each product should use its own ORACLE_HOME/network/admin
+    # plugin_status: Prevent experimental status from leaking between plugins
+    unset TNS_ADMIN
+    unset plugin_status
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_plugin_accept
+# Purpose.: Check a sourced plugin before running its functions (isolated
+#           subshell only, fd 4 is the caller's stderr)
+# Args....: $1 - product type
+# Returns.: 0 if the plugin may run, 1 for experimental plugins
+# Output..: Warnings to fd 4
+# ------------------------------------------------------------------------------
+_oradba_plugin_accept() {
+    # Check if plugin is experimental
+    if [[ -n "${plugin_status:-}" ]] && [[ "${plugin_status}" == "EXPERIMENTAL" ]]; then
+        echo "WARNING: Skipping experimental plugin: $1" >&4
+        return 1
+    fi
+    # Warn if plugin declares a different interface version than expected
+    if [[ -n "${plugin_interface_version:-}" ]] && [[ "${plugin_interface_version}" != "1.0.0" ]]; then
+        echo "WARNING: Plugin $1 declares interface_version=${plugin_interface_version} (expected 1.0.0) — compatibility not guaranteed" >&4
+    fi
+    return 0
+}
+
 # ------------------------------------------------------------------------------
 # Function: execute_plugin_function_v2
 # Purpose.: Execute a plugin function in an isolated subshell with minimal env
@@ -1597,6 +2103,8 @@ sanitize_sensitive_data() {
 # Output..: Stdout from plugin function (or stored in result variable)
 # Notes...: Adds subshell isolation (Phase 3) and minimal ORACLE_HOME/LD_LIBRARY_PATH
 #           For no-arg functions (e.g., plugin_get_config_section), pass "NOARGS" as oracle_home
+#           Plugin stderr is captured through the subshell output (no temp file),
+#           results of ORADBA_PLUGIN_PURE_FUNCTIONS are memoized
 # ------------------------------------------------------------------------------
 execute_plugin_function_v2() {
     local product_type="$1"
@@ -1609,18 +2117,8 @@ execute_plugin_function_v2() {
     [[ -z "${product_type}" ]] && return 1
     [[ -z "${oracle_home}" ]] && return 1
 
-    local oradba_base="${ORADBA_BASE}"
-    if [[ -z "${oradba_base}" ]]; then
-        local script_dir
-        script_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-        oradba_base="$(cd "${script_dir}/../.." && pwd)"
-    fi
-
-    local plugin_file="${oradba_base}/lib/plugins/${product_type}_plugin.sh"
-    [[ ! -f "${plugin_file}" ]] && {
-        oradba_log DEBUG "Plugin not found: ${product_type}_plugin.sh"
-        return 1
-    }
+    local plugin_file
+    _oradba_plugin_file plugin_file "${product_type}" || return 1
 
     local plugin_function="plugin_${function_name}"
 
@@ -1636,116 +2134,71 @@ execute_plugin_function_v2() {
         oradba_log DEBUG "Plugin call: ${sanitized_args}"
     fi
 
-    local output
-    local stderr_output
+    local output=""
+    local stderr_output=""
+    local exit_code=0
+    local memo_key=""
 
-    # Create temp file for capturing stderr; fall back to /tmp if TMPDIR is not ready
-    # (macOS per-session TMPDIR may not exist during early login sourcing)
-    local temp_stderr=""
-    temp_stderr=$(mktemp 2> /dev/null) \
-        || temp_stderr=$(TMPDIR=/tmp mktemp 2> /dev/null) \
-        || true
-
-    if [[ -n "${temp_stderr}" ]] && [[ -f "${temp_stderr}" ]]; then
-        # Set up trap to ensure cleanup happens (use single quotes to defer expansion)
-        # shellcheck disable=SC2064
-        trap "rm -f '${temp_stderr}' 2>/dev/null" RETURN
-    else
-        oradba_log DEBUG "Cannot create temp file for plugin stderr capture; stderr suppressed for plugin ${product_type}"
-        temp_stderr="/dev/null"
-    fi
-
-    # Handle no-arg functions vs functions that take oracle_home
-    if [[ "${oracle_home}" == "NOARGS" ]]; then
-        # No-arg function (e.g., plugin_get_config_section)
-
-        # Debug logging: Log environment snapshot
+    if _oradba_plugin_memo_key memo_key "${plugin_file}" "${product_type}" "${function_name}" "${oracle_home}" "${extra_arg}" \
+        && [[ -n "${_ORADBA_PLUGIN_MEMO[${memo_key}]+set}" ]]; then
+        exit_code="${_ORADBA_PLUGIN_MEMO[${memo_key}]%%:*}"
+        output="${_ORADBA_PLUGIN_MEMO[${memo_key}]#*:}"
         if is_plugin_debug_enabled; then
-            oradba_log DEBUG "Plugin env (no-arg): ORACLE_HOME=${ORACLE_HOME:-<unset>}, LD_LIBRARY_PATH=${LD_LIBRARY_PATH:-<unset>}"
+            oradba_log DEBUG "Plugin memo hit: plugin=${product_type}, function=${function_name}"
         fi
-
-        output=$(
-            # Set minimal Oracle environment from current context
-            export ORACLE_HOME="${ORACLE_HOME:-}"
-            export LD_LIBRARY_PATH="${LD_LIBRARY_PATH:-}"
-            # Unset inherited environment variables to prevent cross-contamination
-            # TNS_ADMIN: Each product should use its own ORACLE_HOME/network/admin
-            # plugin_status: Prevent experimental status from leaking between plugins
-            unset TNS_ADMIN
-            unset plugin_status
-            # Note: Don't use set -euo pipefail here - plugins need flexibility
-            # shellcheck disable=SC1090
-            source "${plugin_file}" 2> "${temp_stderr}" || exit 1
-            # Check if plugin is experimental
-            if [[ -n "${plugin_status:-}" ]] && [[ "${plugin_status}" == "EXPERIMENTAL" ]]; then
-                # Log to stderr so it doesn't pollute stdout
-                echo "WARNING: Skipping experimental plugin: ${product_type}" >&2
-                exit 1
-            fi
-            # Warn if plugin declares a different interface version than expected
-            if [[ -n "${plugin_interface_version:-}" ]] && [[ "${plugin_interface_version}" != "1.0.0" ]]; then
-                echo "WARNING: Plugin ${product_type} declares interface_version=${plugin_interface_version} (expected 1.0.0) — compatibility not guaranteed" >&2
-            fi
-            if ! declare -F "${plugin_function}" > /dev/null 2>&1; then
-                exit 1
-            fi
-            "${plugin_function}" 2>> "${temp_stderr}"
-        )
     else
-        # Function takes oracle_home as argument
-
         # Debug logging: Log environment snapshot
         if is_plugin_debug_enabled; then
-            oradba_log DEBUG "Plugin env: ORACLE_HOME=${oracle_home}, LD_LIBRARY_PATH=${oracle_home}/lib, TNS_ADMIN=<unset>, PATH=${PATH:-<unset>}"
+            if [[ "${oracle_home}" == "NOARGS" ]]; then
+                oradba_log DEBUG "Plugin env (no-arg): ORACLE_HOME=${ORACLE_HOME:-<unset>}, LD_LIBRARY_PATH=${LD_LIBRARY_PATH:-<unset>}"
+            else
+                oradba_log DEBUG "Plugin env: ORACLE_HOME=${oracle_home}, LD_LIBRARY_PATH=${oracle_home}/lib, TNS_ADMIN=<unset>, PATH=${PATH:-<unset>}"
+            fi
         fi
 
-        output=$(
-            ORACLE_HOME="${oracle_home}"
-            export ORACLE_HOME
-            LD_LIBRARY_PATH="${oracle_home}/lib"
-            export LD_LIBRARY_PATH
-            # Unset inherited environment variables to prevent cross-contamination
-            # TNS_ADMIN: Each product should use its own ORACLE_HOME/network/admin
-            # plugin_status: Prevent experimental status from leaking between plugins
-            unset TNS_ADMIN
-            unset plugin_status
+        # Isolated subshell: its stderr is part of the captured output, the
+        # function stdout follows a record separator (\x1e); fd 4 keeps the
+        # caller's stderr for plugin warnings
+        local raw
+        raw=$(
+            exec 4>&2 2>&1
+            _oradba_plugin_isolate "${oracle_home}"
             # Note: Don't use set -euo pipefail here - plugins need flexibility
             # shellcheck disable=SC1090
-            source "${plugin_file}" 2> "${temp_stderr}" || exit 1
-            # Check if plugin is experimental
-            if [[ -n "${plugin_status:-}" ]] && [[ "${plugin_status}" == "EXPERIMENTAL" ]]; then
-                # Log to stderr so it doesn't pollute stdout
-                echo "WARNING: Skipping experimental plugin: ${product_type}" >&2
-                exit 1
-            fi
-            # Warn if plugin declares a different interface version than expected
-            if [[ -n "${plugin_interface_version:-}" ]] && [[ "${plugin_interface_version}" != "1.0.0" ]]; then
-                echo "WARNING: Plugin ${product_type} declares interface_version=${plugin_interface_version} (expected 1.0.0) — compatibility not guaranteed" >&2
-            fi
+            source "${plugin_file}" || exit 1
+            _oradba_plugin_accept "${product_type}" || exit 1
             if ! declare -F "${plugin_function}" > /dev/null 2>&1; then
                 exit 1
             fi
-            if [[ -n "${extra_arg}" ]]; then
-                "${plugin_function}" "${oracle_home}" "${extra_arg}" 2>> "${temp_stderr}"
+            if [[ "${oracle_home}" == "NOARGS" ]]; then
+                _out=$("${plugin_function}")
+            elif [[ -n "${extra_arg}" ]]; then
+                _out=$("${plugin_function}" "${oracle_home}" "${extra_arg}")
             else
-                "${plugin_function}" "${oracle_home}" 2>> "${temp_stderr}"
+                _out=$("${plugin_function}" "${oracle_home}")
             fi
+            _rc=$?
+            printf '\x1e%s' "${_out}"
+            exit "${_rc}"
         )
-    fi
-    local exit_code=$?
+        exit_code=$?
 
-    # Read stderr output if available (trap will clean up)
-    if [[ -f "${temp_stderr}" ]]; then
-        stderr_output=$(< "${temp_stderr}")
-    fi
-
-    # Trace logging: Log raw stdout/stderr
-    if is_plugin_trace_enabled; then
-        if [[ -n "${output}" ]]; then
-            oradba_log TRACE "Plugin stdout: $(sanitize_sensitive_data "${output}")"
+        if [[ "${raw}" == *$'\x1e'* ]]; then
+            stderr_output="${raw%%$'\x1e'*}"
+            output="${raw#*$'\x1e'}"
+        else
+            stderr_output="${raw}"
         fi
-        if [[ -n "${stderr_output}" ]]; then
-            oradba_log TRACE "Plugin stderr: $(sanitize_sensitive_data "${stderr_output}")"
+        [[ -n "${memo_key}" ]] && _ORADBA_PLUGIN_MEMO["${memo_key}"]="${exit_code}:${output}"
+
+        # Trace logging: Log raw stdout/stderr
+        if is_plugin_trace_enabled; then
+            if [[ -n "${output}" ]]; then
+                oradba_log TRACE "Plugin stdout: $(sanitize_sensitive_data "${output}")"
+            fi
+            if [[ -n "${stderr_output}" ]]; then
+                oradba_log TRACE "Plugin stderr: $(sanitize_sensitive_data "${stderr_output}")"
+            fi
         fi
     fi
 
@@ -1763,6 +2216,122 @@ execute_plugin_function_v2() {
     return ${exit_code}
 }
 
+# ------------------------------------------------------------------------------
+# Function: execute_plugin_batch
+# Purpose.: Execute several plugin functions for one home in one isolated subshell
+# Args....: $1 - product type (plugin name, e.g., database, datasafe)
+#           $2 - ORACLE_HOME / base path (use "NOARGS" for no-arg functions)
+#           $3 - name of an associative array for the results (optional, "" to
+#                only fill the memo)
+#           $4... - function names (without plugin_ prefix), "name=arg" passes
+#                an extra argument
+# Returns.: 0 if the plugin was loaded, 1 otherwise
+# Output..: None (results: array[name] = stdout, array[name.rc] = exit code)
+# Notes...: Same environment and isolation as execute_plugin_function_v2, but
+#           the plugin is sourced once; every function still runs in its own
+#           nested subshell. Memoized results are not executed again and pure
+#           results are memoized, so a batch can prefetch later v2 calls.
+# ------------------------------------------------------------------------------
+execute_plugin_batch() {
+    local product_type="$1"
+    local oracle_home="$2"
+    local result_array="${3:-}"
+    shift 3 2> /dev/null || return 1
+
+    [[ -z "${product_type}" || -z "${oracle_home}" || $# -eq 0 ]] && return 1
+
+    local plugin_file
+    _oradba_plugin_file plugin_file "${product_type}" || return 1
+
+    local -A _batch=()
+    local -A keys=()
+    local -a pending=()
+    local spec name arg key
+    for spec in "$@"; do
+        name="${spec%%=*}"
+        arg=""
+        [[ "${spec}" == *=* ]] && arg="${spec#*=}"
+        key=""
+        if _oradba_plugin_memo_key key "${plugin_file}" "${product_type}" "${name}" "${oracle_home}" "${arg}"; then
+            keys["${name}"]="${key}"
+            if [[ -n "${_ORADBA_PLUGIN_MEMO[${key}]+set}" ]]; then
+                _batch["${name}.rc"]="${_ORADBA_PLUGIN_MEMO[${key}]%%:*}"
+                _batch["${name}"]="${_ORADBA_PLUGIN_MEMO[${key}]#*:}"
+                continue
+            fi
+        fi
+        pending+=("${spec}")
+    done
+
+    if is_plugin_debug_enabled; then
+        oradba_log DEBUG "Plugin batch: plugin=${product_type}, functions=$*, memo hits=$(($# - ${#pending[@]}))"
+    fi
+
+    local exit_code=0
+    if [[ ${#pending[@]} -gt 0 ]]; then
+        # One record per function: \x1e name \x1f exit code \x1f stdout \x1d;
+        # stderr (sourcing, functions) lies between the records
+        local raw rest record stderr_output=""
+        raw=$(
+            exec 4>&2 2>&1
+            _oradba_plugin_isolate "${oracle_home}"
+            # shellcheck disable=SC1090
+            source "${plugin_file}" || exit 1
+            _oradba_plugin_accept "${product_type}" || exit 1
+            for spec in "${pending[@]}"; do
+                name="${spec%%=*}"
+                _out=""
+                if ! declare -F "plugin_${name}" > /dev/null 2>&1; then
+                    _rc=1
+                elif [[ "${oracle_home}" == "NOARGS" ]]; then
+                    _out=$("plugin_${name}")
+                    _rc=$?
+                elif [[ "${spec}" == *=* ]]; then
+                    _out=$("plugin_${name}" "${oracle_home}" "${spec#*=}")
+                    _rc=$?
+                else
+                    _out=$("plugin_${name}" "${oracle_home}")
+                    _rc=$?
+                fi
+                printf '\x1e%s\x1f%s\x1f%s\x1d' "${name}" "${_rc}" "${_out}"
+            done
+        )
+        exit_code=$?
+
+        rest="${raw}"
+        while [[ "${rest}" == *$'\x1e'* ]]; do
+            stderr_output+="${rest%%$'\x1e'*}"
+            rest="${rest#*$'\x1e'}"
+            record="${rest%%$'\x1d'*}"
+            rest="${rest#*$'\x1d'}"
+            name="${record%%$'\x1f'*}"
+            record="${record#*$'\x1f'}"
+            _batch["${name}.rc"]="${record%%$'\x1f'*}"
+            _batch["${name}"]="${record#*$'\x1f'}"
+            if [[ -n "${keys[${name}]:-}" ]]; then
+                _ORADBA_PLUGIN_MEMO["${keys[${name}]}"]="${_batch[${name}.rc]}:${_batch[${name}]}"
+            fi
+        done
+        stderr_output+="${rest}"
+
+        if [[ -n "${stderr_output}" ]] && is_plugin_trace_enabled; then
+            oradba_log TRACE "Plugin stderr: $(sanitize_sensitive_data "${stderr_output}")"
+        fi
+    fi
+
+    if [[ -n "${result_array}" ]]; then
+        local -n _results="${result_array}"
+        for key in "${!_batch[@]}"; do
+            _results["${key}"]="${_batch[${key}]}"
+        done
+    fi
+
+    if is_plugin_debug_enabled; then
+        oradba_log DEBUG "Plugin batch exit: code=${exit_code}, plugin=${product_type}"
+    fi
+    return ${exit_code}
+}
+
 # ------------------------------------------------------------------------------
 # CF-007: Canonical install-root variable
 # ORADBA_BASE is canonical. If ORADBA_PREFIX is set in environment and
@@ -1793,4 +2362,6 @@ source "${_ORADBA_COMMON_DIR}/oradba_home_discovery.sh"
 source "${_ORADBA_COMMON_DIR}/oradba_database_discovery.sh"
 # shellcheck disable=SC1091
 source "${_ORADBA_COMMON_DIR}/oradba_version_metadata.sh"
+# shellcheck disable=SC1091
+source "${_ORADBA_COMMON_DIR}/oradba_env_paths.sh"
 unset _ORADBA_COMMON_DIR
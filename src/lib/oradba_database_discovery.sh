@@ -19,6 +19,17 @@
 [[ -n "${ORADBA_DATABASE_DISCOVERY_LOADED:-}" ]] && return 0
 readonly ORADBA_DATABASE_DISCOVERY_LOADED=1
 
+# Running instance table (see oradba_instance_scan)
+if ! declare -p _ORADBA_INST_PID &> /dev/null; then
+    declare -gA _ORADBA_INST_PID=()   # "<kind>:<name>" -> process id
+    declare -gA _ORADBA_INST_OWNER=() # "<kind>:<name>" -> owner (user name or uid)
+    declare -gA _ORADBA_INST_HOME=()  # "<kind>:<name>" -> ORACLE_HOME (may be empty)
+    declare -ga _ORADBA_INST_KEYS=()  # keys in scan order
+    declare -gA _ORADBA_INST_USERS=() # uid -> user name (from /etc/passwd)
+    _ORADBA_INST_SOURCE=""            # proc|ps once scanned
+    _ORADBA_INST_COMPLETE=false       # true if processes of all users are visible
+fi
+
 # ------------------------------------------------------------------------------
 # Function: parse_oratab
 # Purpose.: Parse oratab file to get Oracle home path for a SID
@@ -157,12 +168,221 @@ generate_sid_lists() {
     return 0
 }
 
+# ------------------------------------------------------------------------------
+# Function: _oradba_pdb_cache_file
+# Purpose.: Resolve the PDB topology cache file of a SID
+# Args....: $1 - Name of the variable receiving the path
+#           $2 - Oracle SID
+# Returns.: 0 always
+# Output..: None (sets the named variable, empty if no cache directory)
+# ------------------------------------------------------------------------------
+_oradba_pdb_cache_file() {
+    local cache_dir
+    oradba_cache_dir cache_dir
+    printf -v "$1" '%s' "${cache_dir:+${cache_dir}/pdb_topology.${2}}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_pdb_cache_read
+# Purpose.: Read a PDB topology cache file
+# Args....: $1 - Cache file path
+#           $2 - Name of the variable receiving the refresh time (epoch)
+#           $3 - Name of the variable receiving the CDB flag (YES|NO)
+#           $4 - Name of the array receiving "PDB_NAME|OPEN_MODE" entries
+# Returns.: 0 on success, 1 if the file is missing or not a topology cache
+# ------------------------------------------------------------------------------
+_oradba_pdb_cache_read() {
+    local -n _stamp_ref="$2"
+    local -n _cdb_ref="$3"
+    local -n _pdbs_ref="$4"
+    local -a lines=()
+    local line header
+
+    [[ -r "$1" ]] || return 1
+    mapfile -t lines < "$1"
+    header="${lines[0]:-}"
+    [[ "${header}" == "# oradba pdb topology v1|"* ]] || return 1
+
+    header="${header#*|}"
+    _stamp_ref="${header%%|*}"
+    _cdb_ref=""
+    _pdbs_ref=()
+    for line in "${lines[@]:1}"; do
+        case "${line}" in
+            CDB\|*) _cdb_ref="${line#CDB|}" ;;
+            PDB\|*) _pdbs_ref+=("${line#PDB|}") ;;
+        esac
+    done
+    [[ "${_stamp_ref}" =~ ^[0-9]+$ ]] && [[ -n "${_cdb_ref}" ]]
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_pdb_query
+# Purpose.: Query CDB flag, PDB names and open modes of the current instance
+# Args....: $1 - Name of the variable receiving the CDB flag (YES|NO)
+#           $2 - Name of the array receiving "PDB_NAME|OPEN_MODE" entries
+# Returns.: 0 on success, 1 if the instance is not accessible
+# Notes...: One SQL*Plus session after the connection check; PDB$SEED is
+#           excluded.
+# ------------------------------------------------------------------------------
+_oradba_pdb_query() {
+    local -n _qcdb_ref="$1"
+    local -n _qpdbs_ref="$2"
+    local output line
+
+    # Skip if no database connection
+    if ! check_database_connection 2> /dev/null; then
+        oradba_log DEBUG "No database connection, skipping PDB topology query"
+        return 1
+    fi
+
+    output=$(
+        sqlplus -s / as sysdba << EOF
+SET HEADING OFF FEEDBACK OFF PAGESIZE 0 VERIFY OFF TIMING OFF TIME OFF SQLPROMPT "" TRIMSPOOL ON TRIMOUT ON LINESIZE 400
+WHENEVER SQLERROR EXIT SQL.SQLCODE
+SELECT 'CDB|' || cdb FROM v\$database;
+SELECT 'PDB|' || name || '|' || open_mode FROM v\$pdbs WHERE name != 'PDB\$SEED' ORDER BY name;
+EXIT
+EOF
+    )
+
+    _qcdb_ref=""
+    _qpdbs_ref=()
+    while IFS= read -r line; do
+        case "${line}" in
+            CDB\|*) _qcdb_ref="${line#CDB|}" ;;
+            PDB\|*) _qpdbs_ref+=("${line#PDB|}") ;;
+        esac
+    done <<< "${output}"
+
+    if [[ -z "${_qcdb_ref}" ]]; then
+        oradba_log DEBUG "PDB topology query failed for ${ORACLE_SID:-UNKNOWN}"
+        return 1
+    fi
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_pdb_cache_write
+# Purpose.: Write a PDB topology cache file
+# Args....: $1 - Cache file path
+#           $2 - CDB flag (YES|NO)
+#           $@ - "PDB_NAME|OPEN_MODE" entries (from $3 on)
+# Returns.: 0 on success, 1 if the file could not be written
+# ------------------------------------------------------------------------------
+_oradba_pdb_cache_write() {
+    local cache_file="$1"
+    local cdb="$2"
+    local tmp="${cache_file}.$$"
+    local entry
+    shift 2
+
+    mkdir -p "${cache_file%/*}" 2> /dev/null || return 1
+    if {
+        printf '# oradba pdb topology v1|%(%s)T|%s\n' -1 "${ORACLE_SID:-}"
+        printf 'CDB|%s\n' "${cdb}"
+        for entry in "$@"; do
+            printf 'PDB|%s\n' "${entry}"
+        done
+    } > "${tmp}" 2> /dev/null && mv -f "${tmp}" "${cache_file}" 2> /dev/null; then
+        oradba_log DEBUG "PDB topology cache written: ${cache_file} ($# PDBs)"
+        return 0
+    fi
+    rm -f "${tmp}" 2> /dev/null
+    return 1
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_pdb_cache_refresh
+# Purpose.: Refresh the PDB topology cache of the current instance
+# Args....: None (uses ORACLE_SID and ORACLE_HOME of the current environment)
+# Returns.: 0 on success, 1 if the instance is not accessible or the cache
+#           could not be written
+# Output..: None
+# ------------------------------------------------------------------------------
+oradba_pdb_cache_refresh() {
+    local cache_file="" cdb=""
+    local -a pdbs=()
+
+    if [[ -z "${ORACLE_SID:-}" ]]; then
+        oradba_log ERROR "ORACLE_SID not set, cannot refresh PDB topology"
+        return 1
+    fi
+    _oradba_pdb_cache_file cache_file "${ORACLE_SID}"
+    if [[ -z "${cache_file}" ]]; then
+        oradba_log ERROR "No cache directory for the PDB topology (ORADBA_CACHE_DIR)"
+        return 1
+    fi
+
+    _oradba_pdb_query cdb pdbs || return 1
+    _oradba_pdb_cache_write "${cache_file}" "${cdb}" ${pdbs[@]+"${pdbs[@]}"}
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_pdb_cache_refresh_async
+# Purpose.: Refresh the PDB topology cache in a detached background process
+# Args....: $1 - Cache file path
+# Returns.: 0 always
+# Notes...: A lock file next to the cache keeps concurrent shells from
+#           starting more than one refresh; locks older than 5 minutes are
+#           considered abandoned.
+# ------------------------------------------------------------------------------
+_oradba_pdb_cache_refresh_async() {
+    local lock="${1}.lock"
+    local now stamp=""
+
+    printf -v now '%(%s)T' -1
+    if [[ -f "${lock}" ]]; then
+        read -r stamp < "${lock}" 2> /dev/null || stamp=""
+        [[ "${stamp}" =~ ^[0-9]+$ ]] && ((now - stamp < 300)) && return 0
+        rm -f "${lock}" 2> /dev/null
+    fi
+    (set -o noclobber && printf '%s\n' "${now}" > "${lock}") 2> /dev/null || return 0
+
+    # Double fork: no job table entry or completion notice in interactive shells
+    (
+        (
+            trap 'rm -f "${lock}"' EXIT
+            oradba_pdb_cache_refresh
+        ) < /dev/null > /dev/null 2>&1 &
+    )
+    oradba_log DEBUG "PDB topology refresh started in background for ${ORACLE_SID:-UNKNOWN}"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_pdb_topology
+# Purpose.: Show the cached PDB topology of a SID
+# Args....: $1 - Oracle SID (optional, defaults to ORACLE_SID)
+# Returns.: 0 if a cache exists, 1 otherwise
+# Output..: "PDB_NAME<TAB>OPEN_MODE" lines; nothing for a non-CDB
+# ------------------------------------------------------------------------------
+oradba_pdb_topology() {
+    local sid="${1:-${ORACLE_SID:-}}"
+    local cache_file="" stamp="" cdb="" entry
+    local -a pdbs=()
+
+    [[ -z "${sid}" ]] && return 1
+    _oradba_pdb_cache_file cache_file "${sid}"
+    _oradba_pdb_cache_read "${cache_file}" stamp cdb pdbs || return 1
+
+    for entry in ${pdbs[@]+"${pdbs[@]}"}; do
+        printf '%s\t%s\n' "${entry%%|*}" "${entry#*|}"
+    done
+    return 0
+}
+
 # ------------------------------------------------------------------------------
 # Function: generate_pdb_aliases
 # Purpose.: Generate aliases for PDBs in the current CDB
 # Args....: None
 # Returns.: 0 on success
 # Output..: Creates shell aliases for each PDB and exports ORADBA_PDBLIST
+# Notes...: Reads the per-SID topology cache (CDB flag, PDB names, open modes)
+#           kept for ORADBA_PDB_CACHE_TTL seconds (default 3600, 0 disables
+#           the cache). Only a missing cache queries the database inline; an
+#           expired cache is used as is and refreshed in the background
+#           unless ORADBA_PDB_CACHE_BACKGROUND=false.
 # ------------------------------------------------------------------------------
 generate_pdb_aliases() {
     # Gate 1: feature flag (default: disabled)
@@ -179,47 +399,46 @@ generate_pdb_aliases() {
         return 0
     fi
 
-    # Skip if no database connection
-    if ! check_database_connection 2> /dev/null; then
-        oradba_log DEBUG "No database connection, skipping PDB alias generation"
-        return 0
+    local ttl="${ORADBA_PDB_CACHE_TTL:-3600}"
+    local cache_file="" stamp="" is_cdb="" now
+    local -a pdbs=()
+
+    [[ "${ttl}" =~ ^[0-9]+$ ]] || ttl=3600
+    [[ ${ttl} -gt 0 ]] && _oradba_pdb_cache_file cache_file "${ORACLE_SID:-UNKNOWN}"
+
+    if [[ -n "${cache_file}" ]] && _oradba_pdb_cache_read "${cache_file}" stamp is_cdb pdbs; then
+        printf -v now '%(%s)T' -1
+        if ((now - stamp >= ttl)); then
+            if [[ "${ORADBA_PDB_CACHE_BACKGROUND:-true}" == "true" ]]; then
+                _oradba_pdb_cache_refresh_async "${cache_file}"
+            elif _oradba_pdb_query is_cdb pdbs; then
+                _oradba_pdb_cache_write "${cache_file}" "${is_cdb}" ${pdbs[@]+"${pdbs[@]}"} || true
+            fi
+        fi
+    else
+        if ! _oradba_pdb_query is_cdb pdbs; then
+            oradba_log DEBUG "No database connection, skipping PDB alias generation"
+            return 0
+        fi
+        if [[ -n "${cache_file}" ]]; then
+            _oradba_pdb_cache_write "${cache_file}" "${is_cdb}" ${pdbs[@]+"${pdbs[@]}"} || true
+        fi
     fi
 
     # Skip if not a CDB
-    local is_cdb
-    is_cdb=$(
-        sqlplus -s / as sysdba << EOF
-SET HEADING OFF FEEDBACK OFF PAGESIZE 0 VERIFY OFF TIMING OFF TIME OFF SQLPROMPT "" TRIMSPOOL ON TRIMOUT ON
-WHENEVER SQLERROR EXIT SQL.SQLCODE
-SELECT cdb FROM v\$database;
-EXIT
-EOF
-    )
-
     if [[ "${is_cdb}" != "YES" ]]; then
         oradba_log DEBUG "Not a CDB, skipping PDB alias generation"
         return 0
     fi
 
-    # Get list of PDBs
-    local pdb_list
-    pdb_list=$(
-        sqlplus -s / as sysdba << EOF
-SET HEADING OFF FEEDBACK OFF PAGESIZE 0 VERIFY OFF TIMING OFF TIME OFF SQLPROMPT "" TRIMSPOOL ON TRIMOUT ON
-WHENEVER SQLERROR EXIT SQL.SQLCODE
-SELECT name FROM v\$pdbs WHERE name != 'PDB\$SEED' ORDER BY name;
-EXIT
-EOF
-    )
-
     # Create aliases for each PDB
-    while IFS= read -r pdb_name; do
-        # Skip empty lines
+    local entry pdb_name pdb_lower pdb_list=""
+    for entry in ${pdbs[@]+"${pdbs[@]}"}; do
+        pdb_name="${entry%%|*}"
         [[ -z "$pdb_name" ]] && continue
 
         # Create lowercase alias
-        local pdb_lower
-        pdb_lower=$(printf '%s' "${pdb_name}" | tr '[:upper:]' '[:lower:]')
+        pdb_lower="${pdb_name,,}"
 
         # Create alias to set ORADBA_PDB and connect
         # shellcheck disable=SC2139
@@ -229,16 +448,253 @@ EOF
         # shellcheck disable=SC2139
         alias "pdb${pdb_lower}"="export ORADBA_PDB='${pdb_name}'; sqlplus / as sysdba <<< 'ALTER SESSION SET CONTAINER=${pdb_name};'"
 
-        oradba_log DEBUG "Created PDB alias: ${pdb_lower} -> ${pdb_name}"
-    done <<< "$pdb_list"
+        pdb_list="${pdb_list}${pdb_list:+ }${pdb_name}"
+        oradba_log DEBUG "Created PDB alias: ${pdb_lower} -> ${pdb_name} (${entry#*|})"
+    done
 
     # Export the PDB list
-    export ORADBA_PDBLIST="${pdb_list//$'\n'/ }"
+    export ORADBA_PDBLIST="${pdb_list}"
     oradba_log DEBUG "ORADBA_PDBLIST: $ORADBA_PDBLIST"
 
     return 0
 }
 
+# ------------------------------------------------------------------------------
+# Function: _oradba_instance_record
+# Purpose.: Classify a process and record it in the running instance table
+# Args....: $1 - Process id
+#           $2 - Owner (user name or numeric uid)
+#           $3 - Program name (argv[0], may be a full path)
+#           $4 - First argument (listener name for tnslsnr, may be empty)
+# Returns.: 0 if recorded, 1 if not an Oracle instance process
+# Output..: None (adds to the _ORADBA_INST_* tables)
+# Notes...: Kinds: db (ora_pmon_<sid>, db_pmon_<SID>), asm (asm_pmon_<sid>),
+#           listener (tnslsnr) and cman (Connection Manager / Data Safe
+#           gateways and their listeners). The home of listeners and
+#           gateways is taken from the program path, the first process of a
+#           name wins.
+# ------------------------------------------------------------------------------
+_oradba_instance_record() {
+    local pid="$1" owner="$2" prog="$3" arg="${4:-}"
+    local kind name home=""
+
+    case "${prog##*/}" in
+        ora_pmon_* | db_pmon_*)
+            kind="db"
+            name="${prog#*_pmon_}"
+            ;;
+        asm_pmon_*)
+            kind="asm"
+            name="${prog#asm_pmon_}"
+            ;;
+        tnslsnr)
+            kind="listener"
+            name="${arg:-LISTENER}"
+            [[ "${prog}" == */bin/tnslsnr ]] && home="${prog%/bin/tnslsnr}"
+            [[ "${prog}" == *datasafe* || "${prog}" == *oracle_cman_home* ]] && kind="cman"
+            ;;
+        cmadmin | cmgw*)
+            kind="cman"
+            name="${prog##*/}"
+            [[ -n "${arg}" && "${arg}" != -* ]] && name="${arg}"
+            [[ "${prog}" == */bin/* ]] && home="${prog%/bin/*}"
+            ;;
+        *) return 1 ;;
+    esac
+    [[ -n "${name}" ]] || return 1
+    [[ -n "${_ORADBA_INST_PID[${kind}:${name}]:-}" ]] && return 0
+
+    _ORADBA_INST_PID["${kind}:${name}"]="${pid}"
+    _ORADBA_INST_OWNER["${kind}:${name}"]="${owner}"
+    _ORADBA_INST_HOME["${kind}:${name}"]="${home}"
+    _ORADBA_INST_KEYS+=("${kind}:${name}")
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_instance_scan_proc
+# Purpose.: Fill the running instance table from a proc file system
+# Args....: $1 - Proc root directory
+# Returns.: 0 always
+# Output..: None
+# Notes...: One pass over <root>/<pid>/comm; only matching processes have
+#           cmdline and status read, all without external commands. The
+#           homes of database and ASM instances come from the exe links,
+#           resolved with a single find call; if that yields nothing the
+#           ORACLE_HOME in the process environment is used.
+# ------------------------------------------------------------------------------
+_oradba_instance_scan_proc() {
+    local root="$1"
+    local dir pid comm field uid owner arg key target
+    local -a argv=() links=()
+
+    for dir in "${root}"/[0-9]*/; do
+        read -r comm 2> /dev/null < "${dir}comm" || continue
+        case "${comm}" in
+            ora_pmon_* | db_pmon_* | asm_pmon_* | tnslsnr | cmadmin | cmgw*) ;;
+            *) continue ;;
+        esac
+        pid="${dir%/}"
+        pid="${pid##*/}"
+
+        # argv[0] carries the full name (comm is cut at 15 characters)
+        argv=()
+        while IFS= read -r -d '' arg; do
+            argv+=("${arg}")
+            [[ ${#argv[@]} -ge 2 ]] && break
+        done 2> /dev/null < "${dir}cmdline"
+        [[ -n "${argv[0]:-}" ]] || argv=("${comm}")
+
+        uid=""
+        while read -r field uid _; do
+            [[ "${field}" == "Uid:" ]] && break
+            uid=""
+        done 2> /dev/null < "${dir}status"
+        if [[ -n "${uid}" ]] && [[ ${#_ORADBA_INST_USERS[@]} -eq 0 ]]; then
+            while IFS=: read -r owner _ field _; do
+                _ORADBA_INST_USERS["${field}"]="${owner}"
+            done 2> /dev/null < /etc/passwd
+        fi
+        owner="${_ORADBA_INST_USERS[${uid:-x}]:-${uid}}"
+
+        _oradba_instance_record "${pid}" "${owner}" "${argv[0]}" "${argv[1]:-}" || continue
+        [[ "${argv[0]}" == *_pmon_* ]] && links+=("${dir}exe")
+    done
+
+    [[ ${#links[@]} -gt 0 ]] || return 0
+    while IFS=$'\t' read -r dir target; do
+        pid="${dir%/exe}"
+        pid="${pid##*/}"
+        target="${target% (deleted)}"
+        [[ "${target}" =~ ^(.+)/bin/(oracle|asm)$ ]] || continue
+        for key in "${_ORADBA_INST_KEYS[@]}"; do
+            [[ "${_ORADBA_INST_PID[${key}]}" == "${pid}" ]] && _ORADBA_INST_HOME["${key}"]="${BASH_REMATCH[1]}"
+        done
+    done < <(find "${links[@]}" -maxdepth 0 -printf '%p\t%l\n' 2> /dev/null)
+
+    for key in "${_ORADBA_INST_KEYS[@]}"; do
+        [[ -z "${_ORADBA_INST_HOME[${key}]}" ]] || continue
+        while IFS= read -r -d '' arg; do
+            if [[ "${arg}" == ORACLE_HOME=* ]]; then
+                _ORADBA_INST_HOME["${key}"]="${arg#ORACLE_HOME=}"
+                break
+            fi
+        done 2> /dev/null < "${root}/${_ORADBA_INST_PID[${key}]}/environ"
+    done
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_instance_scan
+# Purpose.: Scan running database, ASM, listener and cman processes
+# Args....: None
+# Returns.: 0 if a process source was available, 1 otherwise
+# Output..: None (fills the running instance table, read it with
+#           oradba_instance_get, oradba_instance_list or
+#           oradba_instance_running)
+# Notes...: Reads ${ORADBA_PROC_ROOT:-/proc} in a single pass on Linux. Where
+#           no proc file system exists, one "ps -eo pid,user,args" call is
+#           parsed instead (without homes of database instances).
+#           ORADBA_PROC_ROOT points the scan to a fake proc tree for tests.
+# ------------------------------------------------------------------------------
+oradba_instance_scan() {
+    local root="${ORADBA_PROC_ROOT:-/proc}"
+    local -a dirs=("${root}"/[0-9]*/)
+    local pid owner prog arg
+
+    _ORADBA_INST_PID=()
+    _ORADBA_INST_OWNER=()
+    _ORADBA_INST_HOME=()
+    _ORADBA_INST_KEYS=()
+    _ORADBA_INST_SOURCE=""
+    _ORADBA_INST_COMPLETE=false
+
+    if [[ -d "${dirs[0]}" ]]; then
+        _oradba_instance_scan_proc "${root}"
+        _ORADBA_INST_SOURCE="proc"
+        # pid 1 is hidden when proc is mounted with hidepid
+        [[ -d "${root}/1" ]] && _ORADBA_INST_COMPLETE=true
+    elif command -v ps &> /dev/null; then
+        while read -r pid owner prog arg _; do
+            _oradba_instance_record "${pid}" "${owner}" "${prog}" "${arg}" || true
+        done < <(ps -eo pid=,user=,args= 2> /dev/null)
+        _ORADBA_INST_SOURCE="ps"
+        _ORADBA_INST_COMPLETE=true
+    else
+        oradba_log DEBUG "Instance scan: neither ${root} nor ps available"
+        return 1
+    fi
+
+    oradba_log DEBUG "Instance scan (${_ORADBA_INST_SOURCE}): ${#_ORADBA_INST_KEYS[@]} running: ${_ORADBA_INST_KEYS[*]}"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_instance_get
+# Purpose.: Look up a running instance in the instance table
+# Args....: $1 - Kind (db|asm|listener|cman); db also finds "+..." ASM SIDs
+#           $2 - Name (SID, listener or gateway name)
+#           $3 - Optional: name of the variable receiving the pid
+#           $4 - Optional: name of the variable receiving the ORACLE_HOME
+#           $5 - Optional: name of the variable receiving the owner
+# Returns.: 0 if running, 1 otherwise
+# Output..: None
+# Notes...: Requires oradba_instance_scan. Matches the name as given, then in
+#           lower and upper case (ora_pmon_ names follow the SID case used at
+#           startup). No subshell or external command.
+# ------------------------------------------------------------------------------
+oradba_instance_get() {
+    local kind="$1" name="$2"
+    local key="" try
+
+    [[ "${kind}" == "db" && "${name}" == +* ]] && kind="asm"
+    for try in "${name}" "${name,,}" "${name^^}"; do
+        if [[ -n "${_ORADBA_INST_PID[${kind}:${try}]:-}" ]]; then
+            key="${kind}:${try}"
+            break
+        fi
+    done
+
+    [[ -n "${3:-}" ]] && printf -v "$3" '%s' "${key:+${_ORADBA_INST_PID[${key}]}}"
+    [[ -n "${4:-}" ]] && printf -v "$4" '%s' "${key:+${_ORADBA_INST_HOME[${key}]}}"
+    [[ -n "${5:-}" ]] && printf -v "$5" '%s' "${key:+${_ORADBA_INST_OWNER[${key}]}}"
+    [[ -n "${key}" ]]
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_instance_list
+# Purpose.: List running instances from the instance table
+# Args....: $@ - Optional: kinds to list (db|asm|listener|cman, default all)
+# Returns.: 0 always
+# Output..: One "kind|name|pid|owner|oracle_home" line per instance
+# Notes...: Requires oradba_instance_scan
+# ------------------------------------------------------------------------------
+oradba_instance_list() {
+    local key kinds=" ${*} "
+
+    for key in "${_ORADBA_INST_KEYS[@]}"; do
+        [[ $# -eq 0 || "${kinds}" == *" ${key%%:*} "* ]] || continue
+        printf '%s|%s|%s|%s|%s\n' "${key%%:*}" "${key#*:}" "${_ORADBA_INST_PID[${key}]}" \
+            "${_ORADBA_INST_OWNER[${key}]}" "${_ORADBA_INST_HOME[${key}]}"
+    done
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_instance_running
+# Purpose.: Check from a fresh scan whether a database or ASM instance runs
+# Args....: $1 - Oracle SID
+# Returns.: 0 if running, 1 if not running, 2 if the scan cannot tell
+#           (no process source, or processes of other users hidden)
+# Output..: None
+# ------------------------------------------------------------------------------
+oradba_instance_running() {
+    oradba_instance_scan || return 2
+    oradba_instance_get db "$1" && return 0
+    [[ "${_ORADBA_INST_COMPLETE}" == "true" ]] || return 2
+    return 1
+}
+
 # ------------------------------------------------------------------------------
 # Function: discover_running_oracle_instances
 # Purpose.: Auto-discover running Oracle instances when oratab is empty
@@ -247,84 +703,54 @@ EOF
 # Output..: Prints discovered instances in oratab format (SID:ORACLE_HOME:N)
 #           to stdout, one per line
 # Notes...: - Only checks processes owned by current user
-#           - Detects db_smon_*, ora_pmon_*, asm_smon_* processes
-#           - Extracts ORACLE_HOME from /proc/<pid>/exe
+#           - Uses the instance table of oradba_instance_scan (ora_pmon_*,
+#             db_pmon_*, asm_pmon_* processes)
+#           - ORACLE_HOME comes from /proc/<pid>/exe or the process environment
 #           - Adds temporary entries with startup flag 'N'
 #           - Shows warning if Oracle processes run as different user
 # ------------------------------------------------------------------------------
 discover_running_oracle_instances() {
-    local current_user
-    current_user=$(id -un)
-
-    oradba_log DEBUG "Discovering running Oracle instances for user: $current_user"
+    local current_user key kind sid oracle_home owner
+    local discovered_count=0 other_user_processes=0
 
-    # Check for Oracle processes running as different user
-    local other_user_processes
-    other_user_processes=$(ps -eo user,comm | grep -E "(db_smon_|ora_pmon_|asm_smon_)" | grep -v "^${current_user}" | wc -l)
+    oradba_instance_scan || return 1
 
-    if [[ "$other_user_processes" -gt 0 ]]; then
-        oradba_log WARN "Oracle processes detected running as different user(s)"
-        oradba_log WARN "Auto-discovery only works for processes owned by: $current_user"
-    fi
+    # Owners are resolved from /etc/passwd by the scan, fall back to id
+    current_user="${_ORADBA_INST_USERS[${EUID}]:-}"
+    [[ -n "${current_user}" ]] || current_user=$(id -un)
+    oradba_log DEBUG "Discovering running Oracle instances for user: $current_user"
 
-    # Find Oracle smon/pmon processes for current user
-    # Pattern matches: db_smon_FREE, ora_pmon_orcl, asm_smon_+ASM
-    local discovered_count=0
-    local -A seen_sids # Track SIDs to avoid duplicates
-
-    # Get processes for current user only
-    while read -r pid comm; do
-        local sid=""
-        local oracle_home=""
-
-        # Extract SID from process name
-        if [[ "$comm" =~ ^db_smon_(.+)$ ]]; then
-            sid="${BASH_REMATCH[1]}"
-        elif [[ "$comm" =~ ^ora_pmon_(.+)$ ]]; then
-            # Convert lowercase pmon SID to uppercase
-            sid=$(printf '%s' "${BASH_REMATCH[1]}" | tr '[:lower:]' '[:upper:]')
-        elif [[ "$comm" =~ ^asm_smon_(.+)$ ]]; then
-            sid="${BASH_REMATCH[1]}"
-        else
+    for key in "${_ORADBA_INST_KEYS[@]}"; do
+        kind="${key%%:*}"
+        [[ "${kind}" == "db" || "${kind}" == "asm" ]] || continue
+        owner="${_ORADBA_INST_OWNER[${key}]}"
+        if [[ "${owner}" != "${current_user}" && "${owner}" != "${EUID}" ]]; then
+            other_user_processes=$((other_user_processes + 1))
             continue
         fi
 
-        # Skip if we've already seen this SID
-        [[ -n "${seen_sids[$sid]:-}" ]] && continue
-
-        # Determine ORACLE_HOME from /proc/<pid>/exe
-        if [[ -d "/proc" && -L "/proc/$pid/exe" ]]; then
-            local exe_path
-            exe_path=$(readlink "/proc/$pid/exe" 2> /dev/null)
-
-            # Extract ORACLE_HOME (everything before /bin/oracle)
-            if [[ "$exe_path" =~ ^(.+)/bin/oracle$ ]]; then
-                oracle_home="${BASH_REMATCH[1]}"
-            elif [[ "$exe_path" =~ ^(.+)/bin/asm$ ]]; then
-                # Handle ASM processes
-                oracle_home="${BASH_REMATCH[1]}"
-            fi
-        fi
-
-        # If we couldn't determine ORACLE_HOME, try ps environment
-        if [[ -z "$oracle_home" ]] && [[ -r "/proc/$pid/environ" ]]; then
-            oracle_home=$(tr '\0' '\n' < "/proc/$pid/environ" 2> /dev/null | grep "^ORACLE_HOME=" | cut -d= -f2)
-        fi
+        # oratab entries use upper case SIDs (ora_pmon_ names may be lower case)
+        sid="${key#*:}"
+        [[ "${kind}" == "db" ]] && sid="${sid^^}"
+        oracle_home="${_ORADBA_INST_HOME[${key}]}"
 
-        # If still no ORACLE_HOME, skip this instance
+        # If no ORACLE_HOME could be determined, skip this instance
         if [[ -z "$oracle_home" || ! -d "$oracle_home" ]]; then
-            oradba_log WARN "Could not determine ORACLE_HOME for SID: $sid (PID: $pid)"
+            oradba_log WARN "Could not determine ORACLE_HOME for SID: $sid (PID: ${_ORADBA_INST_PID[${key}]})"
             continue
         fi
 
         # Output discovered instance in oratab format
         echo "${sid}:${oracle_home}:N"
-        seen_sids[$sid]=1
         discovered_count=$((discovered_count + 1))
 
         oradba_log INFO "Auto-discovered Oracle instance: $sid ($oracle_home)"
+    done
 
-    done < <(ps -U "$current_user" -o pid,comm --no-headers 2> /dev/null | grep -E "(db_smon_|ora_pmon_|asm_smon_)")
+    if [[ "$other_user_processes" -gt 0 ]]; then
+        oradba_log WARN "Oracle processes detected running as different user(s)"
+        oradba_log WARN "Auto-discovery only works for processes owned by: $current_user"
+    fi
 
     if [[ $discovered_count -gt 0 ]]; then
         oradba_log INFO "Discovered $discovered_count running Oracle instance(s)"
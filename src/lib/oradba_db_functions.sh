@@ -309,6 +309,8 @@ format_uptime() {
 # Function: show_database_status
 # Purpose.: Display comprehensive database status based on open mode
 # Parameters: None (uses current ORACLE_SID environment)
+# Notes...: No SQL*Plus call when oradba_instance_running reports the SID as
+#           not running
 # ------------------------------------------------------------------------------
 show_database_status() {
     # Check if this is a non-database Oracle Home
@@ -338,8 +340,13 @@ show_database_status() {
         return 0
     fi
 
-    # Check if we can connect (for real SIDs)
-    if ! check_database_connection; then
+    # Check if we can connect (for real SIDs). When a complete instance scan
+    # finds no pmon process, the SQL*Plus connection attempt is skipped.
+    local scan_rc=0
+    if type -t oradba_instance_running > /dev/null 2>&1; then
+        oradba_instance_running "${ORACLE_SID:-}" || scan_rc=$?
+    fi
+    if [[ ${scan_rc} -eq 1 ]] || ! check_database_connection; then
         # Database not accessible - show environment status
         echo ""
 
@@ -355,6 +362,9 @@ show_database_status() {
         return 0
     fi
 
+    # Share one SQL*Plus session across the status queries (ORADBA_SQL_SESSION=true)
+    oradba_sql_session_open 2> /dev/null || true
+
     # Get open mode first
     local open_mode
     open_mode=$(get_database_open_mode | tr -d '[:space:]')
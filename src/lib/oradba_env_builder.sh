@@ -71,30 +71,35 @@ _oradba_builder_log() {
 }
 
 # ------------------------------------------------------------------------------
-# Function: oradba_dedupe_path
-# Purpose.: Remove duplicate entries from PATH-like variables
-# Args....: $1 - Path string (colon-separated)
-# Returns.: Deduplicated path string
+# Function: _oradba_builder_plugin_type
+# Purpose.: Map a product type to its plugin name
+# Args....: $1 - Variable name for the plugin name
+#           $2 - Product type (any case, RDBMS/GRID map to database)
+# Returns.: 0 on success
+# Output..: None
 # ------------------------------------------------------------------------------
-oradba_dedupe_path() {
-    local input_path="$1"
-    [[ -z "${input_path}" ]] && return 0
-    # O(n) deduplication via bash 4+ associative array — zero external forks (#216)
-    local -A seen
-    local -a result
-    local dir
-    IFS=':' read -ra dirs <<< "${input_path}"
-    for dir in "${dirs[@]}"; do
-        [[ -z "${dir}" ]] && continue
-        if [[ -z "${seen["${dir}"]+x}" ]]; then
-            seen["${dir}"]=1
-            result+=("${dir}")
-        fi
-    done
-    local IFS=':'
-    echo "${result[*]}"
+_oradba_builder_plugin_type() {
+    local -n _plugin_type="$1"
+    case "$2" in
+        RDBMS | rdbms | GRID | grid) _plugin_type="database" ;;
+        DATABASE | database) _plugin_type="database" ;;
+        WLS | wls | WEBLOGIC | weblogic) _plugin_type="weblogic" ;;
+        *) _plugin_type="${2,,}" ;;
+    esac
+    return 0
 }
 
+# Require path-set engine (oradba_pathset_*, oradba_dedupe_path)
+if [[ -z "${ORADBA_ENV_PATHS_LOADED}" ]]; then
+    if [[ -f "${ORADBA_BASE}/lib/oradba_env_paths.sh" ]]; then
+        # shellcheck source=./oradba_env_paths.sh
+        source "${ORADBA_BASE}/lib/oradba_env_paths.sh"
+    else
+        echo "ERROR: oradba_env_paths.sh not found" >&2
+        return 1
+    fi
+fi
+
 # Require parser functions
 if [[ -z "${ORADBA_ENV_PARSER_LOADED}" ]]; then
     if [[ -f "${ORADBA_BASE}/lib/oradba_env_parser.sh" ]]; then
@@ -127,26 +132,10 @@ fi
 # Purpose.: Remove Oracle-related directories from PATH
 # Args....: None
 # Returns.: 0 on success
-# Output..: Cleaned PATH exported
+# Output..: Cleaned PATH exported (held in the path-set session if active)
 # ------------------------------------------------------------------------------
 oradba_clean_path() {
-    local new_path=""
-    local IFS=":"
-
-    for dir in $PATH; do
-        # Skip Oracle directories
-        [[ "$dir" =~ /oracle/ ]] && continue
-        [[ "$dir" =~ /grid/ ]] && continue
-        [[ "$dir" =~ instantclient ]] && continue
-
-        # Add to new path
-        if [[ -n "$new_path" ]]; then
-            new_path="${new_path}:"
-        fi
-        new_path="${new_path}${dir}"
-    done
-
-    export PATH="$new_path"
+    oradba_pathset_remove_match PATH '/oracle/|/grid/|instantclient'
 }
 
 # ------------------------------------------------------------------------------
@@ -166,12 +155,7 @@ oradba_add_oracle_path() {
     [[ ! -d "$oracle_home" ]] && return 1
 
     # Convert product type to lowercase for plugin matching (case lookup, no subshell)
-    case "${product_type}" in
-        RDBMS | rdbms | GRID | grid) product_type="database" ;;
-        DATABASE | database) product_type="database" ;;
-        WLS | wls | WEBLOGIC | weblogic) product_type="weblogic" ;;
-        *) product_type="${product_type,,}" ;;
-    esac
+    _oradba_builder_plugin_type product_type "${product_type}"
 
     # Use v2 wrapper for isolated plugin execution (Phase 3)
     if execute_plugin_function_v2 "${product_type}" "build_bin_path" "${oracle_home}" "new_path"; then
@@ -195,21 +179,30 @@ oradba_add_oracle_path() {
     # Add paths to PATH only if directories exist AND not already in PATH
     # Handle both single paths and colon-separated path lists
     if [[ -n "$new_path" ]]; then
-        [[ "${ORADBA_DEBUG:-false}" == "true" ]] && echo "DEBUG: oradba_add_oracle_path - new_path: $new_path" >&2
-        [[ "${ORADBA_DEBUG:-false}" == "true" ]] && echo "DEBUG: oradba_add_oracle_path - Current PATH before: $PATH" >&2
+        local current_path=""
+        local -a add_dirs=()
+        if [[ "${ORADBA_DEBUG:-false}" == "true" ]]; then
+            oradba_pathset_get PATH current_path
+            echo "DEBUG: oradba_add_oracle_path - new_path: $new_path" >&2
+            echo "DEBUG: oradba_add_oracle_path - Current PATH before: $current_path" >&2
+        fi
 
         IFS=':' read -ra path_array <<< "$new_path"
         for dir in "${path_array[@]}"; do
-            # Only add if directory exists and not already in PATH
-            if [[ -d "$dir" ]] && [[ ":${PATH}:" != *":${dir}:"* ]]; then
-                [[ "${ORADBA_DEBUG:-false}" == "true" ]] && echo "DEBUG: oradba_add_oracle_path - Adding: $dir" >&2
-                export PATH="${dir}:${PATH}"
+            # Only add if directory exists; entries already in PATH are skipped
+            # by the path-set engine (each one goes in front of the previous)
+            if [[ -d "$dir" ]]; then
+                add_dirs+=("$dir")
             else
                 [[ "${ORADBA_DEBUG:-false}" == "true" ]] && echo "DEBUG: oradba_add_oracle_path - Skipping: $dir" >&2
             fi
         done
+        oradba_pathset_prepend PATH "${add_dirs[@]}"
 
-        [[ "${ORADBA_DEBUG:-false}" == "true" ]] && echo "DEBUG: oradba_add_oracle_path - Current PATH after: $PATH" >&2
+        if [[ "${ORADBA_DEBUG:-false}" == "true" ]]; then
+            oradba_pathset_get PATH current_path
+            echo "DEBUG: oradba_add_oracle_path - Current PATH after: $current_path" >&2
+        fi
     fi
 }
 
@@ -238,12 +231,7 @@ oradba_set_lib_path() {
     esac
 
     # Convert product type to lowercase for plugin matching (case lookup, no subshell)
-    case "${product_type}" in
-        RDBMS | rdbms | GRID | grid) product_type="database" ;;
-        DATABASE | database) product_type="database" ;;
-        WLS | wls | WEBLOGIC | weblogic) product_type="weblogic" ;;
-        *) product_type="${product_type,,}" ;;
-    esac
+    _oradba_builder_plugin_type product_type "${product_type}"
 
     # Use v2 wrapper for isolated plugin execution (Phase 3)
     if execute_plugin_function_v2 "${product_type}" "build_lib_path" "${oracle_home}" "lib_path"; then
@@ -268,38 +256,22 @@ oradba_set_lib_path() {
         fi
     fi
 
-    # Clean existing Oracle library paths from the environment
-    eval "local existing=\"\${${lib_var}}\""
-    if [[ -n "$existing" ]]; then
-        _oradba_builder_log DEBUG "Cleaning ${lib_var}: ${existing}"
-        local cleaned_path=""
-        local IFS=":"
-        for dir in $existing; do
-            # Skip Oracle-related directories
-            if [[ "$dir" =~ /oracle/ ]] || [[ "$dir" =~ /grid/ ]] || [[ "$dir" =~ instantclient ]]; then
-                _oradba_builder_log DEBUG "Removing old Oracle path: ${dir}"
-                continue
-            fi
-
-            # Add to cleaned path
-            cleaned_path="${cleaned_path:+${cleaned_path}:}${dir}"
-        done
-        _oradba_builder_log DEBUG "Cleaned ${lib_var}: ${cleaned_path}"
-
-        # Append cleaned non-Oracle paths to new Oracle paths
-        if [[ -n "$cleaned_path" ]]; then
-            lib_path="${lib_path:+${lib_path}:}${cleaned_path}"
-        fi
-    fi
+    # Clean existing Oracle library paths, keeping non-Oracle entries
+    oradba_pathset_remove_match "${lib_var}" '/oracle/|/grid/|instantclient'
 
-    # Deduplicate library path
-    lib_path="$(oradba_dedupe_path "$lib_path")"
+    # Put the new Oracle paths in front, in plugin order (promote reversed)
+    local -a lib_dirs=() lib_front=()
+    local i
+    IFS=':' read -ra lib_dirs <<< "$lib_path"
+    for ((i = ${#lib_dirs[@]} - 1; i >= 0; i--)); do
+        lib_front+=("${lib_dirs[i]}")
+    done
+    # Always marks the variable modified, so it is exported even if empty
+    # to clear old values from previous environments
+    oradba_pathset_promote "${lib_var}" "${lib_front[@]}"
 
+    oradba_pathset_get "${lib_var}" lib_path
     _oradba_builder_log DEBUG "Final ${lib_var} to be exported: ${lib_path}"
-
-    # Export library path variable (always export, even if empty)
-    # This ensures we clear old values from previous environments
-    export ${lib_var}="$lib_path"
 }
 
 # ------------------------------------------------------------------------------
@@ -667,13 +639,13 @@ oradba_add_client_path() {
     _oradba_builder_log DEBUG "Exported ORACLE_CLIENT_HOME=${ORACLE_CLIENT_HOME}"
 
     # Check if already in PATH
-    if [[ ":${PATH}:" == *":${client_bin}:"* ]]; then
+    if oradba_pathset_contains PATH "${client_bin}"; then
         _oradba_builder_log DEBUG "Client path already in PATH: ${client_bin}"
         return 0
     fi
 
     # Append to PATH (after current entries)
-    export PATH="${PATH}:${client_bin}"
+    oradba_pathset_append PATH "${client_bin}"
     _oradba_builder_log DEBUG "Added client path for ${product_type}: ${client_bin}"
 
     return 0
@@ -854,13 +826,13 @@ oradba_add_java_path() {
     _oradba_builder_log DEBUG "Exported JAVA_HOME=${JAVA_HOME}"
 
     # Check if already in PATH
-    if [[ ":${PATH}:" == *":${java_bin}:"* ]]; then
+    if oradba_pathset_contains PATH "${java_bin}"; then
         _oradba_builder_log DEBUG "Java path already in PATH: ${java_bin}"
         return 0
     fi
 
     # Prepend to PATH (before current entries so it takes precedence)
-    export PATH="${java_bin}:${PATH}"
+    oradba_pathset_prepend PATH "${java_bin}"
     _oradba_builder_log DEBUG "Added Java path for ${product_type}: ${java_bin}"
 
     return 0
@@ -949,11 +921,26 @@ oradba_build_environment() {
     [[ -z "$oracle_home" ]] && return 1
     [[ ! -d "$oracle_home" ]] && return 1
 
+    # Hold PATH and library paths in the path-set engine for the whole build;
+    # each variable is exported once by oradba_pathset_end below
+    oradba_pathset_begin
+
     # Clean existing Oracle paths
     oradba_clean_path
 
     # Set core Oracle variables
-    oradba_set_oracle_vars "$oracle_sid" "$oracle_home" "$product_type" || return 1
+    if ! oradba_set_oracle_vars "$oracle_sid" "$oracle_home" "$product_type"; then
+        oradba_pathset_end
+        return 1
+    fi
+
+    # Run both path builders of the plugin in one subshell; the results are
+    # memoized and picked up by oradba_add_oracle_path/oradba_set_lib_path
+    if declare -F execute_plugin_batch > /dev/null 2>&1; then
+        local plugin_type
+        _oradba_builder_plugin_type plugin_type "${product_type:-database}"
+        execute_plugin_batch "${plugin_type}" "$oracle_home" "" build_bin_path build_lib_path || true
+    fi
 
     # Set PATH
     oradba_add_oracle_path "$oracle_home" "$product_type"
@@ -970,7 +957,10 @@ oradba_build_environment() {
     fi
 
     # Apply configuration files (Phase 2)
+    # Config files read and modify PATH directly: commit pending changes first,
+    # their modifications are picked up by the next path-set operation
     if command -v oradba_apply_product_config &> /dev/null; then
+        oradba_pathset_commit
         oradba_apply_product_config "$product_type" "$oracle_sid"
     fi
 
@@ -986,27 +976,7 @@ oradba_build_environment() {
     # Final PATH deduplication after all configs loaded
     # This ensures custom PATH additions from config files are deduplicated
     # Must happen AFTER config files to catch any PATH modifications they make
-    local final_path final_lib_path
-    final_path="$(oradba_dedupe_path "$PATH")"
-    export PATH="$final_path"
-
-    # Also deduplicate library paths if they exist
-    if [[ -n "${LD_LIBRARY_PATH:-}" ]]; then
-        final_lib_path="$(oradba_dedupe_path "$LD_LIBRARY_PATH")"
-        export LD_LIBRARY_PATH="$final_lib_path"
-    fi
-    if [[ -n "${LIBPATH:-}" ]]; then
-        final_lib_path="$(oradba_dedupe_path "$LIBPATH")"
-        export LIBPATH="$final_lib_path"
-    fi
-    if [[ -n "${SHLIB_PATH:-}" ]]; then
-        final_lib_path="$(oradba_dedupe_path "$SHLIB_PATH")"
-        export SHLIB_PATH="$final_lib_path"
-    fi
-    if [[ -n "${DYLD_LIBRARY_PATH:-}" ]]; then
-        final_lib_path="$(oradba_dedupe_path "$DYLD_LIBRARY_PATH")"
-        export DYLD_LIBRARY_PATH="$final_lib_path"
-    fi
+    oradba_pathset_dedupe PATH LD_LIBRARY_PATH LIBPATH SHLIB_PATH DYLD_LIBRARY_PATH
 
     # Load extensions after Oracle environment is fully set up
     # Extensions are loaded based on priority (mixed with Oracle paths)
@@ -1015,6 +985,9 @@ oradba_build_environment() {
         load_extensions
     fi
 
+    # Export PATH, library paths and SQLPATH once
+    oradba_pathset_end
+
     # Set tracking variables
     export ORADBA_ENV_LOADED=1
     export ORADBA_CURRENT_SID="$oracle_sid"
@@ -18,8 +18,48 @@
 [[ -n "${ORADBA_ENV_CHANGES_LOADED:-}" ]] && return 0
 readonly ORADBA_ENV_CHANGES_LOADED=1
 
-# Default cache directory
-: "${ORADBA_CACHE_DIR:=${ORADBA_BASE}/var/cache}"
+# Cache files live in the directory resolved by oradba_cache_dir
+# (oradba_common.sh, which must be sourced first): ORADBA_CACHE_DIR, else
+# ${ORADBA_BASE}/var/cache, else the user's cache directory; never /var/cache.
+
+# Consolidated signature manifest of the watched configuration files: one
+# "path<TAB>mtime:ctime:size:inode" line per file, replaces the per-file .sig files.
+# ORADBA_CHANGE_MANIFEST overrides <cache dir>/config_changes.sig.
+# Next to it, <manifest without .sig>.stamps holds one empty stamp file per
+# watched file carrying that file's mtime (touch -r) for the quick check.
+
+# Files reported by the last oradba_check_config_changes call
+declare -ga ORADBA_CONFIG_CHANGES=()
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_change_manifest
+# Purpose.: Resolve the path of the signature manifest
+# Args....: $1 - Name of the variable to receive the path
+# Returns.: 0 on success
+# Output..: None
+# ------------------------------------------------------------------------------
+_oradba_change_manifest() {
+    if [[ -n "${ORADBA_CHANGE_MANIFEST:-}" ]]; then
+        printf -v "$1" '%s' "${ORADBA_CHANGE_MANIFEST}"
+    else
+        oradba_cache_dir "$1"
+        printf -v "$1" '%s/config_changes.sig' "${!1}"
+    fi
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_change_stamp
+# Purpose.: Resolve the mtime stamp file of a watched file
+# Args....: $1 - Name of the variable to receive the path
+#           $2 - Manifest path
+#           $3 - Watched file
+# Returns.: 0 on success
+# Output..: None
+# ------------------------------------------------------------------------------
+_oradba_change_stamp() {
+    local _file="${3//%/%25}"
+    printf -v "$1" '%s.stamps/%s' "${2%.sig}" "${_file//\//%2F}"
+}
 
 # ------------------------------------------------------------------------------
 # Function: oradba_get_file_signature
@@ -27,6 +67,7 @@ readonly ORADBA_ENV_CHANGES_LOADED=1
 # Args....: $1 - File path
 # Returns.: 0 on success, 1 on failure
 # Output..: File signature string
+# Notes...: Platform is taken from OSTYPE (no uname fork)
 # ------------------------------------------------------------------------------
 oradba_get_file_signature() {
     local file="$1"
@@ -34,18 +75,34 @@ oradba_get_file_signature() {
     [[ ! -f "$file" ]] && return 1
 
     # Get timestamp and size
-    if [[ "$(uname -s)" == "Darwin" ]]; then
+    if [[ "${OSTYPE:-}" == darwin* ]]; then
         # macOS
-        local mtime size
-        mtime=$(stat -f "%m" "$file" 2> /dev/null)
-        size=$(stat -f "%z" "$file" 2> /dev/null)
-        echo "${mtime}:${size}"
+        stat -f '%m:%z' "$file" 2> /dev/null
     else
         # Linux
         stat -c '%Y:%s' "$file" 2> /dev/null
     fi
 }
 
+# ------------------------------------------------------------------------------
+# Function: oradba_get_file_signatures
+# Purpose.: Get the signatures of several files with one stat call
+# Args....: $@ - File paths (existing files)
+# Returns.: 0 on success, non-zero if stat failed for a file
+# Output..: One "path<TAB>mtime:ctime:size:inode" line per file
+# Notes...: ctime and inode catch files replaced by an older copy (mv, cp -p).
+#           Shared with the config compiler (oradba_env_config.sh).
+# ------------------------------------------------------------------------------
+oradba_get_file_signatures() {
+    [[ $# -eq 0 ]] && return 0
+
+    if [[ "${OSTYPE:-}" == darwin* ]]; then
+        stat -f $'%N\t%m:%c:%z:%i' "$@" 2> /dev/null
+    else
+        stat -c $'%n\t%Y:%Z:%s:%i' "$@" 2> /dev/null
+    fi
+}
+
 # ------------------------------------------------------------------------------
 # Function: oradba_store_file_signature
 # Purpose.: Store file signature for future comparison
@@ -61,9 +118,10 @@ oradba_store_file_signature() {
 
     # Auto-generate signature file path if not provided
     if [[ -z "$sig_file" ]]; then
-        local filename
+        local filename cache_dir
         filename=$(basename "$file")
-        sig_file="${ORADBA_CACHE_DIR}/${filename}.sig"
+        oradba_cache_dir cache_dir
+        sig_file="${cache_dir}/${filename}.sig"
     fi
 
     # Ensure cache directory exists
@@ -97,9 +155,10 @@ oradba_check_file_changed() {
 
     # Auto-generate signature file path if not provided
     if [[ -z "$sig_file" ]]; then
-        local filename
+        local filename cache_dir
         filename=$(basename "$file")
-        sig_file="${ORADBA_CACHE_DIR}/${filename}.sig"
+        oradba_cache_dir cache_dir
+        sig_file="${cache_dir}/${filename}.sig"
     fi
 
     # Get current signature
@@ -130,18 +189,15 @@ oradba_check_file_changed() {
 }
 
 # ------------------------------------------------------------------------------
-# Function: oradba_check_config_changes
-# Purpose.: Check if any configuration files have changed
+# Function: _oradba_change_watch_files
+# Purpose.: Build the list of watched configuration files
 # Args....: None
-# Returns.: 0 if changes detected, 1 if no changes
-# Output..: List of changed files
+# Returns.: 0 on success
+# Output..: None (sets _ORADBA_CHANGE_FILES)
+# Notes...: Includes the SID config if ORACLE_SID is set; no subprocesses
 # ------------------------------------------------------------------------------
-oradba_check_config_changes() {
-    local changed=1
-    local changes=()
-
-    # Files to monitor
-    local config_files=(
+_oradba_change_watch_files() {
+    _ORADBA_CHANGE_FILES=(
         "/etc/oratab"
         "${ORADBA_BASE}/etc/oradba_homes.conf"
         "${ORADBA_BASE}/etc/oradba_core.conf"
@@ -152,27 +208,157 @@ oradba_check_config_changes() {
 
     # Check SID-specific config if ORACLE_SID is set
     if [[ -n "${ORACLE_SID:-}" ]]; then
-        config_files+=("${ORADBA_BASE}/etc/sid/sid.${ORACLE_SID}.conf")
+        _ORADBA_CHANGE_FILES+=("${ORADBA_BASE}/etc/sid/sid.${ORACLE_SID}.conf")
     fi
+    return 0
+}
 
-    # Check each file
-    for file in "${config_files[@]}"; do
-        [[ ! -f "$file" ]] && continue
+# ------------------------------------------------------------------------------
+# Function: _oradba_change_load_manifest
+# Purpose.: Read the signature manifest into an associative array
+# Args....: $1 - Name of an associative array (path -> signature)
+# Returns.: 0 if the manifest was read, 1 if it does not exist
+# Output..: None
+# ------------------------------------------------------------------------------
+_oradba_change_load_manifest() {
+    local -n _sigs
+    _sigs="$1"
+    local manifest
+    _oradba_change_manifest manifest
+    local path sig
+
+    [[ -f "$manifest" ]] || return 1
+    while IFS=$'\t' read -r path sig; do
+        [[ -n "$path" ]] && _sigs["$path"]="$sig"
+    done < "$manifest"
+    return 0
+}
 
-        if oradba_check_file_changed "$file"; then
-            changes+=("$file")
-            changed=0
-        fi
+# ------------------------------------------------------------------------------
+# Function: _oradba_change_save_manifest
+# Purpose.: Write the signature manifest
+# Args....: $1 - Name of an associative array (path -> signature)
+# Returns.: 0 on success, 1 if the manifest cannot be written
+# Output..: None
+# Notes...: Also copies the mtime of each file to its stamp (touch -r, only
+#           for stamps that differ) and removes stamps of dropped files
+# ------------------------------------------------------------------------------
+_oradba_change_save_manifest() {
+    local -n _sigs
+    _sigs="$1"
+    local manifest
+    _oradba_change_manifest manifest
+    local path stamp tmp="${manifest}.$$"
+    local -A stamps=()
+
+    [[ -d "${manifest%.sig}.stamps" ]] || mkdir -p "${manifest%.sig}.stamps" 2> /dev/null
+    {
+        for path in "${!_sigs[@]}"; do
+            printf '%s\t%s\n' "$path" "${_sigs[$path]}"
+        done
+    } > "$tmp" 2> /dev/null || return 1
+    mv -f "$tmp" "$manifest" 2> /dev/null || return 1
+
+    for path in "${!_sigs[@]}"; do
+        _oradba_change_stamp stamp "$manifest" "$path"
+        stamps["$stamp"]=1
+        [[ -e "$stamp" && ! "$path" -nt "$stamp" && ! "$path" -ot "$stamp" ]] && continue
+        touch -r "$path" "$stamp" 2> /dev/null || { : > "$stamp"; } 2> /dev/null
+    done
+    for stamp in "${manifest%.sig}.stamps"/*; do
+        [[ -e "$stamp" && -z "${stamps[$stamp]+set}" ]] && rm -f "$stamp"
     done
+    return 0
+}
 
-    # Output changes if any
-    if [[ ${#changes[@]} -gt 0 ]]; then
-        for change in "${changes[@]}"; do
-            echo "$change"
+# ------------------------------------------------------------------------------
+# Function: oradba_config_changed_quick
+# Purpose.: Cheap check whether any watched configuration file may have changed
+# Args....: None
+# Returns.: 0 if a file may have changed (or no manifest exists), 1 if not
+# Output..: None
+# Notes...: Forks nothing: each watched file must have exactly the mtime of
+#           its stamp (neither -nt nor -ot), so files replaced by an older
+#           copy (cp -p, rsync -a, tar, restores) count as changed too.
+#           New/removed files are checked against the manifest entries.
+#           On a possible change the config compiler and the registry are
+#           told to verify their signatures again (oradba_config_recheck,
+#           oradba_registry_recheck, if loaded).
+#           Use oradba_check_config_changes for details.
+# ------------------------------------------------------------------------------
+oradba_config_changed_quick() {
+    local manifest stamp
+    _oradba_change_manifest manifest
+    local -A known=()
+    local file changed=false
+
+    if _oradba_change_load_manifest known; then
+        _oradba_change_watch_files
+        for file in "${_ORADBA_CHANGE_FILES[@]}"; do
+            if [[ -f "$file" ]]; then
+                _oradba_change_stamp stamp "$manifest" "$file"
+                [[ -n "${known[$file]+set}" && -e "$stamp" ]] \
+                    && [[ ! "$file" -nt "$stamp" && ! "$file" -ot "$stamp" ]] && continue
+            elif [[ -z "${known[$file]+set}" ]]; then
+                continue
+            fi
+            changed=true
+            break
         done
+    else
+        changed=true
     fi
+    [[ "$changed" == "true" ]] || return 1
+
+    # Let the config compiler and the registry verify their signatures again
+    declare -F oradba_config_recheck > /dev/null && oradba_config_recheck
+    declare -F oradba_registry_recheck > /dev/null && oradba_registry_recheck
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_check_config_changes
+# Purpose.: Check if any configuration files have changed
+# Args....: None
+# Returns.: 0 if changes detected, 1 if no changes
+# Output..: List of changed files
+# Notes...: Returns without forking if oradba_config_changed_quick finds
+#           nothing; otherwise all watched files are checked with one stat
+#           call and the manifest is rewritten. New files count as changed,
+#           removed files are dropped from the manifest. The changed files
+#           are also stored in ORADBA_CONFIG_CHANGES.
+# ------------------------------------------------------------------------------
+oradba_check_config_changes() {
+    local -A sigs=()
+    local -a existing=()
+    local file sig
+
+    ORADBA_CONFIG_CHANGES=()
+    oradba_config_changed_quick || return 1
+
+    _oradba_change_load_manifest sigs || true
+    for file in "${_ORADBA_CHANGE_FILES[@]}"; do
+        if [[ -f "$file" ]]; then
+            existing+=("$file")
+        else
+            unset 'sigs[$file]'
+        fi
+    done
 
-    return $changed
+    # One stat call for all watched files
+    while IFS=$'\t' read -r file sig; do
+        [[ -z "$file" ]] && continue
+        if [[ "${sigs[$file]:-}" != "$sig" ]]; then
+            ORADBA_CONFIG_CHANGES+=("$file")
+            sigs["$file"]="$sig"
+        fi
+    done < <(oradba_get_file_signatures ${existing[@]+"${existing[@]}"})
+
+    _oradba_change_save_manifest sigs || true
+
+    [[ ${#ORADBA_CONFIG_CHANGES[@]} -eq 0 ]] && return 1
+    printf '%s\n' "${ORADBA_CONFIG_CHANGES[@]}"
+    return 0
 }
 
 # ------------------------------------------------------------------------------
@@ -183,28 +369,27 @@ oradba_check_config_changes() {
 # Output..: Initialization message
 # ------------------------------------------------------------------------------
 oradba_init_change_tracking() {
-    # Ensure cache directory exists
-    mkdir -p "${ORADBA_CACHE_DIR}" 2> /dev/null
+    local -A sigs=()
+    local -a existing=()
+    local file sig
 
-    # Files to monitor
-    local config_files=(
-        "/etc/oratab"
-        "${ORADBA_BASE}/etc/oradba_homes.conf"
-        "${ORADBA_BASE}/etc/oradba_core.conf"
-        "${ORADBA_BASE}/etc/oradba_standard.conf"
-        "${ORADBA_BASE}/etc/oradba_local.conf"
-        "${ORADBA_BASE}/etc/oradba_customer.conf"
-    )
-
-    local count=0
-    for file in "${config_files[@]}"; do
-        if [[ -f "$file" ]]; then
-            oradba_store_file_signature "$file"
-            count=$((count + 1))
-        fi
+    # Ensure cache directory exists
+    local cache_dir
+    oradba_cache_dir cache_dir
+    mkdir -p "${cache_dir}" 2> /dev/null
+
+    _oradba_change_load_manifest sigs || true
+    _oradba_change_watch_files
+    for file in "${_ORADBA_CHANGE_FILES[@]}"; do
+        [[ -f "$file" ]] && existing+=("$file")
     done
 
-    echo "Initialized change tracking for $count configuration files"
+    while IFS=$'\t' read -r file sig; do
+        [[ -n "$file" ]] && sigs["$file"]="$sig"
+    done < <(oradba_get_file_signatures ${existing[@]+"${existing[@]}"})
+    _oradba_change_save_manifest sigs || true
+
+    echo "Initialized change tracking for ${#existing[@]} configuration files"
     return 0
 }
 
@@ -215,8 +400,14 @@ oradba_init_change_tracking() {
 # Returns.: 0 on success
 # ------------------------------------------------------------------------------
 oradba_clear_change_tracking() {
-    if [[ -d "${ORADBA_CACHE_DIR}" ]]; then
-        rm -f "${ORADBA_CACHE_DIR}"/*.sig 2> /dev/null
+    local manifest
+    _oradba_change_manifest manifest
+
+    local cache_dir
+    oradba_cache_dir cache_dir
+    if [[ -d "${cache_dir}" ]]; then
+        rm -f "${cache_dir}"/*.sig "$manifest" 2> /dev/null
+        rm -rf "${manifest%.sig}.stamps" 2> /dev/null
         echo "Cleared change tracking data"
     fi
     return 0
@@ -228,16 +419,16 @@ oradba_clear_change_tracking() {
 # Args....: None
 # Returns.: 0 if environment reloaded, 1 if no changes
 # Output..: Reload message if environment was reloaded
+# Notes...: Forks nothing if no file changed, cheap enough for PROMPT_COMMAND
+#           (see oradba_enable_auto_reload)
 # ------------------------------------------------------------------------------
 oradba_auto_reload_on_change() {
-    local changes
-
-    # Check for changes
-    changes=$(oradba_check_config_changes)
+    # Check for changes (result in ORADBA_CONFIG_CHANGES, no subshell)
+    oradba_check_config_changes > /dev/null || return 1
 
-    if [[ -n "$changes" ]]; then
+    if [[ ${#ORADBA_CONFIG_CHANGES[@]} -gt 0 ]]; then
         echo "Configuration changes detected:"
-        echo "$changes"
+        printf '%s\n' "${ORADBA_CONFIG_CHANGES[@]}"
 
         # If we have a current SID, reload its environment
         if [[ -n "${ORACLE_SID:-}" ]]; then
@@ -253,3 +444,40 @@ oradba_auto_reload_on_change() {
 
     return 1
 }
+
+# ------------------------------------------------------------------------------
+# Function: oradba_enable_auto_reload
+# Purpose.: Check for configuration changes before every prompt
+# Args....: None
+# Returns.: 0 on success
+# Output..: None
+# Notes...: Appends oradba_auto_reload_on_change to PROMPT_COMMAND (once) and
+#           initializes the manifest so the first prompt stays quiet
+# ------------------------------------------------------------------------------
+oradba_enable_auto_reload() {
+    local manifest
+    _oradba_change_manifest manifest
+
+    [[ -f "$manifest" ]] || oradba_init_change_tracking > /dev/null
+
+    if [[ "${PROMPT_COMMAND:-}" != *oradba_auto_reload_on_change* ]]; then
+        PROMPT_COMMAND="${PROMPT_COMMAND:+${PROMPT_COMMAND%;}; }oradba_auto_reload_on_change"
+    fi
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_disable_auto_reload
+# Purpose.: Remove the prompt hook installed by oradba_enable_auto_reload
+# Args....: None
+# Returns.: 0 on success
+# Output..: None
+# ------------------------------------------------------------------------------
+oradba_disable_auto_reload() {
+    local hook="oradba_auto_reload_on_change"
+
+    PROMPT_COMMAND="${PROMPT_COMMAND:-}"
+    PROMPT_COMMAND="${PROMPT_COMMAND//; ${hook}/}"
+    PROMPT_COMMAND="${PROMPT_COMMAND//${hook}/}"
+    return 0
+}
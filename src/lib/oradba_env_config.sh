@@ -9,6 +9,7 @@
 # Revision...: 0.21.0
 # Purpose....: Configuration file processing for Oracle environment management
 # Notes......: Part of Phase 2 implementation - section-based config processing
+#              Config files are compiled once into a cached per-section table
 #              Handles DEFAULT, RDBMS, CLIENT, ICLIENT, GRID, ASM, DATASAFE, OUD, WLS sections
 # Reference..: https://github.com/oehrlis/oradba
 # License....: Apache License Version 2.0, January 2004 as shown
@@ -19,78 +20,347 @@
 [[ -n "${ORADBA_ENV_CONFIG_LOADED}" ]] && return 0
 readonly ORADBA_ENV_CONFIG_LOADED=1
 
+# Compiled config table (see oradba_config_compile)
+if ! declare -p _ORADBA_CFG_TABLE &> /dev/null; then
+    declare -gA _ORADBA_CFG_TABLE=()    # "file|section" -> compiled entries
+    declare -gA _ORADBA_CFG_SECTIONS=() # file -> section names (newline separated)
+    declare -gA _ORADBA_CFG_SIG=()      # file -> signature at compile time
+    declare -gA _ORADBA_CFG_CHECKED=()  # file -> 1 once verified in this shell
+    _ORADBA_CFG_TOKEN=""
+fi
+
+# Change tracker provides oradba_get_file_signatures
+if ! declare -F oradba_get_file_signatures > /dev/null 2>&1 \
+    && [[ -f "${BASH_SOURCE[0]%/*}/oradba_env_changes.sh" ]]; then
+    # shellcheck source=oradba_env_changes.sh
+    source "${BASH_SOURCE[0]%/*}/oradba_env_changes.sh"
+fi
+
 # ------------------------------------------------------------------------------
-# Function: oradba_apply_config_section
-# Purpose.: Apply configuration from a specific section in config file
+# Function: _oradba_config_drop
+# Purpose.: Remove a config file from the compiled table
 # Args....: $1 - Config file path
-#          $2 - Section name (DEFAULT|RDBMS|CLIENT|ICLIENT|GRID|ASM|DATASAFE|OUD|WLS)
-# Returns.: 0 on success, 1 if file not found
+# Returns.: 0 always
 # ------------------------------------------------------------------------------
-oradba_apply_config_section() {
+_oradba_config_drop() {
     local config_file="$1"
-    local section="$2"
-    
-    [[ ! -f "$config_file" ]] && return 1
-    
-    [[ "${ORADBA_DEBUG:-false}" == "true" ]] && echo "DEBUG: Loading config file: $config_file, section: $section" >&2
-    
-    local in_section=0
+    local key section
+
+    while IFS= read -r section; do
+        [[ -z "$section" ]] && continue
+        key="${config_file}|${section}"
+        unset '_ORADBA_CFG_TABLE[$key]'
+    done <<< "${_ORADBA_CFG_SECTIONS["${config_file}"]:-}"
+    unset '_ORADBA_CFG_SECTIONS[$config_file]' '_ORADBA_CFG_SIG[$config_file]' '_ORADBA_CFG_CHECKED[$config_file]'
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_config_parse
+# Purpose.: Parse a config file into per-section entries of the compiled table
+# Args....: $1 - Config file path
+# Returns.: 0 on success, 1 if file not readable
+# Notes...: Each entry is one line prefixed with its kind: P (export PATH),
+#           E (export/alias, evaluated as is) or X (plain assignment,
+#           evaluated with export). Comments and unknown lines are dropped.
+# ------------------------------------------------------------------------------
+_oradba_config_parse() {
+    local config_file="$1"
+    local section=""
     local line
-    
+    local -A body=()
+    local -a order=()
+
+    [[ -r "$config_file" ]] || return 1
+
     while IFS= read -r line; do
         # Remove leading/trailing whitespace
         line="${line##*([[:space:]])}"
         line="${line%%*([[:space:]])}"
-        
+
         # Skip empty lines and comments
         [[ -z "$line" ]] && continue
         [[ "$line" =~ ^# ]] && continue
-        
+
         # Check for section headers [SECTION]
         if [[ "$line" =~ ^\[([^]]+)\] ]]; then
-            local current_section="${BASH_REMATCH[1]}"
-            if [[ "$current_section" == "$section" ]]; then
-                in_section=1
-                [[ "${ORADBA_DEBUG:-false}" == "true" ]] && echo "DEBUG: Entered section [$section]" >&2
-            else
-                in_section=0
+            section="${BASH_REMATCH[1]}"
+            if [[ -z "${body["$section"]+set}" ]]; then
+                body["$section"]=""
+                order+=("$section")
             fi
             continue
         fi
+
+        # Lines before the first section header are ignored
+        [[ -z "$section" ]] && continue
+
+        if [[ "$line" =~ ^export[[:space:]]+PATH= ]]; then
+            body["$section"]+="P${line}"$'\n'
+        elif [[ "$line" =~ ^(export|alias)[[:space:]] ]]; then
+            body["$section"]+="E${line}"$'\n'
+        elif [[ "$line" =~ ^([A-Za-z_][A-Za-z0-9_]*)= ]]; then
+            body["$section"]+="X${line}"$'\n'
+        fi
+    done < "$config_file"
+
+    _oradba_config_drop "$config_file"
+    for section in ${order[@]+"${order[@]}"}; do
+        _ORADBA_CFG_TABLE["${config_file}|${section}"]="${body["$section"]}"
+        _ORADBA_CFG_SECTIONS["$config_file"]+="${section}"$'\n'
+    done
+    _ORADBA_CFG_SECTIONS["$config_file"]+=""
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_config_cache_read
+# Purpose.: Replace the compiled table with the content of a cache file
+# Args....: $1 - Cache file path
+# Returns.: 0 on success, 1 if the file is missing, not a config cache or
+#           not private to the current user (see oradba_is_private_file)
+# ------------------------------------------------------------------------------
+_oradba_config_cache_read() {
+    local cache_file="$1"
+    local header=""
+
+    [[ -r "$cache_file" ]] || return 1
+    if ! oradba_is_private_file "$cache_file"; then
+        oradba_log DEBUG "Ignoring config cache not private to this user: ${cache_file}"
+        return 1
+    fi
+    read -r header < "$cache_file" 2> /dev/null || return 1
+    [[ "$header" == "# oradba config cache v1|"* ]] || return 1
+
+    _ORADBA_CFG_TABLE=()
+    _ORADBA_CFG_SECTIONS=()
+    _ORADBA_CFG_SIG=()
+    _ORADBA_CFG_CHECKED=()
+    # shellcheck source=/dev/null
+    if ! source "$cache_file" 2> /dev/null; then
+        _ORADBA_CFG_TABLE=()
+        _ORADBA_CFG_SECTIONS=()
+        _ORADBA_CFG_SIG=()
+        _ORADBA_CFG_TOKEN=""
+        return 1
+    fi
+    _ORADBA_CFG_TOKEN="${header##*|}"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_config_cache_write
+# Purpose.: Write the compiled table as a sourceable cache file
+# Args....: $1 - Cache file path
+# Returns.: 0 on success, 1 if the file could not be written
+# ------------------------------------------------------------------------------
+_oradba_config_cache_write() {
+    local cache_file="$1"
+    local tmp="${cache_file}.$$"
+    local token="${EPOCHREALTIME:-${SECONDS}}.$$"
+    local key
+
+    mkdir -p "${cache_file%/*}" 2> /dev/null || return 1
+    if {
+        printf '# oradba config cache v1|%s\n' "${token}"
+        for key in "${!_ORADBA_CFG_SIG[@]}"; do
+            printf '_ORADBA_CFG_SIG[%q]=%q\n' "${key}" "${_ORADBA_CFG_SIG["${key}"]}"
+            printf '_ORADBA_CFG_SECTIONS[%q]=%q\n' "${key}" "${_ORADBA_CFG_SECTIONS["${key}"]:-}"
+        done
+        for key in "${!_ORADBA_CFG_TABLE[@]}"; do
+            printf '_ORADBA_CFG_TABLE[%q]=%q\n' "${key}" "${_ORADBA_CFG_TABLE["${key}"]}"
+        done
+    } > "${tmp}" 2> /dev/null && chmod 600 "${tmp}" 2> /dev/null \
+        && mv -f "${tmp}" "${cache_file}" 2> /dev/null; then
+        _ORADBA_CFG_TOKEN="${token}"
+        oradba_log DEBUG "Config cache written: ${cache_file} (${#_ORADBA_CFG_SIG[@]} files)"
+        return 0
+    fi
+    rm -f "${tmp}" 2> /dev/null
+    return 1
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_config_compile
+# Purpose.: Compile config files into the in-memory per-section table
+# Args....: $@ - Config file paths (optional, defaults to ${ORADBA_BASE}/etc/*.conf)
+# Returns.: 0 on success
+# Output..: None (fills _ORADBA_CFG_TABLE, _ORADBA_CFG_SECTIONS, _ORADBA_CFG_SIG)
+# Notes...: The table is kept in ${ORADBA_CACHE_DIR}/config_sections.cache as
+#           a sourceable fragment together with the stat signature of every
+#           compiled file. A shell sources the fragment once (or again after
+#           another shell rewrote it) and then only re-parses files that are
+#           not older than the fragment (builtin -ot tests, no forks; equal
+#           timestamps count as changed to cover coarse file system clocks).
+#           Signatures of files taken from a (re)loaded fragment are verified
+#           with a stat call once, and again after oradba_config_recheck (run
+#           by the change tracker's quick check when a file may have changed).
+#           Disable persistence with ORADBA_CONFIG_CACHE=false; files are then
+#           checked by signature on every call.
+# ------------------------------------------------------------------------------
+oradba_config_compile() {
+    local cache_dir cache_file="" header="" changed=false
+    local file sig
+    local -a files=("$@") stale=() check=()
+    local -A sigs=()
+
+    oradba_cache_dir cache_dir
+    if [[ ${#files[@]} -eq 0 ]]; then
+        for file in "${ORADBA_BASE}"/etc/*.conf; do
+            [[ -f "$file" ]] && files+=("$file")
+        done
+    fi
+
+    if [[ "${ORADBA_CONFIG_CACHE:-true}" == "true" ]] && [[ -n "${cache_dir}" ]]; then
+        cache_file="${cache_dir}/config_sections.cache"
+    fi
+
+    # Re-seed from the cache file unless this shell already holds its content
+    if [[ -n "${cache_file}" ]] && [[ -f "${cache_file}" ]]; then
+        read -r header < "${cache_file}" 2> /dev/null || header=""
+        if [[ "${header##*|}" != "${_ORADBA_CFG_TOKEN}" ]]; then
+            _oradba_config_cache_read "${cache_file}" || true
+        fi
+    fi
+
+    for file in ${files[@]+"${files[@]}"}; do
+        if [[ ! -f "$file" ]]; then
+            if [[ -n "${_ORADBA_CFG_SIG["${file}"]+set}" ]]; then
+                _oradba_config_drop "$file"
+                changed=true
+            fi
+            continue
+        fi
+        if [[ -z "${_ORADBA_CFG_SIG["${file}"]:-}" ]] \
+            || { [[ -n "${cache_file}" ]] && [[ ! "$file" -ot "${cache_file}" ]]; }; then
+            stale+=("$file")
+        elif [[ -z "${cache_file}" ]] || [[ -z "${_ORADBA_CFG_CHECKED["${file}"]:-}" ]]; then
+            check+=("$file")
+        fi
+    done
+
+    if [[ ${#stale[@]} -gt 0 ]] || [[ ${#check[@]} -gt 0 ]]; then
+        while IFS=$'\t' read -r file sig; do
+            [[ -n "$file" ]] && sigs["$file"]="$sig"
+        done < <(oradba_get_file_signatures ${stale[@]+"${stale[@]}"} ${check[@]+"${check[@]}"})
+
+        for file in ${check[@]+"${check[@]}"}; do
+            _ORADBA_CFG_CHECKED["$file"]=1
+            [[ "${sigs["$file"]:-}" != "${_ORADBA_CFG_SIG["$file"]}" ]] && stale+=("$file")
+        done
+        for file in ${stale[@]+"${stale[@]}"}; do
+            _oradba_config_parse "$file" || continue
+            _ORADBA_CFG_SIG["$file"]="${sigs["$file"]:-unknown}"
+            _ORADBA_CFG_CHECKED["$file"]=1
+            changed=true
+            oradba_log DEBUG "Compiled config file: ${file}"
+        done
+    fi
+
+    if [[ "${changed}" == "true" ]] && [[ -n "${cache_file}" ]]; then
+        if ! _oradba_config_cache_write "${cache_file}"; then
+            # Keep the in-shell table; stale files are re-parsed on every call
+            _ORADBA_CFG_TOKEN="${header##*|}"
+            oradba_log DEBUG "Config cache not writable: ${cache_file}"
+        fi
+    fi
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_config_recheck
+# Purpose.: Verify the signatures of all compiled files again on the next compile
+# Args....: None
+# Returns.: 0 always
+# Output..: None
+# ------------------------------------------------------------------------------
+oradba_config_recheck() {
+    _ORADBA_CFG_CHECKED=()
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_config_cache_clear
+# Purpose.: Drop the compiled config table and the persisted cache file
+# Args....: None
+# Returns.: 0 always
+# Output..: None
+# ------------------------------------------------------------------------------
+oradba_config_cache_clear() {
+    local cache_dir
+    oradba_cache_dir cache_dir
+
+    [[ -n "${cache_dir}" ]] && rm -f "${cache_dir}/config_sections.cache" 2> /dev/null
+    _ORADBA_CFG_TABLE=()
+    _ORADBA_CFG_SECTIONS=()
+    _ORADBA_CFG_SIG=()
+    _ORADBA_CFG_CHECKED=()
+    _ORADBA_CFG_TOKEN=""
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_apply_config_section
+# Purpose.: Apply configuration from a specific section in config file
+# Args....: $1 - Config file path
+#          $2 - Section name (DEFAULT|RDBMS|CLIENT|ICLIENT|GRID|ASM|DATASAFE|OUD|WLS)
+# Returns.: 0 on success, 1 if file not found
+# Notes...: Entries come from the compiled table (see oradba_config_compile),
+#           the file is only parsed again after it changed.
+# ------------------------------------------------------------------------------
+oradba_apply_config_section() {
+    local config_file="$1"
+    local section="$2"
+    
+    [[ ! -f "$config_file" ]] && return 1
+    
+    [[ "${ORADBA_DEBUG:-false}" == "true" ]] && echo "DEBUG: Loading config file: $config_file, section: $section" >&2
+    
+    oradba_config_compile "$config_file"
+    
+    # Local names are prefixed: evaluated config lines run in this scope
+    local _cfg_rest="${_ORADBA_CFG_TABLE["${config_file}|${section}"]:-}"
+    local _cfg_entry line
+    
+    [[ -n "$_cfg_rest" ]] && [[ "${ORADBA_DEBUG:-false}" == "true" ]] && echo "DEBUG: Entered section [$section]" >&2
+    
+    while [[ -n "$_cfg_rest" ]]; do
+        _cfg_entry="${_cfg_rest%%$'\n'*}"
+        _cfg_rest="${_cfg_rest#*$'\n'}"
+        line="${_cfg_entry:1}"
         
-        # Process lines in active section
-        if [[ $in_section -eq 1 ]]; then
-            [[ "${ORADBA_DEBUG:-false}" == "true" ]] && echo "DEBUG: Processing line in section: $line" >&2
-            
-            # Handle export PATH statements specially to prevent duplicates
-            if [[ "$line" =~ ^export[[:space:]]+PATH= ]]; then
+        [[ "${ORADBA_DEBUG:-false}" == "true" ]] && echo "DEBUG: Processing line in section: $line" >&2
+        
+        case "${_cfg_entry:0:1}" in
+            P)
+                # Handle export PATH statements specially to prevent duplicates
                 # Extract the PATH value (everything after PATH=)
                 local path_value="${line#*PATH=}"
-                
+            
                 # Remove any surrounding quotes
                 path_value="${path_value#\"}"
                 path_value="${path_value%\"}"
                 path_value="${path_value#\'}"
                 path_value="${path_value%\'}"
-                
+            
                 # Debug output
                 [[ "${ORADBA_DEBUG:-false}" == "true" ]] && echo "DEBUG: Processing PATH line: $line" >&2
                 [[ "${ORADBA_DEBUG:-false}" == "true" ]] && echo "DEBUG: path_value after quote removal: $path_value" >&2
-                
+            
                 # Check if it's prepending to ${PATH} or $PATH (match everything before it)
                 # Pattern: anything:${PATH} or anything:$PATH
                 if [[ "$path_value" =~ ^(.+):\$\{?PATH\}?$ ]]; then
                     # Extract just the new paths being prepended (everything before :${PATH})
                     local new_dirs="${BASH_REMATCH[1]}"
-                    
+                
                     [[ "${ORADBA_DEBUG:-false}" == "true" ]] && echo "DEBUG: new_dirs before expansion: $new_dirs" >&2
-                    
+                
                     # Expand any variables in new_dirs
                     new_dirs=$(eval "echo \"$new_dirs\"" 2>/dev/null)
-                    
+                
                     [[ "${ORADBA_DEBUG:-false}" == "true" ]] && echo "DEBUG: new_dirs after expansion: $new_dirs" >&2
                     [[ "${ORADBA_DEBUG:-false}" == "true" ]] && echo "DEBUG: Current PATH: $PATH" >&2
-                    
+                
                     # Split on colon and add each directory if not already in PATH
                     IFS=':' read -ra dir_array <<< "$new_dirs"
                     for dir in "${dir_array[@]}"; do
@@ -107,18 +377,17 @@ oradba_apply_config_section() {
                     # Fallback: evaluate the full expression (less common patterns)
                     eval "export PATH=$path_value" 2>/dev/null
                 fi
-            # Handle other export statements normally
-            elif [[ "$line" =~ ^export[[:space:]] ]]; then
+                ;;
+            E)
+                # Other export statements and aliases
                 eval "$line" 2>/dev/null
-            # Handle aliases
-            elif [[ "$line" =~ ^alias[[:space:]] ]]; then
-                eval "$line" 2>/dev/null
-            # Handle direct variable assignments
-            elif [[ "$line" =~ ^([A-Za-z_][A-Za-z0-9_]*)= ]]; then
+                ;;
+            X)
+                # Direct variable assignments
                 eval "export $line" 2>/dev/null
-            fi
-        fi
-    done < "$config_file"
+                ;;
+        esac
+    done
     
     return 0
 }
@@ -142,6 +411,9 @@ oradba_load_generic_configs() {
         "${config_dir}/oradba_customer.conf"
     )
     
+    # Check all files at once, then apply from the compiled table
+    oradba_config_compile "${config_files[@]}"
+    
     # Load each config file with specified section
     for config_file in "${config_files[@]}"; do
         if [[ -f "$config_file" ]]; then
@@ -166,6 +438,8 @@ oradba_load_sid_config() {
     
     [[ ! -f "$config_file" ]] && return 1
     
+    oradba_config_compile "$config_file"
+    
     # Apply DEFAULT section first
     oradba_apply_config_section "$config_file" "DEFAULT"
     
@@ -354,43 +628,28 @@ oradba_get_config_value() {
     
     [[ ! -f "$config_file" ]] && return 1
     
-    local in_section=0
+    oradba_config_compile "$config_file"
+    
+    local rest="${_ORADBA_CFG_TABLE["${config_file}|${section}"]:-}"
     local line
     
-    while IFS= read -r line; do
-        # Remove leading/trailing whitespace
-        line="${line##*([[:space:]])}"
-        line="${line%%*([[:space:]])}"
-        
-        # Skip empty lines and comments
-        [[ -z "$line" ]] && continue
-        [[ "$line" =~ ^# ]] && continue
+    # Look for variable in the compiled section
+    while [[ -n "$rest" ]]; do
+        line="${rest%%$'\n'*}"
+        line="${line:1}"
+        rest="${rest#*$'\n'}"
         
-        # Check for section headers
-        if [[ "$line" =~ ^\[([^]]+)\] ]]; then
-            local current_section="${BASH_REMATCH[1]}"
-            if [[ "$current_section" == "$section" ]]; then
-                in_section=1
-            else
-                in_section=0
-            fi
-            continue
+        if [[ "$line" =~ ^(export[[:space:]]+)?${var_name}=(.*)$ ]]; then
+            local value="${BASH_REMATCH[2]}"
+            # Remove quotes if present
+            value="${value#\"}"
+            value="${value%\"}"
+            value="${value#\'}"
+            value="${value%\'}"
+            echo "$value"
+            return 0
         fi
-        
-        # Look for variable in active section
-        if [[ $in_section -eq 1 ]]; then
-            if [[ "$line" =~ ^(export[[:space:]]+)?${var_name}=(.*)$ ]]; then
-                local value="${BASH_REMATCH[2]}"
-                # Remove quotes if present
-                value="${value#\"}"
-                value="${value%\"}"
-                value="${value#\'}"
-                value="${value%\'}"
-                echo "$value"
-                return 0
-            fi
-        fi
-    done < "$config_file"
+    done
     
     return 1
 }
@@ -0,0 +1,499 @@
+#!/usr/bin/env bash
+# ------------------------------------------------------------------------------
+# OraDBA - Oracle Database Infrastructure and Security, 5630 Muri, Switzerland
+# ------------------------------------------------------------------------------
+# Name.......: oradba_env_paths.sh
+# Author.....: Stefan Oehrli (oes) stefan.oehrli@oradba.ch
+# Editor.....: Stefan Oehrli
+# Date.......: 2026.02.11
+# Revision...: 0.21.0
+# Purpose....: Path-set engine for PATH, LD_LIBRARY_PATH, SQLPATH and friends
+# Notes......: Each path variable is held as an ordered sparse array plus an
+#              associative index (entry -> slot). Prepend, append, promote and
+#              remove are O(1); removal by prefix or pattern is a single scan.
+#              Entries are unique (first occurrence wins) and empty entries are
+#              dropped, matching oradba_dedupe_path.
+#
+#              Outside a session every operation writes the variable back
+#              immediately. Between oradba_pathset_begin and oradba_pathset_end
+#              changes are only held in memory and each variable is exported
+#              once by oradba_pathset_commit/oradba_pathset_end. Commit before
+#              sourcing foreign code (config files, hooks) that reads or
+#              modifies the variables; changes made outside the engine are
+#              picked up on the next operation and merged into pending ones.
+# Reference..: https://github.com/oehrlis/oradba
+# License....: Apache License Version 2.0, January 2004 as shown
+#              at http://www.apache.org/licenses/
+# ------------------------------------------------------------------------------
+
+# Prevent multiple sourcing
+[[ -n "${ORADBA_ENV_PATHS_LOADED:-}" ]] && return 0
+readonly ORADBA_ENV_PATHS_LOADED=1
+
+# Engine state (survives re-sourcing). Per variable VAR the entries live in
+# _ORADBA_PS_E_VAR (sparse indexed array, slot -> entry) and the index in
+# _ORADBA_PS_I_VAR (associative, entry -> slot). Functions bind them with
+# "local -n ref" followed by "ref=name" (an unset nameref takes the name).
+if ! declare -p _ORADBA_PS_SEEN &> /dev/null; then
+    declare -gA _ORADBA_PS_SEEN=()  # var -> value at last load/commit
+    declare -gA _ORADBA_PS_DIRTY=() # var -> 1 when not yet committed
+    declare -gA _ORADBA_PS_HEAD=()  # var -> lowest used slot
+    declare -gA _ORADBA_PS_TAIL=()  # var -> highest used slot
+    declare -g _ORADBA_PS_DEPTH=0   # nesting level of begin/end sessions
+fi
+
+# Loaded entries start in the middle of the slot range so prepends can count down
+readonly _ORADBA_PS_BASE_SLOT=1073741824
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_pathset_load
+# Purpose.: Load a colon-separated value into the engine state of a variable
+# Args....: $1 - Variable name
+#           $2 - Colon-separated value
+# Returns.: 0 on success
+# Output..: None
+# Notes...: Drops empty and duplicate entries (first occurrence wins)
+# ------------------------------------------------------------------------------
+_oradba_pathset_load() {
+    local _ps_var="$1"
+    local _ps_value="$2"
+    local _ps_slot=${_ORADBA_PS_BASE_SLOT}
+    local _ps_dir
+    local -a _ps_parts
+
+    unset "_ORADBA_PS_E_${_ps_var}" "_ORADBA_PS_I_${_ps_var}"
+    declare -ga "_ORADBA_PS_E_${_ps_var}"
+    declare -gA "_ORADBA_PS_I_${_ps_var}"
+    local -n _ps_e
+    _ps_e="_ORADBA_PS_E_${_ps_var}"
+    local -n _ps_i
+    _ps_i="_ORADBA_PS_I_${_ps_var}"
+
+    IFS=':' read -ra _ps_parts <<< "${_ps_value}"
+    for _ps_dir in "${_ps_parts[@]}"; do
+        [[ -z "${_ps_dir}" || -n "${_ps_i["${_ps_dir}"]+x}" ]] && continue
+        _ps_e[_ps_slot]="${_ps_dir}"
+        _ps_i["${_ps_dir}"]=${_ps_slot}
+        ((_ps_slot++))
+    done
+
+    _ORADBA_PS_HEAD[${_ps_var}]=${_ORADBA_PS_BASE_SLOT}
+    _ORADBA_PS_TAIL[${_ps_var}]=$((_ps_slot - 1))
+    _ORADBA_PS_SEEN[${_ps_var}]="${_ps_value}"
+    unset "_ORADBA_PS_DIRTY[${_ps_var}]"
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_pathset_attach
+# Purpose.: Make sure the engine state of a variable is current
+# Args....: $1 - Variable name
+# Returns.: 0 on success, 1 on invalid variable name
+# Output..: None
+# Notes...: Reloads the variable when it was changed outside the engine since
+#           the last load/commit. Pending changes are kept: the outside
+#           changes are merged into them (see _oradba_pathset_merge).
+# ------------------------------------------------------------------------------
+_oradba_pathset_attach() {
+    local _ps_var="$1"
+
+    if [[ ! "${_ps_var}" =~ ^[A-Za-z_][A-Za-z0-9_]*$ ]]; then
+        declare -F oradba_log > /dev/null && oradba_log ERROR "Invalid path variable name: ${_ps_var}"
+        return 1
+    fi
+
+    if [[ -n "${_ORADBA_PS_SEEN[${_ps_var}]+x}" ]] \
+        && [[ "${!_ps_var-}" == "${_ORADBA_PS_SEEN[${_ps_var}]}" ]]; then
+        return 0
+    fi
+    if [[ -n "${_ORADBA_PS_DIRTY[${_ps_var}]+x}" ]]; then
+        _oradba_pathset_merge "${_ps_var}" "${!_ps_var-}"
+        return 0
+    fi
+    _oradba_pathset_load "${_ps_var}" "${!_ps_var-}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_pathset_merge
+# Purpose.: Merge outside changes of a variable into its pending changes
+# Args....: $1 - Variable name
+#           $2 - Current value of the variable
+# Returns.: 0 on success
+# Output..: None
+# Notes...: Compares the value with the one at the last load/commit. Entries
+#           removed outside are removed, entries added outside are prepended
+#           (if they are in front of all known entries) or appended.
+# ------------------------------------------------------------------------------
+_oradba_pathset_merge() {
+    local _ps_var="$1"
+    local _ps_value="$2"
+    local _ps_dir _ps_known=false
+    local -a _ps_parts=() _ps_front=() _ps_back=() _ps_gone=()
+    local -A _ps_old=() _ps_new=()
+
+    IFS=':' read -ra _ps_parts <<< "${_ORADBA_PS_SEEN[${_ps_var}]}"
+    for _ps_dir in "${_ps_parts[@]}"; do
+        [[ -n "${_ps_dir}" ]] && _ps_old["${_ps_dir}"]=1
+    done
+    IFS=':' read -ra _ps_parts <<< "${_ps_value}"
+    for _ps_dir in "${_ps_parts[@]}"; do
+        [[ -z "${_ps_dir}" ]] && continue
+        _ps_new["${_ps_dir}"]=1
+        if [[ -n "${_ps_old["${_ps_dir}"]+x}" ]]; then
+            _ps_known=true
+        elif [[ "${_ps_known}" == "true" ]]; then
+            _ps_back+=("${_ps_dir}")
+        else
+            # prepend puts each entry in front of the previous one
+            _ps_front=("${_ps_dir}" ${_ps_front[@]+"${_ps_front[@]}"})
+        fi
+    done
+    for _ps_dir in "${!_ps_old[@]}"; do
+        [[ -z "${_ps_new["${_ps_dir}"]+x}" ]] && _ps_gone+=("${_ps_dir}")
+    done
+
+    declare -F oradba_log > /dev/null \
+        && oradba_log DEBUG "Merging outside changes of ${_ps_var} into pending path-set changes"
+    # The value counts as seen, so the operations below do not merge again
+    _ORADBA_PS_SEEN[${_ps_var}]="${_ps_value}"
+    oradba_pathset_remove "${_ps_var}" ${_ps_gone[@]+"${_ps_gone[@]}"}
+    oradba_pathset_prepend "${_ps_var}" ${_ps_front[@]+"${_ps_front[@]}"}
+    oradba_pathset_append "${_ps_var}" ${_ps_back[@]+"${_ps_back[@]}"}
+    _ORADBA_PS_DIRTY[${_ps_var}]=1
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_pathset_join
+# Purpose.: Join the engine entries of a variable without reloading it
+# Args....: $1 - Variable name
+#           $2 - Name of the variable receiving the colon-separated value
+# Returns.: 0 on success
+# Output..: None
+# ------------------------------------------------------------------------------
+_oradba_pathset_join() {
+    local -n _ps_e
+    _ps_e="_ORADBA_PS_E_$1"
+    local IFS=':'
+    printf -v "$2" '%s' "${_ps_e[*]}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_pathset_changed
+# Purpose.: Mark a variable as modified and write it back outside a session
+# Args....: $1 - Variable name
+# Returns.: 0 on success
+# Output..: None
+# ------------------------------------------------------------------------------
+_oradba_pathset_changed() {
+    _ORADBA_PS_DIRTY[$1]=1
+    ((_ORADBA_PS_DEPTH > 0)) && return 0
+    oradba_pathset_commit "$1"
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_pathset_begin
+# Purpose.: Start a path-set session
+# Args....: None
+# Returns.: 0 on success
+# Output..: None
+# Notes...: Sessions nest; only the outermost oradba_pathset_end commits
+# ------------------------------------------------------------------------------
+oradba_pathset_begin() {
+    _ORADBA_PS_DEPTH=$((_ORADBA_PS_DEPTH + 1))
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_pathset_end
+# Purpose.: End a path-set session, committing all pending variables
+# Args....: None
+# Returns.: 0 on success
+# Output..: Modified variables exported
+# ------------------------------------------------------------------------------
+oradba_pathset_end() {
+    ((_ORADBA_PS_DEPTH > 0)) && _ORADBA_PS_DEPTH=$((_ORADBA_PS_DEPTH - 1))
+    ((_ORADBA_PS_DEPTH > 0)) && return 0
+    oradba_pathset_commit
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_pathset_active
+# Purpose.: Check whether a path-set session is active
+# Args....: None
+# Returns.: 0 if a session is active, 1 otherwise
+# Output..: None
+# ------------------------------------------------------------------------------
+oradba_pathset_active() {
+    ((_ORADBA_PS_DEPTH > 0))
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_pathset_commit
+# Purpose.: Export pending path variables
+# Args....: $@ - Variable names (optional, default: all pending variables)
+# Returns.: 0 on success
+# Output..: Variables exported
+# Notes...: Call before sourcing code that reads the variables directly
+# ------------------------------------------------------------------------------
+oradba_pathset_commit() {
+    local _ps_var _ps_value
+    local -a _ps_vars=("$@")
+
+    [[ $# -eq 0 ]] && _ps_vars=("${!_ORADBA_PS_DIRTY[@]}")
+    for _ps_var in "${_ps_vars[@]}"; do
+        [[ -z "${_ORADBA_PS_DIRTY[${_ps_var}]+x}" ]] && continue
+        _oradba_pathset_join "${_ps_var}" _ps_value
+        export "${_ps_var}=${_ps_value}"
+        _ORADBA_PS_SEEN[${_ps_var}]="${_ps_value}"
+        unset "_ORADBA_PS_DIRTY[${_ps_var}]"
+    done
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_pathset_get
+# Purpose.: Get the current (possibly uncommitted) value of a path variable
+# Args....: $1 - Variable name
+#           $2 - Name of the variable receiving the value
+# Returns.: 0 on success, 1 on invalid variable name
+# Output..: None
+# ------------------------------------------------------------------------------
+oradba_pathset_get() {
+    _oradba_pathset_attach "$1" || return 1
+    _oradba_pathset_join "$1" "$2"
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_pathset_contains
+# Purpose.: Check whether a path variable contains an entry
+# Args....: $1 - Variable name
+#           $2 - Entry
+# Returns.: 0 if present, 1 otherwise
+# Output..: None
+# ------------------------------------------------------------------------------
+oradba_pathset_contains() {
+    _oradba_pathset_attach "$1" || return 1
+    local -n _ps_i
+    _ps_i="_ORADBA_PS_I_$1"
+    [[ -n "$2" && -n "${_ps_i["$2"]+x}" ]]
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_pathset_prepend
+# Purpose.: Prepend entries that are not yet present
+# Args....: $1 - Variable name
+#           $@ - Entries, each one put in front of the previous ones
+# Returns.: 0 on success, 1 on invalid variable name
+# Output..: None (variable exported outside a session)
+# Notes...: Existing entries keep their position, like
+#           [[ ":${PATH}:" != *":${dir}:"* ]] && PATH="${dir}:${PATH}"
+# ------------------------------------------------------------------------------
+oradba_pathset_prepend() {
+    local _ps_var="$1"
+    shift
+    _oradba_pathset_attach "${_ps_var}" || return 1
+    local -n _ps_e
+    _ps_e="_ORADBA_PS_E_${_ps_var}"
+    local -n _ps_i
+    _ps_i="_ORADBA_PS_I_${_ps_var}"
+    local _ps_dir _ps_slot=${_ORADBA_PS_HEAD[${_ps_var}]}
+
+    for _ps_dir in "$@"; do
+        [[ -z "${_ps_dir}" || -n "${_ps_i["${_ps_dir}"]+x}" ]] && continue
+        ((_ps_slot--))
+        _ps_e[_ps_slot]="${_ps_dir}"
+        _ps_i["${_ps_dir}"]=${_ps_slot}
+    done
+    [[ ${_ps_slot} -eq ${_ORADBA_PS_HEAD[${_ps_var}]} ]] && return 0
+    _ORADBA_PS_HEAD[${_ps_var}]=${_ps_slot}
+    _oradba_pathset_changed "${_ps_var}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_pathset_promote
+# Purpose.: Move entries to the front, adding them when missing
+# Args....: $1 - Variable name
+#           $@ - Entries, each one put in front of the previous ones
+# Returns.: 0 on success, 1 on invalid variable name
+# Output..: None (variable exported outside a session)
+# Notes...: Same result as PATH="${dir}:${PATH}" followed by a dedupe
+# ------------------------------------------------------------------------------
+oradba_pathset_promote() {
+    local _ps_var="$1"
+    shift
+    _oradba_pathset_attach "${_ps_var}" || return 1
+    local -n _ps_e
+    _ps_e="_ORADBA_PS_E_${_ps_var}"
+    local -n _ps_i
+    _ps_i="_ORADBA_PS_I_${_ps_var}"
+    local _ps_dir _ps_slot=${_ORADBA_PS_HEAD[${_ps_var}]}
+
+    for _ps_dir in "$@"; do
+        [[ -z "${_ps_dir}" ]] && continue
+        if [[ -n "${_ps_i["${_ps_dir}"]+x}" ]]; then
+            [[ ${_ps_i["${_ps_dir}"]} -eq ${_ps_slot} ]] && continue
+            unset "_ps_e[${_ps_i["${_ps_dir}"]}]"
+        fi
+        ((_ps_slot--))
+        _ps_e[_ps_slot]="${_ps_dir}"
+        _ps_i["${_ps_dir}"]=${_ps_slot}
+    done
+    [[ ${_ps_slot} -eq ${_ORADBA_PS_HEAD[${_ps_var}]} ]] && return 0
+    _ORADBA_PS_HEAD[${_ps_var}]=${_ps_slot}
+    _oradba_pathset_changed "${_ps_var}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_pathset_append
+# Purpose.: Append entries that are not yet present
+# Args....: $1 - Variable name
+#           $@ - Entries, appended in order
+# Returns.: 0 on success, 1 on invalid variable name
+# Output..: None (variable exported outside a session)
+# ------------------------------------------------------------------------------
+oradba_pathset_append() {
+    local _ps_var="$1"
+    shift
+    _oradba_pathset_attach "${_ps_var}" || return 1
+    local -n _ps_e
+    _ps_e="_ORADBA_PS_E_${_ps_var}"
+    local -n _ps_i
+    _ps_i="_ORADBA_PS_I_${_ps_var}"
+    local _ps_dir _ps_slot=${_ORADBA_PS_TAIL[${_ps_var}]}
+
+    for _ps_dir in "$@"; do
+        [[ -z "${_ps_dir}" || -n "${_ps_i["${_ps_dir}"]+x}" ]] && continue
+        ((_ps_slot++))
+        _ps_e[_ps_slot]="${_ps_dir}"
+        _ps_i["${_ps_dir}"]=${_ps_slot}
+    done
+    [[ ${_ps_slot} -eq ${_ORADBA_PS_TAIL[${_ps_var}]} ]] && return 0
+    _ORADBA_PS_TAIL[${_ps_var}]=${_ps_slot}
+    _oradba_pathset_changed "${_ps_var}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_pathset_remove
+# Purpose.: Remove entries
+# Args....: $1 - Variable name
+#           $@ - Entries to remove
+# Returns.: 0 on success, 1 on invalid variable name
+# Output..: None (variable exported outside a session)
+# ------------------------------------------------------------------------------
+oradba_pathset_remove() {
+    local _ps_var="$1"
+    shift
+    _oradba_pathset_attach "${_ps_var}" || return 1
+    local -n _ps_e
+    _ps_e="_ORADBA_PS_E_${_ps_var}"
+    local -n _ps_i
+    _ps_i="_ORADBA_PS_I_${_ps_var}"
+    local _ps_dir _ps_count=${#_ps_i[@]}
+
+    for _ps_dir in "$@"; do
+        [[ -z "${_ps_dir}" || -z "${_ps_i["${_ps_dir}"]+x}" ]] && continue
+        unset "_ps_e[${_ps_i["${_ps_dir}"]}]" "_ps_i[${_ps_dir}]"
+    done
+    [[ ${#_ps_i[@]} -eq ${_ps_count} ]] && return 0
+    _oradba_pathset_changed "${_ps_var}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_pathset_remove_prefix
+# Purpose.: Remove all entries starting with a prefix
+# Args....: $1 - Variable name
+#           $2 - Prefix (e.g. an old ORACLE_HOME)
+# Returns.: 0 on success, 1 on invalid variable name
+# Output..: None (variable exported outside a session)
+# ------------------------------------------------------------------------------
+oradba_pathset_remove_prefix() {
+    local _ps_var="$1"
+    local _ps_prefix="$2"
+    _oradba_pathset_attach "${_ps_var}" || return 1
+    local -n _ps_e
+    _ps_e="_ORADBA_PS_E_${_ps_var}"
+    local -n _ps_i
+    _ps_i="_ORADBA_PS_I_${_ps_var}"
+    local _ps_slot _ps_dir _ps_count=${#_ps_i[@]}
+
+    if [[ -n "${_ps_prefix}" ]]; then
+        for _ps_slot in "${!_ps_e[@]}"; do
+            _ps_dir="${_ps_e[_ps_slot]}"
+            [[ "${_ps_dir}" == "${_ps_prefix}"* ]] || continue
+            unset "_ps_e[${_ps_slot}]" "_ps_i[${_ps_dir}]"
+        done
+    fi
+    [[ ${#_ps_i[@]} -eq ${_ps_count} ]] && return 0
+    _oradba_pathset_changed "${_ps_var}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_pathset_remove_match
+# Purpose.: Remove all entries matching an extended regular expression
+# Args....: $1 - Variable name
+#           $2 - Regular expression (bash =~ syntax)
+#           $@ - Entries to keep even if they match (optional)
+# Returns.: 0 on success, 1 on invalid variable name
+# Output..: None (variable exported outside a session)
+# Notes...: Example: oradba_pathset_remove_match PATH '/oracle/|/grid/'
+# ------------------------------------------------------------------------------
+oradba_pathset_remove_match() {
+    local _ps_var="$1"
+    local _ps_regex="$2"
+    shift 2
+    _oradba_pathset_attach "${_ps_var}" || return 1
+    local -n _ps_e
+    _ps_e="_ORADBA_PS_E_${_ps_var}"
+    local -n _ps_i
+    _ps_i="_ORADBA_PS_I_${_ps_var}"
+    local _ps_slot _ps_dir _ps_keep _ps_count=${#_ps_i[@]}
+
+    for _ps_slot in "${!_ps_e[@]}"; do
+        _ps_dir="${_ps_e[_ps_slot]}"
+        [[ "${_ps_dir}" =~ ${_ps_regex} ]] || continue
+        for _ps_keep in "$@"; do
+            [[ "${_ps_dir}" == "${_ps_keep}" ]] && continue 2
+        done
+        unset "_ps_e[${_ps_slot}]" "_ps_i[${_ps_dir}]"
+    done
+    [[ ${#_ps_i[@]} -eq ${_ps_count} ]] && return 0
+    _oradba_pathset_changed "${_ps_var}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_pathset_dedupe
+# Purpose.: Deduplicate path variables (keep first occurrence)
+# Args....: $@ - Variable names; unset or empty variables are left alone
+# Returns.: 0 on success, 1 on invalid variable name
+# Output..: None (variables exported outside a session)
+# ------------------------------------------------------------------------------
+oradba_pathset_dedupe() {
+    local _ps_var _ps_value
+    for _ps_var in "$@"; do
+        # Leave empty variables alone unless they have pending changes
+        [[ -z "${!_ps_var:-}" && -z "${_ORADBA_PS_DIRTY[${_ps_var}]+x}" ]] && continue
+        _oradba_pathset_attach "${_ps_var}" || return 1
+        _oradba_pathset_join "${_ps_var}" _ps_value
+        [[ "${_ps_value}" == "${!_ps_var-}" && -z "${_ORADBA_PS_DIRTY[${_ps_var}]+x}" ]] && continue
+        _oradba_pathset_changed "${_ps_var}"
+    done
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_dedupe_path
+# Purpose.: Remove duplicate entries from PATH-like variables
+# Args....: $1 - Path string (colon-separated)
+# Returns.: Deduplicated path string
+# Notes...: String interface to the path-set engine, e.g. for values that are
+#           not held in a variable. Prefer oradba_pathset_dedupe VAR (no
+#           command substitution).
+# ------------------------------------------------------------------------------
+oradba_dedupe_path() {
+    local input_path="$1"
+    local result
+    [[ -z "${input_path}" ]] && return 0
+    _oradba_pathset_load _ORADBA_PS_STRING "${input_path}"
+    _oradba_pathset_join _ORADBA_PS_STRING result
+    echo "${result}"
+}
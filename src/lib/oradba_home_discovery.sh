@@ -331,6 +331,393 @@ get_oracle_home_type() {
     printf '%s\n' "${_r%% *}"  # field 3
 }
 
+# ------------------------------------------------------------------------------
+# Product Detection Cache
+# ------------------------------------------------------------------------------
+# One line per ORACLE_HOME in ${ORADBA_CACHE_DIR}/home_detect.cache:
+#   home<TAB>signature<TAB>product_type<TAB>version_state<TAB>version
+# The signature is "markers;metadata". The marker bitmap covers every test
+# made by detect_product_type and is computed with builtins, so a product
+# type hit forks nothing. The metadata part (inode/mtime/size of the home,
+# bin, lib, the main binaries and the inventory) needs one stat call and is
+# only checked for cached versions, so relinks, patching and re-installs
+# invalidate them. The file is loaded once per shell and rewritten without
+# stale lines whenever an entry is replaced.
+declare -gA _ORADBA_DETECT_SIG=()
+declare -gA _ORADBA_DETECT_TYPE=()
+declare -gA _ORADBA_DETECT_VSTATE=()
+declare -gA _ORADBA_DETECT_VERSION=()
+: "${_ORADBA_DETECT_HITS:=0}"
+: "${_ORADBA_DETECT_MISSES:=0}"
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_detect_cache_enabled
+# Purpose.: Check whether the detection cache is enabled and resolve its file
+# Args....: None
+# Returns.: 0 if enabled (sets _ORADBA_DETECT_CACHE_FILE), 1 otherwise
+# Notes...: Disable with ORADBA_DETECT_CACHE=false
+# ------------------------------------------------------------------------------
+_oradba_detect_cache_enabled() {
+    [[ "${ORADBA_DETECT_CACHE:-true}" != "true" ]] && return 1
+
+    local cache_dir
+    oradba_cache_dir cache_dir
+    [[ -z "${cache_dir}" ]] && return 1
+
+    _ORADBA_DETECT_CACHE_FILE="${cache_dir}/home_detect.cache"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_detect_cache_read
+# Purpose.: Load the detection cache file into the in-shell tables
+# Args....: None
+# Returns.: 0 on success, 1 if no cache file
+# Notes...: Later lines win, so concurrently appended entries override older
+#           ones. Use oradba_detect_cache_preload to read it only once.
+# ------------------------------------------------------------------------------
+_oradba_detect_cache_read() {
+    _ORADBA_DETECT_CACHE_LOADED="${_ORADBA_DETECT_CACHE_FILE}"
+    [[ -r "${_ORADBA_DETECT_CACHE_FILE}" ]] || return 1
+
+    local home sig ptype vstate version
+    while IFS=$'\t' read -r home sig ptype vstate version; do
+        [[ -z "${home}" ]] && continue
+        _ORADBA_DETECT_SIG["${home}"]="${sig}"
+        _ORADBA_DETECT_TYPE["${home}"]="${ptype}"
+        _ORADBA_DETECT_VSTATE["${home}"]="${vstate}"
+        _ORADBA_DETECT_VERSION["${home}"]="${version}"
+    done < "${_ORADBA_DETECT_CACHE_FILE}"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_detect_cache_preload
+# Purpose.: Load the detection cache into the current shell once
+# Args....: None
+# Returns.: 0 always
+# Output..: None
+# Notes...: Call before loops that run detect_product_type in command
+#           substitutions, so the subshells inherit the tables instead of
+#           reading the cache file on every call
+# ------------------------------------------------------------------------------
+oradba_detect_cache_preload() {
+    _oradba_detect_cache_enabled || return 0
+    [[ "${_ORADBA_DETECT_CACHE_LOADED:-}" == "${_ORADBA_DETECT_CACHE_FILE}" ]] && return 0
+    _oradba_detect_cache_read || true
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_home_markers
+# Purpose.: Compute the marker bitmap of an ORACLE_HOME
+# Args....: $1 - ORACLE_HOME path
+#           $2 - Name of the variable to receive the bitmap
+# Returns.: 0 always
+# Output..: None
+# Notes...: Builtins only. Mirrors the tests of detect_product_type (file
+#           kind, executable bit, client library globs, JDK parent), so an
+#           unchanged bitmap means an unchanged product type.
+# ------------------------------------------------------------------------------
+_oradba_home_markers() {
+    local oracle_home="$1"
+    local marker _bits=""
+
+    for marker in x:bin/java f:bin/sqlplus f:bin/oracle f:oud/lib/ldapjdk.jar \
+        f:wlserver/server/lib/weblogic.jar f:sysman/lib/emoms.jar f:agent_inst/bin/emctl \
+        d:oracle_cman_home x:oracle_cman_home/bin/cmctl f:connector.conf f:setup.py \
+        f:libclntsh.so f:libclntsh.dylib d:bin d:lib d:lib64 \
+        e:inventory/ContentsXML/comps.xml e:OPatch/opatch; do
+        if test "-${marker%%:*}" "${oracle_home}/${marker#*:}"; then
+            _bits+="1"
+        else
+            _bits+="0"
+        fi
+    done
+    for marker in "${oracle_home}/libclntsh.so.*" "${oracle_home}/lib*/libclntsh*"; do
+        if compgen -G "${marker}" > /dev/null; then
+            _bits+="1"
+        else
+            _bits+="0"
+        fi
+    done
+    if [[ -x "${oracle_home%/*}/bin/javac" ]]; then
+        _bits+="1"
+    else
+        _bits+="0"
+    fi
+
+    printf -v "$2" '%s' "${_bits}"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_home_signature
+# Purpose.: Compute the detection signature of an ORACLE_HOME
+# Args....: $1 - ORACLE_HOME path
+# Returns.: 0 on success, 1 if the home does not exist
+# Output..: Signature string (marker bitmap;inode:mtime:size list)
+# Notes...: Marker bitmap uses builtins; metadata needs one stat call
+# ------------------------------------------------------------------------------
+oradba_home_signature() {
+    local oracle_home="$1"
+    [[ -d "${oracle_home}" ]] || return 1
+
+    local marker bitmap
+    _oradba_home_markers "${oracle_home}" bitmap
+
+    local -a stat_paths=("${oracle_home}")
+    for marker in bin lib bin/oracle bin/sqlplus inventory/ContentsXML/comps.xml; do
+        [[ -e "${oracle_home}/${marker}" ]] && stat_paths+=("${oracle_home}/${marker}")
+    done
+
+    local meta
+    if [[ "${OSTYPE:-}" == darwin* ]]; then
+        meta=$(stat -L -f '%i:%m:%z' "${stat_paths[@]}" 2> /dev/null)
+    else
+        meta=$(stat -L -c '%i:%Y:%s' "${stat_paths[@]}" 2> /dev/null)
+    fi
+
+    echo "${bitmap};${meta//$'\n'/,}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_detect_type_lookup
+# Purpose.: Look up a cached product type for an ORACLE_HOME
+# Args....: $1 - ORACLE_HOME path
+# Returns.: 0 on hit, 1 on miss
+# Notes...: Builtins only: validates the entry by its marker bitmap. Counts
+#           hits and misses in _ORADBA_DETECT_HITS/_MISSES (current shell only).
+# ------------------------------------------------------------------------------
+_oradba_detect_type_lookup() {
+    local oracle_home="$1"
+    local bitmap sig
+
+    oradba_detect_cache_preload
+    sig="${_ORADBA_DETECT_SIG[${oracle_home}]:-}"
+    if [[ -n "${_ORADBA_DETECT_TYPE[${oracle_home}]:-}" ]] && [[ -n "${sig}" ]]; then
+        _oradba_home_markers "${oracle_home}" bitmap
+        if [[ "${sig%%;*}" == "${bitmap}" ]]; then
+            _ORADBA_DETECT_HITS=$((_ORADBA_DETECT_HITS + 1))
+            return 0
+        fi
+    fi
+
+    _ORADBA_DETECT_MISSES=$((_ORADBA_DETECT_MISSES + 1))
+    return 1
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_detect_cache_lookup
+# Purpose.: Look up a valid detection cache entry for an ORACLE_HOME
+# Args....: $1 - ORACLE_HOME path
+# Returns.: 0 on hit, 1 on miss (sets _ORADBA_DETECT_CURRENT_SIG either way)
+# Notes...: Compares the full signature (one stat call). Counts hits and
+#           misses in _ORADBA_DETECT_HITS/_MISSES (current shell only).
+# ------------------------------------------------------------------------------
+_oradba_detect_cache_lookup() {
+    local oracle_home="$1"
+
+    _ORADBA_DETECT_CURRENT_SIG=$(oradba_home_signature "${oracle_home}") || return 1
+    oradba_detect_cache_preload
+
+    if [[ -n "${_ORADBA_DETECT_TYPE[${oracle_home}]:-}" ]] \
+        && [[ "${_ORADBA_DETECT_SIG[${oracle_home}]:-}" == "${_ORADBA_DETECT_CURRENT_SIG}" ]]; then
+        _ORADBA_DETECT_HITS=$((_ORADBA_DETECT_HITS + 1))
+        return 0
+    fi
+
+    _ORADBA_DETECT_MISSES=$((_ORADBA_DETECT_MISSES + 1))
+    return 1
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_detect_cache_write
+# Purpose.: Rewrite the cache file from the in-shell tables
+# Args....: None
+# Returns.: 0 on success, 1 if the file cannot be written
+# Output..: None
+# ------------------------------------------------------------------------------
+_oradba_detect_cache_write() {
+    local home tmp_file="${_ORADBA_DETECT_CACHE_FILE}.$$"
+
+    if {
+        for home in "${!_ORADBA_DETECT_TYPE[@]}"; do
+            printf '%s\t%s\t%s\t%s\t%s\n' "${home}" "${_ORADBA_DETECT_SIG[${home}]}" \
+                "${_ORADBA_DETECT_TYPE[${home}]}" "${_ORADBA_DETECT_VSTATE[${home}]}" \
+                "${_ORADBA_DETECT_VERSION[${home}]}"
+        done
+    } > "${tmp_file}" 2> /dev/null && mv -f "${tmp_file}" "${_ORADBA_DETECT_CACHE_FILE}" 2> /dev/null; then
+        return 0
+    fi
+    rm -f "${tmp_file}" 2> /dev/null
+    return 1
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_detect_cache_store
+# Purpose.: Record a detection result in memory and in the cache file
+# Args....: $1 - ORACLE_HOME path
+#           $2 - Signature
+#           $3 - Product type
+#           $4 - Version state (empty = not detected yet, ok, none)
+#           $5 - Version (XXYZ)
+# Returns.: 0 always (cache write failures are ignored)
+# Notes...: New homes are appended; replacing an entry rewrites the file, so
+#           it holds one line per home and does not grow with every relink
+# ------------------------------------------------------------------------------
+_oradba_detect_cache_store() {
+    local oracle_home="$1" sig="$2" ptype="$3" vstate="${4:-}" version="${5:-}"
+    local replace=false
+
+    [[ -z "${sig}" ]] && return 0
+    oradba_detect_cache_preload
+    [[ -n "${_ORADBA_DETECT_TYPE[${oracle_home}]+set}" ]] && replace=true
+    _ORADBA_DETECT_SIG["${oracle_home}"]="${sig}"
+    _ORADBA_DETECT_TYPE["${oracle_home}"]="${ptype}"
+    _ORADBA_DETECT_VSTATE["${oracle_home}"]="${vstate}"
+    _ORADBA_DETECT_VERSION["${oracle_home}"]="${version}"
+
+    mkdir -p "${_ORADBA_DETECT_CACHE_FILE%/*}" 2> /dev/null || return 0
+    if [[ "${replace}" == "true" ]]; then
+        _oradba_detect_cache_write || true
+    else
+        printf '%s\t%s\t%s\t%s\t%s\n' "${oracle_home}" "${sig}" "${ptype}" "${vstate}" "${version}" \
+            >> "${_ORADBA_DETECT_CACHE_FILE}" 2> /dev/null
+    fi
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_detect_cache_invalidate
+# Purpose.: Drop cached detection results
+# Args....: $1 - ORACLE_HOME path (optional, default: all homes)
+# Returns.: 0 always
+# Notes...: Rewrites the cache file without the given home (compacting it)
+# ------------------------------------------------------------------------------
+oradba_detect_cache_invalidate() {
+    local target="${1:-}"
+
+    _oradba_detect_cache_enabled || return 0
+
+    if [[ -z "${target}" ]]; then
+        rm -f "${_ORADBA_DETECT_CACHE_FILE}" 2> /dev/null
+        _ORADBA_DETECT_SIG=()
+        _ORADBA_DETECT_TYPE=()
+        _ORADBA_DETECT_VSTATE=()
+        _ORADBA_DETECT_VERSION=()
+        oradba_log DEBUG "Detection cache cleared: ${_ORADBA_DETECT_CACHE_FILE}"
+        return 0
+    fi
+
+    _oradba_detect_cache_read || return 0
+    unset '_ORADBA_DETECT_SIG[$target]' '_ORADBA_DETECT_TYPE[$target]' \
+        '_ORADBA_DETECT_VSTATE[$target]' '_ORADBA_DETECT_VERSION[$target]'
+
+    _oradba_detect_cache_write || true
+    oradba_log DEBUG "Detection cache entry removed: ${target}"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_detect_cache_stats
+# Purpose.: Report detection cache usage
+# Args....: None
+# Returns.: 0 always
+# Output..: key=value lines (file, entries)
+# Notes...: Hit/miss counters are not reported: they live in the calling
+#           shell and are lost in every subshell, so a per-process count says
+#           nothing about the cache. Callers validate entries themselves.
+# ------------------------------------------------------------------------------
+oradba_detect_cache_stats() {
+    local entries=0
+
+    if _oradba_detect_cache_enabled; then
+        _oradba_detect_cache_read || true
+        entries=${#_ORADBA_DETECT_TYPE[@]}
+        echo "file=${_ORADBA_DETECT_CACHE_FILE}"
+    else
+        echo "file=disabled"
+    fi
+    echo "entries=${entries}"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_detect_product_type_cached
+# Purpose.: Cached front-end for detect_product_type
+# Args....: $1 - ORACLE_HOME path
+# Returns.: 0 on success, 1 if type is unknown
+# Output..: Product type
+# ------------------------------------------------------------------------------
+_oradba_detect_product_type_cached() {
+    local oracle_home="$1"
+
+    if _oradba_detect_type_lookup "${oracle_home}"; then
+        echo "${_ORADBA_DETECT_TYPE[${oracle_home}]}"
+        [[ "${_ORADBA_DETECT_TYPE[${oracle_home}]}" == "unknown" ]] && return 1
+        return 0
+    fi
+
+    local sig ptype rc
+    sig=$(oradba_home_signature "${oracle_home}") || sig=""
+    ptype=$(ORADBA_DETECT_CACHE=false detect_product_type "${oracle_home}")
+    rc=$?
+    _oradba_detect_cache_store "${oracle_home}" "${sig}" "${ptype}"
+    echo "${ptype}"
+    return ${rc}
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_detect_oracle_version_cached
+# Purpose.: Cached front-end for detect_oracle_version
+# Args....: $1 - ORACLE_HOME path
+#           $2 - Product type (optional)
+# Returns.: 0 on success, 1 if no version detected
+# Output..: Oracle version in format XXYZ
+# Notes...: Failed detections are cached too, so a home without a usable
+#           sqlplus is not probed again until its signature changes
+# ------------------------------------------------------------------------------
+_oradba_detect_oracle_version_cached() {
+    local oracle_home="$1"
+    local product_type="${2:-}"
+
+    # Product type populates the cache entry for this home if needed
+    local detected_type
+    detected_type=$(detect_product_type "${oracle_home}")
+    [[ -z "${product_type}" ]] && product_type="${detected_type}"
+
+    # Only the version of the detected product type is cached
+    if [[ "${product_type}" != "${detected_type}" ]]; then
+        ORADBA_DETECT_CACHE=false detect_oracle_version "${oracle_home}" "${product_type}"
+        return $?
+    fi
+
+    if _oradba_detect_cache_lookup "${oracle_home}"; then
+        case "${_ORADBA_DETECT_VSTATE[${oracle_home}]:-}" in
+            ok)
+                echo "${_ORADBA_DETECT_VERSION[${oracle_home}]}"
+                return 0
+                ;;
+            none)
+                return 1
+                ;;
+        esac
+    fi
+
+    local sig="${_ORADBA_DETECT_CURRENT_SIG:-}"
+    local version
+    if version=$(ORADBA_DETECT_CACHE=false detect_oracle_version "${oracle_home}" "${product_type}") \
+        && [[ -n "${version}" ]]; then
+        _oradba_detect_cache_store "${oracle_home}" "${sig}" "${detected_type}" "ok" "${version}"
+        echo "${version}"
+        return 0
+    fi
+
+    _oradba_detect_cache_store "${oracle_home}" "${sig}" "${detected_type}" "none" ""
+    return 1
+}
+
 # ------------------------------------------------------------------------------
 # Function: detect_product_type
 # Purpose.: Detect Oracle product type from ORACLE_HOME path
@@ -338,7 +725,9 @@ get_oracle_home_type() {
 # Returns.: 0 on success, 1 if unable to detect
 # Output..: Product type: database, client, iclient, java, oud, weblogic, oms,
 #           emagent, datasafe, or unknown
-# Notes...: Checks for specific files/directories to identify product type
+# Notes...: Checks for specific files/directories to identify product type.
+#           Served from the per-home detection cache while the home's
+#           signature is unchanged (see oradba_home_signature)
 # ------------------------------------------------------------------------------
 detect_product_type() {
     local oracle_home="$1"
@@ -346,6 +735,12 @@ detect_product_type() {
     [[ -z "${oracle_home}" ]] && echo "unknown" && return 1
     [[ ! -d "${oracle_home}" ]] && echo "unknown" && return 1
 
+    if [[ "${ORADBA_DETECT_CACHE:-true}" == "true" ]] && type -t _oradba_detect_cache_enabled &> /dev/null \
+        && _oradba_detect_cache_enabled; then
+        _oradba_detect_product_type_cached "${oracle_home}"
+        return $?
+    fi
+
     # Check for Java/JDK installations (standalone, not embedded in DB/client)
     if [[ -x "${oracle_home}/bin/java" ]]; then
         # Check if it's ONLY Java (not a database or client with Java embedded)
@@ -461,6 +856,7 @@ detect_product_type() {
 # Notes...: Delegates to product plugin if available, otherwise uses fallback methods
 #           Plugin detection via plugin_get_version() (returns X.Y.Z.W format)
 #           Fallback methods: sqlplus, OPatch, inventory XML, path parsing
+#           Results (including failures) are kept in the detection cache
 # ------------------------------------------------------------------------------
 detect_oracle_version() {
     local oracle_home="$1"
@@ -470,6 +866,12 @@ detect_oracle_version() {
     [[ -z "${oracle_home}" ]] && return 1
     [[ ! -d "${oracle_home}" ]] && return 1
 
+    if [[ "${ORADBA_DETECT_CACHE:-true}" == "true" ]] && type -t _oradba_detect_cache_enabled &> /dev/null \
+        && _oradba_detect_cache_enabled; then
+        _oradba_detect_oracle_version_cached "${oracle_home}" "${product_type}"
+        return $?
+    fi
+
     # Auto-detect product type if not provided
     if [[ -z "${product_type}" ]]; then
         product_type=$(detect_product_type "${oracle_home}")
@@ -696,13 +1098,295 @@ is_bundled_component() {
     esac
 }
 
+# ------------------------------------------------------------------------------
+# Discovery Engine
+# ------------------------------------------------------------------------------
+# auto_discover_oracle_homes walks the discovery paths level by level. Oracle
+# Home subtrees are pruned as soon as the home is validated, candidates of a
+# level are classified by a bounded pool of background workers
+# (ORADBA_DISCOVERY_JOBS) and the classification of every directory is kept in
+# ${ORADBA_CACHE_DIR}/discovery.state. Later runs only re-classify directories
+# that changed since the previous scan (ORADBA_DISCOVERY_STATE=false disables).
+
+# Directories (relative to a candidate) whose mtime invalidates its state entry
+_ORADBA_DISCOVERY_WATCH=("" "/bin" "/lib" "/oracle_cman_home/bin" "/oud/lib")
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_discovery_now_ms
+# Purpose.: Current time in milliseconds without forking
+# Args....: None
+# Returns.: 0 always
+# Output..: Milliseconds since epoch
+# Notes...: Uses EPOCHREALTIME (bash 5+), falls back to date in seconds
+# ------------------------------------------------------------------------------
+_oradba_discovery_now_ms() {
+    if [[ -n "${EPOCHREALTIME:-}" ]]; then
+        local usec="${EPOCHREALTIME/[.,]/}"
+        echo "$((10#${usec} / 1000))"
+    else
+        echo "$(($(date +%s) * 1000))"
+    fi
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_discovery_unchanged
+# Purpose.: Check whether a directory is unchanged since the last discovery scan
+# Args....: $1 - Directory
+#           $2 - Discovery state file (mtime = start of previous scan)
+# Returns.: 0 if unchanged, 1 if the directory or a watched subdirectory is newer
+# Output..: None
+# Notes...: Builtin tests only; missing subdirectories never count as changed
+# ------------------------------------------------------------------------------
+_oradba_discovery_unchanged() {
+    local dir="$1"
+    local ref="$2"
+    local sub
+
+    for sub in "${_ORADBA_DISCOVERY_WATCH[@]}"; do
+        [[ "${dir}${sub}" -nt "${ref}" ]] && return 1
+    done
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_discovery_classify
+# Purpose.: Classify a single candidate directory
+# Args....: $1 - Directory
+# Returns.: 0 always
+# Output..: Product type of a validated home, "invalid:<type>" if the plugin
+#           rejected it, or "none" if it is not an Oracle Home
+# Notes...: Plugins are sourced in a subshell so that plugin_validate_home of
+#           one product never leaks into the validation of another
+# ------------------------------------------------------------------------------
+_oradba_discovery_classify() {
+    local dir="$1"
+    local ptype
+
+    ptype=$(detect_product_type "${dir}") || true
+    if [[ -z "${ptype}" ]] || [[ "${ptype}" == "unknown" ]]; then
+        echo "none"
+        return 0
+    fi
+
+    local plugin_file="${ORADBA_BASE}/lib/plugins/${ptype}_plugin.sh"
+    if [[ -f "${plugin_file}" ]]; then
+        if (
+            # shellcheck source=/dev/null
+            source "${plugin_file}" 2> /dev/null || true
+            # No validation function - accept based on detect_product_type
+            declare -f plugin_validate_home > /dev/null 2>&1 || exit 0
+            plugin_validate_home "${dir}" 2> /dev/null
+        ); then
+            echo "${ptype}"
+        else
+            echo "invalid:${ptype}"
+        fi
+        return 0
+    fi
+
+    # No plugin - accept based on detect_product_type (backward compatible)
+    echo "${ptype}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_discovery_walk
+# Purpose.: Pruned, parallel and incremental walk over the discovery paths
+# Args....: $1 - Discovery paths (space-separated)
+#           $2 - Rescan mode: "incremental" (default) or "full" (ignore state)
+# Returns.: 0 always
+# Output..: One "<dir><TAB><product_type>" line per validated Oracle Home in
+#           walk order, followed by a "#stats" line:
+#           #stats<TAB>scanned<TAB>reused<TAB>classified<TAB>pruned<TAB>jobs<TAB>classify_ms<TAB>total_ms
+# Notes...: Descends at most 3 levels below each discovery path, does not
+#           follow symbolic links and never descends into a validated home.
+#           Each level is listed with a single find call and sorted, so the
+#           order of discovered homes is deterministic.
+# ------------------------------------------------------------------------------
+_oradba_discovery_walk() {
+    local discovery_paths="$1"
+    local rescan="${2:-incremental}"
+    local max_depth=3
+    local jobs="${ORADBA_DISCOVERY_JOBS:-4}"
+    [[ "${jobs}" =~ ^[0-9]+$ ]] && [[ ${jobs} -ge 1 ]] || jobs=1
+
+    local start_ms classify_ms=0 t0
+    start_ms=$(_oradba_discovery_now_ms)
+    local scanned=0 reused=0 classified=0 pruned=0
+    local -a validated_homes=()
+    local -A state=()
+    local -A new_state=()
+
+    # Classifiers run in subshells and inherit the detection cache tables
+    oradba_detect_cache_preload
+
+    # Load discovery state; the scan marker becomes the next state file's mtime
+    local state_file="" marker_file="" cache_dir
+    oradba_cache_dir cache_dir
+    if [[ "${ORADBA_DISCOVERY_STATE:-true}" == "true" ]] && [[ -n "${cache_dir}" ]] \
+        && mkdir -p "${cache_dir}" 2> /dev/null; then
+        state_file="${cache_dir}/discovery.state"
+        marker_file="${state_file}.start.$$"
+        : > "${marker_file}" 2> /dev/null || marker_file=""
+        if [[ "${rescan}" != "full" ]] && [[ -f "${state_file}" ]]; then
+            local s_dir s_result
+            while IFS=$'\t' read -r s_dir s_result; do
+                [[ -z "${s_dir}" ]] || [[ "${s_dir}" == \#* ]] && continue
+                state["${s_dir}"]="${s_result}"
+            done < "${state_file}"
+        fi
+    fi
+
+    local work_dir
+    work_dir=$(mktemp -d "${TMPDIR:-/tmp}/oradba_discover.XXXXXX") || work_dir=""
+
+    local base_dir dir result level i running
+    local -a level_dirs=() parents=() todo=()
+    local -A level_result=()
+
+    for base_dir in ${discovery_paths}; do
+        [[ ! -d "${base_dir}" ]] || [[ -L "${base_dir}" ]] && continue
+
+        # Discovery path inside a home validated from an earlier path
+        if [[ ${#validated_homes[@]} -gt 0 ]] && is_subdirectory_of_oracle_home "${base_dir}" "${validated_homes[@]}"; then
+            oradba_log DEBUG "Skipping subdirectory of Oracle Home: ${base_dir}"
+            continue
+        fi
+
+        level_dirs=("${base_dir}")
+        for ((level = 0; level <= max_depth; level++)); do
+            [[ ${#level_dirs[@]} -eq 0 ]] && break
+
+            # Reuse unchanged classifications, queue the rest
+            level_result=()
+            todo=()
+            for dir in "${level_dirs[@]}"; do
+                [[ -L "${dir}" ]] && continue
+                if is_bundled_component "${dir##*/}"; then
+                    oradba_log DEBUG "Skipping bundled component: ${dir}"
+                    level_result["${dir}"]="skip"
+                    continue
+                fi
+                scanned=$((scanned + 1))
+                if [[ -n "${state[${dir}]:-}" ]] && _oradba_discovery_unchanged "${dir}" "${state_file}"; then
+                    level_result["${dir}"]="${state[${dir}]}"
+                    reused=$((reused + 1))
+                else
+                    todo+=("${dir}")
+                fi
+            done
+
+            # Classify queued candidates with a bounded worker pool
+            if [[ ${#todo[@]} -gt 0 ]]; then
+                t0=$(_oradba_discovery_now_ms)
+                classified=$((classified + ${#todo[@]}))
+                if [[ ${jobs} -le 1 ]] || [[ ${#todo[@]} -eq 1 ]] || [[ -z "${work_dir}" ]]; then
+                    for dir in "${todo[@]}"; do
+                        level_result["${dir}"]=$(_oradba_discovery_classify "${dir}")
+                    done
+                else
+                    running=0
+                    for i in "${!todo[@]}"; do
+                        _oradba_discovery_classify "${todo[${i}]}" > "${work_dir}/${i}" &
+                        running=$((running + 1))
+                        if [[ ${running} -ge ${jobs} ]]; then
+                            # wait -n needs bash 4.3; otherwise drain the whole batch
+                            if wait -n 2> /dev/null; then
+                                running=$((running - 1))
+                            else
+                                wait
+                                running=0
+                            fi
+                        fi
+                    done
+                    wait
+                    for i in "${!todo[@]}"; do
+                        result=""
+                        read -r result < "${work_dir}/${i}" 2> /dev/null || true
+                        level_result["${todo[${i}]}"]="${result:-none}"
+                    done
+                    rm -f "${work_dir}"/*
+                fi
+                classify_ms=$((classify_ms + $(_oradba_discovery_now_ms) - t0))
+            fi
+
+            # Report homes, prune their subtrees, collect parents of next level
+            parents=()
+            for dir in "${level_dirs[@]}"; do
+                result="${level_result[${dir}]:-}"
+                [[ -z "${result}" ]] && continue
+                [[ "${result}" != "skip" ]] && new_state["${dir}"]="${result}"
+                case "${result}" in
+                    skip | none) ;;
+                    invalid:*)
+                        oradba_log DEBUG "Plugin validation failed: ${dir} (${result#invalid:})"
+                        ;;
+                    *)
+                        validated_homes+=("${dir}")
+                        pruned=$((pruned + 1))
+                        printf '%s\t%s\n' "${dir}" "${result}"
+                        continue
+                        ;;
+                esac
+                [[ ${level} -lt ${max_depth} ]] && parents+=("${dir}")
+            done
+
+            level_dirs=()
+            if [[ ${#parents[@]} -gt 0 ]]; then
+                while IFS= read -r -d '' dir; do
+                    level_dirs+=("${dir}")
+                done < <(find "${parents[@]}" -mindepth 1 -maxdepth 1 -type d -print0 2> /dev/null | sort -z)
+            fi
+        done
+    done
+
+    [[ -n "${work_dir}" ]] && rm -rf "${work_dir}"
+
+    # Persist state: keep entries of directories outside this walk that still exist
+    if [[ -n "${marker_file}" ]]; then
+        for dir in "${!state[@]}"; do
+            [[ -z "${new_state[${dir}]:-}" ]] && [[ -d "${dir}" ]] && new_state["${dir}"]="${state[${dir}]}"
+        done
+        local tmp_file="${state_file}.$$"
+        {
+            echo "# OraDBA discovery state - generated, do not edit"
+            for dir in "${!new_state[@]}"; do
+                printf '%s\t%s\n' "${dir}" "${new_state[${dir}]}"
+            done
+        } > "${tmp_file}" 2> /dev/null \
+            && touch -r "${marker_file}" "${tmp_file}" 2> /dev/null \
+            && mv -f "${tmp_file}" "${state_file}" 2> /dev/null \
+            || rm -f "${tmp_file}"
+        rm -f "${marker_file}"
+    fi
+
+    printf '#stats\t%s\t%s\t%s\t%s\t%s\t%s\t%s\n' "${scanned}" "${reused}" "${classified}" \
+        "${pruned}" "${jobs}" "${classify_ms}" "$(($(_oradba_discovery_now_ms) - start_ms))"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_discovery_state_reset
+# Purpose.: Remove the incremental discovery state
+# Args....: None
+# Returns.: 0 always
+# Output..: None
+# Notes...: The next auto_discover_oracle_homes run classifies every directory
+# ------------------------------------------------------------------------------
+oradba_discovery_state_reset() {
+    local cache_dir
+    oradba_cache_dir cache_dir
+    [[ -n "${cache_dir}" ]] && rm -f "${cache_dir}/discovery.state"
+    return 0
+}
+
 # ------------------------------------------------------------------------------
 # Function: auto_discover_oracle_homes
 # Purpose.: Auto-discover Oracle Homes and add to oradba_homes.conf
 # Args....: $1 - Discovery paths (optional, defaults to ORADBA_DISCOVERY_PATHS)
 #           $2 - Silent mode flag (optional, "true" for silent, default: false)
+#           $3 - Rescan mode (optional, "full" ignores the discovery state)
 # Returns.: 0 on success, 1 on error
-# Output..: Discovery summary (unless silent)
+# Output..: Discovery summary and timing (unless silent)
 # Notes...: Issue #70 - Unified auto-discovery function
 #           Used by both oraenv.sh initialization and oradba_homes.sh discover
 #           Silently skips already registered homes (no duplicates)
@@ -710,14 +1394,15 @@ is_bundled_component() {
 #           Excludes subdirectories of validated Oracle Homes (fixes false positives)
 #           Generates home names using generate_home_name() logic
 #           Only adds homes if not already in oradba_homes.conf
+#           Walk and classification are done by _oradba_discovery_walk
 # ------------------------------------------------------------------------------
 auto_discover_oracle_homes() {
     local discovery_paths="${1:-${ORADBA_DISCOVERY_PATHS}}"
     local silent="${2:-false}"
+    local rescan="${3:-incremental}"
     local found_count=0
     local added_count=0
     local skipped_count=0
-    local -a validated_homes=() # Track validated Oracle Homes to avoid subdirectory detection
 
     # Check if ORACLE_BASE is set and use it as default discovery path
     if [[ -z "${discovery_paths}" ]]; then
@@ -780,210 +1465,156 @@ EOF
         echo ""
     }
 
-    # Process each discovery path
-    for base_dir in ${discovery_paths}; do
-        [[ ! -d "${base_dir}" ]] && continue
-
-        # Find directories up to 3 levels deep
-        while IFS= read -r -d '' dir; do
-            # Skip symbolic links
-            [[ -L "${dir}" ]] && continue
-
-            # Skip if this is a subdirectory of an already-validated Oracle Home
-            if is_subdirectory_of_oracle_home "${dir}" "${validated_homes[@]}"; then
-                [[ "${silent}" != "true" ]] && oradba_log DEBUG "Skipping subdirectory of Oracle Home: ${dir}"
-                continue
-            fi
-
-            # Skip common bundled components
-            local dir_name
-            dir_name=$(basename "${dir}")
-            if is_bundled_component "${dir_name}"; then
-                [[ "${silent}" != "true" ]] && oradba_log DEBUG "Skipping bundled component: ${dir}"
-                continue
-            fi
-
-            # Detect product type using common function
-            local ptype
-            ptype=$(detect_product_type "${dir}")
-
-            # Skip unknown types
-            [[ "${ptype}" == "unknown" ]] && continue
-
-            # Validate using plugin system before counting as found
-            local plugin_file="${ORADBA_BASE}/lib/plugins/${ptype}_plugin.sh"
-            local is_valid_home=false
-
-            if [[ -f "${plugin_file}" ]]; then
-                # Source plugin and validate
-                # shellcheck source=/dev/null
-                source "${plugin_file}" 2> /dev/null || true
+    # Walk discovery paths (pruned, parallel, incremental); one line per home
+    local dir ptype stats=""
+    while IFS=$'\t' read -r dir ptype; do
+        if [[ "${dir}" == "#stats" ]]; then
+            stats="${ptype}"
+            continue
+        fi
 
-                if declare -f plugin_validate_home > /dev/null 2>&1; then
-                    if plugin_validate_home "${dir}" 2> /dev/null; then
-                        is_valid_home=true
-                        # Add to validated homes list to exclude its subdirectories
-                        validated_homes+=("${dir}")
-                    else
-                        [[ "${silent}" != "true" ]] && oradba_log DEBUG "Plugin validation failed: ${dir} (${ptype})"
-                        continue
-                    fi
+        found_count=$((found_count + 1))
+
+        # Generate home name from path and product type
+        local dir_name home_name
+        dir_name=$(basename "${dir}")
+
+        # Generate home name using same logic as oradba_homes.sh
+        case "${ptype}" in
+            java)
+                # Normalize Java/JDK/JRE names to lowercase jdkNNN or jreNNN
+                if [[ "${dir_name}" =~ ^[Jj][Dd][Kk][-_]?([0-9]+) ]]; then
+                    home_name="jdk${BASH_REMATCH[1]}"
+                elif [[ "${dir_name}" =~ ^[Jj][Rr][Ee][-_]?([0-9]+) ]]; then
+                    home_name="jre${BASH_REMATCH[1]}"
+                elif [[ "${dir_name}" =~ ^[Jj]ava[-_]?([0-9]+) ]]; then
+                    home_name="jdk${BASH_REMATCH[1]}"
                 else
-                    # No validation function - accept based on detect_product_type
-                    is_valid_home=true
-                    validated_homes+=("${dir}")
+                    home_name="${dir_name//./_}"
+                    home_name="${home_name//-/_}"
+                    home_name=$(printf "%s" "${home_name}" | tr "[:upper:]" "[:lower:]")
                 fi
-            else
-                # No plugin - accept based on detect_product_type (backward compatible)
-                is_valid_home=true
-                validated_homes+=("${dir}")
-            fi
-
-            [[ "${is_valid_home}" == "false" ]] && continue
-
-            found_count=$((found_count + 1))
-
-            # Generate home name from path and product type
-            local dir_name home_name
-            dir_name=$(basename "${dir}")
-
-            # Generate home name using same logic as oradba_homes.sh
-            case "${ptype}" in
-                java)
-                    # Normalize Java/JDK/JRE names to lowercase jdkNNN or jreNNN
-                    if [[ "${dir_name}" =~ ^[Jj][Dd][Kk][-_]?([0-9]+) ]]; then
-                        home_name="jdk${BASH_REMATCH[1]}"
-                    elif [[ "${dir_name}" =~ ^[Jj][Rr][Ee][-_]?([0-9]+) ]]; then
-                        home_name="jre${BASH_REMATCH[1]}"
-                    elif [[ "${dir_name}" =~ ^[Jj]ava[-_]?([0-9]+) ]]; then
-                        home_name="jdk${BASH_REMATCH[1]}"
-                    else
-                        home_name="${dir_name//./_}"
-                        home_name="${home_name//-/_}"
-                        home_name=$(printf "%s" "${home_name}" | tr "[:upper:]" "[:lower:]")
-                    fi
-                    ;;
-                iclient)
-                    # Normalize instant client names to lowercase iclientNNN
-                    if [[ "${dir_name}" =~ instantclient[-_]?([0-9]+) ]]; then
-                        local version="${BASH_REMATCH[1]}"
-                        version="${version%%[_.-]*}"
-                        home_name="iclient${version}"
-                    else
-                        home_name="${dir_name//./_}"
-                        home_name="${home_name//-/_}"
-                        home_name=$(printf "%s" "${home_name}" | tr "[:upper:]" "[:lower:]")
-                    fi
-                    ;;
-                datasafe)
-                    # DataSafe connectors: sequential naming dscon1, dscon2, ...
-                    local counter=1
-                    if [[ -f "${config_file}" ]]; then
-                        while grep -q "^dscon${counter}:" "${config_file}" 2> /dev/null; do
-                            counter=$((counter + 1))
-                        done
-                    fi
-                    home_name="dscon${counter}"
-                    ;;
-                oud)
-                    # OUD instances: normalize to oudNNN
-                    if [[ "${dir_name}" =~ [Oo][Uu][Dd][-_]?([0-9]+) ]]; then
-                        home_name="oud${BASH_REMATCH[1]}"
-                    else
-                        home_name="${dir_name//./_}"
-                        home_name="${home_name//-/_}"
-                        home_name=$(printf "%s" "${home_name}" | tr "[:upper:]" "[:lower:]")
-                    fi
-                    ;;
-                database)
-                    # Database homes: normalize to rdbmsNNNN
-                    if [[ "${dir_name}" =~ ([0-9]{2,4}) ]]; then
-                        local version="${BASH_REMATCH[1]}"
-                        # If 4 digits (e.g., 1918), keep as-is; if 2-3 digits (e.g., 19), pad
-                        [[ ${#version} -eq 2 ]] && version="${version}00"
-                        [[ ${#version} -eq 3 ]] && version="${version}0"
-                        home_name="rdbms${version}"
-                    else
-                        home_name="${dir_name//./_}"
-                        home_name="${home_name//-/_}"
-                        home_name=$(printf '%s' "${home_name}" | tr '[:lower:]' '[:upper:]')
-                    fi
-                    ;;
-                client)
-                    # Full client: clientNNNN
-                    if [[ "${dir_name}" =~ ([0-9]{2,4}) ]]; then
-                        local version="${BASH_REMATCH[1]}"
-                        [[ ${#version} -eq 2 ]] && version="${version}00"
-                        [[ ${#version} -eq 3 ]] && version="${version}0"
-                        home_name="client${version}"
-                    else
-                        home_name="${dir_name//./_}"
-                        home_name="${home_name//-/_}"
-                        home_name=$(printf '%s' "${home_name}" | tr '[:lower:]' '[:upper:]')
-                    fi
-                    ;;
-                weblogic)
-                    # WebLogic: wlsNNNN
-                    if [[ "${dir_name}" =~ ([0-9]{2,4}) ]]; then
-                        home_name="wls${BASH_REMATCH[1]}"
-                    else
-                        home_name="${dir_name//./_}"
-                        home_name="${home_name//-/_}"
-                        home_name=$(printf '%s' "${home_name}" | tr '[:lower:]' '[:upper:]')
-                    fi
-                    ;;
-                *)
-                    # Other products: use uppercase (backward compatible)
+                ;;
+            iclient)
+                # Normalize instant client names to lowercase iclientNNN
+                if [[ "${dir_name}" =~ instantclient[-_]?([0-9]+) ]]; then
+                    local version="${BASH_REMATCH[1]}"
+                    version="${version%%[_.-]*}"
+                    home_name="iclient${version}"
+                else
+                    home_name="${dir_name//./_}"
+                    home_name="${home_name//-/_}"
+                    home_name=$(printf "%s" "${home_name}" | tr "[:upper:]" "[:lower:]")
+                fi
+                ;;
+            datasafe)
+                # DataSafe connectors: sequential naming dscon1, dscon2, ...
+                local counter=1
+                if [[ -f "${config_file}" ]]; then
+                    while grep -q "^dscon${counter}:" "${config_file}" 2> /dev/null; do
+                        counter=$((counter + 1))
+                    done
+                fi
+                home_name="dscon${counter}"
+                ;;
+            oud)
+                # OUD instances: normalize to oudNNN
+                if [[ "${dir_name}" =~ [Oo][Uu][Dd][-_]?([0-9]+) ]]; then
+                    home_name="oud${BASH_REMATCH[1]}"
+                else
+                    home_name="${dir_name//./_}"
+                    home_name="${home_name//-/_}"
+                    home_name=$(printf "%s" "${home_name}" | tr "[:upper:]" "[:lower:]")
+                fi
+                ;;
+            database)
+                # Database homes: normalize to rdbmsNNNN
+                if [[ "${dir_name}" =~ ([0-9]{2,4}) ]]; then
+                    local version="${BASH_REMATCH[1]}"
+                    # If 4 digits (e.g., 1918), keep as-is; if 2-3 digits (e.g., 19), pad
+                    [[ ${#version} -eq 2 ]] && version="${version}00"
+                    [[ ${#version} -eq 3 ]] && version="${version}0"
+                    home_name="rdbms${version}"
+                else
                     home_name="${dir_name//./_}"
                     home_name="${home_name//-/_}"
                     home_name=$(printf '%s' "${home_name}" | tr '[:lower:]' '[:upper:]')
-                    ;;
-            esac
-
-            # Check if already registered (by name or path)
-            local already_exists=false
-            if [[ -f "${config_file}" ]]; then
-                # Check by name (first field)
-                if grep -q "^${home_name}:" "${config_file}"; then
-                    already_exists=true
-                    [[ "${silent}" != "true" ]] && echo "  [SKIP] ${home_name} (${ptype}) - already registered"
-                # Check by path (second field)
-                elif grep -q ":${dir}:" "${config_file}"; then
-                    local existing_name
-                    existing_name=$(grep ":${dir}:" "${config_file}" | head -1 | cut -d':' -f1)
-                    already_exists=true
-
-                    # Migrate legacy DataSafe names to sequential dsconN
-                    if [[ "${ptype}" == "datasafe" ]] && [[ "${existing_name}" != "${home_name}" ]] && [[ ! "${existing_name}" =~ ^dscon[0-9]+$ ]]; then
-                        local tmp_file
-                        tmp_file="${config_file}.tmp"
-                        if awk -F: -v OFS=: -v path="${dir}" -v new_name="${home_name}" '$2 == path { $1 = new_name } { print }' "${config_file}" > "${tmp_file}"; then
-                            mv "${tmp_file}" "${config_file}"
-                            existing_name="${home_name}"
-                        else
-                            rm -f "${tmp_file}"
-                        fi
+                fi
+                ;;
+            client)
+                # Full client: clientNNNN
+                if [[ "${dir_name}" =~ ([0-9]{2,4}) ]]; then
+                    local version="${BASH_REMATCH[1]}"
+                    [[ ${#version} -eq 2 ]] && version="${version}00"
+                    [[ ${#version} -eq 3 ]] && version="${version}0"
+                    home_name="client${version}"
+                else
+                    home_name="${dir_name//./_}"
+                    home_name="${home_name//-/_}"
+                    home_name=$(printf '%s' "${home_name}" | tr '[:lower:]' '[:upper:]')
+                fi
+                ;;
+            weblogic)
+                # WebLogic: wlsNNNN
+                if [[ "${dir_name}" =~ ([0-9]{2,4}) ]]; then
+                    home_name="wls${BASH_REMATCH[1]}"
+                else
+                    home_name="${dir_name//./_}"
+                    home_name="${home_name//-/_}"
+                    home_name=$(printf '%s' "${home_name}" | tr '[:lower:]' '[:upper:]')
+                fi
+                ;;
+            *)
+                # Other products: use uppercase (backward compatible)
+                home_name="${dir_name//./_}"
+                home_name="${home_name//-/_}"
+                home_name=$(printf '%s' "${home_name}" | tr '[:lower:]' '[:upper:]')
+                ;;
+        esac
+
+        # Check if already registered (by name or path)
+        local already_exists=false
+        if [[ -f "${config_file}" ]]; then
+            # Check by name (first field)
+            if grep -q "^${home_name}:" "${config_file}"; then
+                already_exists=true
+                [[ "${silent}" != "true" ]] && echo "  [SKIP] ${home_name} (${ptype}) - already registered"
+            # Check by path (second field)
+            elif grep -q ":${dir}:" "${config_file}"; then
+                local existing_name
+                existing_name=$(grep ":${dir}:" "${config_file}" | head -1 | cut -d':' -f1)
+                already_exists=true
+
+                # Migrate legacy DataSafe names to sequential dsconN
+                if [[ "${ptype}" == "datasafe" ]] && [[ "${existing_name}" != "${home_name}" ]] && [[ ! "${existing_name}" =~ ^dscon[0-9]+$ ]]; then
+                    local tmp_file
+                    tmp_file="${config_file}.tmp"
+                    if awk -F: -v OFS=: -v path="${dir}" -v new_name="${home_name}" '$2 == path { $1 = new_name } { print }' "${config_file}" > "${tmp_file}"; then
+                        mv "${tmp_file}" "${config_file}"
+                        existing_name="${home_name}"
+                    else
+                        rm -f "${tmp_file}"
                     fi
-
-                    [[ "${silent}" != "true" ]] && echo "  [SKIP] ${home_name} (${ptype}) - path registered as '${existing_name}'"
                 fi
-            fi
 
-            if [[ "${already_exists}" == "true" ]]; then
-                skipped_count=$((skipped_count + 1))
-                continue
+                [[ "${silent}" != "true" ]] && echo "  [SKIP] ${home_name} (${ptype}) - path registered as '${existing_name}'"
             fi
+        fi
+
+        if [[ "${already_exists}" == "true" ]]; then
+            skipped_count=$((skipped_count + 1))
+            continue
+        fi
 
-            # Add to config file
-            # Format: NAME:ORACLE_HOME:PRODUCT_TYPE:ORDER:ALIAS_NAME:DESCRIPTION:VERSION
-            local order=$((50 + found_count * 10))
-            echo "${home_name}:${dir}:${ptype}:${order}::Auto-discovered ${ptype}:AUTO" >> "${config_file}"
+        # Add to config file
+        # Format: NAME:ORACLE_HOME:PRODUCT_TYPE:ORDER:ALIAS_NAME:DESCRIPTION:VERSION
+        local order=$((50 + found_count * 10))
+        echo "${home_name}:${dir}:${ptype}:${order}::Auto-discovered ${ptype}:AUTO" >> "${config_file}"
 
-            [[ "${silent}" != "true" ]] && echo "  [ADD] ${home_name} (${ptype}) - ${dir}"
-            added_count=$((added_count + 1))
+        [[ "${silent}" != "true" ]] && echo "  [ADD] ${home_name} (${ptype}) - ${dir}"
+        added_count=$((added_count + 1))
 
-        done < <(find "${base_dir}" -maxdepth 3 -type d -print0 2> /dev/null)
-    done
+    done < <(_oradba_discovery_walk "${discovery_paths}" "${rescan}")
 
     # Summary
     [[ "${silent}" != "true" ]] && {
@@ -993,6 +1624,16 @@ EOF
         echo "  Skipped: ${skipped_count} already registered"
         echo "  Added:   ${added_count} new Oracle Home(s)"
         echo ""
+        if [[ -n "${stats}" ]]; then
+            local scanned reused classified pruned jobs classify_ms total_ms
+            IFS=$'\t' read -r scanned reused classified pruned jobs classify_ms total_ms <<< "${stats}"
+            echo "Discovery Timing:"
+            echo "  Scanned:    ${scanned} directories (${reused} unchanged, ${classified} classified)"
+            echo "  Pruned:     ${pruned} Oracle Home subtree(s)"
+            echo "  Workers:    ${jobs}"
+            echo "  Elapsed:    ${total_ms} ms (classification ${classify_ms} ms)"
+            echo ""
+        fi
         if [[ ${added_count} -gt 0 ]]; then
             echo "Note: Discovered entries can be customized in ${config_file}"
             echo "      You can edit the file to change names, order, or descriptions."
@@ -1001,6 +1642,7 @@ EOF
     }
 
     # Log summary
+    [[ -n "${stats}" ]] && oradba_log DEBUG "Auto-discovery stats (scanned/reused/classified/pruned/jobs/classify_ms/total_ms): ${stats//$'\t'//}"
     if [[ ${added_count} -gt 0 ]]; then
         oradba_log INFO "Auto-discovery added ${added_count} Oracle Home(s) to ${config_file}"
     elif [[ ${found_count} -gt 0 ]]; then
@@ -0,0 +1,437 @@
+#!/usr/bin/env bash
+# ------------------------------------------------------------------------------
+# OraDBA - Oracle Database Infrastructure and Security, 5630 Muri, Switzerland
+# ------------------------------------------------------------------------------
+# Name.......: oradba_peer_sync.sh
+# Author.....: Stefan Oehrli (oes) stefan.oehrli@oradba.ch
+# Editor.....: Stefan Oehrli
+# Date.......: 2026.02.11
+# Revision...: 0.21.0
+# Purpose....: Peer sync engine for sync_to_peers.sh and sync_from_peers.sh
+# Notes......: Runs one rsync per peer with a bounded fan-out (SYNC_JOBS) and
+#              an optional wall-clock limit per peer (SYNC_TIMEOUT). rsync uses
+#              ssh with a ControlMaster socket per peer that persists between
+#              runs (SSH_CONTROL_PERSIST), so repeated syncs skip the SSH
+#              handshake. Each peer produces a result record in
+#              PEER_SYNC_RESULTS:
+#                  host|status|exit_code|duration_ms|bytes_sent|bytes_received
+#
+#              Pushes are driven by a content manifest of the local source
+#              (path, size, mtime, optional sha256) kept in SYNC_STATE_DIR
+#              together with the manifest generation last pushed to each
+#              peer. Peers at the current generation are skipped without
+#              starting rsync (status UNCHANGED); the others get only the
+#              changed files via --files-from.
+#              Requires oradba_common.sh (oradba_log, oradba_kill_process_tree).
+#              Uses the caller's SSH_USER, SSH_PORT, RSYNC_OPTS and, if
+#              defined, should_log to filter messages.
+# Reference..: https://github.com/oehrlis/oradba
+# License....: Apache License Version 2.0, January 2004 as shown
+#              at http://www.apache.org/licenses/
+# ------------------------------------------------------------------------------
+
+# Prevent multiple sourcing
+[[ -n "${ORADBA_PEER_SYNC_LOADED:-}" ]] && return 0
+readonly ORADBA_PEER_SYNC_LOADED=1
+
+# Engine settings (config files or environment may override)
+SYNC_JOBS="${SYNC_JOBS:-4}"
+SYNC_TIMEOUT="${SYNC_TIMEOUT:-0}"
+SYNC_POLL_INTERVAL="${SYNC_POLL_INTERVAL:-0.1}"
+SYNC_KILL_GRACE="${SYNC_KILL_GRACE:-5}"
+SSH_CONTROL_MASTER="${SSH_CONTROL_MASTER:-true}"
+SSH_CONTROL_DIR="${SSH_CONTROL_DIR:-${HOME}/.ssh/oradba_cm}"
+SSH_CONTROL_PERSIST="${SSH_CONTROL_PERSIST:-10m}"
+SSH_OPTS="${SSH_OPTS:-}"
+SYNC_MANIFEST="${SYNC_MANIFEST:-true}"
+SYNC_MANIFEST_HASH="${SYNC_MANIFEST_HASH:-false}"
+SYNC_STATE_DIR="${SYNC_STATE_DIR:-}"
+
+# Result records of all engine runs in this process
+PEER_SYNC_RESULTS=()
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_peer_log
+# Purpose.: Log through the caller's should_log filter
+# Args....: $1 - Log level
+#           $@ - Message
+# Returns.: 0
+# Output..: Log message via oradba_log
+# ------------------------------------------------------------------------------
+_oradba_peer_log() {
+    if declare -F should_log > /dev/null && ! should_log "$1"; then
+        return 0
+    fi
+    oradba_log "$@"
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_peer_clock
+# Purpose.: Current time in milliseconds
+# Args....: $1 - Name of the variable to set
+# Returns.: 0
+# Output..: None
+# Notes...: Uses EPOCHREALTIME (bash 5) without forking, seconds otherwise
+# ------------------------------------------------------------------------------
+_oradba_peer_clock() {
+    if [[ -n "${EPOCHREALTIME:-}" ]]; then
+        local _pc_now="${EPOCHREALTIME/[.,]/}"
+        printf -v "$1" '%s' "$((10#${_pc_now} / 1000))"
+    else
+        printf -v "$1" '%(%s)T000' -1
+    fi
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_peer_ssh_command
+# Purpose.: Build the ssh command used as rsync remote shell
+# Args....: None (uses SSH_PORT, SSH_OPTS and SSH_CONTROL_* settings)
+# Returns.: 0
+# Output..: ssh command line for rsync -e
+# Notes...: With SSH_CONTROL_MASTER=true the first connection to a peer opens
+#           a master socket in SSH_CONTROL_DIR (%C = hash of user, host and
+#           port) that later rsync runs reuse until SSH_CONTROL_PERSIST
+#           expires. BatchMode avoids password prompts from parallel jobs.
+#           The path must not contain spaces (rsync splits -e on whitespace).
+# ------------------------------------------------------------------------------
+oradba_peer_ssh_command() {
+    local cmd="ssh -p ${SSH_PORT:-22} -o BatchMode=yes"
+
+    if [[ "${SSH_CONTROL_MASTER}" == "true" ]]; then
+        if [[ -d "${SSH_CONTROL_DIR}" ]] \
+            || { mkdir -p "${SSH_CONTROL_DIR}" && chmod 700 "${SSH_CONTROL_DIR}"; } 2> /dev/null; then
+            cmd+=" -o ControlMaster=auto -o ControlPath=${SSH_CONTROL_DIR}/%C"
+            cmd+=" -o ControlPersist=${SSH_CONTROL_PERSIST}"
+        else
+            _oradba_peer_log WARN "Cannot create ${SSH_CONTROL_DIR}, SSH connection sharing disabled"
+        fi
+    fi
+    [[ -n "${SSH_OPTS}" ]] && cmd+=" ${SSH_OPTS}"
+    echo "${cmd}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_peer_sync_stats
+# Purpose.: Extract transferred bytes from rsync --stats output
+# Args....: $1 - rsync output file
+# Returns.: 0
+# Output..: "<bytes_sent> <bytes_received>" (0 if not found)
+# ------------------------------------------------------------------------------
+oradba_peer_sync_stats() {
+    local file="$1"
+    local line value sent=0 received=0
+
+    [[ -f "${file}" ]] || {
+        echo "0 0"
+        return 0
+    }
+    while IFS= read -r line; do
+        case "${line}" in
+            "Total bytes sent:"* | "Total bytes received:"*)
+                value="${line##*:}"
+                value="${value//[!0-9]/}"
+                [[ "${line}" == *sent* ]] && sent="${value:-0}" || received="${value:-0}"
+                ;;
+        esac
+    done < "${file}"
+    echo "${sent} ${received}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_peer_state_dir
+# Purpose.: Locate the manifest state directory of a sync source and target
+# Args....: $1 - Local source path
+#           $2 - Remote target path
+# Returns.: 0 on success, 1 if manifests are disabled or unsupported
+# Output..: State directory (created if missing)
+# Notes...: SYNC_STATE_DIR, else <cache dir>/peer_sync. One subdirectory per
+#           source/target/user/port combination. Requires GNU find (-printf).
+# ------------------------------------------------------------------------------
+oradba_peer_state_dir() {
+    local source="$1" target="$2"
+    local base="${SYNC_STATE_DIR}"
+    local key
+
+    [[ "${SYNC_MANIFEST}" == "true" ]] || return 1
+    if [[ -z "${base}" ]]; then
+        oradba_cache_dir base
+        [[ -n "${base}" ]] || return 1
+        base="${base}/peer_sync"
+    fi
+    find "${source}" -maxdepth 0 -printf '' > /dev/null 2>&1 || return 1
+
+    key="$(printf '%s|%s|%s|%s' "${source}" "${target}" "${SSH_USER}" "${SSH_PORT}" | cksum)"
+    key="${key%% *}"
+    mkdir -p "${base}/${key}/peers" 2> /dev/null || return 1
+    echo "${base}/${key}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_peer_manifest_update
+# Purpose.: Refresh the content manifest of a sync source
+# Args....: $1 - Local source path (file or directory)
+#           $2 - State directory
+# Returns.: 0 on success, 1 on error
+# Output..: Current manifest generation
+# Notes...: Manifest lines: path<TAB>type+mode<TAB>size<TAB>mtime<TAB>sha256|-
+#           sorted by path (relative to a directory source, basename for a
+#           file). Directories, symlinks (type+mode:target) and other file
+#           types are listed too, so mode changes, retargeted links and empty
+#           directories reach the peers. With SYNC_MANIFEST_HASH=true only
+#           regular files whose type, mode, size or mtime changed since the
+#           previous manifest are hashed. The generation is only increased
+#           when the manifest content changes.
+# ------------------------------------------------------------------------------
+oradba_peer_manifest_update() {
+    local source="${1%/}" dir="$2"
+    local manifest="${dir}/manifest" generation=0
+    local name='%P' mindepth=1
+
+    [[ -f "${source}" ]] && name='%f' mindepth=0
+    [[ -f "${dir}/generation" ]] && read -r generation < "${dir}/generation"
+
+    find "${source}" -mindepth "${mindepth}" \
+        \( -type l -printf "${name}\t%y%m:%l\t%s\t%T@\t-\n" \) \
+        -o -printf "${name}\t%y%m\t%s\t%T@\t-\n" 2> /dev/null \
+        | LC_ALL=C sort -t $'\t' -k1,1 > "${manifest}.new" || return 1
+
+    if [[ "${SYNC_MANIFEST_HASH}" == "true" ]]; then
+        # Reuse hashes of unchanged entries, hash the rest in one batch
+        local base="${source}"
+        [[ -f "${source}" ]] && base="${source%/*}"
+        awk -F'\t' -v OFS='\t' 'FILENAME == ARGV[1] { old[$1 FS $2 FS $3 FS $4] = $5; next }
+            { h = old[$1 FS $2 FS $3 FS $4]; print $1, $2, $3, $4, (h != "" ? h : "-") }' \
+            "${manifest}" "${manifest}.new" 2> /dev/null > "${manifest}.tmp" \
+            || cp "${manifest}.new" "${manifest}.tmp"
+        awk -F'\t' '$5 == "-" && $2 ~ /^f/ { print $1 }' "${manifest}.tmp" \
+            | (cd "${base}" && xargs -r -d '\n' sha256sum 2> /dev/null) \
+            | awk -F'\t' -v OFS='\t' 'FILENAME == "-" { p = substr($0, 67); h[p] = substr($0, 1, 64); next }
+                $5 == "-" && ($1 in h) { $5 = h[$1] } { print }' - "${manifest}.tmp" \
+                > "${manifest}.new"
+        rm -f "${manifest}.tmp"
+    fi
+
+    if [[ -f "${manifest}" ]] && cmp -s "${manifest}" "${manifest}.new"; then
+        rm -f "${manifest}.new"
+    else
+        mv -f "${manifest}.new" "${manifest}"
+        generation=$((generation + 1))
+        echo "${generation}" > "${dir}/generation"
+    fi
+    echo "${generation}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_peer_manifest_diff
+# Purpose.: List entries that differ between a peer snapshot and the manifest
+# Args....: $1 - Peer manifest snapshot
+#           $2 - Current manifest
+#           $3 - Output file for the changed paths (rsync --files-from)
+# Returns.: 0
+# Output..: Number of paths that no longer exist locally
+# Notes...: Entries are compared by type, mode (symlink target) and size,
+#           then by hash when both sides have a hash, else by mtime
+# ------------------------------------------------------------------------------
+oradba_peer_manifest_diff() {
+    awk -F'\t' -v out="$3" '
+        FILENAME == ARGV[1] { old[$1] = $0; next }
+        {
+            seen[$1] = 1
+            if (!($1 in old)) { print $1 > out; next }
+            split(old[$1], o, FS)
+            if ($2 != o[2] || $3 != o[3]) print $1 > out
+            else if ($5 != "-" && o[5] != "-") { if ($5 != o[5]) print $1 > out }
+            else if ($4 != o[4]) print $1 > out
+        }
+        END {
+            printf "" >> out
+            for (p in old) if (!(p in seen)) deleted++
+            print deleted + 0
+        }' "$1" "$2"
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_peer_sync
+# Purpose.: Run rsync against a list of peers with bounded fan-out
+# Args....: $1 - Direction: push (local -> peer) or pull (peer -> local)
+#           $2 - Source path (remote path for pull)
+#           $3 - Target path (remote path for push)
+#           $@ - Peer hosts
+# Returns.: 0 if all peers succeeded, 1 otherwise
+# Output..: Status via oradba_log; rsync output if VERBOSE=true or on error
+# Notes...: Starts up to SYNC_JOBS peers at a time (0 = all), polls every
+#           SYNC_POLL_INTERVAL seconds and terminates a peer's rsync/ssh
+#           process tree after SYNC_TIMEOUT seconds (0 = no limit; KILL
+#           follows after SYNC_KILL_GRACE seconds). Appends one record per
+#           peer to PEER_SYNC_RESULTS (status SUCCESS, FAILED or TIMEOUT).
+#           rsync runs with --stats for the byte counts.
+#           Pushes use the source manifest (see oradba_peer_manifest_update):
+#           peers already at the current generation are recorded UNCHANGED,
+#           peers with a snapshot get --files-from with the changed paths; a
+#           full rsync runs for new peers, file sources and deletions with
+#           --delete. Peer state is not updated for --dry-run.
+# ------------------------------------------------------------------------------
+oradba_peer_sync() {
+    local direction="$1" source="$2" target="$3"
+    shift 3
+    local -a hosts=("$@")
+    local -A job_pid=() job_start=() job_log=() job_killed=()
+    local -i running=0 next=0 failed=0
+    local -A job_args=()
+    local -a pending=()
+    local ssh_cmd work_dir host pid rc now status elapsed sent received line
+    local state_dir="" generation=0 peer_gen deleted dry_run=false
+    local jobs="${SYNC_JOBS}" timeout_ms=$((${SYNC_TIMEOUT:-0} * 1000))
+
+    [[ ${#hosts[@]} -eq 0 ]] && return 0
+    [[ "${jobs}" =~ ^[0-9]+$ ]] || jobs=1
+
+    work_dir="$(mktemp -d "${TMPDIR:-/tmp}/oradba_peer_sync.XXXXXX")"
+    [[ " ${RSYNC_OPTS} " == *" --dry-run "* ]] && dry_run=true
+
+    # Manifest: skip peers at the current generation, send changed files only
+    if [[ "${direction}" == "push" ]] && state_dir="$(oradba_peer_state_dir "${source}" "${target}")" \
+        && generation="$(oradba_peer_manifest_update "${source}" "${state_dir}")"; then
+        for host in "${hosts[@]}"; do
+            peer_gen=""
+            [[ -f "${state_dir}/peers/${host}.gen" ]] && read -r peer_gen < "${state_dir}/peers/${host}.gen"
+            if [[ "${peer_gen}" == "${generation}" ]]; then
+                _oradba_peer_log INFO "${host} is up to date (manifest generation ${generation})"
+                PEER_SYNC_RESULTS+=("${host}|UNCHANGED|0|0|0|0")
+                continue
+            fi
+            if [[ -d "${source}" && -f "${state_dir}/peers/${host}.manifest" ]]; then
+                deleted="$(oradba_peer_manifest_diff "${state_dir}/peers/${host}.manifest" \
+                    "${state_dir}/manifest" "${work_dir}/${host}.files")"
+                if [[ ${deleted} -gt 0 && " ${RSYNC_OPTS} " == *" --delete "* ]]; then
+                    _oradba_peer_log DEBUG "${deleted} file(s) removed, full sync to ${host}"
+                elif [[ ! -s "${work_dir}/${host}.files" ]]; then
+                    _oradba_peer_log INFO "${host} is up to date (no content changes)"
+                    PEER_SYNC_RESULTS+=("${host}|UNCHANGED|0|0|0|0")
+                    [[ "${dry_run}" == "true" ]] || echo "${generation}" > "${state_dir}/peers/${host}.gen"
+                    continue
+                else
+                    job_args[${host}]="--files-from=${work_dir}/${host}.files"
+                fi
+            fi
+            pending+=("${host}")
+        done
+        hosts=(${pending[@]+"${pending[@]}"})
+    else
+        state_dir=""
+    fi
+    if [[ ${#hosts[@]} -eq 0 ]]; then
+        rm -rf "${work_dir}"
+        return 0
+    fi
+    ssh_cmd="$(oradba_peer_ssh_command)"
+
+    _oradba_peer_log DEBUG "Peer sync (${direction}): ${#hosts[@]} peer(s), ${jobs} parallel, timeout ${SYNC_TIMEOUT:-0}s"
+    _oradba_peer_log DEBUG "Remote shell: ${ssh_cmd}"
+
+    while [[ ${next} -lt ${#hosts[@]} || ${running} -gt 0 ]]; do
+        # Start peers while fan-out allows
+        while [[ ${next} -lt ${#hosts[@]} ]] && [[ ${jobs} -eq 0 || ${running} -lt ${jobs} ]]; do
+            host="${hosts[next]}"
+            next+=1
+            job_log[${host}]="${work_dir}/${host}.log"
+            if [[ "${direction}" == "pull" ]]; then
+                _oradba_peer_log INFO "Syncing from ${host}:${source} ..."
+            elif [[ -n "${job_args[${host}]:-}" ]]; then
+                _oradba_peer_log INFO "Syncing $(wc -l < "${work_dir}/${host}.files") changed file(s) to ${host}:${target} ..."
+            else
+                _oradba_peer_log INFO "Syncing to ${host}:${target} ..."
+            fi
+            (
+                if [[ "${direction}" == "pull" ]]; then
+                    # shellcheck disable=SC2086
+                    exec rsync ${RSYNC_OPTS} --stats -e "${ssh_cmd}" \
+                        "${SSH_USER}@${host}:${source}" "${target}"
+                else
+                    # shellcheck disable=SC2086
+                    exec rsync ${RSYNC_OPTS} --stats ${job_args[${host}]:-} -e "${ssh_cmd}" \
+                        "${source}" "${SSH_USER}@${host}:${target}"
+                fi
+            ) > "${job_log[${host}]}" 2>&1 &
+            job_pid[${host}]=$!
+            _oradba_peer_clock "job_start[${host}]"
+            running+=1
+        done
+
+        sleep "${SYNC_POLL_INTERVAL}"
+        _oradba_peer_clock now
+
+        for host in "${!job_pid[@]}"; do
+            pid="${job_pid[${host}]}"
+            elapsed=$((now - job_start[${host}]))
+            if kill -0 "${pid}" 2> /dev/null; then
+                if [[ -z "${job_killed[${host}]:-}" && ${timeout_ms} -gt 0 && ${elapsed} -ge ${timeout_ms} ]]; then
+                    _oradba_peer_log ERROR "Sync with ${host} exceeded timeout of ${SYNC_TIMEOUT}s, terminating"
+                    oradba_kill_process_tree "${pid}" TERM
+                    job_killed[${host}]="${now}"
+                elif [[ -n "${job_killed[${host}]:-}" ]] \
+                    && [[ $((now - job_killed[${host}])) -ge $((SYNC_KILL_GRACE * 1000)) ]]; then
+                    oradba_kill_process_tree "${pid}" KILL
+                fi
+                continue
+            fi
+
+            rc=0
+            wait "${pid}" || rc=$?
+            read -r sent received <<< "$(oradba_peer_sync_stats "${job_log[${host}]}")"
+            if [[ -n "${job_killed[${host}]:-}" ]]; then
+                status="TIMEOUT"
+            elif [[ ${rc} -eq 0 ]]; then
+                status="SUCCESS"
+                _oradba_peer_log INFO "Sync with ${host} completed"
+                if [[ -n "${state_dir}" && "${dry_run}" != "true" ]]; then
+                    cp -f "${state_dir}/manifest" "${state_dir}/peers/${host}.manifest"
+                    echo "${generation}" > "${state_dir}/peers/${host}.gen"
+                fi
+            else
+                status="FAILED"
+                _oradba_peer_log ERROR "Failed to sync with ${host} (rsync exit ${rc})"
+            fi
+            # rsync output, prefixed by peer: on error or in verbose mode
+            if [[ "${status}" != "SUCCESS" ]]; then
+                [[ -n "${state_dir}" ]] && rm -f "${state_dir}/peers/${host}.gen"
+                failed+=1
+                while IFS= read -r line; do
+                    printf '[%s] %s\n' "${host}" "${line}" >&2
+                done < "${job_log[${host}]}"
+            elif [[ "${VERBOSE:-false}" == "true" && "${QUIET:-false}" != "true" ]]; then
+                while IFS= read -r line; do
+                    printf '[%s] %s\n' "${host}" "${line}"
+                done < "${job_log[${host}]}"
+            fi
+
+            PEER_SYNC_RESULTS+=("${host}|${status}|${rc}|${elapsed}|${sent}|${received}")
+            running=$((running - 1))
+            unset "job_pid[${host}]"
+        done
+    done
+
+    rm -rf "${work_dir}"
+    [[ ${failed} -eq 0 ]]
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_peer_sync_summary
+# Purpose.: Print the per-peer timing and byte-count table
+# Args....: $1 - First record index (optional, default: 0)
+# Returns.: 0
+# Output..: One log line per peer: host, status, duration, bytes sent/received
+# ------------------------------------------------------------------------------
+oradba_peer_sync_summary() {
+    local first="${1:-0}"
+    local i host status rc ms sent received
+
+    _oradba_peer_log INFO "$(printf '%-20s %-8s %10s %14s %14s' PEER STATUS DURATION SENT RECEIVED)"
+    for ((i = first; i < ${#PEER_SYNC_RESULTS[@]}; i++)); do
+        IFS='|' read -r host status rc ms sent received <<< "${PEER_SYNC_RESULTS[i]}"
+        _oradba_peer_log INFO "$(printf '%-20s %-8s %9d.%01ds %14s %14s' "${host}" "${status}" \
+            $((ms / 1000)) $((ms % 1000 / 100)) "${sent}" "${received}")"
+    done
+}
+
+# --- EOF ----------------------------------------------------------------------
@@ -0,0 +1,334 @@
+#!/usr/bin/env bash
+# ------------------------------------------------------------------------------
+# OraDBA - Oracle Database Infrastructure and Security, 5630 Muri, Switzerland
+# ------------------------------------------------------------------------------
+# Name.......: oradba_profile.sh
+# Author.....: Stefan Oehrli (oes) stefan.oehrli@oradba.ch
+# Editor.....: Stefan Oehrli
+# Date.......: 2026.02.11
+# Revision...: 0.21.0
+# Purpose....: Startup profiler with phase/function timing and fork counts
+# Notes......: Enabled with ORADBA_PROFILE=true. Times are taken from
+#              EPOCHREALTIME (no subshells). Forks are derived from the
+#              kernel's last allocated PID, so they are approximate on busy
+#              hosts. Each run writes one tab-separated profile file to
+#              ORADBA_PROFILE_DIR; oradba_profile.sh report aggregates them.
+# Reference..: https://github.com/oehrlis/oradba
+# License....: Apache License Version 2.0, January 2004 as shown
+#              at http://www.apache.org/licenses/
+# ------------------------------------------------------------------------------
+
+# Prevent multiple sourcing
+[[ -n "${ORADBA_PROFILE_LOADED:-}" ]] && return 0
+readonly ORADBA_PROFILE_LOADED=1
+
+# Functions timed by default (override with ORADBA_PROFILE_FUNCTIONS)
+ORADBA_PROFILE_DEFAULT_FUNCTIONS="oradba_registry_load _oraenv_set_environment _oraenv_lookup_oratab_entry \
+_oraenv_apply_product_adjustments _oraenv_load_configurations oradba_build_environment \
+set_oracle_home_environment load_config load_config_file configure_sqlpath load_extensions \
+generate_sid_aliases generate_base_aliases generate_pdb_aliases generate_oracle_home_aliases \
+show_database_status detect_product_type detect_oracle_version"
+
+# Profiler state (profile file, clocks, wrapped functions, own forks)
+_ORADBA_PROFILE_ACTIVE=""
+_ORADBA_PROFILE_FILE=""
+_ORADBA_PROFILE_T0=0
+_ORADBA_PROFILE_LAST=0
+_ORADBA_PROFILE_PID0=""
+_ORADBA_PROFILE_LASTPID=""
+_ORADBA_PROFILE_OWN=0
+_ORADBA_PROFILE_OWN_TOTAL=0
+_ORADBA_PROFILE_NOW=0
+_ORADBA_PROFILE_PID=""
+declare -ga _ORADBA_PROFILE_STACK=()
+declare -ga _ORADBA_PROFILE_FUNCS=()
+declare -gA _ORADBA_PROFILE_WRAPPED=()
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_profile_clock
+# Purpose.: Read the wall clock and the last allocated PID without forking
+# Args....: None
+# Returns.: 0 always
+# Output..: None (sets _ORADBA_PROFILE_NOW in microseconds and
+#           _ORADBA_PROFILE_PID, empty if the PID counter is unavailable)
+# ------------------------------------------------------------------------------
+_oradba_profile_clock() {
+    local now="${EPOCHREALTIME:-}"
+    if [[ -n "${now}" ]]; then
+        now="${now/[.,]/}"
+        _ORADBA_PROFILE_NOW=$((10#${now}))
+    else
+        printf -v now '%(%s)T' -1
+        _ORADBA_PROFILE_NOW=$((now * 1000000))
+    fi
+    _ORADBA_PROFILE_PID=""
+    if [[ -r /proc/sys/kernel/ns_last_pid ]]; then
+        read -r _ORADBA_PROFILE_PID < /proc/sys/kernel/ns_last_pid
+    fi
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_profile_record
+# Purpose.: Append one record to the profile file
+# Args....: $1 - Kind (phase, func, total)
+#           $2 - Name
+#           $3 - Start time in microseconds
+#           $4 - Start PID (may be empty)
+#           $5 - Forks made by the profiler itself in this interval (default: 0)
+# Returns.: 0 always
+# Output..: None (appends "kind<TAB>name<TAB>ms<TAB>forks" to the profile)
+# ------------------------------------------------------------------------------
+_oradba_profile_record() {
+    local us=$((_ORADBA_PROFILE_NOW - $3))
+    local ms forks="-"
+    printf -v ms '%d.%03d' $((us / 1000)) $((us % 1000))
+    if [[ -n "$4" && -n "${_ORADBA_PROFILE_PID}" ]]; then
+        forks=$((_ORADBA_PROFILE_PID - $4 - ${5:-0}))
+        [[ ${forks} -lt 0 ]] && forks=0
+    fi
+    printf '%s\t%s\t%s\t%s\n' "$1" "$2" "${ms}" "${forks}" >> "${_ORADBA_PROFILE_FILE}" 2> /dev/null
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_profile_active
+# Purpose.: Check whether a profile is being recorded
+# Args....: None
+# Returns.: 0 if active, 1 otherwise
+# Output..: None
+# ------------------------------------------------------------------------------
+oradba_profile_active() {
+    [[ -n "${_ORADBA_PROFILE_ACTIVE}" ]]
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_profile_start
+# Purpose.: Start recording a profile
+# Args....: $1 - Script or run name (e.g. oraenv.sh)
+#           $2 - Start time as EPOCHREALTIME value (optional, default: now)
+# Returns.: 0 on success, 1 if the profile directory is not writable
+# Output..: None (creates the profile file)
+# Notes...: Profile directory: ORADBA_PROFILE_DIR, default ${ORADBA_LOG}/profile
+# ------------------------------------------------------------------------------
+oradba_profile_start() {
+    local name="${1:-oradba}"
+    local start="${2:-}"
+    local dir="${ORADBA_PROFILE_DIR:-${ORADBA_LOG:-${ORADBA_BASE:-/tmp}/log}/profile}"
+    local stamp
+
+    _oradba_profile_clock
+    if [[ -n "${start}" ]]; then
+        start="${start/[.,]/}"
+        _ORADBA_PROFILE_T0=$((10#${start}))
+    else
+        _ORADBA_PROFILE_T0="${_ORADBA_PROFILE_NOW}"
+    fi
+    _ORADBA_PROFILE_LAST="${_ORADBA_PROFILE_T0}"
+    _ORADBA_PROFILE_PID0="${_ORADBA_PROFILE_PID}"
+    _ORADBA_PROFILE_LASTPID="${_ORADBA_PROFILE_PID}"
+    _ORADBA_PROFILE_OWN=0
+    _ORADBA_PROFILE_OWN_TOTAL=0
+
+    if [[ ! -d "${dir}" ]]; then
+        mkdir -p "${dir}" 2> /dev/null || return 1
+        _ORADBA_PROFILE_OWN=1
+        _ORADBA_PROFILE_OWN_TOTAL=1
+    fi
+    printf -v stamp '%(%Y%m%d_%H%M%S)T' -1
+    _ORADBA_PROFILE_FILE="${dir}/${name%.sh}_${stamp}_$$.prof"
+    {
+        printf '# OraDBA profile v1: kind<TAB>name<TAB>ms<TAB>forks\n'
+        printf 'meta\tscript\t%s\n' "${name}"
+        printf 'meta\thost\t%s\n' "${HOSTNAME:-unknown}"
+        printf 'meta\tstart\t%(%Y-%m-%dT%H:%M:%S)T\n' -1
+        printf 'meta\tbash\t%s\n' "${BASH_VERSION}"
+    } > "${_ORADBA_PROFILE_FILE}" 2> /dev/null || return 1
+
+    _ORADBA_PROFILE_ACTIVE="${name}"
+    read -r -a _ORADBA_PROFILE_FUNCS <<< "${ORADBA_PROFILE_FUNCTIONS:-${ORADBA_PROFILE_DEFAULT_FUNCTIONS}}"
+    oradba_profile_wrap "${_ORADBA_PROFILE_FUNCS[@]}"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_profile_mark
+# Purpose.: Record the time since the previous mark as a named phase
+# Args....: $1 - Phase name
+# Returns.: 0 always
+# Output..: None
+# Notes...: Also wraps default functions defined since the previous mark
+# ------------------------------------------------------------------------------
+oradba_profile_mark() {
+    oradba_profile_active || return 0
+    _oradba_profile_clock
+    _oradba_profile_record phase "$1" "${_ORADBA_PROFILE_LAST}" "${_ORADBA_PROFILE_LASTPID}" "${_ORADBA_PROFILE_OWN}"
+    oradba_profile_wrap "${_ORADBA_PROFILE_FUNCS[@]}"
+    # The next phase starts after wrapping, so its forks are not counted twice
+    _oradba_profile_clock
+    _ORADBA_PROFILE_LAST="${_ORADBA_PROFILE_NOW}"
+    _ORADBA_PROFILE_LASTPID="${_ORADBA_PROFILE_PID}"
+    _ORADBA_PROFILE_OWN=0
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_profile_enter
+# Purpose.: Push the start time of a timed function call
+# Args....: None
+# Returns.: 0 always
+# Output..: None
+# ------------------------------------------------------------------------------
+_oradba_profile_enter() {
+    _oradba_profile_clock
+    _ORADBA_PROFILE_STACK+=("${_ORADBA_PROFILE_NOW}:${_ORADBA_PROFILE_PID}")
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_profile_leave
+# Purpose.: Pop a timed function call and record it
+# Args....: $1 - Function name
+# Returns.: 0 always
+# Output..: None
+# Notes...: Times are inclusive of nested calls. Calls made in subshells
+#           (e.g. $(...)) are recorded too, since records go to the file.
+# ------------------------------------------------------------------------------
+_oradba_profile_leave() {
+    local top=$((${#_ORADBA_PROFILE_STACK[@]} - 1))
+    [[ ${top} -lt 0 ]] && return 0
+    local entry="${_ORADBA_PROFILE_STACK[${top}]}"
+    unset "_ORADBA_PROFILE_STACK[${top}]"
+    _oradba_profile_clock
+    _oradba_profile_record func "$1" "${entry%%:*}" "${entry#*:}"
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_profile_wrap
+# Purpose.: Wrap functions with timing probes
+# Args....: $@ - Function names; undefined functions are skipped
+# Returns.: 0 always
+# Output..: None
+# Notes...: The original body is kept as __oradba_prof_orig_<name>.
+#           oradba_profile_finish restores the originals.
+# ------------------------------------------------------------------------------
+oradba_profile_wrap() {
+    oradba_profile_active || return 0
+    local fn def
+    for fn in "$@"; do
+        [[ -n "${_ORADBA_PROFILE_WRAPPED[${fn}]:-}" ]] && continue
+        declare -F "${fn}" > /dev/null || continue
+        def="$(declare -f "${fn}")"
+        _ORADBA_PROFILE_OWN=$((_ORADBA_PROFILE_OWN + 1))
+        _ORADBA_PROFILE_OWN_TOTAL=$((_ORADBA_PROFILE_OWN_TOTAL + 1))
+        _ORADBA_PROFILE_WRAPPED["${fn}"]="${def}"
+        eval "__oradba_prof_orig_${fn}${def#"${fn}"}"
+        eval "${fn}() {
+    _oradba_profile_enter
+    __oradba_prof_orig_${fn} \"\$@\"
+    local __oradba_prof_rc=\$?
+    _oradba_profile_leave ${fn}
+    return \${__oradba_prof_rc}
+}"
+    done
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_profile_finish
+# Purpose.: Record the total run time, restore wrapped functions and stop
+# Args....: $1 - Exit status of the profiled run (optional, default: 0)
+# Returns.: 0 always
+# Output..: None (prints the profile path at DEBUG level)
+# ------------------------------------------------------------------------------
+oradba_profile_finish() {
+    oradba_profile_active || return 0
+    local fn
+    _oradba_profile_clock
+    _oradba_profile_record total "${_ORADBA_PROFILE_ACTIVE}" "${_ORADBA_PROFILE_T0}" "${_ORADBA_PROFILE_PID0}" \
+        "${_ORADBA_PROFILE_OWN_TOTAL}"
+    printf 'meta\tstatus\t%s\n' "${1:-0}" >> "${_ORADBA_PROFILE_FILE}" 2> /dev/null
+
+    for fn in "${!_ORADBA_PROFILE_WRAPPED[@]}"; do
+        eval "${_ORADBA_PROFILE_WRAPPED[${fn}]}"
+        unset -f "__oradba_prof_orig_${fn}"
+    done
+    _ORADBA_PROFILE_WRAPPED=()
+    _ORADBA_PROFILE_STACK=()
+    _ORADBA_PROFILE_ACTIVE=""
+    if type -t oradba_log &> /dev/null; then
+        oradba_log DEBUG "Profile written: ${_ORADBA_PROFILE_FILE}"
+    fi
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_profile_report
+# Purpose.: Aggregate profile files into a hot-spot table
+# Args....: $1 - Number of rows to show (0 = all)
+#           $@ - Profile files or directories (remaining arguments)
+# Returns.: 0 on success, 1 if no profiles were found
+# Output..: Table sorted by total time: kind, name, runs/calls, avg, max and
+#           total milliseconds, average forks per call
+# Notes...: Runs counts profiles containing the entry; calls counts records
+# ------------------------------------------------------------------------------
+oradba_profile_report() {
+    local top="${1:-20}"
+    shift
+    local -a files=()
+    local path
+
+    for path in "$@"; do
+        if [[ -d "${path}" ]]; then
+            files+=("${path}"/*.prof)
+        else
+            files+=("${path}")
+        fi
+    done
+    local -a existing=()
+    for path in "${files[@]}"; do
+        [[ -f "${path}" ]] && existing+=("${path}")
+    done
+    if [[ ${#existing[@]} -eq 0 ]]; then
+        oradba_log ERROR "No profile files found in: $*"
+        return 1
+    fi
+
+    awk -F'\t' -v top="${top}" '
+        FNR == 1 { runs++ }
+        $1 == "total" { tot_n++; tot_sum += $3; if ($3 > tot_max) tot_max = $3 }
+        $1 == "phase" || $1 == "func" || $1 == "total" {
+            key = $1 SUBSEP $2
+            if (!(key in calls)) order[++n] = key
+            calls[key]++
+            sum[key] += $3
+            if ($3 > max[key]) max[key] = $3
+            if ($4 != "-") { fsum[key] += $4; fcnt[key]++ }
+            if (seen[key] != FILENAME) { seen[key] = FILENAME; nruns[key]++ }
+        }
+        END {
+            printf "Profiles: %d run(s)", runs
+            if (tot_n > 0) printf ", total avg %.1f ms, max %.1f ms", tot_sum / tot_n, tot_max
+            printf "\n\n"
+            printf "%-4s %-6s %-44s %5s %6s %10s %10s %11s %7s\n", "Rank", "Kind", "Name", "Runs", "Calls", "Avg ms", "Max ms", "Total ms", "Forks"
+            printf "%-4s %-6s %-44s %5s %6s %10s %10s %11s %7s\n", "----", "------", "--------------------------------------------", "-----", "------", "----------", "----------", "-----------", "-------"
+            # selection sort by total time (small tables)
+            for (i = 1; i <= n; i++) idx[i] = order[i]
+            for (i = 1; i <= n; i++) {
+                best = i
+                for (j = i + 1; j <= n; j++) if (sum[idx[j]] > sum[idx[best]]) best = j
+                tmp = idx[i]; idx[i] = idx[best]; idx[best] = tmp
+            }
+            shown = 0
+            for (i = 1; i <= n; i++) {
+                key = idx[i]
+                split(key, parts, SUBSEP)
+                if (parts[1] == "total") continue
+                if (top > 0 && shown >= top) break
+                shown++
+                forks = (fcnt[key] > 0) ? sprintf("%.1f", fsum[key] / fcnt[key]) : "-"
+                printf "%-4d %-6s %-44s %5d %6d %10.2f %10.2f %11.2f %7s\n", shown, parts[1], substr(parts[2], 1, 44), nruns[key], calls[key], sum[key] / calls[key], max[key], sum[key], forks
+            }
+        }
+    ' "${existing[@]}"
+}
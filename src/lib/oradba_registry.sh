@@ -32,25 +32,42 @@ if [[ -z "${REGISTRY_FIELD_SEP:-}" ]]; then
     readonly REGISTRY_FIELD_SEP="|"
 fi
 
+# Registry snapshot state (in-shell index, survives re-sourcing)
+if ! declare -p _ORADBA_REGISTRY_BY_NAME &> /dev/null; then
+    declare -ga _ORADBA_REGISTRY_ENTRIES=()
+    declare -gA _ORADBA_REGISTRY_BY_NAME=()
+    declare -gA _ORADBA_REGISTRY_BY_TYPE=()
+    _ORADBA_REGISTRY_CHECKED=false
+    _ORADBA_REGISTRY_LOADED=false
+fi
+
+# Change tracker provides oradba_get_file_signature (optional)
+if ! declare -F oradba_get_file_signature > /dev/null 2>&1 \
+    && [[ -f "${BASH_SOURCE[0]%/*}/oradba_env_changes.sh" ]]; then
+    # shellcheck source=oradba_env_changes.sh
+    source "${BASH_SOURCE[0]%/*}/oradba_env_changes.sh"
+fi
+
 # ------------------------------------------------------------------------------
-# Function: oradba_registry_get_all
-# Purpose.: Get all Oracle installations (databases + homes)
-# Args....: None
-# Returns.: 0 on success, 1 on error
+# Function: _oradba_registry_compile
+# Purpose.: Parse oratab and oradba_homes.conf into installation objects
+# Args....: $1 - oratab path
+#           $2 - oradba_homes.conf path
+# Returns.: 0 on success
 # Output..: List of installation objects (one per line)
 # Format..: type|name|home|version|flags|order|alias|desc
-# Notes...: Combines oratab and oradba_homes.conf entries
+# Notes...: Uncached worker behind oradba_registry_get_all and the snapshot
 # ------------------------------------------------------------------------------
-oradba_registry_get_all() {
-    # shellcheck disable=SC2034
-    local -a installations=()
+_oradba_registry_compile() {
+    local oratab_path="$1"
+    local homes_path="$2"
     local oratab_found=false
     local homes_found=false
 
-    # 1. Parse oratab (if exists)
-    local oratab_path
-    oratab_path=$(get_oratab_path 2> /dev/null) || oratab_path="/etc/oratab"
+    # Detection cache tables are inherited by the command substitutions below
+    type -t oradba_detect_cache_preload &> /dev/null && oradba_detect_cache_preload
 
+    # 1. Parse oratab (if exists)
     if [[ -f "${oratab_path}" ]] && [[ -r "${oratab_path}" ]]; then
         oratab_found=true
         while IFS=: read -r sid home flags; do
@@ -73,9 +90,6 @@ oradba_registry_get_all() {
     fi
 
     # 2. Parse oradba_homes.conf (if exists)
-    local homes_path
-    homes_path=$(get_oracle_homes_path 2> /dev/null) || homes_path="${ORADBA_BASE}/etc/oradba_homes.conf"
-
     if [[ -f "${homes_path}" ]] && [[ -r "${homes_path}" ]]; then
         homes_found=true
         while IFS=: read -r name path ptype order alias desc version; do
@@ -109,6 +123,274 @@ oradba_registry_get_all() {
     return 0
 }
 
+# ------------------------------------------------------------------------------
+# Function: _oradba_registry_signature
+# Purpose.: Build the combined signature of the registry source files
+# Args....: $1 - oratab path
+#           $2 - oradba_homes.conf path
+# Returns.: 0 on success
+# Output..: Signature string (path=mtime:ctime:size:inode per file, "missing"
+#           if absent)
+# Notes...: One stat call for both files (oradba_get_file_signatures)
+# ------------------------------------------------------------------------------
+_oradba_registry_signature() {
+    local file sig result=""
+    local -a present=()
+    local -A sigs=()
+
+    for file in "$1" "$2"; do
+        [[ -f "${file}" ]] && present+=("${file}")
+    done
+    if [[ ${#present[@]} -gt 0 ]]; then
+        if declare -F oradba_get_file_signatures > /dev/null 2>&1; then
+            while IFS=$'\t' read -r file sig; do
+                [[ -n "${file}" ]] && sigs["${file}"]="${sig}"
+            done < <(oradba_get_file_signatures "${present[@]}")
+        else
+            for file in "${present[@]}"; do
+                sigs["${file}"]=$(stat -c '%Y:%Z:%s:%i' "${file}" 2> /dev/null \
+                    || stat -f '%m:%c:%z:%i' "${file}" 2> /dev/null) || sigs["${file}"]="unknown"
+            done
+        fi
+    fi
+
+    for file in "$1" "$2"; do
+        sig="missing"
+        [[ -f "${file}" ]] && sig="${sigs[${file}]:-unknown}"
+        result="${result}${result:+;}${file}=${sig}"
+    done
+
+    echo "${result}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_registry_is_current
+# Purpose.: Check whether the in-shell registry index is still valid
+# Args....: None
+# Returns.: 0 if the loaded index can be used, 1 if it must be rebuilt
+# Notes...: Uses shell builtins (-f / -nt against the snapshot file) so a warm
+#           lookup does not fork. -nt misses files replaced by an older copy
+#           (cp -p, rsync -a, restores), so the stored signature is verified
+#           with one stat call once per shell, and again after
+#           oradba_registry_recheck (run by the change tracker's quick check).
+#           Without a snapshot file the signature is checked on every call.
+# ------------------------------------------------------------------------------
+_oradba_registry_is_current() {
+    [[ "${_ORADBA_REGISTRY_LOADED}" == "true" ]] || return 1
+    [[ "${_ORADBA_REGISTRY_KEY:-}" == "${ORADBA_ORATAB:-}|${ORADBA_BASE:-}" ]] || return 1
+
+    local src state
+    for src in "${_ORADBA_REGISTRY_ORATAB}" "${_ORADBA_REGISTRY_HOMES}"; do
+        state="missing"
+        [[ -f "${src}" ]] && state="present"
+        [[ "${_ORADBA_REGISTRY_SIG}" == *"${src}=missing"* ]] && [[ "${state}" == "present" ]] && return 1
+        [[ "${_ORADBA_REGISTRY_SIG}" != *"${src}=missing"* ]] && [[ "${state}" == "missing" ]] && return 1
+    done
+
+    if [[ -n "${_ORADBA_REGISTRY_SNAPSHOT:-}" ]] && [[ -f "${_ORADBA_REGISTRY_SNAPSHOT}" ]]; then
+        [[ "${_ORADBA_REGISTRY_ORATAB}" -nt "${_ORADBA_REGISTRY_SNAPSHOT}" ]] && return 1
+        [[ "${_ORADBA_REGISTRY_HOMES}" -nt "${_ORADBA_REGISTRY_SNAPSHOT}" ]] && return 1
+        _oradba_registry_homes_newer "${_ORADBA_REGISTRY_SNAPSHOT}" "${_ORADBA_REGISTRY_ENTRIES[@]}" && return 1
+        [[ "${_ORADBA_REGISTRY_CHECKED:-}" == "true" ]] && return 0
+    fi
+
+    [[ "$(_oradba_registry_signature "${_ORADBA_REGISTRY_ORATAB}" "${_ORADBA_REGISTRY_HOMES}")" == "${_ORADBA_REGISTRY_SIG}" ]] || return 1
+    _ORADBA_REGISTRY_CHECKED=true
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_registry_homes_newer
+# Purpose.: Check whether a registered home changed after the snapshot
+# Args....: $1 - Snapshot file
+#           $@ - Registry entries
+# Returns.: 0 if a home or its bin directory is not older than the snapshot,
+#           1 otherwise
+# Output..: None
+# Notes...: Product types are detected from home contents, so an in-place
+#           install or relink must invalidate the snapshot. Builtins only.
+#           Equal timestamps count as changed: with a coarse file system
+#           clock a change right after the snapshot write gets the same mtime.
+# ------------------------------------------------------------------------------
+_oradba_registry_homes_newer() {
+    local snapshot="$1"
+    shift
+    local entry home
+    local -A seen=()
+
+    for entry in "$@"; do
+        home="${entry#*"${REGISTRY_FIELD_SEP}"}"
+        home="${home#*"${REGISTRY_FIELD_SEP}"}"
+        home="${home%%"${REGISTRY_FIELD_SEP}"*}"
+        [[ -z "${home}" ]] || [[ -n "${seen[${home}]:-}" ]] && continue
+        seen["${home}"]=1
+        [[ -e "${home}" ]] && [[ ! "${home}" -ot "${snapshot}" ]] && return 0
+        [[ -e "${home}/bin" ]] && [[ ! "${home}/bin" -ot "${snapshot}" ]] && return 0
+    done
+    return 1
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_registry_load
+# Purpose.: Load the compiled registry snapshot and build the in-shell index
+# Args....: None
+# Returns.: 0 if the index is available, 1 if caching is disabled or there
+#           are no registry files (callers fall back to a live parse)
+# Output..: None
+# Notes...: Snapshot is stored in ${ORADBA_CACHE_DIR}/registry.snapshot and is
+#           invalidated by the stat signature of oratab and oradba_homes.conf
+#           and by changes to a registered home or its bin directory.
+#           Call once in the parent shell so command substitutions inherit
+#           the index. Disable with ORADBA_REGISTRY_CACHE=false.
+# ------------------------------------------------------------------------------
+oradba_registry_load() {
+    [[ "${ORADBA_REGISTRY_CACHE:-true}" != "true" ]] && return 1
+    _oradba_registry_is_current && return 0
+
+    local oratab_path homes_path
+    oratab_path=$(get_oratab_path 2> /dev/null) || oratab_path="/etc/oratab"
+    homes_path=$(get_oracle_homes_path 2> /dev/null) || homes_path="${ORADBA_BASE}/etc/oradba_homes.conf"
+
+    # Nothing to compile - leave auto-discovery to the live path
+    if [[ ! -r "${oratab_path}" ]] && [[ ! -r "${homes_path}" ]]; then
+        _ORADBA_REGISTRY_LOADED=false
+        return 1
+    fi
+
+    local signature
+    signature=$(_oradba_registry_signature "${oratab_path}" "${homes_path}")
+
+    local cache_dir snapshot=""
+    oradba_cache_dir cache_dir
+    [[ -n "${cache_dir}" ]] && snapshot="${cache_dir}/registry.snapshot"
+
+    local -a entries=()
+    local header=""
+    if [[ -n "${snapshot}" ]] && [[ -r "${snapshot}" ]] \
+        && [[ ! "${oratab_path}" -nt "${snapshot}" ]] && [[ ! "${homes_path}" -nt "${snapshot}" ]]; then
+        mapfile -t entries < "${snapshot}"
+        header="${entries[0]:-}"
+    fi
+
+    if [[ "${header}" == "# signature: ${signature}" ]] \
+        && ! _oradba_registry_homes_newer "${snapshot}" "${entries[@]:1}"; then
+        entries=("${entries[@]:1}")
+        oradba_log DEBUG "Registry snapshot reused: ${snapshot}"
+    else
+        mapfile -t entries < <(_oradba_registry_compile "${oratab_path}" "${homes_path}")
+        if [[ -n "${snapshot}" ]] && mkdir -p "${cache_dir}" 2> /dev/null; then
+            local tmp_snapshot="${snapshot}.$$"
+            if { printf '# signature: %s\n' "${signature}"; [[ ${#entries[@]} -gt 0 ]] && printf '%s\n' "${entries[@]}"; } > "${tmp_snapshot}" 2> /dev/null \
+                && mv -f "${tmp_snapshot}" "${snapshot}" 2> /dev/null; then
+                oradba_log DEBUG "Registry snapshot written: ${snapshot} (${#entries[@]} entries)"
+            else
+                rm -f "${tmp_snapshot}" 2> /dev/null
+                snapshot=""
+            fi
+        else
+            snapshot=""
+        fi
+    fi
+
+    # Build in-shell index by name/alias and by type
+    _ORADBA_REGISTRY_ENTRIES=("${entries[@]}")
+    _ORADBA_REGISTRY_BY_NAME=()
+    _ORADBA_REGISTRY_BY_TYPE=()
+    local idx ptype name home version flags order alias desc
+    for idx in "${!_ORADBA_REGISTRY_ENTRIES[@]}"; do
+        IFS="${REGISTRY_FIELD_SEP}" read -r ptype name home version flags order alias desc <<< "${_ORADBA_REGISTRY_ENTRIES[idx]}"
+        [[ -n "${name}" ]] && _ORADBA_REGISTRY_BY_NAME["${name}"]+="${idx} "
+        if [[ -n "${alias}" ]] && [[ "${alias}" != "${name}" ]]; then
+            _ORADBA_REGISTRY_BY_NAME["${alias}"]+="${idx} "
+        fi
+        [[ -n "${ptype}" ]] && _ORADBA_REGISTRY_BY_TYPE["${ptype}"]+="${idx} "
+    done
+
+    _ORADBA_REGISTRY_ORATAB="${oratab_path}"
+    _ORADBA_REGISTRY_HOMES="${homes_path}"
+    _ORADBA_REGISTRY_SIG="${signature}"
+    _ORADBA_REGISTRY_SNAPSHOT="${snapshot}"
+    _ORADBA_REGISTRY_KEY="${ORADBA_ORATAB:-}|${ORADBA_BASE:-}"
+    _ORADBA_REGISTRY_CHECKED=true
+    _ORADBA_REGISTRY_LOADED=true
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_registry_recheck
+# Purpose.: Verify the registry signature again on the next lookup
+# Args....: None
+# Returns.: 0 always
+# Output..: None
+# ------------------------------------------------------------------------------
+oradba_registry_recheck() {
+    _ORADBA_REGISTRY_CHECKED=false
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_registry_invalidate
+# Purpose.: Drop the in-shell registry index and the on-disk snapshot
+# Args....: None
+# Returns.: 0 always
+# Notes...: Use after changes the signature cannot see (e.g. product files
+#           replaced deeper inside a home than its bin directory)
+# ------------------------------------------------------------------------------
+oradba_registry_invalidate() {
+    local cache_dir
+    oradba_cache_dir cache_dir
+
+    [[ -n "${cache_dir}" ]] && rm -f "${cache_dir}/registry.snapshot" 2> /dev/null
+    [[ -n "${_ORADBA_REGISTRY_SNAPSHOT:-}" ]] && rm -f "${_ORADBA_REGISTRY_SNAPSHOT}" 2> /dev/null
+    _ORADBA_REGISTRY_ENTRIES=()
+    _ORADBA_REGISTRY_BY_NAME=()
+    _ORADBA_REGISTRY_BY_TYPE=()
+    _ORADBA_REGISTRY_CHECKED=false
+    _ORADBA_REGISTRY_LOADED=false
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: _oradba_registry_print_indexed
+# Purpose.: Print registry entries for a space-separated list of indexes
+# Args....: $1 - Index list (from _ORADBA_REGISTRY_BY_NAME/_BY_TYPE)
+# Returns.: 0 if at least one entry printed, 1 otherwise
+# Output..: Installation objects
+# ------------------------------------------------------------------------------
+_oradba_registry_print_indexed() {
+    local idx
+    [[ -z "${1// /}" ]] && return 1
+    for idx in $1; do
+        printf '%s\n' "${_ORADBA_REGISTRY_ENTRIES[idx]}"
+    done
+    return 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: oradba_registry_get_all
+# Purpose.: Get all Oracle installations (databases + homes)
+# Args....: None
+# Returns.: 0 on success, 1 on error
+# Output..: List of installation objects (one per line)
+# Format..: type|name|home|version|flags|order|alias|desc
+# Notes...: Combines oratab and oradba_homes.conf entries. Served from the
+#           compiled snapshot/in-shell index when available.
+# ------------------------------------------------------------------------------
+oradba_registry_get_all() {
+    if oradba_registry_load; then
+        [[ ${#_ORADBA_REGISTRY_ENTRIES[@]} -gt 0 ]] && printf '%s\n' "${_ORADBA_REGISTRY_ENTRIES[@]}"
+        return 0
+    fi
+
+    local oratab_path
+    oratab_path=$(get_oratab_path 2> /dev/null) || oratab_path="/etc/oratab"
+
+    local homes_path
+    homes_path=$(get_oracle_homes_path 2> /dev/null) || homes_path="${ORADBA_BASE}/etc/oradba_homes.conf"
+
+    _oradba_registry_compile "${oratab_path}" "${homes_path}"
+}
+
 # ------------------------------------------------------------------------------
 # Function: oradba_registry_get_by_name
 # Purpose.: Get installation by name (SID or home name)
@@ -121,6 +403,11 @@ oradba_registry_get_by_name() {
 
     [[ -z "${search_name}" ]] && return 1
 
+    if oradba_registry_load; then
+        _oradba_registry_print_indexed "${_ORADBA_REGISTRY_BY_NAME[${search_name}]:-}"
+        return $?
+    fi
+
     local found=false
     while IFS="${REGISTRY_FIELD_SEP}" read -r ptype name home version flags order alias desc; do
         if [[ "${name}" == "${search_name}" ]] || [[ "${alias}" == "${search_name}" ]]; then
@@ -145,6 +432,11 @@ oradba_registry_get_by_type() {
 
     [[ -z "${search_type}" ]] && return 1
 
+    if oradba_registry_load; then
+        _oradba_registry_print_indexed "${_ORADBA_REGISTRY_BY_TYPE[${search_type}]:-}"
+        return 0
+    fi
+
     while IFS="${REGISTRY_FIELD_SEP}" read -r ptype name home version flags order alias desc; do
         if [[ "${ptype}" == "${search_type}" ]]; then
             printf "%s${REGISTRY_FIELD_SEP}%s${REGISTRY_FIELD_SEP}%s${REGISTRY_FIELD_SEP}%s${REGISTRY_FIELD_SEP}%s${REGISTRY_FIELD_SEP}%s${REGISTRY_FIELD_SEP}%s${REGISTRY_FIELD_SEP}%s\n" \
@@ -223,6 +515,7 @@ oradba_registry_sync_oratab() {
         oradba_log DEBUG "oratab not found or not readable: ${oratab_path}"
         return 0
     fi
+    type -t oradba_detect_cache_preload &> /dev/null && oradba_detect_cache_preload
 
     # Ensure oradba_homes.conf exists
     if [[ ! -f "${homes_path}" ]]; then
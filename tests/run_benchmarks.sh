@@ -0,0 +1,528 @@
+#!/usr/bin/env bash
+# ------------------------------------------------------------------------------
+# OraDBA - Oracle Database Infrastructure and Security, 5630 Muri, Switzerland
+# ------------------------------------------------------------------------------
+# Name.......: run_benchmarks.sh
+# Author.....: Stefan Oehrli (oes) stefan.oehrli@oradba.ch
+# Editor.....: Stefan Oehrli
+# Date.......: 2026.02.11
+# Revision...: 0.1.0
+# Purpose....: Reproducible performance benchmarks on a synthetic Oracle estate
+# Notes......: Builds a throw-away estate (large oratab, fake Oracle Homes,
+#              extensions, stub sqlplus/ps), times the main entry points over
+#              several iterations in clean shells and writes medians/p95 as
+#              JSON. Optionally compares against a stored baseline.
+#              Requires bash 5+ (EPOCHREALTIME).
+# Reference..: https://github.com/oehrlis/oradba
+# License....: Apache License Version 2.0, January 2004 as shown
+#              at http://www.apache.org/licenses/
+# ------------------------------------------------------------------------------
+
+set -euo pipefail
+
+# Get script directory
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(dirname "$SCRIPT_DIR")"
+SCRIPT_NAME="$(basename "$0")"
+
+# Defaults (overridable by options)
+ITERATIONS=10
+WARMUP=1
+ORATAB_ENTRIES=500
+HOME_COUNT=100
+EXTENSION_COUNT=30
+RUNNING_COUNT=20
+THRESHOLD=25
+MIN_DELTA=5
+FILTER=""
+BASELINE=""
+OUTPUT="${PROJECT_ROOT}/dist/benchmarks/benchmark_$(date '+%Y%m%d_%H%M%S').json"
+KEEP_ESTATE=false
+ESTATE_DIR=""
+
+# Colors
+GREEN='\033[0;32m'
+RED='\033[0;31m'
+NC='\033[0m' # No Color
+
+# Benchmark definitions: name|setup|timed body
+# Setup runs in the same clean shell before the timer starts. ${B} is the
+# OraDBA base and ${E} the estate directory inside the benchmark shell.
+BENCHMARKS=(
+    'oraenv||source "${B}/bin/oraenv.sh" DB001 --silent'
+    'oraenv_cold|export ORADBA_ENV_BUNDLE=false ORADBA_REGISTRY_CACHE=false ORADBA_DETECT_CACHE=false|source "${B}/bin/oraenv.sh" DB001 --silent'
+    'oraup||"${B}/bin/oraup.sh"'
+    'registry_get_all|source "${B}/lib/oradba_common.sh"; source "${B}/lib/oradba_registry.sh"|oradba_registry_get_all'
+    'discover_homes|source "${B}/lib/oradba_common.sh"; : > "${B}/etc/oradba_homes.conf"|auto_discover_oracle_homes "${E}/oracle/product" true full'
+    'load_extensions|source "${B}/lib/oradba_common.sh"; load_config_file "${B}/etc/oradba_core.conf"; source "${B}/lib/extensions.sh"|load_extensions'
+    'homes_list||"${B}/bin/oradba_homes.sh" list'
+    'log_suppressed|source "${B}/lib/oradba_common.sh"|for ((n = 0; n < 1000; n++)); do oradba_log DEBUG "message ${n}"; done'
+    'log_emitted|source "${B}/lib/oradba_common.sh"; export ORADBA_LOG_FILE="${E}/log/bench.log"|for ((n = 0; n < 1000; n++)); do oradba_log INFO "message ${n}"; done'
+    'config_changes|source "${B}/lib/oradba_env_changes.sh"; oradba_init_change_tracking|for ((n = 0; n < 1000; n++)); do oradba_auto_reload_on_change || true; done'
+    'config_sections|source "${B}/lib/oradba_common.sh"; source "${B}/lib/oradba_env_config.sh"|for ((n = 0; n < 20; n++)); do oradba_load_generic_configs DEFAULT; oradba_load_generic_configs RDBMS; done'
+)
+
+# ------------------------------------------------------------------------------
+# Function: usage
+# Purpose.: Display usage information and command-line options
+# Args....: None
+# Returns.: 0 (exits after display)
+# Output..: Usage information to stdout
+# ------------------------------------------------------------------------------
+usage() {
+    cat << EOF
+Usage: $SCRIPT_NAME [OPTIONS]
+
+Time OraDBA entry points on a synthetic estate and write results as JSON.
+
+Options:
+  -i, --iterations N    Timed iterations per benchmark (default: ${ITERATIONS})
+  -w, --warmup N        Untimed warm-up iterations (default: ${WARMUP})
+  -f, --filter REGEX    Only run benchmarks whose name matches REGEX
+  -o, --output FILE     JSON result file (default: dist/benchmarks/benchmark_<stamp>.json)
+  -b, --baseline FILE   Compare medians against a stored result file
+  -t, --threshold PCT   Regression threshold in percent (default: ${THRESHOLD})
+      --min-delta MS    Ignore slowdowns below MS milliseconds (default: ${MIN_DELTA})
+      --oratab N        oratab entries in the estate (default: ${ORATAB_ENTRIES})
+      --homes N         Fake Oracle Homes in the estate (default: ${HOME_COUNT})
+      --extensions N    Extensions in the estate (default: ${EXTENSION_COUNT})
+      --running N       Instances reported as running by stub ps (default: ${RUNNING_COUNT})
+  -k, --keep            Keep the estate directory for inspection
+  -l, --list            List benchmarks and exit
+  -h, --help            Display this help message
+
+Exit status:
+  0  Success (no regression against the baseline)
+  1  Error
+  2  At least one benchmark median regressed beyond the threshold
+
+Examples:
+  $SCRIPT_NAME --iterations 20 --output tests/benchmark_baseline.json
+  $SCRIPT_NAME --baseline tests/benchmark_baseline.json
+  $SCRIPT_NAME --filter 'oraenv|registry' --iterations 5
+
+EOF
+    exit 0
+}
+
+# ------------------------------------------------------------------------------
+# Function: die
+# Purpose.: Print an error message and exit
+# Args....: $1 - Message
+# Returns.: Exits with 1
+# Output..: Error message to stderr
+# ------------------------------------------------------------------------------
+die() {
+    echo -e "${RED}ERROR:${NC} $1" >&2
+    exit 1
+}
+
+# ------------------------------------------------------------------------------
+# Function: write_stub
+# Purpose.: Write an executable stub script
+# Args....: $1 - Target path
+#           stdin - Script body (without shebang)
+# Returns.: 0 on success
+# Output..: None
+# ------------------------------------------------------------------------------
+write_stub() {
+    local target="$1"
+    {
+        echo '#!/usr/bin/env bash'
+        cat
+    } > "${target}"
+    chmod +x "${target}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: build_estate
+# Purpose.: Create the synthetic estate below ESTATE_DIR
+# Args....: None (uses ORATAB_ENTRIES, HOME_COUNT, EXTENSION_COUNT, RUNNING_COUNT)
+# Returns.: 0 on success
+# Output..: None
+# Notes...: Layout: local/oradba (copy of src), local/ext_NN (extensions),
+#           oracle/product/<version>/<home> (marker files detect_product_type
+#           looks for), stubs/ (sqlplus, ps), oratab, cache/, log/, home/
+#           Every 10th home is a client, iclient, OUD or WebLogic home, the
+#           rest are database homes serving the oratab entries round-robin.
+# ------------------------------------------------------------------------------
+build_estate() {
+    local base="${ESTATE_DIR}/local/oradba"
+    local product="${ESTATE_DIR}/oracle/product"
+    local i home name version
+    local -a db_homes=()
+
+    mkdir -p "${ESTATE_DIR}"/{local,oracle/product,stubs,cache,log,home}
+    cp -R "${PROJECT_ROOT}/src" "${base}"
+    rm -rf "${base:?}/var" "${base:?}/log"
+    rm -f "${base:?}"/etc/sid.*.conf "${base:?}/etc/oradba_homes.conf"
+
+    # Stub sqlplus: answers version probes and status queries immediately
+    write_stub "${ESTATE_DIR}/stubs/sqlplus" << 'EOF'
+case "${1:-}" in
+    -V | -v)
+        echo "SQL*Plus: Release 19.0.0.0.0 - Production"
+        echo "Version 19.21.0.0.0"
+        exit 0
+        ;;
+esac
+cat > /dev/null
+echo "OPEN"
+EOF
+
+    # Stub ps: reports pmon processes for the first RUNNING_COUNT SIDs
+    write_stub "${ESTATE_DIR}/stubs/ps" << EOF
+running=${RUNNING_COUNT}
+if [[ "\$*" == *"-o"* ]]; then
+    for ((i = 1; i <= running; i++)); do
+        printf '%d ora_pmon_DB%03d\n' \$((1000 + i)) "\${i}"
+    done
+else
+    echo "UID          PID    PPID  C STIME TTY          TIME CMD"
+    for ((i = 1; i <= running; i++)); do
+        printf 'oracle    %5d       1  0 10:00 ?        00:00:01 ora_pmon_DB%03d\n' \$((1000 + i)) "\${i}"
+    done
+fi
+EOF
+
+    # Oracle Homes with the marker files used by detect_product_type
+    : > "${ESTATE_DIR}/homes.conf"
+    for ((i = 1; i <= HOME_COUNT; i++)); do
+        version="$((18 + i % 6)).0.0"
+        case $((i % 10)) in
+            1)
+                name="client_${i}"
+                home="${product}/${version}/client_${i}"
+                mkdir -p "${home}/bin"
+                cp "${ESTATE_DIR}/stubs/sqlplus" "${home}/bin/sqlplus"
+                echo "${name}:${home}:client:$((i * 10))::Synthetic client ${i}:AUTO" >> "${ESTATE_DIR}/homes.conf"
+                ;;
+            2)
+                name="ic_${i}"
+                home="${product}/instantclient_${i}"
+                mkdir -p "${home}"
+                : > "${home}/libclntsh.so"
+                echo "${name}:${home}:iclient:$((i * 10))::Synthetic instant client ${i}:AUTO" >> "${ESTATE_DIR}/homes.conf"
+                ;;
+            3)
+                name="oud_${i}"
+                home="${product}/oud_${i}"
+                mkdir -p "${home}/oud/lib"
+                : > "${home}/oud/lib/ldapjdk.jar"
+                echo "${name}:${home}:oud:$((i * 10))::Synthetic OUD ${i}:AUTO" >> "${ESTATE_DIR}/homes.conf"
+                ;;
+            4)
+                name="wls_${i}"
+                home="${product}/wls_${i}"
+                mkdir -p "${home}/wlserver/server/lib"
+                : > "${home}/wlserver/server/lib/weblogic.jar"
+                echo "${name}:${home}:weblogic:$((i * 10))::Synthetic WebLogic ${i}:AUTO" >> "${ESTATE_DIR}/homes.conf"
+                ;;
+            *)
+                name="dbhome_${i}"
+                home="${product}/${version}/dbhome_${i}"
+                mkdir -p "${home}/bin" "${home}/lib" "${home}/network/admin"
+                cp "${ESTATE_DIR}/stubs/sqlplus" "${home}/bin/sqlplus"
+                printf '#!/bin/sh\nexit 0\n' > "${home}/bin/oracle"
+                chmod +x "${home}/bin/oracle"
+                db_homes+=("${home}")
+                echo "${name}:${home}:database:$((i * 10))::Synthetic database home ${i}:AUTO" >> "${ESTATE_DIR}/homes.conf"
+                ;;
+        esac
+    done
+    [[ ${#db_homes[@]} -eq 0 ]] && die "--homes must create at least one database home (use 5 or more)"
+    cp "${ESTATE_DIR}/homes.conf" "${base}/etc/oradba_homes.conf"
+
+    # oratab: SIDs DB001.. mapped round-robin onto the database homes
+    {
+        echo "# Synthetic oratab generated by ${SCRIPT_NAME}"
+        for ((i = 1; i <= ORATAB_ENTRIES; i++)); do
+            printf 'DB%03d:%s:N\n' "${i}" "${db_homes[$(((i - 1) % ${#db_homes[@]}))]}"
+        done
+    } > "${ESTATE_DIR}/oratab"
+
+    # Extensions with metadata and content directories
+    for ((i = 1; i <= EXTENSION_COUNT; i++)); do
+        name=$(printf 'ext_%02d' "${i}")
+        mkdir -p "${ESTATE_DIR}/local/${name}"/{bin,sql,rcv,etc}
+        cat > "${ESTATE_DIR}/local/${name}/.extension" << EOF
+name: ${name}
+version: 1.0.${i}
+description: Synthetic extension ${i}
+priority: $((i % 5 * 10 + 10))
+EOF
+        write_stub "${ESTATE_DIR}/local/${name}/bin/${name}_tool.sh" <<< 'echo ok'
+        echo "SELECT 1 FROM dual;" > "${ESTATE_DIR}/local/${name}/sql/${name}.sql"
+    done
+}
+
+# ------------------------------------------------------------------------------
+# Function: run_iteration
+# Purpose.: Run one benchmark iteration in a clean shell
+# Args....: $1 - Setup code
+#           $2 - Timed body
+# Returns.: 0 if timing was captured, 1 otherwise
+# Output..: "<milliseconds> <exit code>" to stdout
+# Notes...: The environment is reset with env -i so the caller's OraDBA
+#           session does not leak in. oradba_homes.conf is restored first
+#           (discover_homes rewrites it).
+# ------------------------------------------------------------------------------
+run_iteration() {
+    local setup="$1"
+    local body="$2"
+    local timing="${ESTATE_DIR}/timing"
+    local snippet t0 t1 rc
+
+    # Restore only when changed so mtime-based caches stay valid
+    cmp -s "${ESTATE_DIR}/homes.conf" "${ESTATE_DIR}/local/oradba/etc/oradba_homes.conf" \
+        || cp -p "${ESTATE_DIR}/homes.conf" "${ESTATE_DIR}/local/oradba/etc/oradba_homes.conf"
+    snippet="B='${ESTATE_DIR}/local/oradba'; E='${ESTATE_DIR}'
+${setup}
+_bench_t0=\${EPOCHREALTIME}
+{ ${body}
+} > /dev/null 2>&1 && _bench_rc=0 || _bench_rc=\$?
+_bench_t1=\${EPOCHREALTIME}
+echo \"\${_bench_t0} \${_bench_t1} \${_bench_rc}\" >&3"
+
+    : > "${timing}"
+    env -i \
+        HOME="${ESTATE_DIR}/home" \
+        USER="${USER:-oracle}" \
+        LOGNAME="${LOGNAME:-oracle}" \
+        TERM=dumb \
+        LANG=C \
+        PATH="${ESTATE_DIR}/stubs:/usr/local/bin:/usr/bin:/bin" \
+        ORACLE_BASE="${ESTATE_DIR}/oracle" \
+        ORADBA_BASE="${ESTATE_DIR}/local/oradba" \
+        ORADBA_LOCAL_BASE="${ESTATE_DIR}/local" \
+        ORADBA_CACHE_DIR="${ESTATE_DIR}/cache" \
+        ORADBA_LOG="${ESTATE_DIR}/log" \
+        ORATAB_FILE="${ESTATE_DIR}/oratab" \
+        ORADBA_AUTO_CREATE_SID_CONFIG=false \
+        bash --noprofile --norc -c "${snippet}" 3> "${timing}" > /dev/null 2>&1 < /dev/null || true
+
+    read -r t0 t1 rc < "${timing}" || return 1
+    [[ -n "${t1:-}" ]] || return 1
+    awk -v a="${t0}" -v b="${t1}" -v rc="${rc}" 'BEGIN { printf "%.3f %d\n", (b - a) * 1000, rc }'
+}
+
+# ------------------------------------------------------------------------------
+# Function: summarize
+# Purpose.: Compute statistics for a list of timings
+# Args....: $@ - Timings in milliseconds
+# Returns.: 0 on success
+# Output..: "median p95 min max mean" (milliseconds, 3 decimals)
+# Notes...: p95 uses the nearest-rank method
+# ------------------------------------------------------------------------------
+summarize() {
+    printf '%s\n' "$@" | sort -n | awk '
+        { v[NR] = $1; sum += $1 }
+        END {
+            n = NR
+            if (n == 0) { print "0 0 0 0 0"; exit }
+            median = (n % 2) ? v[(n + 1) / 2] : (v[n / 2] + v[n / 2 + 1]) / 2
+            rank = int(0.95 * n); if (rank < 0.95 * n) rank++
+            printf "%.3f %.3f %.3f %.3f %.3f\n", median, v[rank], v[1], v[n], sum / n
+        }'
+}
+
+# ------------------------------------------------------------------------------
+# Function: baseline_median
+# Purpose.: Look up the median of a benchmark in a baseline result file
+# Args....: $1 - Baseline file
+#           $2 - Benchmark name
+# Returns.: 0 if found, 1 otherwise
+# Output..: Median in milliseconds
+# Notes...: Relies on the one-result-per-line layout written by write_json
+# ------------------------------------------------------------------------------
+baseline_median() {
+    local file="$1"
+    local name="$2"
+    local line
+
+    line=$(grep -E "\"name\": \"${name}\"," "${file}" 2> /dev/null | head -1) || return 1
+    [[ "${line}" =~ \"median_ms\":\ ([0-9.]+) ]] || return 1
+    echo "${BASH_REMATCH[1]}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: write_json
+# Purpose.: Write the benchmark results as JSON
+# Args....: $1 - Output file
+#           $@ - Result records "name iterations failures median p95 min max mean"
+# Returns.: 0 on success
+# Output..: None (writes file)
+# ------------------------------------------------------------------------------
+write_json() {
+    local file="$1"
+    shift
+    local version host record count=0 total=$#
+    local name iters fails median p95 min max mean
+
+    version=$(cat "${PROJECT_ROOT}/VERSION" 2> /dev/null || echo "unknown")
+    host=$(uname -n 2> /dev/null || echo "unknown")
+    mkdir -p "$(dirname "${file}")"
+    {
+        echo "{"
+        echo "  \"suite\": \"oradba-benchmarks\","
+        echo "  \"version\": \"${version}\","
+        echo "  \"timestamp\": \"$(date -u '+%Y-%m-%dT%H:%M:%SZ')\","
+        echo "  \"host\": \"${host}\","
+        echo "  \"bash\": \"${BASH_VERSION}\","
+        echo "  \"iterations\": ${ITERATIONS},"
+        echo "  \"warmup\": ${WARMUP},"
+        echo "  \"estate\": {\"oratab_entries\": ${ORATAB_ENTRIES}, \"oracle_homes\": ${HOME_COUNT}, \"extensions\": ${EXTENSION_COUNT}, \"running_instances\": ${RUNNING_COUNT}},"
+        echo "  \"results\": ["
+        for record in "$@"; do
+            count=$((count + 1))
+            read -r name iters fails median p95 min max mean <<< "${record}"
+            printf '    {"name": "%s", "iterations": %d, "failures": %d, "median_ms": %s, "p95_ms": %s, "min_ms": %s, "max_ms": %s, "mean_ms": %s}%s\n' \
+                "${name}" "${iters}" "${fails}" "${median}" "${p95}" "${min}" "${max}" "${mean}" \
+                "$([[ ${count} -lt ${total} ]] && echo ",")"
+        done
+        echo "  ]"
+        echo "}"
+    } > "${file}"
+}
+
+# ------------------------------------------------------------------------------
+# Function: compare_baseline
+# Purpose.: Compare current medians with a baseline result file
+# Args....: $1 - Baseline file
+#           $@ - Result records (see write_json)
+# Returns.: 0 if no regression, 2 if a median regressed beyond the threshold
+# Output..: Comparison table to stdout
+# Notes...: A regression needs both THRESHOLD percent and MIN_DELTA ms
+# ------------------------------------------------------------------------------
+compare_baseline() {
+    local file="$1"
+    shift
+    local record name median base verdict rc=0
+
+    echo ""
+    echo "Baseline: ${file} (threshold ${THRESHOLD}%, min delta ${MIN_DELTA} ms)"
+    printf '%-18s %12s %12s %9s  %s\n' "Benchmark" "Base ms" "Current ms" "Delta" "Status"
+    for record in "$@"; do
+        read -r name _ _ median _ <<< "${record}"
+        if ! base=$(baseline_median "${file}" "${name}"); then
+            printf '%-18s %12s %12s %9s  %s\n' "${name}" "-" "${median}" "-" "new"
+            continue
+        fi
+        verdict=$(awk -v c="${median}" -v b="${base}" -v t="${THRESHOLD}" -v d="${MIN_DELTA}" 'BEGIN {
+            pct = (b > 0) ? (c - b) * 100 / b : 0
+            status = "ok"
+            if (c - b > d && pct > t) status = "REGRESSION"
+            else if (b - c > d && -pct > t) status = "improved"
+            printf "%+.1f%% %s\n", pct, status
+        }')
+        printf '%-18s %12s %12s %9s  %s\n' "${name}" "${base}" "${median}" "${verdict% *}" "${verdict#* }"
+        [[ "${verdict}" == *REGRESSION ]] && rc=2
+    done
+    return ${rc}
+}
+
+# ------------------------------------------------------------------------------
+# Function: main
+# Purpose.: Parse options, build the estate, run benchmarks and report
+# Args....: $@ - Command-line options
+# Returns.: 0 on success, 1 on error, 2 on regression
+# Output..: Result table to stdout
+# ------------------------------------------------------------------------------
+main() {
+    local entry name setup body i result ms rc fails rc_compare=0
+    local -a timings=() records=()
+
+    while [[ $# -gt 0 ]]; do
+        case "$1" in
+            -i | --iterations) ITERATIONS="${2:-}"; shift 2 ;;
+            -w | --warmup) WARMUP="${2:-}"; shift 2 ;;
+            -f | --filter) FILTER="${2:-}"; shift 2 ;;
+            -o | --output) OUTPUT="${2:-}"; shift 2 ;;
+            -b | --baseline) BASELINE="${2:-}"; shift 2 ;;
+            -t | --threshold) THRESHOLD="${2:-}"; shift 2 ;;
+            --min-delta) MIN_DELTA="${2:-}"; shift 2 ;;
+            --oratab) ORATAB_ENTRIES="${2:-}"; shift 2 ;;
+            --homes) HOME_COUNT="${2:-}"; shift 2 ;;
+            --extensions) EXTENSION_COUNT="${2:-}"; shift 2 ;;
+            --running) RUNNING_COUNT="${2:-}"; shift 2 ;;
+            -k | --keep) KEEP_ESTATE=true; shift ;;
+            -l | --list)
+                for entry in "${BENCHMARKS[@]}"; do echo "${entry%%|*}"; done
+                exit 0
+                ;;
+            -h | --help) usage ;;
+            *) die "Unknown option: $1 (see --help)" ;;
+        esac
+    done
+
+    for i in "${ITERATIONS}" "${WARMUP}" "${ORATAB_ENTRIES}" "${HOME_COUNT}" "${EXTENSION_COUNT}" "${RUNNING_COUNT}" "${THRESHOLD}" "${MIN_DELTA}"; do
+        [[ "${i}" =~ ^[0-9]+$ ]] || die "Numeric option expected, got '${i}'"
+    done
+    [[ ${ITERATIONS} -gt 0 ]] || die "--iterations must be at least 1"
+    [[ ${BASH_VERSINFO[0]} -ge 5 ]] || die "bash 5 or later required (EPOCHREALTIME)"
+    [[ -z "${BASELINE}" || -f "${BASELINE}" ]] || die "Baseline file not found: ${BASELINE}"
+
+    ESTATE_DIR="$(mktemp -d "${TMPDIR:-/tmp}/oradba_bench.XXXXXX")"
+    if [[ "${KEEP_ESTATE}" == "true" ]]; then
+        echo "Estate kept in ${ESTATE_DIR}"
+    else
+        trap 'rm -rf "${ESTATE_DIR}"' EXIT
+    fi
+
+    echo "========================================="
+    echo "OraDBA Benchmarks"
+    echo "========================================="
+    echo "Estate: ${ORATAB_ENTRIES} oratab entries, ${HOME_COUNT} homes, ${EXTENSION_COUNT} extensions, ${RUNNING_COUNT} running"
+    echo "Iterations: ${ITERATIONS} (warm-up ${WARMUP})"
+    echo ""
+    build_estate
+
+    printf '%-18s %6s %10s %10s %10s %10s\n' "Benchmark" "Fails" "Median ms" "p95 ms" "Min ms" "Max ms"
+    for entry in "${BENCHMARKS[@]}"; do
+        IFS='|' read -r name setup body <<< "${entry}"
+        [[ -n "${FILTER}" && ! "${name}" =~ ${FILTER} ]] && continue
+
+        for ((i = 0; i < WARMUP; i++)); do
+            run_iteration "${setup}" "${body}" > /dev/null || true
+        done
+
+        timings=()
+        fails=0
+        for ((i = 0; i < ITERATIONS; i++)); do
+            if result=$(run_iteration "${setup}" "${body}"); then
+                read -r ms rc <<< "${result}"
+                timings+=("${ms}")
+                [[ "${rc}" -ne 0 ]] && fails=$((fails + 1))
+            else
+                fails=$((fails + 1))
+            fi
+        done
+
+        if [[ ${#timings[@]} -eq 0 ]]; then
+            echo -e "${RED}${name}: no timing captured${NC}" >&2
+            records+=("${name} 0 ${fails} 0 0 0 0 0")
+            continue
+        fi
+        result=$(summarize "${timings[@]}")
+        records+=("${name} ${#timings[@]} ${fails} ${result}")
+        # shellcheck disable=SC2086
+        printf '%-18s %6d %10.3f %10.3f %10.3f %10.3f\n' "${name}" "${fails}" ${result% *}
+    done
+
+    [[ ${#records[@]} -gt 0 ]] || die "No benchmark matches filter '${FILTER}'"
+    write_json "${OUTPUT}" "${records[@]}"
+    echo ""
+    echo "Results written to ${OUTPUT}"
+
+    if [[ -n "${BASELINE}" ]]; then
+        compare_baseline "${BASELINE}" "${records[@]}" || rc_compare=$?
+        if [[ ${rc_compare} -ne 0 ]]; then
+            echo -e "${RED}Performance regression detected${NC}"
+            return ${rc_compare}
+        fi
+        echo -e "${GREEN}No regression against baseline${NC}"
+    fi
+    return 0
+}
+
+main "$@"
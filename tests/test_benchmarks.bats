@@ -0,0 +1,75 @@
+#!/usr/bin/env bats
+# ------------------------------------------------------------------------------
+# OraDBA - Oracle Database Infrastructure and Security, 5630 Muri, Switzerland
+# ------------------------------------------------------------------------------
+# Name.......: test_benchmarks.bats
+# Author.....: Stefan Oehrli (oes) stefan.oehrli@oradba.ch
+# Editor.....: Stefan Oehrli
+# Date.......: 2026.02.11
+# Purpose....: BATS tests for the benchmark runner (tests/run_benchmarks.sh)
+# Notes......: Uses a tiny estate and few iterations; timings are not asserted
+# Reference..: https://github.com/oehrlis/oradba
+# License....: Apache License Version 2.0, January 2004 as shown
+#              at http://www.apache.org/licenses/
+# ------------------------------------------------------------------------------
+
+setup() {
+    BENCH_SCRIPT="${BATS_TEST_DIRNAME}/run_benchmarks.sh"
+    TEST_TEMP_DIR="$(mktemp -d)"
+    SMALL_ESTATE=(--oratab 20 --homes 5 --extensions 2 --running 2 --iterations 2 --warmup 0)
+}
+
+teardown() {
+    rm -rf "${TEST_TEMP_DIR}"
+}
+
+@test "run_benchmarks.sh lists the benchmarks" {
+    run bash "${BENCH_SCRIPT}" --list
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"oraenv"* ]]
+    [[ "$output" == *"registry_get_all"* ]]
+    [[ "$output" == *"discover_homes"* ]]
+    [[ "$output" == *"load_extensions"* ]]
+    [[ "$output" == *"homes_list"* ]]
+}
+
+@test "run_benchmarks.sh rejects non-numeric options" {
+    run bash "${BENCH_SCRIPT}" --iterations many
+    [ "$status" -eq 1 ]
+    [[ "$output" == *"Numeric option expected"* ]]
+}
+
+@test "run_benchmarks.sh writes JSON results with median and p95" {
+    run bash "${BENCH_SCRIPT}" "${SMALL_ESTATE[@]}" --filter '^(registry_get_all|homes_list)$' \
+        --output "${TEST_TEMP_DIR}/result.json"
+    [ "$status" -eq 0 ]
+    [ -f "${TEST_TEMP_DIR}/result.json" ]
+    grep -q '"oratab_entries": 20' "${TEST_TEMP_DIR}/result.json"
+    grep -qE '"name": "registry_get_all", "iterations": 2, "failures": 0, "median_ms": [0-9.]+, "p95_ms": [0-9.]+' \
+        "${TEST_TEMP_DIR}/result.json"
+    grep -q '"name": "homes_list"' "${TEST_TEMP_DIR}/result.json"
+    ! grep -q '"name": "oraenv"' "${TEST_TEMP_DIR}/result.json"
+    if command -v python3 > /dev/null 2>&1; then
+        python3 -m json.tool "${TEST_TEMP_DIR}/result.json" > /dev/null
+    fi
+}
+
+@test "run_benchmarks.sh reports regressions against a baseline" {
+    cat > "${TEST_TEMP_DIR}/baseline.json" << 'EOF'
+{
+  "results": [
+    {"name": "registry_get_all", "iterations": 2, "failures": 0, "median_ms": 0.001, "p95_ms": 0.001, "min_ms": 0.001, "max_ms": 0.001, "mean_ms": 0.001}
+  ]
+}
+EOF
+    run bash "${BENCH_SCRIPT}" "${SMALL_ESTATE[@]}" --filter '^registry_get_all$' \
+        --output "${TEST_TEMP_DIR}/result.json" --baseline "${TEST_TEMP_DIR}/baseline.json" --min-delta 0
+    [ "$status" -eq 2 ]
+    [[ "$output" == *"REGRESSION"* ]]
+
+    # Comparing a run with its own result never regresses beyond the threshold
+    run bash "${BENCH_SCRIPT}" "${SMALL_ESTATE[@]}" --filter '^registry_get_all$' \
+        --output "${TEST_TEMP_DIR}/result2.json" --baseline "${TEST_TEMP_DIR}/result.json" --threshold 1000
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"No regression against baseline"* ]]
+}
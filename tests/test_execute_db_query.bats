@@ -199,3 +199,98 @@ setup() {
     [ "$status" -eq 0 ]
     [[ "$output" =~ "execute_db_query" ]]
 }
+
+# =======================================================================
+# Persistent Session Tests (ORADBA_SQL_SESSION=true)
+# =======================================================================
+
+# Mock sqlplus reading statements from stdin; logs every process start
+_setup_mock_sqlplus() {
+    MOCK_DIR="${BATS_TEST_TMPDIR}/mock"
+    mkdir -p "${MOCK_DIR}/bin"
+    export MOCK_CALLS="${MOCK_DIR}/calls"
+    : > "${MOCK_CALLS}"
+    cat > "${MOCK_DIR}/bin/sqlplus" << 'EOF'
+#!/usr/bin/env bash
+echo "start $$" >> "${MOCK_CALLS}"
+while IFS= read -r line; do
+    case "${line}" in
+        PROMPT\ *) echo "${line#PROMPT }" ;;
+        EXIT*) exit 0 ;;
+        SELECT\ *ERR*) echo "ORA-00942: table or view does not exist"; [[ "$*" != *-L* ]] && exit 1 ;;
+        SELECT\ *) v="${line#SELECT }"; echo "row|${v%;}" ;;
+    esac
+done
+EOF
+    chmod +x "${MOCK_DIR}/bin/sqlplus"
+    export PATH="${MOCK_DIR}/bin:${PATH}"
+    export ORACLE_SID="FREE" ORACLE_HOME="${MOCK_DIR}"
+}
+
+# Run a snippet in a fresh shell with oradba_common.sh loaded
+_run_session_script() {
+    run bash -c "source '${ORADBA_SRC_BASE}/lib/oradba_common.sh'; $1"
+}
+
+@test "execute_db_query session serves several queries with one sqlplus process" {
+    _setup_mock_sqlplus
+    _run_session_script 'export ORADBA_SQL_SESSION=true
+        oradba_sql_session_open || exit 9
+        execute_db_query "SELECT a;" delimited
+        execute_db_query "SELECT b;" raw
+        execute_db_query "SELECT c;" delimited'
+    [ "$status" -eq 0 ]
+    [ "${lines[0]}" = "row|a" ]
+    [ "${lines[1]}" = "row|b" ]
+    [ "${lines[2]}" = "row|c" ]
+    [ "$(wc -l < "${MOCK_CALLS}")" -eq 1 ]
+}
+
+@test "execute_db_query session reports SQL errors and keeps the session" {
+    _setup_mock_sqlplus
+    _run_session_script 'export ORADBA_SQL_SESSION=true
+        oradba_sql_session_open || exit 9
+        execute_db_query "SELECT ERR;" raw && exit 8
+        execute_db_query "SELECT ok;" raw'
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"row|ok"* ]]
+    [[ "$output" != *"ORA-00942"* ]]
+    [ "$(wc -l < "${MOCK_CALLS}")" -eq 1 ]
+}
+
+@test "oradba_sql_session_close ends the sqlplus process" {
+    _setup_mock_sqlplus
+    _run_session_script 'export ORADBA_SQL_SESSION=true
+        oradba_sql_session_open || exit 9
+        pid="${_ORADBA_SQL_SESSION_PID[${ORACLE_SID}|${ORACLE_HOME}]}"
+        oradba_sql_session_close
+        sleep 0.2
+        kill -0 "${pid}" 2>/dev/null && exit 7
+        oradba_sql_session_active && exit 6
+        exit 0'
+    [ "$status" -eq 0 ]
+}
+
+@test "idle persistent session is closed and replaced by a new one" {
+    _setup_mock_sqlplus
+    _run_session_script 'export ORADBA_SQL_SESSION=true ORADBA_SQL_SESSION_IDLE=1
+        oradba_sql_session_open || exit 9
+        sleep 3
+        oradba_sql_session_active && exit 7
+        execute_db_query "SELECT again;" raw'
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"row|again"* ]]
+    [ "$(wc -l < "${MOCK_CALLS}")" -eq 2 ]
+}
+
+@test "execute_db_query uses one-shot sqlplus when session mode is disabled" {
+    _setup_mock_sqlplus
+    _run_session_script 'export ORADBA_SQL_SESSION=false
+        oradba_sql_session_open && exit 9
+        execute_db_query "SELECT a;" delimited
+        execute_db_query "SELECT b;" delimited'
+    [ "$status" -eq 0 ]
+    [ "${lines[0]}" = "row|a" ]
+    [ "${lines[1]}" = "row|b" ]
+    [ "$(wc -l < "${MOCK_CALLS}")" -eq 2 ]
+}
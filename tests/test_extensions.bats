@@ -2028,4 +2028,72 @@ EOF
     [[ "${desc}" == "New version" ]]
 }
 
+# ------------------------------------------------------------------------------
+# Extension metadata index
+# ------------------------------------------------------------------------------
+
+@test "extension index parses metadata once and persists it" {
+    export ORADBA_CACHE_DIR="${TEST_TEMP_DIR}/cache"
+    mkdir -p "${TEST_TEMP_DIR}/ext_a/bin" "${TEST_TEMP_DIR}/ext_b/sql" "${TEST_TEMP_DIR}/no_ext"
+    printf 'name: alpha\nversion: 1.2.3\npriority: 20\nprovides:\n  bin: false\n' > "${TEST_TEMP_DIR}/ext_a/.extension"
+
+    oradba_extension_index_load
+    [ "${#_ORADBA_EXT_LIST[@]}" -eq 2 ]
+    [ "${_ORADBA_EXT_KIND[${TEST_TEMP_DIR}/ext_a]}" = "meta" ]
+    [ "${_ORADBA_EXT_KIND[${TEST_TEMP_DIR}/ext_b]}" = "content" ]
+    [ "${_ORADBA_EXT_KIND[${TEST_TEMP_DIR}/no_ext]}" = "none" ]
+    [ "${_ORADBA_EXT_META[${TEST_TEMP_DIR}/ext_a|provides.bin]}" = "false" ]
+    [ -f "${ORADBA_CACHE_DIR}/extensions.index" ]
+
+    # A fresh shell reuses the persisted index without parsing any .extension
+    run bash -c "
+        source '${ORADBA_SRC_BASE}/lib/oradba_common.sh'
+        source '${ORADBA_SRC_BASE}/lib/extensions.sh'
+        export ORADBA_LOG_LEVEL=DEBUG
+        discover_extensions
+        get_extension_version '${TEST_TEMP_DIR}/ext_a'
+        get_extension_priority '${TEST_TEMP_DIR}/ext_a'
+    "
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"${TEST_TEMP_DIR}/ext_a"* ]]
+    [[ "$output" == *"1.2.3"* ]]
+    [[ "$output" == *"20"* ]]
+    [[ "$output" != *"Indexed extension metadata"* ]]
+}
+
+@test "extension index re-parses changed and drops removed extensions" {
+    export ORADBA_CACHE_DIR="${TEST_TEMP_DIR}/cache"
+    mkdir -p "${TEST_TEMP_DIR}/ext_a/bin" "${TEST_TEMP_DIR}/ext_b/bin"
+    echo "version: 1.0.0" > "${TEST_TEMP_DIR}/ext_a/.extension"
+    echo "version: 1.0.0" > "${TEST_TEMP_DIR}/ext_b/.extension"
+    oradba_extension_index_load
+
+    # Edit ext_a in place, remove ext_b, add ext_c (timestamps after the index)
+    echo "version: 2.0.0" > "${TEST_TEMP_DIR}/ext_a/.extension"
+    rm -rf "${TEST_TEMP_DIR}/ext_b"
+    mkdir -p "${TEST_TEMP_DIR}/ext_c/rcv"
+    touch -d "+2 seconds" "${TEST_TEMP_DIR}/ext_a/.extension" "${TEST_TEMP_DIR}" "${TEST_TEMP_DIR}/ext_c"
+
+    oradba_extension_index_load
+    [ "$(get_extension_version "${TEST_TEMP_DIR}/ext_a")" = "2.0.0" ]
+    [ -z "${_ORADBA_EXT_KIND[${TEST_TEMP_DIR}/ext_b]:-}" ]
+    [ "${_ORADBA_EXT_KIND[${TEST_TEMP_DIR}/ext_c]}" = "content" ]
+    run discover_extensions
+    [[ "$output" != *"ext_b"* ]]
+    [[ "$output" == *"ext_c"* ]]
+    ! grep -q "ext_b" "${ORADBA_CACHE_DIR}/extensions.index"
+}
+
+@test "extension index works without persistence (ORADBA_EXTENSION_CACHE=false)" {
+    export ORADBA_CACHE_DIR="${TEST_TEMP_DIR}/cache"
+    export ORADBA_EXTENSION_CACHE=false
+    mkdir -p "${TEST_TEMP_DIR}/ext_a/bin"
+    printf 'name: alpha\nprovides:\n  bin: false\n' > "${TEST_TEMP_DIR}/ext_a/.extension"
+
+    load_extensions
+    [ ! -f "${ORADBA_CACHE_DIR}/extensions.index" ]
+    [[ ":${PATH}:" != *":${TEST_TEMP_DIR}/ext_a/bin:"* ]]
+    [ "${ORADBA_EXT_ALPHA_PATH}" = "${TEST_TEMP_DIR}/ext_a" ]
+}
+
 # EOF
@@ -266,6 +266,57 @@ teardown() {
     [ "$output" -eq 1 ]
 }
 
+@test "oradba_log() buffers session log lines until exit when ORADBA_SESSION_LOG_BUFFER=true" {
+    export ORADBA_LOG_DIR="${TEST_LOG_DIR}"
+    export ORADBA_SESSION_LOGGING="true"
+    export ORADBA_SESSION_LOG_BUFFER="true"
+
+    run bash -c "
+        source ${ORADBA_BASE}/lib/oradba_common.sh
+        init_session_log
+        oradba_log INFO 'Buffered message' 2> /dev/null
+        grep -c 'Buffered message' \"\${ORADBA_SESSION_LOG}\" || true
+        echo \"\${ORADBA_SESSION_LOG}\" > '${TEST_LOG_DIR}/name'
+    "
+    [ "$status" -eq 0 ]
+    [ "$output" = "0" ]
+    run grep -c "Buffered message" "$(cat "${TEST_LOG_DIR}/name")"
+    [ "$output" -eq 1 ]
+}
+
+@test "oradba_log() flushes the session log buffer every ORADBA_SESSION_LOG_BUFFER_LINES lines" {
+    export ORADBA_LOG_DIR="${TEST_LOG_DIR}"
+    export ORADBA_SESSION_LOGGING="true"
+    export ORADBA_SESSION_LOG_BUFFER="true"
+    export ORADBA_SESSION_LOG_BUFFER_LINES=3
+
+    run bash -c "
+        source ${ORADBA_BASE}/lib/oradba_common.sh
+        init_session_log
+        for n in 1 2 3 4; do oradba_log INFO \"Line \${n}\"; done 2> /dev/null
+        grep -c 'Line' \"\${ORADBA_SESSION_LOG}\"
+    "
+    [ "$status" -eq 0 ]
+    [ "$output" = "3" ]
+}
+
+@test "oradba_log() applies a changed ORADBA_LOG_LEVEL after init_logging" {
+    export ORADBA_LOG_DIR="${TEST_LOG_DIR}"
+
+    run bash -c "
+        source ${ORADBA_BASE}/lib/oradba_common.sh
+        init_logging
+        oradba_log DEBUG 'hidden debug'
+        export ORADBA_LOG_LEVEL=DEBUG
+        oradba_log DEBUG 'visible debug'
+        ORADBA_LOG_LEVEL=ERROR
+        oradba_log WARN 'hidden warn'
+    " 2>&1
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"visible debug"* ]]
+    [[ "$output" != *"hidden"* ]]
+}
+
 # ------------------------------------------------------------------------------
 # Test: Integration - Complete Logging Setup
 # ------------------------------------------------------------------------------
@@ -195,3 +195,46 @@ setup() {
         skip "Oracle environment is available"
     fi
 }
+
+# ------------------------------------------------------------------------------
+# Watch mode with persistent sessions (mock sqlplus)
+# ------------------------------------------------------------------------------
+
+# Mock sqlplus: every v$session_longops query advances sofar by 100 blocks
+# and last_update_time by 10 seconds (rate 10/s), each start is logged
+_setup_mock_longops() {
+    MOCK_DIR="${BATS_TEST_TMPDIR}/mock"
+    mkdir -p "${MOCK_DIR}/bin"
+    export MOCK_CALLS="${MOCK_DIR}/calls"
+    : > "${MOCK_CALLS}"
+    cat > "${MOCK_DIR}/bin/sqlplus" << 'EOF'
+#!/usr/bin/env bash
+echo "start $$" >> "${MOCK_CALLS}"
+n=0
+while IFS= read -r line; do
+    case "${line}" in
+        PROMPT\ *) echo "${line#PROMPT }" ;;
+        EXIT*) exit 0 ;;
+        *session_longops*)
+            n=$((n + 1))
+            echo "42|7|RMAN: full datafile backup|$((n * 100))|1000|Blocks|$((1000 + n * 10))|$((n * 20))|99|900|msg"
+            ;;
+    esac
+done
+EOF
+    chmod +x "${MOCK_DIR}/bin/sqlplus"
+    export PATH="${MOCK_DIR}/bin:${PATH}"
+    export ORACLE_HOME="${MOCK_DIR}"
+}
+
+@test "longops.sh watch mode polls several SIDs over one session each" {
+    _setup_mock_longops
+    run "$LONGOPS_SCRIPT" -w -i 0.1 -c 3 CDB1 CDB2
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"CDB1,CDB2"* ]]
+    # One sqlplus process per SID for all three refreshes
+    [ "$(wc -l < "${MOCK_CALLS}")" -eq 2 ]
+    # Merged view: third sample, 300/1000 at 10 blocks/s -> 70 seconds left
+    [[ "$output" =~ CDB1\ +42\ +7\ +RMAN:\ full\ datafile\ backup\ +30\.0\ +300\ +1000\ +Blocks\ +10\.0\ +0:01:10\ +0:01:39 ]]
+    [[ "$output" =~ CDB2\ +42\ +7\ +RMAN ]]
+}
@@ -238,3 +238,81 @@ EOF
     [[ "$output" =~ "awk" ]]
     [[ "$output" =~ "find" ]]
 }
+
+# ============================================================================
+# Check Executor Tests
+# ============================================================================
+
+@test "oradba_check.sh --json reports status, message and duration per check" {
+    run bash -c "'$CHECK_SCRIPT' --json --dir '$TEST_TEMP_DIR' 2> /dev/null"
+    [ "$status" -eq 0 ]
+    [[ "$output" =~ \"status\":\ \"passed\" ]]
+    [[ "$output" =~ \"name\":\ \"system_tools\" ]]
+    [[ "$output" =~ \"name\":\ \"oradba_installation\" ]]
+    [[ "$output" =~ \"duration_ms\":\ [0-9]+ ]]
+    [[ "$output" =~ \"summary\": ]]
+    # No colored text report in JSON mode
+    [[ ! "$output" =~ "System check PASSED" ]]
+    if command -v python3 > /dev/null 2>&1; then
+        python3 -m json.tool <<< "$output" > /dev/null
+    fi
+}
+
+@test "oradba_check.sh keeps the declared check order with concurrent jobs" {
+    run "$CHECK_SCRIPT" --jobs 8 --dir "$TEST_TEMP_DIR"
+    [ "$status" -eq 0 ]
+    local order
+    order=$(grep -E "^(System Information|System Tools|Disk Space|Oracle Tools|OraDBA Installation)$" <<< "$output" | tr '\n' '|')
+    [ "$order" = "System Information|System Tools|Disk Space|Oracle Tools|OraDBA Installation|" ]
+}
+
+@test "oradba_check.sh --quiet --json runs only critical checks" {
+    run bash -c "'$CHECK_SCRIPT' --quiet --json 2> /dev/null"
+    [ "$status" -eq 0 ]
+    [[ "$output" =~ \"name\":\ \"system_tools\" ]]
+    [[ "$output" =~ \"name\":\ \"disk_space\" ]]
+    [[ ! "$output" =~ \"name\":\ \"system_info\" ]]
+}
+
+@test "oradba_check.sh times out a hanging check" {
+    # Fake running instance whose SQL*Plus connection hangs
+    mkdir -p "${TEST_TEMP_DIR}/home/bin"
+    printf '#!/usr/bin/env bash\nexec sleep 30\n' > "${TEST_TEMP_DIR}/home/bin/sqlplus"
+    chmod +x "${TEST_TEMP_DIR}/home/bin/sqlplus"
+    bash -c 'exec -a ora_pmon_CHKTMO sleep 30' &
+    local pmon_pid=$!
+
+    local start=${SECONDS}
+    run bash -c "ORACLE_HOME='${TEST_TEMP_DIR}/home' ORACLE_SID=CHKTMO PATH='${TEST_TEMP_DIR}/home/bin:${PATH}' \
+        '$CHECK_SCRIPT' --json --timeout 1 2> /dev/null"
+    kill "${pmon_pid}" 2> /dev/null || true
+
+    # Non-critical timeout: reported, but the run still passes
+    [ "$status" -eq 0 ]
+    [[ "$output" =~ \"name\":\ \"database_connectivity\",[^}]*\"status\":\ \"timeout\" ]]
+    [ $((SECONDS - start)) -lt 5 ]
+}
+
+@test "oradba_check.sh kills processes of a timed out check that ignore TERM" {
+    mkdir -p "${TEST_TEMP_DIR}/home/bin"
+    printf '#!/usr/bin/env bash\ntrap "" TERM\nexec -a chktmo_sqlplus_%s sleep 30\n' "$$" \
+        > "${TEST_TEMP_DIR}/home/bin/sqlplus"
+    chmod +x "${TEST_TEMP_DIR}/home/bin/sqlplus"
+    bash -c 'exec -a ora_pmon_CHKTMO sleep 30' &
+    local pmon_pid=$!
+
+    run bash -c "ORACLE_HOME='${TEST_TEMP_DIR}/home' ORACLE_SID=CHKTMO PATH='${TEST_TEMP_DIR}/home/bin:${PATH}' \
+        '$CHECK_SCRIPT' --json --timeout 1 2> /dev/null"
+    kill "${pmon_pid}" 2> /dev/null || true
+
+    [[ "$output" =~ \"name\":\ \"database_connectivity\",[^}]*\"status\":\ \"timeout\" ]]
+    sleep 0.5
+    ! pgrep -f "chktmo_sqlplus_$$" > /dev/null
+}
+
+@test "oradba_check.sh rejects invalid --jobs and --timeout" {
+    run "$CHECK_SCRIPT" --jobs 0
+    [ "$status" -eq 2 ]
+    run "$CHECK_SCRIPT" --timeout abc
+    [ "$status" -eq 2 ]
+}
@@ -43,6 +43,57 @@ teardown() {
     [ -d "$script_dir" ]
 }
 
+@test "oradba_add_exit_handler keeps the existing EXIT trap" {
+    run bash -c 'source "$1"
+        trap "echo user" EXIT
+        oradba_add_exit_handler "echo last"
+        oradba_add_exit_handler "echo first" first
+        oradba_add_exit_handler "echo last"' _ "${ORADBA_BASE}/lib/oradba_common.sh"
+    [ "$status" -eq 0 ]
+    [ "$output" = $'first\nuser\nlast' ]
+}
+
+@test "oradba_is_private_file accepts only files private to the current user" {
+    local file="${TEST_TEMP_DIR}/cache.sh"
+    echo ": ok" > "$file"
+
+    chmod 600 "$file"
+    oradba_is_private_file "$file"
+    chmod 644 "$file"
+    oradba_is_private_file "$file"
+
+    chmod 620 "$file"
+    run oradba_is_private_file "$file"
+    [ "$status" -eq 1 ]
+    chmod 602 "$file"
+    run oradba_is_private_file "$file"
+    [ "$status" -eq 1 ]
+    run oradba_is_private_file "${TEST_TEMP_DIR}/missing.sh"
+    [ "$status" -eq 1 ]
+
+    if [[ $EUID -eq 0 ]] && id nobody > /dev/null 2>&1; then
+        chmod 600 "$file"
+        chown nobody "$file"
+        run oradba_is_private_file "$file"
+        [ "$status" -eq 1 ]
+    fi
+}
+
+@test "oradba_cache_dir resolves ORADBA_CACHE_DIR, ORADBA_BASE, then the user cache" {
+    local dir
+    ORADBA_CACHE_DIR="${TEST_TEMP_DIR}/cache" oradba_cache_dir dir
+    [ "$dir" = "${TEST_TEMP_DIR}/cache" ]
+
+    ORADBA_CACHE_DIR="" oradba_cache_dir dir
+    [ "$dir" = "${ORADBA_BASE}/var/cache" ]
+
+    ORADBA_CACHE_DIR="" ORADBA_BASE="" XDG_CACHE_HOME="${TEST_TEMP_DIR}/xdg" oradba_cache_dir dir
+    [ "$dir" = "${TEST_TEMP_DIR}/xdg/oradba" ]
+
+    ORADBA_CACHE_DIR="" ORADBA_BASE="" XDG_CACHE_HOME="" HOME="${TEST_TEMP_DIR}" oradba_cache_dir dir
+    [ "$dir" = "${TEST_TEMP_DIR}/.cache/oradba" ]
+}
+
 @test "command_exists detects existing commands" {
     run command_exists "bash"
     [ "$status" -eq 0 ]
@@ -396,6 +447,102 @@ EOF
     [ "$status" -eq 0 ] || [ "$status" -eq 1 ]
 }
 
+# ------------------------------------------------------------------------------
+# Instance Scan Tests (fake proc root)
+# ------------------------------------------------------------------------------
+
+# Create a fake process: pid, comm, cmdline (printf format), uid, [exe target]
+_fake_proc() {
+    local dir="${ORADBA_PROC_ROOT}/$1"
+    mkdir -p "${dir}"
+    printf '%s\n' "$2" > "${dir}/comm"
+    # shellcheck disable=SC2059
+    printf "$3" > "${dir}/cmdline"
+    printf 'Name:\t%s\nUid:\t%s\t%s\t%s\t%s\n' "$2" "$4" "$4" "$4" "$4" > "${dir}/status"
+    [[ -z "${5:-}" ]] || ln -s "$5" "${dir}/exe"
+}
+
+_fake_proc_setup() {
+    export ORADBA_PROC_ROOT="${TEST_TEMP_DIR}/proc"
+    DB_HOME="${TEST_TEMP_DIR}/u01/db19"
+    LSNR_HOME="${TEST_TEMP_DIR}/u01/grid"
+    mkdir -p "${DB_HOME}/bin" "${LSNR_HOME}/bin"
+    _fake_proc 1 systemd 'systemd\0' 0
+    _fake_proc 200 bash 'bash\0' "$(id -u)"
+    _fake_proc 300 ora_pmon_orcl 'ora_pmon_orcl\0' "$(id -u)" "${DB_HOME}/bin/oracle"
+    _fake_proc 301 tnslsnr "${LSNR_HOME}/bin/tnslsnr\\0LISTENER\\0-inherit\\0" "$(id -u)"
+    _fake_proc 302 tnslsnr '/u01/ds/oracle_cman_home/bin/tnslsnr\0cust_cman\0-inherit\0' "$(id -u)"
+}
+
+@test "Instance scan: classifies db, listener and cman processes from fake proc root" {
+    _fake_proc_setup
+    oradba_instance_scan
+    [ "${_ORADBA_INST_SOURCE}" = "proc" ]
+
+    run oradba_instance_list
+    [ "$status" -eq 0 ]
+    [ "${#lines[@]}" -eq 3 ]
+    [ "${lines[0]}" = "db|orcl|300|$(id -un)|${DB_HOME}" ]
+    [ "${lines[1]}" = "listener|LISTENER|301|$(id -un)|${LSNR_HOME}" ]
+    [ "${lines[2]}" = "cman|cust_cman|302|$(id -un)|/u01/ds/oracle_cman_home" ]
+}
+
+@test "Instance scan: full name from cmdline and home from environ" {
+    _fake_proc_setup
+    # comm is cut at 15 characters, no readable exe link
+    _fake_proc 310 ora_pmon_longs 'ora_pmon_longsid12\0' "$(id -u)"
+    printf 'PATH=/bin\0ORACLE_HOME=%s\0' "${DB_HOME}" > "${ORADBA_PROC_ROOT}/310/environ"
+    oradba_instance_scan
+
+    local pid="" home=""
+    oradba_instance_get db LONGSID12 pid home
+    [ "${pid}" = "310" ]
+    [ "${home}" = "${DB_HOME}" ]
+}
+
+@test "Instance scan: lookup is case-insensitive and reports not running" {
+    _fake_proc_setup
+    oradba_instance_scan
+
+    local pid=""
+    oradba_instance_get db ORCL pid
+    [ "${pid}" = "300" ]
+    run oradba_instance_get db FREE
+    [ "$status" -eq 1 ]
+    run oradba_instance_running FREE
+    [ "$status" -eq 1 ]
+    # Without pid 1 (hidepid) a missing instance cannot be ruled out
+    rm -rf "${ORADBA_PROC_ROOT}/1"
+    run oradba_instance_running FREE
+    [ "$status" -eq 2 ]
+}
+
+@test "Instance scan: discover_running_oracle_instances uses the instance table" {
+    _fake_proc_setup
+    _fake_proc 320 db_pmon_FREE 'db_pmon_FREE\0' 4242 "${DB_HOME}/bin/oracle"
+    run discover_running_oracle_instances
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"ORCL:${DB_HOME}:N"* ]]
+    [[ "$output" != *"FREE:"* ]]
+    [[ "$output" == *"different user"* ]]
+}
+
+@test "Instance scan: falls back to ps without proc root" {
+    export ORADBA_PROC_ROOT="${TEST_TEMP_DIR}/noproc"
+    ps() {
+        printf '%s\n' "  10 oracle   ora_pmon_CDB1" \
+            "  11 oracle   /u01/db/bin/tnslsnr LISTENER_1 -inherit" \
+            "  12 oracle   grep ora_pmon_CDB1"
+    }
+    oradba_instance_scan
+    [ "${_ORADBA_INST_SOURCE}" = "ps" ]
+
+    run oradba_instance_list
+    [ "${#lines[@]}" -eq 2 ]
+    [ "${lines[0]}" = "db|CDB1|10|oracle|" ]
+    [ "${lines[1]}" = "listener|LISTENER_1|11|oracle|/u01/db" ]
+}
+
 @test "persist_discovered_instances function exists" {
     type -t persist_discovered_instances | grep -q "function"
 }
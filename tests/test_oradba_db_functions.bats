@@ -144,6 +144,24 @@ setup() {
     unset -f sqlplus
 }
 
+# Test: show_database_status skips SQL*Plus when the instance scan finds no pmon
+@test "show_database_status skips connection check for instance that is not running" {
+    unset ORADBA_CURRENT_HOME_TYPE
+    export ORACLE_SID="NOTRUNNING"
+    export ORADBA_PROC_ROOT="${BATS_TEST_TMPDIR}/proc"
+    mkdir -p "${ORADBA_PROC_ROOT}/1"
+    printf 'systemd\n' > "${ORADBA_PROC_ROOT}/1/comm"
+    check_database_connection() {
+        echo "connection attempted"
+        return 1
+    }
+
+    run show_database_status
+    [ "$status" -eq 0 ]
+    [[ "$output" =~ "NOT STARTED" ]]
+    [[ ! "$output" =~ "connection attempted" ]]
+}
+
 # Test: Functions handle sqlplus errors gracefully
 @test "query_instance_info handles sqlplus errors" {
     # This test verifies that the function can be called
@@ -10,6 +10,7 @@
 setup() {
     # Source the changes library
     export ORADBA_BASE="${BATS_TEST_DIRNAME}/../src"
+    source "${ORADBA_BASE}/lib/oradba_common.sh"
     source "${ORADBA_BASE}/lib/oradba_env_changes.sh"
     
     # Create temporary test directory
@@ -214,3 +215,117 @@ teardown() {
     run oradba_check_file_changed "${TEST_DIR}/config.txt"
     [ "$status" -eq 1 ]
 }
+
+# Batched change tracking (single manifest, quick check)
+_setup_watched_base() {
+    export ORADBA_BASE="${TEST_DIR}/base"
+    mkdir -p "${ORADBA_BASE}/etc/sid"
+    echo "core" > "${ORADBA_BASE}/etc/oradba_core.conf"
+    echo "standard" > "${ORADBA_BASE}/etc/oradba_standard.conf"
+    unset ORACLE_SID
+}
+
+@test "check_config_changes: uses one manifest instead of per-file signatures" {
+    _setup_watched_base
+
+    run oradba_init_change_tracking
+    [ "$status" -eq 0 ]
+    [ -f "${ORADBA_CACHE_DIR}/config_changes.sig" ]
+    grep -q "oradba_core.conf" "${ORADBA_CACHE_DIR}/config_changes.sig"
+    local -a sig_files=("${ORADBA_CACHE_DIR}"/*.sig)
+    [ "${sig_files[*]}" = "${ORADBA_CACHE_DIR}/config_changes.sig" ]
+
+    run oradba_check_config_changes
+    [ "$status" -eq 1 ]
+}
+
+@test "config_changed_quick: no stat call when nothing changed" {
+    _setup_watched_base
+    oradba_init_change_tracking > /dev/null
+
+    # Count stat invocations
+    stat() { echo x >> "${TEST_DIR}/stat_calls"; command stat "$@"; }
+    run oradba_config_changed_quick
+    [ "$status" -eq 1 ]
+    run oradba_check_config_changes
+    [ "$status" -eq 1 ]
+    [ ! -f "${TEST_DIR}/stat_calls" ]
+
+    touch -d "+5 seconds" "${ORADBA_BASE}/etc/oradba_core.conf"
+    run oradba_config_changed_quick
+    [ "$status" -eq 0 ]
+    run oradba_check_config_changes
+    [ "$status" -eq 0 ]
+    [ "$output" = "${ORADBA_BASE}/etc/oradba_core.conf" ]
+    [ "$(wc -l < "${TEST_DIR}/stat_calls")" -eq 1 ]
+}
+
+@test "config_changed_quick: detects a file replaced by an older copy" {
+    _setup_watched_base
+    touch -d "-1 hour" "${ORADBA_BASE}/etc/oradba_core.conf"
+    oradba_init_change_tracking > /dev/null
+
+    # e.g. cp -p / rsync -a of an older version
+    echo "restored" > "${TEST_DIR}/old.conf"
+    touch -d "-2 hours" "${TEST_DIR}/old.conf"
+    cp -p "${TEST_DIR}/old.conf" "${ORADBA_BASE}/etc/oradba_core.conf"
+    run oradba_config_changed_quick
+    [ "$status" -eq 0 ]
+    run oradba_check_config_changes
+    [ "$status" -eq 0 ]
+    [ "$output" = "${ORADBA_BASE}/etc/oradba_core.conf" ]
+    run oradba_config_changed_quick
+    [ "$status" -eq 1 ]
+}
+
+@test "check_config_changes: reports new SID config and drops removed files" {
+    _setup_watched_base
+    oradba_init_change_tracking > /dev/null
+
+    export ORACLE_SID=FREE
+    echo "sid" > "${ORADBA_BASE}/etc/sid/sid.FREE.conf"
+    oradba_check_config_changes
+    [ "${ORADBA_CONFIG_CHANGES[*]}" = "${ORADBA_BASE}/etc/sid/sid.FREE.conf" ]
+
+    rm -f "${ORADBA_BASE}/etc/oradba_standard.conf"
+    run oradba_check_config_changes
+    [ "$status" -eq 1 ]
+    ! grep -q "oradba_standard.conf" "${ORADBA_CACHE_DIR}/config_changes.sig"
+    run oradba_config_changed_quick
+    [ "$status" -eq 1 ]
+}
+
+@test "auto_reload_on_change: prompt hook reports changes once" {
+    _setup_watched_base
+    PROMPT_COMMAND="history -a"
+
+    oradba_enable_auto_reload
+    oradba_enable_auto_reload
+    [ "$PROMPT_COMMAND" = "history -a; oradba_auto_reload_on_change" ]
+
+    run oradba_auto_reload_on_change
+    [ "$status" -eq 1 ]
+    [ -z "$output" ]
+
+    echo "core changed" > "${ORADBA_BASE}/etc/oradba_core.conf"
+    touch -d "+5 seconds" "${ORADBA_BASE}/etc/oradba_core.conf"
+    oradba_auto_reload_on_change > "${TEST_DIR}/out" || true
+    grep -q "Configuration changes detected" "${TEST_DIR}/out"
+    grep -q "oradba_core.conf" "${TEST_DIR}/out"
+    run oradba_auto_reload_on_change
+    [ "$status" -eq 1 ]
+
+    oradba_disable_auto_reload
+    [ "$PROMPT_COMMAND" = "history -a" ]
+}
+
+@test "cache dir: never defaults to /var/cache without ORADBA_BASE" {
+    run env -u ORADBA_BASE -u ORADBA_PREFIX -u ORADBA_CACHE_DIR HOME="${TEST_DIR}" XDG_CACHE_HOME= \
+        bash -c 'source "$1/oradba_common.sh"; unset ORADBA_BASE
+                 source "$1/oradba_env_changes.sh"
+                 echo "dir=${ORADBA_CACHE_DIR:-}"; _oradba_change_manifest m; echo "$m"' \
+        _ "${BATS_TEST_DIRNAME}/../src/lib"
+    [ "$status" -eq 0 ]
+    [ "${lines[0]}" = "dir=" ]
+    [ "${lines[1]}" = "${TEST_DIR}/.cache/oradba/config_changes.sig" ]
+}
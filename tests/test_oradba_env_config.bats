@@ -451,3 +451,124 @@ EOF
     rm -f "${ORADBA_BASE}/etc/oradba_local.conf"
     rm -rf "${ORADBA_BASE}/etc/sid"
 }
+
+# Test compiled config cache
+@test "config_compile: should cache sections and serve values from memory" {
+    export ORADBA_CACHE_DIR="${TEST_DIR}/cache"
+    cat > "${TEST_DIR}/test.conf" <<'EOF'
+[DEFAULT]
+export TEST_VAR=compiled
+alias TEST_ALIAS='echo hi'
+EOF
+
+    oradba_config_compile "${TEST_DIR}/test.conf"
+    [ -f "${TEST_DIR}/cache/config_sections.cache" ]
+    [[ "${_ORADBA_CFG_TABLE["${TEST_DIR}/test.conf|DEFAULT"]}" == *"TEST_VAR=compiled"* ]]
+
+    # The fragment is sourceable and restores the table
+    oradba_config_cache_clear
+    [ -z "${_ORADBA_CFG_TABLE["${TEST_DIR}/test.conf|DEFAULT"]:-}" ]
+    oradba_config_compile "${TEST_DIR}/test.conf"
+    _ORADBA_CFG_TOKEN=""
+    _ORADBA_CFG_TABLE=()
+    oradba_config_compile "${TEST_DIR}/test.conf"
+    [[ "${_ORADBA_CFG_TABLE["${TEST_DIR}/test.conf|DEFAULT"]}" == *"TEST_VAR=compiled"* ]]
+
+    run oradba_get_config_value "${TEST_DIR}/test.conf" "DEFAULT" "TEST_VAR"
+    [ "$output" = "compiled" ]
+}
+
+@test "config_compile: should not source a cache file writable by others" {
+    export ORADBA_CACHE_DIR="${TEST_DIR}/cache"
+    cat > "${TEST_DIR}/test.conf" <<'EOF'
+[DEFAULT]
+export TEST_VAR=compiled
+EOF
+    oradba_config_compile "${TEST_DIR}/test.conf"
+    [ "$(stat -c '%a' "${TEST_DIR}/cache/config_sections.cache")" = "600" ]
+
+    echo "touch '${TEST_DIR}/sourced'" >> "${TEST_DIR}/cache/config_sections.cache"
+    chmod g+w "${TEST_DIR}/cache/config_sections.cache"
+    # Start like a new shell
+    _ORADBA_CFG_TOKEN=""
+    _ORADBA_CFG_TABLE=()
+    _ORADBA_CFG_SIG=()
+    oradba_config_compile "${TEST_DIR}/test.conf"
+    [ ! -e "${TEST_DIR}/sourced" ]
+    [[ "${_ORADBA_CFG_TABLE["${TEST_DIR}/test.conf|DEFAULT"]}" == *"TEST_VAR=compiled"* ]]
+    [ "$(stat -c '%a' "${TEST_DIR}/cache/config_sections.cache")" = "600" ]
+}
+
+@test "config_compile: should recompile a changed file" {
+    export ORADBA_CACHE_DIR="${TEST_DIR}/cache"
+    cat > "${TEST_DIR}/test.conf" <<'EOF'
+[DEFAULT]
+export TEST_VAR=old
+EOF
+    oradba_apply_config_section "${TEST_DIR}/test.conf" "DEFAULT"
+    [ "${TEST_VAR}" = "old" ]
+
+    cat > "${TEST_DIR}/test.conf" <<'EOF'
+[DEFAULT]
+export TEST_VAR=new
+EOF
+    oradba_apply_config_section "${TEST_DIR}/test.conf" "DEFAULT"
+    [ "${TEST_VAR}" = "new" ]
+}
+
+@test "config_compile: should verify signatures of a file replaced by an older copy" {
+    export ORADBA_CACHE_DIR="${TEST_DIR}/cache"
+    cat > "${TEST_DIR}/backup.conf" <<'EOF'
+[DEFAULT]
+export TEST_VAR=restored_value
+EOF
+    touch -d '2020-01-01' "${TEST_DIR}/backup.conf"
+    cat > "${TEST_DIR}/test.conf" <<'EOF'
+[DEFAULT]
+export TEST_VAR=current
+EOF
+    oradba_config_compile "${TEST_DIR}/test.conf"
+
+    # Older mtime than the cache: only the signature check can tell
+    mv "${TEST_DIR}/backup.conf" "${TEST_DIR}/test.conf"
+    _ORADBA_CFG_TOKEN=""
+    oradba_apply_config_section "${TEST_DIR}/test.conf" "DEFAULT"
+    [ "${TEST_VAR}" = "restored_value" ]
+}
+
+@test "config_compile: should verify signatures again after the quick change check" {
+    export ORADBA_CACHE_DIR="${TEST_DIR}/cache"
+    cat > "${TEST_DIR}/backup.conf" <<'EOF'
+[DEFAULT]
+export TEST_VAR=restored_value
+EOF
+    touch -d '2020-01-01' "${TEST_DIR}/backup.conf"
+    cat > "${TEST_DIR}/test.conf" <<'EOF'
+[DEFAULT]
+export TEST_VAR=current
+EOF
+    oradba_apply_config_section "${TEST_DIR}/test.conf" "DEFAULT"
+    [ "${TEST_VAR}" = "current" ]
+
+    # Verified once in this shell: an older copy is not noticed yet
+    mv "${TEST_DIR}/backup.conf" "${TEST_DIR}/test.conf"
+    oradba_apply_config_section "${TEST_DIR}/test.conf" "DEFAULT"
+    [ "${TEST_VAR}" = "current" ]
+
+    oradba_config_changed_quick
+    oradba_apply_config_section "${TEST_DIR}/test.conf" "DEFAULT"
+    [ "${TEST_VAR}" = "restored_value" ]
+}
+
+@test "config_compile: should work without persistence" {
+    export ORADBA_CACHE_DIR="${TEST_DIR}/cache"
+    export ORADBA_CONFIG_CACHE=false
+    cat > "${TEST_DIR}/test.conf" <<'EOF'
+[DEFAULT]
+export TEST_VAR=no_cache
+EOF
+    oradba_apply_config_section "${TEST_DIR}/test.conf" "DEFAULT"
+    [ "${TEST_VAR}" = "no_cache" ]
+    [ ! -e "${TEST_DIR}/cache/config_sections.cache" ]
+    unset ORADBA_CONFIG_CACHE
+}
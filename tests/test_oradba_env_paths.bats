@@ -0,0 +1,143 @@
+#!/usr/bin/env bats
+# ------------------------------------------------------------------------------
+# OraDBA - Oracle Database Infrastructure and Security, 5630 Muri, Switzerland
+# ------------------------------------------------------------------------------
+# Name.......: test_oradba_env_paths.bats
+# Author.....: Stefan Oehrli (oes) stefan.oehrli@oradba.ch
+# Editor.....: Stefan Oehrli
+# Date.......: 2026.02.11
+# Revision...: 0.21.0
+# Purpose....: Unit tests for the path-set engine (oradba_env_paths.sh)
+# Notes......: Compares the engine with the string-based PATH handling it
+#              replaced (prepend/append if missing, prepend + dedupe, filter)
+#              Run with: bats tests/test_oradba_env_paths.bats
+# Reference..: https://github.com/oehrlis/oradba
+# License....: Apache License Version 2.0, January 2004 as shown
+#              at http://www.apache.org/licenses/
+# ------------------------------------------------------------------------------
+
+setup() {
+    export ORADBA_BASE="${BATS_TEST_DIRNAME}/../src"
+    source "${ORADBA_BASE}/lib/oradba_env_paths.sh"
+}
+
+# Reference implementation: the string operations used before the engine
+legacy_prepend() { [[ ":${TESTPATH}:" != *":$1:"* ]] && TESTPATH="$1${TESTPATH:+:${TESTPATH}}"; return 0; }
+legacy_append() { [[ ":${TESTPATH}:" != *":$1:"* ]] && TESTPATH="${TESTPATH:+${TESTPATH}:}$1"; return 0; }
+legacy_promote() { TESTPATH="$1${TESTPATH:+:${TESTPATH}}"; }
+legacy_filter() {
+    local out="" dir
+    IFS=':' read -ra parts <<< "${TESTPATH}"
+    for dir in "${parts[@]}"; do
+        [[ "${dir}" =~ $1 ]] && continue
+        out="${out:+${out}:}${dir}"
+    done
+    TESTPATH="${out}"
+}
+
+@test "engine matches legacy string operations followed by dedupe" {
+    local -a dirs=(/u01/app/oracle/bin /usr/bin /bin /opt/grid/bin /opt/tool/bin /home/x/bin /opt/instantclient_23)
+    local seed op dir legacy
+    for seed in 1 2 3 4 5 6 7 8; do
+        RANDOM=${seed}
+        TESTPATH="/usr/bin:/bin:/usr/bin:/u01/app/oracle/bin"
+        ENGINEPATH="${TESTPATH}"
+        oradba_pathset_begin
+        for _ in {1..40}; do
+            op=$((RANDOM % 5))
+            dir="${dirs[RANDOM % ${#dirs[@]}]}"
+            case ${op} in
+                0) legacy_prepend "${dir}"; oradba_pathset_prepend ENGINEPATH "${dir}" ;;
+                1) legacy_append "${dir}"; oradba_pathset_append ENGINEPATH "${dir}" ;;
+                2) legacy_promote "${dir}"; oradba_pathset_promote ENGINEPATH "${dir}" ;;
+                3) legacy_filter '/oracle/|/grid/'; oradba_pathset_remove_match ENGINEPATH '/oracle/|/grid/' ;;
+                4) legacy_filter '^/opt/'; oradba_pathset_remove_prefix ENGINEPATH /opt/ ;;
+            esac
+        done
+        # Nothing is exported before the session ends
+        [ "${ENGINEPATH}" = "/usr/bin:/bin:/usr/bin:/u01/app/oracle/bin" ]
+        oradba_pathset_end
+        legacy="$(oradba_dedupe_path "${TESTPATH}")"
+        [ "${ENGINEPATH}" = "${legacy}" ]
+    done
+}
+
+@test "multiple prepends put each entry in front of the previous one" {
+    TESTPATH="/usr/bin:/bin"
+    oradba_pathset_prepend TESTPATH /a /b /usr/bin /c
+    [ "${TESTPATH}" = "/c:/b:/a:/usr/bin:/bin" ]
+    oradba_pathset_promote TESTPATH /bin /a
+    [ "${TESTPATH}" = "/a:/bin:/c:/b:/usr/bin" ]
+}
+
+@test "session picks up changes made outside the engine" {
+    TESTPATH="/usr/bin"
+    oradba_pathset_begin
+    oradba_pathset_prepend TESTPATH /a
+    oradba_pathset_commit
+    [ "${TESTPATH}" = "/a:/usr/bin" ]
+    # e.g. a sourced config file
+    export TESTPATH="/custom:${TESTPATH}"
+    oradba_pathset_append TESTPATH /z
+    oradba_pathset_end
+    [ "${TESTPATH}" = "/custom:/a:/usr/bin:/z" ]
+}
+
+@test "session merges outside changes into pending changes" {
+    TESTPATH="/usr/bin:/old/bin"
+    oradba_pathset_begin
+    oradba_pathset_prepend TESTPATH /a
+    oradba_pathset_append TESTPATH /z
+    # Changed outside the engine while /a and /z are pending
+    export TESTPATH="/custom:/usr/bin:/late"
+    oradba_pathset_append TESTPATH /y
+    oradba_pathset_end
+    [ "${TESTPATH}" = "/custom:/a:/usr/bin:/z:/late:/y" ]
+}
+
+@test "operations that change nothing do not export the variable" {
+    unset UNSETPATH
+    oradba_pathset_remove UNSETPATH /a
+    oradba_pathset_remove_prefix UNSETPATH /opt/
+    oradba_pathset_remove_match UNSETPATH '^/opt/'
+    [ -z "${UNSETPATH+x}" ]
+
+    TESTPATH="/usr/bin:/bin"
+    oradba_pathset_begin
+    oradba_pathset_remove TESTPATH /nope
+    oradba_pathset_append TESTPATH /bin
+    [ -z "${_ORADBA_PS_DIRTY[TESTPATH]+x}" ]
+    oradba_pathset_end
+    [ "${TESTPATH}" = "/usr/bin:/bin" ]
+}
+
+@test "remove_match keeps listed entries and dedupe leaves unset variables alone" {
+    TESTPATH="/l/ext1/bin:/l/oradba/bin:/usr/bin:/l/ext2/bin"
+    oradba_pathset_remove_match TESTPATH '^/l/[^/]+/bin$' /l/oradba/bin
+    [ "${TESTPATH}" = "/l/oradba/bin:/usr/bin" ]
+
+    unset UNSETPATH
+    oradba_pathset_dedupe UNSETPATH
+    [ -z "${UNSETPATH+x}" ]
+}
+
+@test "oradba_build_environment cleans, prepends and dedupes PATH and library path" {
+    local home="${BATS_TMPDIR}/paths_$$/oracle/product/19"
+    mkdir -p "${home}/bin" "${home}/lib"
+    run bash -c "
+        export ORADBA_BASE='${ORADBA_BASE}' ORATAB_FILE=/dev/null
+        source '${ORADBA_BASE}/lib/oradba_common.sh'
+        source '${ORADBA_BASE}/lib/oradba_env_builder.sh'
+        export PATH='/old/oracle/bin:/usr/bin:/bin:/usr/bin'
+        export LD_LIBRARY_PATH='/old/oracle/lib:/usr/local/lib'
+        oradba_build_environment '${home}' > /dev/null 2>&1
+        echo \"PATH=\${PATH}\"
+        echo \"LD_LIBRARY_PATH=\${LD_LIBRARY_PATH}\"
+        echo \"depth=\${_ORADBA_PS_DEPTH}\"
+    "
+    rm -rf "${BATS_TMPDIR}/paths_$$"
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"PATH=${home}/bin:/usr/bin:/bin"* ]]
+    [[ "$output" == *"LD_LIBRARY_PATH=${home}/lib:/usr/local/lib"* ]]
+    [[ "$output" == *"depth=0"* ]]
+}
@@ -100,3 +100,52 @@ setup() {
     [ "$status" -eq 0 ]
     [[ "$output" =~ Configuration\ System ]]
 }
+
+# Small catalog in the format written by scripts/generate_api_docs.py
+_create_catalog() {
+    export ORADBA_FUNCTION_CATALOG="${BATS_TEST_TMPDIR}/function-catalog.tsv"
+    {
+        echo "# OraDBA function catalog v1: name, category, source, line, purpose, args, returns, output, notes, callers"
+        printf '%s\t%s\t%s\t%s\t%s\t%s\t%s\t%s\t%s\t%s\n' \
+            oradba_registry_get_all registry lib/oradba_registry.sh 100 "Get all installations" "" "0 on success" "" "" "bin/oraup.sh:10" \
+            oradba_registry_get_field registry lib/oradba_registry.sh 428 "Extract specific field" \
+            '$1 - Installation object\n$2 - Field name' "0 on success, 1 on error" "Field value" "" \
+            "bin/oraup.sh:1,bin/oraup.sh:2,bin/oraup.sh:3,bin/oraup.sh:4,bin/oraup.sh:5,bin/oraup.sh:6,bin/oraup.sh:7,bin/oraup.sh:8,bin/oraup.sh:9,bin/oraup.sh:10,bin/oraup.sh:11,bin/oraup.sh:12" \
+            oradba_registry_sync registry lib/oradba_registry.sh 500 "Sync registry" "" "" "" "" ""
+    } > "${ORADBA_FUNCTION_CATALOG}"
+}
+
+@test "oradba help function shows the catalog entry of a function" {
+    _create_catalog
+    run "$ORADBA_HELP" function oradba_registry_get_field
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"lib/oradba_registry.sh:428"* ]]
+    [[ "$output" == *"\$2 - Field name"* ]]
+    [[ "$output" == *"Called from (12)"* ]]
+    [[ "$output" == *"2 more (--callers)"* ]]
+    [[ "$output" != *"oradba_registry_sync"* ]]
+}
+
+@test "oradba help function --callers lists all call sites" {
+    _create_catalog
+    run "$ORADBA_HELP" help function oradba_registry_get_field --callers
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"bin/oraup.sh:12"* ]]
+    [[ "$output" != *"more (--callers)"* ]]
+}
+
+@test "oradba help function with prefix lists matching functions" {
+    _create_catalog
+    run "$ORADBA_HELP" function 'oradba_registry_get*'
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"oradba_registry_get_all"* ]]
+    [[ "$output" == *"oradba_registry_get_field"* ]]
+    [[ "$output" != *"oradba_registry_sync"* ]]
+}
+
+@test "oradba help function fails for unknown functions" {
+    _create_catalog
+    run "$ORADBA_HELP" function no_such_function
+    [ "$status" -eq 1 ]
+    [[ "$output" == *"No function matching"* ]]
+}
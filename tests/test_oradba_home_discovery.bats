@@ -170,3 +170,221 @@ teardown() {
     run is_subdirectory_of_oracle_home "${other}" "${home}"
     [ "$status" -eq 1 ]
 }
+
+# ------------------------------------------------------------------------------
+# Product detection cache
+# ------------------------------------------------------------------------------
+
+@test "detect_product_type records the result in the detection cache" {
+    export ORADBA_CACHE_DIR="${BATS_TEST_TMPDIR}/cache"
+    local home="${BATS_TEST_TMPDIR}/cached_db"
+    mkdir -p "${home}/bin"
+    touch "${home}/bin/sqlplus" "${home}/bin/oracle"
+
+    run detect_product_type "${home}"
+    [ "$status" -eq 0 ]
+    [ "$output" = "database" ]
+    grep -q "^${home}"$'\t'".*"$'\t'"database"$'\t' "${ORADBA_CACHE_DIR}/home_detect.cache"
+}
+
+@test "detect_product_type is served from cache while the signature is unchanged" {
+    export ORADBA_CACHE_DIR="${BATS_TEST_TMPDIR}/cache"
+    local home="${BATS_TEST_TMPDIR}/cached_client"
+    mkdir -p "${home}/bin"
+    touch "${home}/bin/sqlplus"
+
+    detect_product_type "${home}" > /dev/null
+    detect_product_type "${home}" > /dev/null
+    [ "${_ORADBA_DETECT_MISSES}" -eq 1 ]
+    [ "${_ORADBA_DETECT_HITS}" -eq 1 ]
+    run detect_product_type "${home}"
+    [ "$output" = "client" ]
+}
+
+@test "detection cache entry is invalidated when a marker file appears" {
+    export ORADBA_CACHE_DIR="${BATS_TEST_TMPDIR}/cache"
+    local home="${BATS_TEST_TMPDIR}/relinked_home"
+    mkdir -p "${home}/bin"
+    touch "${home}/bin/sqlplus"
+
+    run detect_product_type "${home}"
+    [ "$output" = "client" ]
+
+    touch "${home}/bin/oracle"
+    run detect_product_type "${home}"
+    [ "$output" = "database" ]
+}
+
+@test "detect_product_type cache hit runs no stat call" {
+    export ORADBA_CACHE_DIR="${BATS_TEST_TMPDIR}/cache"
+    local home="${BATS_TEST_TMPDIR}/nostat_home"
+    mkdir -p "${home}/bin"
+    touch "${home}/bin/sqlplus" "${home}/bin/oracle"
+    detect_product_type "${home}" > /dev/null
+
+    stat() { echo "stat" >> "${BATS_TEST_TMPDIR}/stat.calls"; command stat "$@"; }
+    run detect_product_type "${home}"
+    [ "$output" = "database" ]
+    [ ! -f "${BATS_TEST_TMPDIR}/stat.calls" ]
+}
+
+@test "detection cache keeps one line per home when entries are replaced" {
+    export ORADBA_CACHE_DIR="${BATS_TEST_TMPDIR}/cache"
+    local home="${BATS_TEST_TMPDIR}/compact_home"
+    mkdir -p "${home}/bin"
+    touch "${home}/bin/sqlplus"
+    detect_product_type "${home}" > /dev/null
+    touch "${home}/bin/oracle"
+    detect_product_type "${home}" > /dev/null
+    rm -f "${home}/bin/oracle"
+    detect_product_type "${home}" > /dev/null
+
+    [ "$(grep -c "^${home}"$'\t' "${ORADBA_CACHE_DIR}/home_detect.cache")" -eq 1 ]
+    grep -q $'\t'"client"$'\t' "${ORADBA_CACHE_DIR}/home_detect.cache"
+}
+
+@test "detect_oracle_version caches the detected version" {
+    export ORADBA_CACHE_DIR="${BATS_TEST_TMPDIR}/cache"
+    local home="${BATS_TEST_TMPDIR}/product/19.0.0.0/dbhome_1"
+    mkdir -p "${home}/bin"
+    touch "${home}/bin/sqlplus" "${home}/bin/oracle"
+
+    execute_plugin_function_v2() { return 1; }
+    run detect_oracle_version "${home}"
+    [ "$status" -eq 0 ]
+    [ "$output" = "1900" ]
+    grep -q $'\t'"ok"$'\t'"1900$" "${ORADBA_CACHE_DIR}/home_detect.cache"
+
+    execute_plugin_function_v2() { echo "should-not-run"; return 0; }
+    run detect_oracle_version "${home}"
+    [ "$output" = "1900" ]
+}
+
+@test "oradba_detect_cache_invalidate removes a single home" {
+    export ORADBA_CACHE_DIR="${BATS_TEST_TMPDIR}/cache"
+    local home1="${BATS_TEST_TMPDIR}/inv_home1" home2="${BATS_TEST_TMPDIR}/inv_home2"
+    mkdir -p "${home1}/bin" "${home2}/bin"
+    touch "${home1}/bin/sqlplus" "${home2}/bin/sqlplus"
+    detect_product_type "${home1}" > /dev/null
+    detect_product_type "${home2}" > /dev/null
+
+    oradba_detect_cache_invalidate "${home1}"
+    ! grep -q "^${home1}"$'\t' "${ORADBA_CACHE_DIR}/home_detect.cache"
+    grep -q "^${home2}"$'\t' "${ORADBA_CACHE_DIR}/home_detect.cache"
+}
+
+@test "oradba_detect_cache_stats reports the file and its entries" {
+    export ORADBA_CACHE_DIR="${BATS_TEST_TMPDIR}/cache"
+    local home="${BATS_TEST_TMPDIR}/stats_home"
+    mkdir -p "${home}/bin"
+    touch "${home}/bin/sqlplus"
+    detect_product_type "${home}" > /dev/null
+    detect_product_type "${home}" > /dev/null
+
+    run oradba_detect_cache_stats
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"file=${ORADBA_CACHE_DIR}/home_detect.cache"* ]]
+    [[ "$output" == *"entries=1"* ]]
+    [[ "$output" != *"hits="* ]]
+}
+
+@test "ORADBA_DETECT_CACHE=false disables the detection cache" {
+    export ORADBA_CACHE_DIR="${BATS_TEST_TMPDIR}/cache"
+    export ORADBA_DETECT_CACHE=false
+    local home="${BATS_TEST_TMPDIR}/nocache_home"
+    mkdir -p "${home}/bin"
+    touch "${home}/bin/sqlplus"
+
+    run detect_product_type "${home}"
+    [ "$output" = "client" ]
+    [ ! -f "${ORADBA_CACHE_DIR}/home_detect.cache" ]
+}
+
+# ------------------------------------------------------------------------------
+# auto_discover_oracle_homes (pruned, parallel, incremental walk)
+# ------------------------------------------------------------------------------
+
+_mk_discovery_tree() {
+    local product="$1"
+    mkdir -p "${product}/19.0.0/dbhome_1/bin" "${product}/21.0.0/client_1/bin" \
+        "${product}/instantclient_21_10"
+    touch "${product}/19.0.0/dbhome_1/bin/sqlplus" "${product}/19.0.0/dbhome_1/bin/oracle"
+    touch "${product}/21.0.0/client_1/bin/sqlplus"
+    touch "${product}/instantclient_21_10/libclntsh.so.21.1"
+}
+
+@test "auto_discover_oracle_homes prunes subtrees of discovered homes" {
+    export ORADBA_CACHE_DIR="${BATS_TEST_TMPDIR}/cache"
+    local product="${BATS_TEST_TMPDIR}/product"
+    mkdir -p "${product}/dbhome_19/bin" "${product}/dbhome_19/inner/bin"
+    touch "${product}/dbhome_19/bin/sqlplus" "${product}/dbhome_19/bin/oracle"
+    touch "${product}/dbhome_19/inner/bin/sqlplus"
+
+    run auto_discover_oracle_homes "${product}" "false"
+    [ "$status" -eq 0 ]
+    [ "$(grep -c ':AUTO$' "${HOMES_CONF}")" -eq 1 ]
+    ! grep -q "/inner:" "${HOMES_CONF}"
+    [[ "$output" == *"Pruned:     1 Oracle Home subtree(s)"* ]]
+}
+
+@test "auto_discover_oracle_homes registers the same homes serially and in parallel" {
+    export ORADBA_CACHE_DIR="${BATS_TEST_TMPDIR}/cache"
+    export ORADBA_DISCOVERY_STATE=false
+    local product="${BATS_TEST_TMPDIR}/product"
+    _mk_discovery_tree "${product}"
+
+    ORADBA_DISCOVERY_JOBS=1 auto_discover_oracle_homes "${product}" "true"
+    cp "${HOMES_CONF}" "${BATS_TEST_TMPDIR}/serial.conf"
+    rm -f "${HOMES_CONF}"
+    ORADBA_DISCOVERY_JOBS=4 auto_discover_oracle_homes "${product}" "true"
+
+    [ "$(grep -c ':AUTO$' "${HOMES_CONF}")" -eq 3 ]
+    diff "${BATS_TEST_TMPDIR}/serial.conf" "${HOMES_CONF}"
+}
+
+@test "auto_discover_oracle_homes reuses discovery state for unchanged directories" {
+    export ORADBA_CACHE_DIR="${BATS_TEST_TMPDIR}/cache"
+    local product="${BATS_TEST_TMPDIR}/product"
+    _mk_discovery_tree "${product}"
+
+    run auto_discover_oracle_homes "${product}" "false"
+    [ "$status" -eq 0 ]
+    [ -f "${ORADBA_CACHE_DIR}/discovery.state" ]
+    grep -q "^${product}/19.0.0/dbhome_1"$'\t'"database$" "${ORADBA_CACHE_DIR}/discovery.state"
+
+    run auto_discover_oracle_homes "${product}" "false"
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"0 classified"* ]]
+    [[ "$output" == *"Skipped: 3 already registered"* ]]
+}
+
+@test "auto_discover_oracle_homes re-examines directories that changed" {
+    export ORADBA_CACHE_DIR="${BATS_TEST_TMPDIR}/cache"
+    local product="${BATS_TEST_TMPDIR}/product"
+    _mk_discovery_tree "${product}"
+    mkdir -p "${product}/21.0.0/dbhome_2/bin"
+    # Age the tree and the state so only the new marker files are newer
+    find "${product}" -exec touch -d "@$(($(date +%s) - 120))" {} +
+
+    auto_discover_oracle_homes "${product}" "true"
+    ! grep -q "/dbhome_2:" "${HOMES_CONF}"
+
+    touch -d "@$(($(date +%s) - 60))" "${ORADBA_CACHE_DIR}/discovery.state"
+    touch "${product}/21.0.0/dbhome_2/bin/sqlplus" "${product}/21.0.0/dbhome_2/bin/oracle"
+
+    run auto_discover_oracle_homes "${product}" "false"
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"1 classified"* ]]
+    grep -q "/dbhome_2:database:" "${HOMES_CONF}"
+}
+
+@test "auto_discover_oracle_homes full rescan ignores discovery state" {
+    export ORADBA_CACHE_DIR="${BATS_TEST_TMPDIR}/cache"
+    local product="${BATS_TEST_TMPDIR}/product"
+    _mk_discovery_tree "${product}"
+
+    auto_discover_oracle_homes "${product}" "true"
+    run auto_discover_oracle_homes "${product}" "false" "full"
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"(0 unchanged,"* ]]
+}
@@ -968,3 +968,45 @@ EOF
     # Alias field must hold the NAME default, not the description text.
     [[ "$output" == "OUD12||oud|50|OUD12|My OUD Description|1234" ]]
 }
+
+# ------------------------------------------------------------------------------
+# Detection cache command
+# ------------------------------------------------------------------------------
+
+@test "oradba_homes.sh cache stats reports valid and stale homes" {
+    mkdir -p "${ORACLE_BASE}/product/client19/bin"
+    touch "${ORACLE_BASE}/product/client19/bin/sqlplus"
+    cat > "${ORADBA_BASE}/etc/oradba_homes.conf" << EOF
+CLIENT19:${ORACLE_BASE}/product/client19:client:10:cl19:Client:AUTO
+EOF
+
+    run "$HOMES_SCRIPT" cache stats
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"Detection Cache"* ]]
+    [[ "$output" =~ stale[[:space:]]+:\ 1 ]]
+
+    run "$HOMES_SCRIPT" show CLIENT19
+    run "$HOMES_SCRIPT" cache stats
+    [ "$status" -eq 0 ]
+    [[ "$output" =~ valid[[:space:]]+:\ 1 ]]
+    # Per-process hit/miss counters are not reported
+    [[ "$output" != *"hits"* ]]
+    [[ "$output" != *"misses"* ]]
+}
+
+@test "oradba_homes.sh cache clear removes cached detection results" {
+    mkdir -p "${ORACLE_BASE}/product/client19/bin"
+    touch "${ORACLE_BASE}/product/client19/bin/sqlplus"
+    detect_product_type "${ORACLE_BASE}/product/client19" > /dev/null
+    [ -f "${ORADBA_BASE}/var/cache/home_detect.cache" ]
+
+    run "$HOMES_SCRIPT" cache clear
+    [ "$status" -eq 0 ]
+    [ ! -f "${ORADBA_BASE}/var/cache/home_detect.cache" ]
+}
+
+@test "oradba_homes.sh cache rejects unknown actions" {
+    run "$HOMES_SCRIPT" cache bogus
+    [ "$status" -eq 1 ]
+    [[ "$output" == *"Unknown cache action"* ]]
+}
@@ -122,3 +122,77 @@ setup() {
     # Should be exactly 2 top-level load_config_file calls (core + local bootstrap)
     [[ "${toplevel_calls}" -le 2 ]]
 }
+
+# ---------------------------------------------------------------------------
+# PDB topology cache: a fresh cache creates aliases without SQL*Plus
+# ---------------------------------------------------------------------------
+_pdb_cache_setup() {
+    source "${ORADBA_BASE}/lib/oradba_common.sh"
+    export ORADBA_CACHE_DIR="${BATS_TMPDIR}/pdb_cache_$$"
+    rm -rf "${ORADBA_CACHE_DIR}" "${ORADBA_CACHE_DIR}.calls"
+    export ORADBA_LOAD_PDB_ALIASES="true"
+    export ORADBA_NO_PDB_ALIASES="false"
+    export ORACLE_SID="CDB1"
+    check_database_connection() { return 0; }
+    sqlplus() {
+        echo "call" >> "${ORADBA_CACHE_DIR}.calls"
+        cat > /dev/null
+        printf 'CDB|YES\nPDB|PDB1|READ WRITE\nPDB|PDB2|MOUNTED\n'
+    }
+}
+
+@test "PDB cache: missing cache queries once and records topology" {
+    _pdb_cache_setup
+
+    generate_pdb_aliases
+    [[ "${ORADBA_PDBLIST}" == "PDB1 PDB2" ]]
+    [ "$(wc -l < "${ORADBA_CACHE_DIR}.calls")" -eq 1 ]
+    [[ "$(alias pdb1)" == *"CONTAINER=PDB1"* ]]
+    [[ "$(alias pdbpdb2)" == *"CONTAINER=PDB2"* ]]
+
+    run oradba_pdb_topology CDB1
+    [ "$status" -eq 0 ]
+    [[ "${lines[0]}" == $'PDB1\tREAD WRITE' ]]
+    [[ "${lines[1]}" == $'PDB2\tMOUNTED' ]]
+    rm -rf "${ORADBA_CACHE_DIR}" "${ORADBA_CACHE_DIR}.calls"
+}
+
+@test "PDB cache: fresh cache creates aliases without SQL*Plus" {
+    _pdb_cache_setup
+    oradba_pdb_cache_refresh
+    sqlplus() { echo "SQLPLUS_CALLED" >&2; return 1; }
+    check_database_connection() { echo "SQLPLUS_CALLED" >&2; return 1; }
+
+    run generate_pdb_aliases
+    [ "$status" -eq 0 ]
+    [[ "${output}" != *"SQLPLUS_CALLED"* ]]
+
+    generate_pdb_aliases 2> /dev/null
+    [[ "${ORADBA_PDBLIST}" == "PDB1 PDB2" ]]
+    rm -rf "${ORADBA_CACHE_DIR}" "${ORADBA_CACHE_DIR}.calls"
+}
+
+@test "PDB cache: expired cache is used and refreshed synchronously when background is off" {
+    _pdb_cache_setup
+    export ORADBA_PDB_CACHE_BACKGROUND="false"
+    mkdir -p "${ORADBA_CACHE_DIR}"
+    printf '# oradba pdb topology v1|1|CDB1\nCDB|YES\nPDB|OLD|MOUNTED\n' > "${ORADBA_CACHE_DIR}/pdb_topology.CDB1"
+
+    generate_pdb_aliases
+    [[ "${ORADBA_PDBLIST}" == "PDB1 PDB2" ]]
+    [ "$(wc -l < "${ORADBA_CACHE_DIR}.calls")" -eq 1 ]
+    grep -q '^PDB|PDB2|MOUNTED$' "${ORADBA_CACHE_DIR}/pdb_topology.CDB1"
+    unset ORADBA_PDB_CACHE_BACKGROUND
+    rm -rf "${ORADBA_CACHE_DIR}" "${ORADBA_CACHE_DIR}.calls"
+}
+
+@test "PDB cache: TTL 0 disables the cache" {
+    _pdb_cache_setup
+    export ORADBA_PDB_CACHE_TTL=0
+
+    generate_pdb_aliases
+    [[ "${ORADBA_PDBLIST}" == "PDB1 PDB2" ]]
+    [ ! -e "${ORADBA_CACHE_DIR}/pdb_topology.CDB1" ]
+    unset ORADBA_PDB_CACHE_TTL
+    rm -rf "${ORADBA_CACHE_DIR}" "${ORADBA_CACHE_DIR}.calls"
+}
@@ -0,0 +1,102 @@
+#!/usr/bin/env bats
+# ---------------------------------------------------------------------------
+# OraDBA - Oracle Database Infrastructure and Security Automation
+# ---------------------------------------------------------------------------
+# Unit tests for oradba_profile.sh (library) and oradba_profile.sh (report)
+# Tests phase/function timing, profile files and report aggregation
+# ---------------------------------------------------------------------------
+
+setup() {
+    export ORADBA_BASE="${BATS_TEST_DIRNAME}/../src"
+    TEST_DIR="${BATS_TMPDIR}/test_profile_$$"
+    mkdir -p "${TEST_DIR}"
+    export ORADBA_PROFILE_DIR="${TEST_DIR}/profiles"
+    source "${ORADBA_BASE}/lib/oradba_common.sh"
+    source "${ORADBA_BASE}/lib/oradba_profile.sh"
+}
+
+teardown() {
+    rm -rf "${TEST_DIR}"
+}
+
+@test "profile records phases, wrapped functions and total, then restores functions" {
+    slow_step() { sleep 0.05; echo "result:$1"; }
+    export ORADBA_PROFILE_FUNCTIONS="slow_step"
+
+    oradba_profile_start "unit.sh"
+    declare -f slow_step | grep -q "_oradba_profile_enter"
+    [ "$(slow_step a)" = "result:a" ]
+    oradba_profile_mark "first phase"
+    oradba_profile_finish 0
+
+    profile=$(ls "${ORADBA_PROFILE_DIR}"/unit_*.prof)
+    grep -q $'^meta\tscript\tunit.sh$' "$profile"
+    grep -qE $'^func\tslow_step\t[0-9]+\\.[0-9]{3}\t' "$profile"
+    grep -qE $'^phase\tfirst phase\t[0-9]+\\.[0-9]{3}\t' "$profile"
+    grep -qE $'^total\tunit.sh\t' "$profile"
+    # slow_step ran in a subshell and still took at least 50 ms
+    ms=$(awk -F'\t' '$1 == "func" { print int($3) }' "$profile")
+    [ "$ms" -ge 50 ]
+    # original function restored, profiler inactive
+    ! declare -f slow_step | grep -q "_oradba_profile_enter"
+    ! oradba_profile_active
+}
+
+@test "profile marks are no-ops when profiling is not active" {
+    run oradba_profile_mark "ignored"
+    [ "$status" -eq 0 ]
+    [ ! -d "${ORADBA_PROFILE_DIR}" ]
+}
+
+@test "report aggregates profiles into a sorted top-N table" {
+    mkdir -p "${ORADBA_PROFILE_DIR}"
+    printf 'meta\tscript\toraenv.sh\nphase\tload_config\t30.000\t4\nfunc\tgen_aliases\t5.000\t1\nfunc\tgen_aliases\t7.000\t3\ntotal\toraenv.sh\t50.000\t9\n' \
+        > "${ORADBA_PROFILE_DIR}/oraenv_1.prof"
+    printf 'meta\tscript\toraenv.sh\nphase\tload_config\t10.000\t2\nphase\tparse_args\t1.000\t0\ntotal\toraenv.sh\t30.000\t3\n' \
+        > "${ORADBA_PROFILE_DIR}/oraenv_2.prof"
+
+    run oradba_profile_report 2 "${ORADBA_PROFILE_DIR}"
+    [ "$status" -eq 0 ]
+    [[ "${lines[0]}" == "Profiles: 2 run(s), total avg 40.0 ms, max 50.0 ms" ]]
+    # rank 1: load_config (2 runs, avg 20, max 30, total 40, 3 forks per call)
+    echo "$output" | grep -qE '^1 +phase +load_config +2 +2 +20\.00 +30\.00 +40\.00 +3\.0$'
+    echo "$output" | grep -qE '^2 +func +gen_aliases +1 +2 +6\.00 +7\.00 +12\.00 +2\.0$'
+    # top 2 drops parse_args
+    [[ "$output" != *"parse_args"* ]]
+}
+
+@test "oraenv.sh writes a profile when ORADBA_PROFILE=true" {
+    mkdir -p "${TEST_DIR}/oracle/19c/bin"
+    echo "FREE:${TEST_DIR}/oracle/19c:N" > "${TEST_DIR}/oratab"
+    run bash -c "
+        export ORATAB_FILE='${TEST_DIR}/oratab' ORADBA_CACHE_DIR='${TEST_DIR}/cache'
+        export ORADBA_AUTO_CREATE_SID_CONFIG=false ORADBA_PROFILE=true
+        source '${ORADBA_BASE}/bin/oraenv.sh' FREE --silent > /dev/null 2>&1
+        declare -f load_config | grep -c _oradba_profile_enter
+    "
+    [ "$output" = "0" ]
+    profile=$(ls "${ORADBA_PROFILE_DIR}"/oraenv_*.prof)
+    grep -q $'^phase\tsource oradba_common.sh\t' "$profile"
+    grep -q $'^func\tload_config\t' "$profile"
+    grep -q $'^total\toraenv.sh\t' "$profile"
+
+    run "${ORADBA_BASE}/bin/oradba_profile.sh" report --top 3
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"Profiles: 1 run(s)"* ]]
+}
+
+@test "oraenv.sh finishes the profile on an early return" {
+    mkdir -p "${TEST_DIR}/oracle/19c/bin"
+    echo "FREE:${TEST_DIR}/oracle/19c:N" > "${TEST_DIR}/oratab"
+    run bash -c "
+        export ORATAB_FILE='${TEST_DIR}/oratab' ORADBA_CACHE_DIR='${TEST_DIR}/cache'
+        export ORADBA_AUTO_CREATE_SID_CONFIG=false ORADBA_PROFILE=true
+        source '${ORADBA_BASE}/bin/oraenv.sh' --silent < /dev/null > /dev/null 2>&1
+        echo \"rc=\$? active=\${_ORADBA_PROFILE_ACTIVE}\"
+        declare -f load_config | grep -c _oradba_profile_enter
+    "
+    [ "${lines[0]}" = "rc=1 active=" ]
+    [ "${lines[1]}" = "0" ]
+    profile=$(ls "${ORADBA_PROFILE_DIR}"/oraenv_*.prof)
+    grep -q $'^meta\tstatus\t1$' "$profile"
+}
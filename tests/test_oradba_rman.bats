@@ -369,6 +369,47 @@ teardown() {
     [[ "$output" =~ "DB3" ]]
 }
 
+@test "oradba_rman.sh --max-jobs writes one result record per SID" {
+    run "$RMAN_SCRIPT" --sid DB1,DB2,DB3 --rcv "$MOCK_RCV" --max-jobs 1 --dry-run
+    [[ "$status" -eq 0 ]]
+    results=("${ORADBA_LOG}"/oradba_rman_*.results)
+    [[ -f "${results[0]}" ]]
+    [[ "$(grep -c '|SUCCESS|0|' "${results[0]}")" -eq 3 ]]
+    grep -q '^DB2|SUCCESS|0|[0-9]*|1|' "${results[0]}"
+    # Weight comes from RMAN_CHANNELS in the SID config
+    run "$RMAN_SCRIPT" --sid TEST --rcv "$MOCK_RCV" --dry-run
+    grep -q '^TEST|SUCCESS|0|[0-9]*|2|' "${ORADBA_LOG}"/oradba_rman_*.results
+}
+
+@test "oradba_rman.sh --timeout terminates hanging RMAN jobs" {
+    printf '#!/usr/bin/env bash\nsleep 60\n' > "${ORACLE_HOME}/bin/rman"
+    chmod +x "${ORACLE_HOME}/bin/rman"
+    mkdir -p "${ORACLE_BASE}/admin/TEST1/log" "${ORACLE_BASE}/admin/TEST2/log"
+    export RMAN_POLL_INTERVAL=0.2
+    SECONDS=0
+    run "$RMAN_SCRIPT" --sid TEST1,TEST2 --rcv "$MOCK_RCV" --timeout 1s
+    [[ "$status" -eq 1 ]]
+    [[ ${SECONDS} -lt 30 ]]
+    [[ "$(grep -c '|TIMEOUT|' "${ORADBA_LOG}"/oradba_rman_*.results)" -eq 2 ]]
+    ! pgrep -f "${ORACLE_HOME}/bin/rman" > /dev/null
+}
+
+@test "oradba_rman.sh rejects invalid --timeout and --max-jobs" {
+    run "$RMAN_SCRIPT" --sid TEST --rcv "$MOCK_RCV" --timeout 5x --dry-run
+    [[ "$status" -eq 2 ]]
+    run "$RMAN_SCRIPT" --sid TEST --rcv "$MOCK_RCV" --max-jobs all --dry-run
+    [[ "$status" -eq 2 ]]
+    local value
+    for value in 1h30m 10s5 m; do
+        run "$RMAN_SCRIPT" --sid TEST --rcv "$MOCK_RCV" --timeout "${value}" --dry-run
+        [[ "$status" -eq 2 ]]
+        [[ "$output" != *"syntax error"* ]]
+    done
+    # Leading zeros are decimal, not octal
+    run "$RMAN_SCRIPT" --sid TEST --rcv "$MOCK_RCV" --timeout 08 --dry-run
+    [[ "$output" != *"value too great for base"* ]]
+}
+
 # ------------------------------------------------------------------------------
 # Error handling tests
 # ------------------------------------------------------------------------------
@@ -482,3 +482,99 @@ EOF
     [ "$error_line" -gt "$home_line" ]
 }
 
+
+# Environment bundles - cached result of a full environment build
+
+# Source oraenv.sh for a SID in a fresh shell and print bundle log lines,
+# ORACLE_SID, ORACLE_HOME and the first PATH element
+_source_with_bundle() {
+    bash -c "
+        export ORATAB_FILE='$MOCK_ORATAB' ORADBA_CACHE_DIR='${TEST_TEMP_DIR}/cache'
+        export ORADBA_AUTO_CREATE_SID_CONFIG=false ORADBA_LOG_LEVEL=DEBUG $2
+        source '$ORAENV_SCRIPT' $1 --silent > '${TEST_TEMP_DIR}/oraenv.log' 2>&1
+        grep -o 'Environment.*bundle[^/]*' '${TEST_TEMP_DIR}/oraenv.log'
+        echo \"env=\${ORACLE_SID}|\${ORACLE_HOME}|\${PATH%%:*}|\${ORACLE_STARTUP}\"
+    "
+}
+
+@test "oraenv.sh writes an environment bundle and reuses it on the next switch" {
+    run _source_with_bundle TESTDB
+    [[ "$output" == *"Environment bundle written"* ]]
+    compgen -G "${TEST_TEMP_DIR}/cache/env/TESTDB.s.*.sh"
+    cold_env="${lines[-1]}"
+
+    run _source_with_bundle TESTDB
+    [[ "$output" == *"Environment for TESTDB loaded from bundle"* ]]
+    [ "${lines[-1]}" = "$cold_env" ]
+    [ "${lines[-1]}" = "env=TESTDB|${TEST_TEMP_DIR}/oracle/19c|${TEST_TEMP_DIR}/oracle/19c/bin|Y" ]
+}
+
+@test "oraenv.sh keeps one environment bundle per starting environment" {
+    run _source_with_bundle FREE
+    [[ "$output" == *"Environment bundle written"* ]]
+
+    # Switching away and back in one shell must not replace the bundle of a
+    # fresh login shell
+    run bash -c "
+        export ORATAB_FILE='$MOCK_ORATAB' ORADBA_CACHE_DIR='${TEST_TEMP_DIR}/cache'
+        export ORADBA_AUTO_CREATE_SID_CONFIG=false
+        source '$ORAENV_SCRIPT' CDB1 --silent > /dev/null 2>&1
+        source '$ORAENV_SCRIPT' FREE --silent > /dev/null 2>&1
+    "
+    [ "$(compgen -G "${TEST_TEMP_DIR}/cache/env/FREE.s.*.sh" | wc -l)" -eq 2 ]
+
+    run _source_with_bundle FREE
+    [[ "$output" == *"Environment for FREE loaded from bundle"* ]]
+}
+
+@test "oraenv.sh restores the same functions from a bundle as a full build" {
+    local probe="
+        export ORATAB_FILE='$MOCK_ORATAB' ORADBA_CACHE_DIR='${TEST_TEMP_DIR}/cache'
+        export ORADBA_AUTO_CREATE_SID_CONFIG=false ORADBA_LOG_LEVEL=DEBUG
+        source '$ORAENV_SCRIPT' FREE --silent > '${TEST_TEMP_DIR}/oraenv.log' 2>&1
+        grep -o 'Environment.*bundle[^/]*' '${TEST_TEMP_DIR}/oraenv.log'
+        declare -F > '${TEST_TEMP_DIR}'/funcs.\$1
+        declare -Fx > '${TEST_TEMP_DIR}'/exported.\$1
+        type -t oradba_tnsping
+    "
+    run bash -c "${probe}" _ cold
+    [[ "$output" == *"Environment bundle written"* ]]
+    [ "${lines[-1]}" = "function" ]
+
+    run bash -c "${probe}" _ warm
+    [[ "$output" == *"Environment for FREE loaded from bundle"* ]]
+    [ "${lines[-1]}" = "function" ]
+    diff "${TEST_TEMP_DIR}/funcs.cold" "${TEST_TEMP_DIR}/funcs.warm"
+    diff "${TEST_TEMP_DIR}/exported.cold" "${TEST_TEMP_DIR}/exported.warm"
+}
+
+@test "oraenv.sh ignores environment bundles writable by others" {
+    run _source_with_bundle FREE
+    [[ "$output" == *"Environment bundle written"* ]]
+    bundle=$(compgen -G "${TEST_TEMP_DIR}/cache/env/FREE.s.*.sh")
+    [ "$(stat -c '%a' "$bundle")" = "600" ]
+
+    chmod g+w "$bundle"
+    run _source_with_bundle FREE
+    grep -q "Ignoring environment bundle not private" "${TEST_TEMP_DIR}/oraenv.log"
+    [[ "$output" != *"loaded from bundle"* ]]
+    [[ "$output" == *"Environment bundle written"* ]]
+    [ "$(stat -c '%a' "$bundle")" = "600" ]
+}
+
+@test "oraenv.sh rebuilds the environment bundle when oratab changes" {
+    run _source_with_bundle FREE
+    [[ "$output" == *"Environment bundle written"* ]]
+
+    sleep 0.1
+    sed -i 's|^FREE:.*|FREE:'"${TEST_TEMP_DIR}"'/oracle/21c:Y|' "$MOCK_ORATAB"
+    run _source_with_bundle FREE
+    [[ "$output" == *"Environment bundle for FREE is stale"* ]]
+    [ "${lines[-1]}" = "env=FREE|${TEST_TEMP_DIR}/oracle/21c|${TEST_TEMP_DIR}/oracle/21c/bin|Y" ]
+}
+
+@test "oraenv.sh skips environment bundles when ORADBA_ENV_BUNDLE=false" {
+    run _source_with_bundle FREE "ORADBA_ENV_BUNDLE=false"
+    [[ "$output" != *"bundle"* ]]
+    [ ! -d "${TEST_TEMP_DIR}/cache/env" ]
+}
@@ -204,9 +204,9 @@ setup() {
     grep -q "wait.*pid" "${ORAUP_SCRIPT}"
 }
 
-@test "oraup.sh uses cached process list for listeners" {
-    # Verify that listener checks use cached process list instead of ps -ef
-    grep -A 5 "Check if any database listeners" "${ORAUP_SCRIPT}" | grep -q "process_list"
+@test "oraup.sh uses the instance map for listeners" {
+    # Verify that listener checks use the instance map instead of ps -ef
+    grep -A 5 "Check if any database listeners" "${ORAUP_SCRIPT}" | grep -q "_ORAUP_LISTENERS"
 }
 
 @test "datasafe_plugin.sh supports ORADBA_CACHED_PS environment variable" {
@@ -251,3 +251,71 @@ setup() {
     ! echo "$metadata_section" | grep -q 'connector_version='
 }
 
+
+# ------------------------------------------------------------------------------
+# Status Collection Engine Tests (single snapshot, concurrent open modes)
+# ------------------------------------------------------------------------------
+
+# Mock estate: a fake proc root with two pmon processes and a grep mentioning
+# a third SID
+_setup_mock_estate() {
+    MOCK_DIR="${BATS_TEST_TMPDIR}/estate"
+    mkdir -p "${MOCK_DIR}/bin" "${MOCK_DIR}/h1/bin" "${MOCK_DIR}/h2/bin" "${MOCK_DIR}/cache"
+    local pid comm cmdline
+    while read -r pid comm cmdline; do
+        mkdir -p "${MOCK_DIR}/proc/${pid}"
+        printf '%s\n' "${comm}" > "${MOCK_DIR}/proc/${pid}/comm"
+        printf '%s\0' ${cmdline} > "${MOCK_DIR}/proc/${pid}/cmdline"
+    done << 'EOF'
+1 systemd systemd
+1111 ora_pmon_orcl ora_pmon_orcl
+2222 db_pmon_HUNG db_pmon_HUNG
+3333 grep grep ora_pmon_down
+EOF
+    cat > "${MOCK_DIR}/h1/bin/sqlplus" << EOF
+#!/usr/bin/env bash
+cat > /dev/null
+echo x >> "${MOCK_DIR}/sqlplus_calls"
+echo OPEN
+EOF
+    printf '#!/usr/bin/env bash\nsleep 30\n' > "${MOCK_DIR}/h2/bin/sqlplus"
+    touch "${MOCK_DIR}/h1/bin/oracle" "${MOCK_DIR}/h2/bin/oracle"
+    chmod +x "${MOCK_DIR}/h1/bin/sqlplus" "${MOCK_DIR}/h2/bin/sqlplus"
+    printf '%s\n' "orcl:${MOCK_DIR}/h1:Y" "HUNG:${MOCK_DIR}/h2:N" "down:${MOCK_DIR}/h1:N" > "${MOCK_DIR}/oratab"
+
+    export PATH="${MOCK_DIR}/bin:${PATH}"
+    export ORADBA_PROC_ROOT="${MOCK_DIR}/proc"
+    export ORADBA_ORATAB="${MOCK_DIR}/oratab"
+    export ORADBA_CACHE_DIR="${MOCK_DIR}/cache"
+    export ORADBA_ORAUP_TIMEOUT=1
+}
+
+@test "oraup.sh reports open, timed out and down instances from one snapshot" {
+    command -v timeout > /dev/null || skip "timeout command not available"
+    _setup_mock_estate
+
+    local start=${SECONDS}
+    run "${ORAUP_SCRIPT}"
+    [ "$status" -eq 0 ]
+    [[ "$output" =~ orcl\ +Y\ +open ]]
+    [[ "$output" =~ HUNG\ +N\ +timeout ]]
+    [[ "$output" =~ down\ +N\ +down ]]
+    # A hung instance costs one timeout, not a stalled report
+    [ $((SECONDS - start)) -lt 10 ]
+}
+
+@test "oraup.sh --watch reuses open modes between refreshes" {
+    command -v timeout > /dev/null || skip "timeout command not available"
+    _setup_mock_estate
+
+    run "${ORAUP_SCRIPT}" --watch 1 --count 2
+    [ "$status" -eq 0 ]
+    [ "$(grep -c "Refreshing every 1s" <<< "$output")" -eq 2 ]
+    [ "$(wc -l < "${MOCK_DIR}/sqlplus_calls")" -eq 1 ]
+}
+
+@test "oraup.sh rejects --count without a number" {
+    run "${ORAUP_SCRIPT}" --watch --count abc
+    [ "$status" -ne 0 ]
+    [[ "$output" =~ "--count requires a number" ]]
+}
@@ -465,3 +465,102 @@ EOF
     unset TNS_ADMIN
     unset plugin_status
 }
+
+# ------------------------------------------------------------------------------
+# Test 17: Batched calls source the plugin once, functions stay isolated
+# ------------------------------------------------------------------------------
+@test "execute_plugin_batch: one plugin load for several functions" {
+    cat > "${ORADBA_BASE}/lib/plugins/batch_plugin.sh" << EOF
+echo "sourced" >> "${TEST_TEMP_DIR}/loads"
+plugin_get_version() { BATCH_STATE="set"; echo "19.0.0"; }
+plugin_check_status() { echo "status=\${2:-none} state=\${BATCH_STATE:-clean} lib=\${LD_LIBRARY_PATH}"; return 3; }
+plugin_noisy() { echo "diagnostics" >&2; echo "quiet"; }
+EOF
+
+    declare -A results=()
+    export TNS_ADMIN="/parent/tns/admin"
+    execute_plugin_batch "batch" "/fake/home" results get_version check_status=FREE noisy missing 2> "${TEST_TEMP_DIR}/stderr"
+
+    [ "$(wc -l < "${TEST_TEMP_DIR}/loads")" -eq 1 ]
+    [ "${results[get_version]}" = "19.0.0" ]
+    [ "${results[get_version.rc]}" -eq 0 ]
+    [ "${results[check_status]}" = "status=FREE state=clean lib=/fake/home/lib" ]
+    [ "${results[check_status.rc]}" -eq 3 ]
+    [ "${results[noisy]}" = "quiet" ]
+    [ "${results[missing.rc]}" -eq 1 ]
+    [ ! -s "${TEST_TEMP_DIR}/stderr" ]
+    [[ -z "${BATCH_STATE:-}" ]]
+    [[ "${TNS_ADMIN}" == "/parent/tns/admin" ]]
+    unset TNS_ADMIN
+}
+
+# ------------------------------------------------------------------------------
+# Test 18: Pure plugin results are memoized until the plugin file changes
+# ------------------------------------------------------------------------------
+@test "execute_plugin_function_v2: memoizes pure functions by plugin mtime" {
+    cat > "${ORADBA_BASE}/lib/plugins/memo_plugin.sh" << EOF
+plugin_build_bin_path() { echo "run" >> "${TEST_TEMP_DIR}/runs"; echo "\$1/bin"; }
+plugin_check_status() { echo "run" >> "${TEST_TEMP_DIR}/status_runs"; echo "running"; }
+EOF
+    local result=""
+    execute_plugin_function_v2 "memo" "build_bin_path" "/fake/home" "result"
+    execute_plugin_function_v2 "memo" "build_bin_path" "/fake/home" "result"
+    [ "${result}" = "/fake/home/bin" ]
+    [ "$(wc -l < "${TEST_TEMP_DIR}/runs")" -eq 1 ]
+
+    # Other home is a separate entry, batch results come from the memo
+    execute_plugin_batch "memo" "/other/home" "" build_bin_path
+    execute_plugin_function_v2 "memo" "build_bin_path" "/other/home" "result"
+    [ "${result}" = "/other/home/bin" ]
+    [ "$(wc -l < "${TEST_TEMP_DIR}/runs")" -eq 2 ]
+
+    # Non-pure functions always run
+    execute_plugin_function_v2 "memo" "check_status" "/fake/home" "result"
+    execute_plugin_function_v2 "memo" "check_status" "/fake/home" "result"
+    [ "$(wc -l < "${TEST_TEMP_DIR}/status_runs")" -eq 2 ]
+
+    # Changed plugin file invalidates the memo
+    touch -d "+5 seconds" "${ORADBA_BASE}/lib/plugins/memo_plugin.sh"
+    ORADBA_PLUGIN_MEMO_CHECK=0 execute_plugin_function_v2 "memo" "build_bin_path" "/fake/home" "result"
+    [ "$(wc -l < "${TEST_TEMP_DIR}/runs")" -eq 3 ]
+}
+
+@test "execute_plugin_function_v2: memoized database paths follow GRID_HOME" {
+    mkdir -p "${TEST_TEMP_DIR}/db/bin" "${TEST_TEMP_DIR}/grid/bin"
+    cp "${BATS_TEST_DIRNAME}/../src/lib/plugins/database_plugin.sh" "${ORADBA_BASE}/lib/plugins/"
+    local result=""
+
+    unset GRID_HOME
+    execute_plugin_function_v2 "database" "build_bin_path" "${TEST_TEMP_DIR}/db" "result"
+    [ "${result}" = "${TEST_TEMP_DIR}/db/bin" ]
+
+    export GRID_HOME="${TEST_TEMP_DIR}/grid"
+    execute_plugin_function_v2 "database" "build_bin_path" "${TEST_TEMP_DIR}/db" "result"
+    [ "${result}" = "${TEST_TEMP_DIR}/db/bin:${TEST_TEMP_DIR}/grid/bin" ]
+
+    unset GRID_HOME
+    execute_plugin_function_v2 "database" "build_bin_path" "${TEST_TEMP_DIR}/db" "result"
+    [ "${result}" = "${TEST_TEMP_DIR}/db/bin" ]
+}
+
+# ------------------------------------------------------------------------------
+# Test 19: stderr is captured without temp files
+# ------------------------------------------------------------------------------
+@test "execute_plugin_function_v2: captures stderr without temp files" {
+    cat > "${ORADBA_BASE}/lib/plugins/stderr_plugin.sh" << 'EOF'
+plugin_noisy() {
+    echo "plugin diagnostics" >&2
+    echo "result_value"
+    return 0
+}
+EOF
+    mktemp() { echo "called" >> "${TEST_TEMP_DIR}/mktemp_calls"; command mktemp "$@"; }
+    export ORADBA_LOG_LEVEL=TRACE
+
+    local result=""
+    execute_plugin_function_v2 "stderr" "noisy" "/fake/home" "result" 2> "${TEST_TEMP_DIR}/stderr"
+    [ "${result}" = "result_value" ]
+    [ ! -f "${TEST_TEMP_DIR}/mktemp_calls" ]
+    grep -q "Plugin stderr: plugin diagnostics" "${TEST_TEMP_DIR}/stderr"
+    grep -q "Plugin stdout: result_value" "${TEST_TEMP_DIR}/stderr"
+}
@@ -34,6 +34,9 @@ get_oratab_path() {
 get_oracle_homes_path() {
     echo "${ORADBA_PREFIX}/etc/oradba_homes.conf"
 }
+oradba_cache_dir() {
+    printf -v "$1" '%s' "${ORADBA_CACHE_DIR:-${ORADBA_PREFIX}/var/cache}"
+}
 detect_product_type() {
     local home="$1"
     if [[ -d "${home}/rdbms" ]]; then
@@ -291,3 +294,177 @@ EOF
     
     rm -f "/tmp/test_oratab_$$"
 }
+
+
+# ------------------------------------------------------------------------------
+# Test: Registry snapshot is written and reused
+# ------------------------------------------------------------------------------
+@test "get_all writes compiled snapshot and reuses it" {
+    export ORADBA_AUTO_DISCOVER=false
+    export ORADBA_CACHE_DIR="${TEST_DIR}/cache"
+    mkdir -p "${TEST_DIR}/homes/db19/rdbms"
+
+    echo "TESTDB:${TEST_DIR}/homes/db19:Y" > "${TEST_DIR}/oratab"
+    export ORADBA_ORATAB="${TEST_DIR}/oratab"
+    get_oratab_path() { echo "${ORADBA_ORATAB}"; }
+
+    run oradba_registry_get_all
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"database|TESTDB|${TEST_DIR}/homes/db19"* ]]
+    [ -f "${TEST_DIR}/cache/registry.snapshot" ]
+    grep -q "^# signature: ${TEST_DIR}/oratab=" "${TEST_DIR}/cache/registry.snapshot"
+
+    # Second load must come from the snapshot, not from detect_product_type
+    detect_product_type() { echo "CALLED"; }
+    run oradba_registry_get_all
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"database|TESTDB"* ]]
+    [[ "$output" != *"CALLED"* ]]
+}
+
+# ------------------------------------------------------------------------------
+# Test: In-shell index answers name, alias and type lookups
+# ------------------------------------------------------------------------------
+@test "registry index serves get_by_name, alias and get_by_type" {
+    export ORADBA_AUTO_DISCOVER=false
+    export ORADBA_CACHE_DIR="${TEST_DIR}/cache"
+    mkdir -p "${TEST_DIR}/homes/db19/rdbms" "${TEST_DIR}/homes/client19/bin"
+
+    printf '%s\n' "PROD:${TEST_DIR}/homes/db19:Y" "TEST:${TEST_DIR}/homes/db19:N" > "${TEST_DIR}/oratab"
+    echo "client19:${TEST_DIR}/homes/client19:client:10:cli19:Client 19c:19.0.0" > "${TEST_DIR}/etc/oradba_homes.conf"
+    export ORADBA_ORATAB="${TEST_DIR}/oratab"
+    get_oratab_path() { echo "${ORADBA_ORATAB}"; }
+
+    oradba_registry_load
+    [ "${_ORADBA_REGISTRY_LOADED}" = "true" ]
+    [ "${#_ORADBA_REGISTRY_ENTRIES[@]}" -eq 3 ]
+
+    run oradba_registry_get_by_name "cli19"
+    [ "$status" -eq 0 ]
+    [[ "$output" == "client|client19|"* ]]
+
+    run oradba_registry_get_by_type "database"
+    [ "$status" -eq 0 ]
+    [ "${#lines[@]}" -eq 2 ]
+    [[ "${lines[0]}" == *"|PROD|"* ]]
+    [[ "${lines[1]}" == *"|TEST|"* ]]
+
+    run oradba_registry_get_by_name "MISSING"
+    [ "$status" -eq 1 ]
+    [ -z "$output" ]
+}
+
+# ------------------------------------------------------------------------------
+# Test: Index is rebuilt when oratab changes
+# ------------------------------------------------------------------------------
+@test "registry index is invalidated when oratab changes" {
+    export ORADBA_AUTO_DISCOVER=false
+    export ORADBA_CACHE_DIR="${TEST_DIR}/cache"
+    mkdir -p "${TEST_DIR}/homes/db19/rdbms"
+
+    echo "PROD:${TEST_DIR}/homes/db19:Y" > "${TEST_DIR}/oratab"
+    export ORADBA_ORATAB="${TEST_DIR}/oratab"
+    get_oratab_path() { echo "${ORADBA_ORATAB}"; }
+
+    oradba_registry_load
+    [ "${#_ORADBA_REGISTRY_ENTRIES[@]}" -eq 1 ]
+
+    echo "NEWDB:${TEST_DIR}/homes/db19:N" >> "${TEST_DIR}/oratab"
+    touch -d "+2 seconds" "${TEST_DIR}/oratab" 2> /dev/null || true
+
+    run oradba_registry_get_by_name "NEWDB"
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"database|NEWDB"* ]]
+}
+
+# ------------------------------------------------------------------------------
+# Test: Snapshot cache can be disabled
+# ------------------------------------------------------------------------------
+@test "ORADBA_REGISTRY_CACHE=false bypasses the snapshot" {
+    export ORADBA_AUTO_DISCOVER=false
+    export ORADBA_CACHE_DIR="${TEST_DIR}/cache"
+    export ORADBA_REGISTRY_CACHE=false
+    mkdir -p "${TEST_DIR}/homes/db19/rdbms"
+
+    echo "PROD:${TEST_DIR}/homes/db19:Y" > "${TEST_DIR}/oratab"
+    export ORADBA_ORATAB="${TEST_DIR}/oratab"
+    get_oratab_path() { echo "${ORADBA_ORATAB}"; }
+
+    run oradba_registry_get_all
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"database|PROD"* ]]
+    [ ! -f "${TEST_DIR}/cache/registry.snapshot" ]
+}
+
+# ------------------------------------------------------------------------------
+# Test: Invalidate drops snapshot and index
+# ------------------------------------------------------------------------------
+@test "oradba_registry_invalidate removes snapshot and index" {
+    export ORADBA_AUTO_DISCOVER=false
+    export ORADBA_CACHE_DIR="${TEST_DIR}/cache"
+    mkdir -p "${TEST_DIR}/homes/db19/rdbms"
+
+    echo "PROD:${TEST_DIR}/homes/db19:Y" > "${TEST_DIR}/oratab"
+    export ORADBA_ORATAB="${TEST_DIR}/oratab"
+    get_oratab_path() { echo "${ORADBA_ORATAB}"; }
+
+    oradba_registry_load
+    [ -f "${TEST_DIR}/cache/registry.snapshot" ]
+
+    oradba_registry_invalidate
+    [ ! -f "${TEST_DIR}/cache/registry.snapshot" ]
+    [ "${_ORADBA_REGISTRY_LOADED}" = "false" ]
+}
+
+# ------------------------------------------------------------------------------
+# Test: Snapshot is recompiled when a registered home changes
+# ------------------------------------------------------------------------------
+@test "registry snapshot is invalidated when a registered home changes" {
+    export ORADBA_AUTO_DISCOVER=false
+    export ORADBA_CACHE_DIR="${TEST_DIR}/cache"
+    mkdir -p "${TEST_DIR}/homes/cman/bin"
+    touch -d "@$(($(date +%s) - 60))" "${TEST_DIR}/homes/cman" "${TEST_DIR}/homes/cman/bin"
+
+    echo "CMAN:${TEST_DIR}/homes/cman:N" > "${TEST_DIR}/oratab"
+    export ORADBA_ORATAB="${TEST_DIR}/oratab"
+    get_oratab_path() { echo "${ORADBA_ORATAB}"; }
+
+    run oradba_registry_get_all
+    [[ "$output" == *"unknown|CMAN|"* ]]
+
+    # In-place install changes the detected product type
+    mkdir -p "${TEST_DIR}/homes/cman/oracle_cman_home"
+    run oradba_registry_get_all
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"datasafe|CMAN|"* ]]
+}
+
+# ------------------------------------------------------------------------------
+# Test: Index is rebuilt when oratab is replaced by an older copy
+# ------------------------------------------------------------------------------
+@test "registry index verifies the signature once after a recheck" {
+    export ORADBA_AUTO_DISCOVER=false
+    export ORADBA_CACHE_DIR="${TEST_DIR}/cache"
+    mkdir -p "${TEST_DIR}/homes/db19/rdbms"
+    touch -d "@$(($(date +%s) - 60))" "${TEST_DIR}/homes/db19" "${TEST_DIR}/homes/db19/rdbms"
+
+    echo "PROD:${TEST_DIR}/homes/db19:Y" > "${TEST_DIR}/oratab"
+    echo "RESTORED:${TEST_DIR}/homes/db19:N" > "${TEST_DIR}/oratab.backup"
+    touch -d '2020-01-01' "${TEST_DIR}/oratab.backup"
+    export ORADBA_ORATAB="${TEST_DIR}/oratab"
+    get_oratab_path() { echo "${ORADBA_ORATAB}"; }
+
+    oradba_registry_load
+    [ "${_ORADBA_REGISTRY_CHECKED}" = "true" ]
+
+    # Older mtime than the snapshot: -nt cannot see the replacement
+    mv "${TEST_DIR}/oratab.backup" "${TEST_DIR}/oratab"
+    _oradba_registry_is_current
+
+    oradba_registry_recheck
+    run _oradba_registry_is_current
+    [ "$status" -eq 1 ]
+    run oradba_registry_get_by_name "RESTORED"
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"database|RESTORED"* ]]
+}
@@ -35,6 +35,7 @@ setup() {
     cp "${ORADBA_SRC_BASE}/lib/oradba_home_discovery.sh" "${TEST_DIR}/lib/"
     cp "${ORADBA_SRC_BASE}/lib/oradba_database_discovery.sh" "${TEST_DIR}/lib/"
     cp "${ORADBA_SRC_BASE}/lib/oradba_version_metadata.sh" "${TEST_DIR}/lib/"
+    cp "${ORADBA_SRC_BASE}/lib/oradba_env_paths.sh" "${TEST_DIR}/lib/"
     
     # Set environment for testing
     export ORADBA_PREFIX="${TEST_DIR}"
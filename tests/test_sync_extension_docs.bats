@@ -0,0 +1,163 @@
+#!/usr/bin/env bats
+# ------------------------------------------------------------------------------
+# OraDBA - Oracle Database Infrastructure and Security
+# ------------------------------------------------------------------------------
+# Name.......: test_sync_extension_docs.bats
+# Author.....: Stefan Oehrli (oes) stefan.oehrli@oradba.ch
+# Date.......: 2026.10.17
+# Purpose....: BATS tests for .github/scripts/sync_extension_docs.py using
+#              local file:// repositories (no network access required)
+# ------------------------------------------------------------------------------
+
+setup() {
+    SCRIPT_DIR="$(cd "$(dirname "$BATS_TEST_FILENAME")/.." && pwd)"
+    SYNC_SCRIPT="${SCRIPT_DIR}/.github/scripts/sync_extension_docs.py"
+
+    if ! command -v git >/dev/null 2>&1 || ! python3 -c 'import yaml' >/dev/null 2>&1; then
+        skip "git and python3 with PyYAML required"
+    fi
+
+    TEST_DIR="${BATS_TEST_TMPDIR}/sync"
+    mkdir -p "${TEST_DIR}/docs"
+    export GIT_AUTHOR_NAME=test GIT_AUTHOR_EMAIL=test@example.com
+    export GIT_COMMITTER_NAME=test GIT_COMMITTER_EMAIL=test@example.com
+
+    printf '%s\n' "# Extensions" "<!-- EXTENSIONS_LIST_START -->" \
+        "<!-- EXTENSIONS_LIST_END -->" > "${TEST_DIR}/docs/extensions.md"
+
+    _create_extension_repo alpha
+    _create_extension_repo beta
+
+    cat > "${TEST_DIR}/extensions.yml" <<YAML
+extensions:
+  - name: alpha
+    display_name: Alpha Extension
+    repo: example/alpha
+    url: file://${TEST_DIR}/alpha.git
+    docs_path: doc
+    description: Alpha test extension
+    category: test
+    status: active
+  - name: beta
+    display_name: Beta Extension
+    repo: example/beta
+    url: file://${TEST_DIR}/beta.git
+    docs_path: doc
+    description: Beta test extension
+    category: test
+    status: active
+YAML
+}
+
+# Create a bare repository with a doc/ tree and a src/ tree outside docs_path
+_create_extension_repo() {
+    local name="$1"
+    local src="${TEST_DIR}/${name}.src"
+    git init -q -b main "${src}"
+    mkdir -p "${src}/doc/guide" "${src}/doc/releases" "${src}/lib"
+    printf '# %s\n\nSee [library](../lib/tool.sh).\n' "${name}" > "${src}/doc/README.md"
+    echo "guide" > "${src}/doc/guide/usage.md"
+    echo "old" > "${src}/doc/guide/old.md"
+    echo "notes" > "${src}/doc/releases/v1.md"
+    echo "code" > "${src}/lib/tool.sh"
+    git -C "${src}" add -A
+    git -C "${src}" commit -qm initial
+    git clone -q --bare "${src}" "${TEST_DIR}/${name}.git"
+    git -C "${src}" remote add origin "${TEST_DIR}/${name}.git"
+    git -C "${TEST_DIR}/${name}.git" config uploadpack.allowFilter true
+}
+
+_run_sync() {
+    run python3 "${SYNC_SCRIPT}" --registry "${TEST_DIR}/extensions.yml" \
+        --docs-dir "${TEST_DIR}/docs" --work-dir "${TEST_DIR}/work" "$@"
+}
+
+@test "sync copies docs of all extensions from file:// repositories" {
+    _run_sync
+    [ "$status" -eq 0 ]
+    [[ "$output" =~ "Synced 2/2 extensions" ]]
+
+    local target="${TEST_DIR}/docs/extensions/alpha"
+    [ -f "${target}/index.md" ]
+    [ ! -f "${target}/README.md" ]
+    [ -f "${target}/guide/usage.md" ]
+    [ -f "${target}/.metadata.yml" ]
+    [ ! -d "${target}/releases" ]
+    [ -f "${TEST_DIR}/docs/extensions/beta/index.md" ]
+    # link to source code outside the docs is reduced to plain text
+    grep -q "See library." "${target}/index.md"
+    grep -q "extensions/beta/index.md" "${TEST_DIR}/docs/extensions.md"
+    # sparse checkout limited to docs_path
+    [ ! -e "${TEST_DIR}/work/alpha/lib/tool.sh" ]
+    [ -f "${TEST_DIR}/work/sync_state.json" ]
+}
+
+@test "sync skips extensions whose upstream commit is unchanged" {
+    _run_sync
+    [ "$status" -eq 0 ]
+    touch -d "2020-01-01" "${TEST_DIR}/docs/extensions/alpha/guide/usage.md"
+
+    _run_sync
+    [ "$status" -eq 0 ]
+    [[ "$output" =~ "Unchanged at" ]]
+    [[ "$output" =~ "Synced 2/2 extensions" ]]
+    [ "$(date -r "${TEST_DIR}/docs/extensions/alpha/guide/usage.md" +%Y)" = "2020" ]
+}
+
+@test "sync writes only changed files and deletes removed files" {
+    _run_sync
+    [ "$status" -eq 0 ]
+    touch -d "2020-01-01" "${TEST_DIR}/docs/extensions/alpha/guide/usage.md"
+
+    local src="${TEST_DIR}/alpha.src"
+    echo "new" > "${src}/doc/guide/new.md"
+    git -C "${src}" rm -q doc/guide/old.md
+    git -C "${src}" add -A
+    git -C "${src}" commit -qm update
+    git -C "${src}" push -q origin main
+
+    _run_sync
+    [ "$status" -eq 0 ]
+    [[ "$output" =~ "1 written, 1 deleted" ]]
+
+    local target="${TEST_DIR}/docs/extensions/alpha"
+    [ -f "${target}/guide/new.md" ]
+    [ ! -f "${target}/guide/old.md" ]
+    [ "$(date -r "${target}/guide/usage.md" +%Y)" = "2020" ]
+}
+
+@test "sync --force resyncs unchanged extensions" {
+    _run_sync
+    [ "$status" -eq 0 ]
+
+    _run_sync --force --jobs 1
+    [ "$status" -eq 0 ]
+    [[ ! "$output" =~ "Unchanged at" ]]
+    [[ "$output" =~ "0 written, 0 deleted" ]]
+}
+
+@test "sync --check-links reports unresolved links and anchors" {
+    _run_sync
+    [ "$status" -eq 0 ]
+
+    cat >> "${TEST_DIR}/docs/extensions.md" <<'MD'
+
+## Links
+
+- [alpha](extensions/alpha/index.md#alpha)
+- [usage](extensions/alpha/guide/usage.md)
+- [section](#links)
+- [missing page](extensions/alpha/nothere.md)
+- [missing anchor](extensions/alpha/index.md#nothere)
+
+```bash
+echo "[not a link](ignored.md)"
+```
+MD
+    _run_sync --no-sync --check-links
+    [ "$status" -eq 1 ]
+    [[ "$output" == *"2 unresolved"* ]]
+    [[ "$output" == *"extensions/alpha/nothere.md (not found)"* ]]
+    [[ "$output" == *"extensions/alpha/index.md#nothere (missing anchor)"* ]]
+    [[ "$output" != *"ignored.md"* ]]
+}
@@ -252,12 +252,18 @@ setup() {
 }
 
 @test "sync_from_peers.sh uses ssh for rsync transport" {
-    run bash -c "grep -qi 'ssh.*-p\\|-e.*ssh' '$SYNC_FROM_PEERS'"
+    # rsync transport lives in the shared peer sync engine
+    run bash -c "grep -q 'oradba_peer_sync.sh' '$SYNC_FROM_PEERS'"
+    [[ "$status" -eq 0 ]]
+    run bash -c "grep -qi 'ssh.*-p\\|-e.*ssh' '${PROJECT_ROOT}/src/lib/oradba_peer_sync.sh'"
     [[ "$status" -eq 0 ]]
 }
 
 @test "sync_to_peers.sh uses ssh for rsync transport" {
-    run bash -c "grep -qi 'ssh.*-p\\|-e.*ssh' '$SYNC_TO_PEERS'"
+    # rsync transport lives in the shared peer sync engine
+    run bash -c "grep -q 'oradba_peer_sync.sh' '$SYNC_TO_PEERS'"
+    [[ "$status" -eq 0 ]]
+    run bash -c "grep -qi 'ssh.*-p\\|-e.*ssh' '${PROJECT_ROOT}/src/lib/oradba_peer_sync.sh'"
     [[ "$status" -eq 0 ]]
 }
 
@@ -322,3 +328,131 @@ setup() {
     run bash -c "grep -q 'show_summary()' '$SYNC_TO_PEERS'"
     [[ "$status" -eq 0 ]]
 }
+
+# ------------------------------------------------------------------------------
+# Parallel peer sync engine tests (stub rsync on PATH)
+# ------------------------------------------------------------------------------
+
+# Stub rsync: logs start/end per peer, sleeps STUB_SLEEP, fails for bad* hosts
+create_rsync_stub() {
+    STUB_DIR="${BATS_TMPDIR}/sync_stub_$$"
+    mkdir -p "${STUB_DIR}/bin"
+    cat > "${STUB_DIR}/bin/rsync" <<'EOF'
+#!/usr/bin/env bash
+for arg in "$@"; do
+    [[ "${arg}" == *@*:* ]] && host="${arg#*@}" && host="${host%%:*}"
+    [[ "${arg}" == --files-from=* ]] && cat "${arg#*=}" >> "${STUB_LOG}.files"
+done
+echo "start ${host} $*" >> "${STUB_LOG}"
+sleep "${STUB_SLEEP:-0.5}"
+[[ "${host}" == bad* ]] && exit 12
+echo "end ${host}" >> "${STUB_LOG}"
+echo "Total bytes sent: 1,234"
+echo "Total bytes received: 56"
+EOF
+    chmod +x "${STUB_DIR}/bin/rsync"
+    echo "data" > "${STUB_DIR}/source.txt"
+    export PATH="${STUB_DIR}/bin:${PATH}" STUB_LOG="${STUB_DIR}/rsync.log"
+    export SSH_CONTROL_DIR="${STUB_DIR}/cm" SYNC_STATE_DIR="${STUB_DIR}/state"
+}
+
+@test "sync_to_peers.sh syncs peers in parallel and reports bytes per peer" {
+    create_rsync_stub
+    run "$SYNC_TO_PEERS" -v -j 3 -H "db1 db2 bad3" "${STUB_DIR}/source.txt"
+    [[ "$status" -eq 1 ]]
+    # All three started before the first one finished
+    [[ "$(head -n 3 "${STUB_LOG}" | grep -c '^start ')" -eq 3 ]]
+    [[ "$output" =~ db1\ +SUCCESS\ +[0-9.]+s\ +1234\ +56 ]]
+    [[ "$output" =~ bad3\ +FAILED ]]
+    [[ "$output" =~ "Failed : bad3" ]]
+    rm -rf "${STUB_DIR}"
+}
+
+@test "sync_to_peers.sh -j 1 syncs peers one after another" {
+    create_rsync_stub
+    export STUB_SLEEP=0.1
+    run "$SYNC_TO_PEERS" -j 1 -H "db1 db2" "${STUB_DIR}/source.txt"
+    [[ "$status" -eq 0 ]]
+    [[ "$(sed -n 2p "${STUB_LOG}")" == "end db1" ]]
+    rm -rf "${STUB_DIR}"
+}
+
+@test "sync_to_peers.sh shares SSH connections via ControlMaster" {
+    create_rsync_stub
+    export STUB_SLEEP=0
+    run "$SYNC_TO_PEERS" -H "db1" "${STUB_DIR}/source.txt"
+    [[ "$status" -eq 0 ]]
+    grep -q -- "-o ControlMaster=auto -o ControlPath=${SSH_CONTROL_DIR}/%C -o ControlPersist=10m" "${STUB_LOG}"
+    [[ -d "${SSH_CONTROL_DIR}" && "$(stat -c %a "${SSH_CONTROL_DIR}")" == "700" ]]
+
+    : > "${STUB_LOG}"
+    SSH_CONTROL_MASTER=false run "$SYNC_TO_PEERS" -H "db1" "${STUB_DIR}/source.txt"
+    ! grep -q "ControlMaster" "${STUB_LOG}"
+    rm -rf "${STUB_DIR}"
+}
+
+@test "sync_to_peers.sh terminates peers exceeding the timeout" {
+    create_rsync_stub
+    export STUB_SLEEP=30
+    SECONDS=0
+    run "$SYNC_TO_PEERS" -v -t 1 -H "db1" "${STUB_DIR}/source.txt"
+    [[ "$status" -eq 1 ]]
+    [[ ${SECONDS} -lt 10 ]]
+    [[ "$output" =~ db1\ +TIMEOUT ]]
+    ! grep -q "^end db1" "${STUB_LOG}"
+    rm -rf "${STUB_DIR}"
+}
+
+@test "sync_from_peers.sh pulls from the source peer before pushing to the others" {
+    create_rsync_stub
+    export STUB_SLEEP=0.1
+    run "$SYNC_FROM_PEERS" -v -p db1 -H "db1 db2 db3" "${STUB_DIR}/source.txt"
+    [[ "$status" -eq 0 ]]
+    [[ "$(head -n 2 "${STUB_LOG}" | cut -d' ' -f1-2 | tr '\n' ' ')" == "start db1 end db1 " ]]
+    grep -q "oracle@db1:${STUB_DIR}/source.txt ${STUB_DIR}/source.txt" "${STUB_LOG}"
+    [[ "$(grep -c '^start db[23]' "${STUB_LOG}")" -eq 2 ]]
+    [[ "$output" =~ "Success: " ]]
+    [[ "$output" =~ db2\ +SUCCESS ]]
+    rm -rf "${STUB_DIR}"
+}
+
+@test "sync_to_peers.sh skips unchanged peers and sends only changed files" {
+    create_rsync_stub
+    export STUB_SLEEP=0
+    mkdir -p "${STUB_DIR}/tree/sub"
+    echo "a" > "${STUB_DIR}/tree/a.ora"
+    echo "b" > "${STUB_DIR}/tree/sub/b.ora"
+
+    run "$SYNC_TO_PEERS" -v -H "db1 db2" "${STUB_DIR}/tree"
+    [[ "$status" -eq 0 ]]
+    [[ "$(grep -c '^start' "${STUB_LOG}")" -eq 2 ]]
+    [[ ! -f "${STUB_LOG}.files" ]]
+
+    # Unchanged tree: no rsync at all
+    run "$SYNC_TO_PEERS" -v -H "db1 db2" "${STUB_DIR}/tree"
+    [[ "$status" -eq 0 ]]
+    [[ "$(grep -c '^start' "${STUB_LOG}")" -eq 2 ]]
+    [[ "$output" =~ db1\ +UNCHANGED ]]
+    [[ "$output" =~ "Success: db1 db2" ]]
+
+    # One changed file: rsync gets only that file
+    echo "b2" > "${STUB_DIR}/tree/sub/b.ora"
+    run "$SYNC_TO_PEERS" -H "db1 db2" "${STUB_DIR}/tree"
+    [[ "$status" -eq 0 ]]
+    [[ "$(grep -c '^start' "${STUB_LOG}")" -eq 4 ]]
+    [[ "$(sort -u "${STUB_LOG}.files")" == "sub/b.ora" ]]
+
+    # Mode changes, symlinks and empty directories are changes too
+    rm -f "${STUB_LOG}.files"
+    chmod 600 "${STUB_DIR}/tree/a.ora"
+    ln -s a.ora "${STUB_DIR}/tree/link.ora"
+    mkdir "${STUB_DIR}/tree/empty"
+    run "$SYNC_TO_PEERS" -H "db1" "${STUB_DIR}/tree"
+    [[ "$status" -eq 0 ]]
+    [[ "$(sort -u "${STUB_LOG}.files" | tr '\n' ' ')" == "a.ora empty link.ora " ]]
+
+    # -F forces a full rsync
+    run "$SYNC_TO_PEERS" -F -H "db1" "${STUB_DIR}/tree"
+    [[ "$(grep -c '^start db1' "${STUB_LOG}")" -eq 4 ]]
+    rm -rf "${STUB_DIR}"
+}